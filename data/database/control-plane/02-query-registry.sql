@@ -22,6 +22,25 @@ CREATE INDEX IF NOT EXISTS idx_query_pairs_embedding
 ON public.query_pairs
 USING hnsw (embedding vector_cosine_ops);
 
+-- Per-role partial ANN indexes. Lookups inline the role literal and order by
+-- `embedding <=> $1` so the planner walks only the matching role's graph.
+-- Keep in sync with ingestion/vector_index_ddl.py (QUERY_PAIR_ANN_ROLES).
+CREATE INDEX IF NOT EXISTS idx_query_pairs_embedding_cache
+ON public.query_pairs USING hnsw (embedding vector_cosine_ops)
+WITH (m = 16, ef_construction = 64) WHERE 'cache' = ANY(roles);
+CREATE INDEX IF NOT EXISTS idx_query_pairs_embedding_example
+ON public.query_pairs USING hnsw (embedding vector_cosine_ops)
+WITH (m = 16, ef_construction = 64) WHERE 'example' = ANY(roles);
+CREATE INDEX IF NOT EXISTS idx_query_pairs_embedding_interaction
+ON public.query_pairs USING hnsw (embedding vector_cosine_ops)
+WITH (m = 16, ef_construction = 64) WHERE 'interaction' = ANY(roles);
+CREATE INDEX IF NOT EXISTS idx_query_pairs_embedding_sql
+ON public.query_pairs USING hnsw (embedding vector_cosine_ops)
+WITH (m = 16, ef_construction = 64) WHERE 'sql' = ANY(roles);
+CREATE INDEX IF NOT EXISTS idx_query_pairs_embedding_subgraph
+ON public.query_pairs USING hnsw (embedding vector_cosine_ops)
+WITH (m = 16, ef_construction = 64) WHERE 'subgraph' = ANY(roles);
+
 -- Index for role-based retrieval (e.g., fetch all 'example' roles)
 CREATE INDEX IF NOT EXISTS idx_query_pairs_roles ON public.query_pairs USING GIN (roles);
 
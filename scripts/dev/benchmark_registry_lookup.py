@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Benchmark query registry semantic lookup latency against registry size.
+
+Compares the legacy predicate form
+(``WHERE 1 - (embedding <=> $1) >= $2 ORDER BY similarity``) with the
+index-driven top-k form used by the registry store and semantic cache
+(``ORDER BY embedding <=> $1 LIMIT k`` over a per-role partial HNSW index,
+then threshold filtering).
+
+Rows are written to a scratch table (``bench_query_pairs``) that is dropped at
+the end, so the real registry is never touched.
+
+Usage:
+    python scripts/dev/benchmark_registry_lookup.py --sizes 1000 10000 100000
+
+Environment variables:
+    CONTROL_DB_HOST / CONTROL_DB_PORT / CONTROL_DB_NAME / CONTROL_DB_USER /
+    CONTROL_DB_PASSWORD: Postgres with the pgvector extension.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+import asyncpg
+import numpy as np
+
+DIM = 384
+TABLE = "bench_query_pairs"
+
+LEGACY_QUERY = f"""
+    SELECT signature_key, (1 - (embedding <=> $1)) as similarity
+    FROM {TABLE}
+    WHERE (1 - (embedding <=> $1)) >= $2
+    AND $4 = ANY(roles)
+    ORDER BY similarity DESC
+    LIMIT $3
+"""
+
+TOP_K_QUERY = f"""
+    SELECT signature_key, (1 - distance) as similarity
+    FROM (
+        SELECT signature_key, (embedding <=> $1) as distance
+        FROM {TABLE}
+        WHERE 'cache' = ANY(roles)
+        ORDER BY embedding <=> $1
+        LIMIT $3
+    ) AS nearest
+    WHERE (1 - distance) >= $2
+    ORDER BY distance
+"""
+
+
+def _vector(v: np.ndarray) -> str:
+    return "[" + ",".join(f"{x:.6f}" for x in v) + "]"
+
+
+def _random_unit(rng: np.random.Generator, n: int) -> np.ndarray:
+    vectors = rng.standard_normal((n, DIM)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+async def _fill(conn: asyncpg.Connection, rng: np.random.Generator, target: int) -> None:
+    current = await conn.fetchval(f"SELECT count(*) FROM {TABLE}")
+    remaining = target - current
+    batch = 2000
+    while remaining > 0:
+        n = min(batch, remaining)
+        vectors = _random_unit(rng, n)
+        roles = rng.choice(["cache", "example", "interaction"], size=n)
+        await conn.executemany(
+            f"INSERT INTO {TABLE} (signature_key, embedding, roles) VALUES ($1, $2::vector, $3)",
+            [(f"bench-{current + i}", _vector(vectors[i]), [str(roles[i])]) for i in range(n)],
+        )
+        current += n
+        remaining -= n
+    await conn.execute(f"ANALYZE {TABLE}")
+
+
+async def _time(conn, query, queries, args) -> tuple[float, float]:
+    stmt = await conn.prepare(query)
+    samples = []
+    for q in queries:
+        start = time.perf_counter()
+        await stmt.fetch(_vector(q), *args)
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.95) - 1]
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=3)
+    parser.add_argument("--threshold", type=float, default=0.90)
+    args = parser.parse_args()
+
+    conn = await asyncpg.connect(
+        host=os.getenv("CONTROL_DB_HOST", "localhost"),
+        port=int(os.getenv("CONTROL_DB_PORT", "5432")),
+        database=os.getenv("CONTROL_DB_NAME", "agent_control"),
+        user=os.getenv("CONTROL_DB_USER", "postgres"),
+        password=os.getenv("CONTROL_DB_PASSWORD", ""),
+    )
+    rng = np.random.default_rng(0)
+    try:
+        await conn.execute("CREATE EXTENSION IF NOT EXISTS vector")
+        await conn.execute(f"DROP TABLE IF EXISTS {TABLE}")
+        await conn.execute(
+            f"CREATE TABLE {TABLE} ("
+            f"signature_key TEXT PRIMARY KEY, embedding vector({DIM}), roles VARCHAR[])"
+        )
+        await conn.execute(
+            f"CREATE INDEX ON {TABLE} USING hnsw (embedding vector_cosine_ops) "
+            "WITH (m = 16, ef_construction = 64) WHERE 'cache' = ANY(roles)"
+        )
+
+        queries = _random_unit(rng, args.queries)
+        print(f"{'rows':>10} | {'legacy p50':>11} {'p95':>8} | {'top-k p50':>10} {'p95':>8}")
+        for size in sorted(args.sizes):
+            await _fill(conn, rng, size)
+            legacy = await _time(conn, LEGACY_QUERY, queries, (args.threshold, args.limit, "cache"))
+            top_k = await _time(conn, TOP_K_QUERY, queries, (args.threshold, args.limit))
+            print(
+                f"{size:>10} | {legacy[0]:>9.2f}ms {legacy[1]:>6.2f}ms | "
+                f"{top_k[0]:>8.2f}ms {top_k[1]:>6.2f}ms"
+            )
+    finally:
+        await conn.execute(f"DROP TABLE IF EXISTS {TABLE}")
+        await conn.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Benchmark parse time saved by the shared SQL AST cache.
+
+Replays the parse-heavy steps one query goes through (AST validation, LIMIT and
+identifier extraction, read-only checks, complexity analysis and the execution
+tool's AST gate) with the cache disabled and enabled, and reports parse time
+spent and saved per run.
+
+Usage:
+    PYTHONPATH=src python scripts/dev/benchmark_sql_parse_cache.py --runs 200
+"""
+
+import argparse
+import statistics
+import time
+
+from agent.nodes.validate import _extract_identifiers, _extract_limit
+from agent.validation.ast_validator import validate_sql
+from common.sql import ast_cache
+from common.sql.complexity import analyze_sql_complexity
+from dal.util.read_only import is_mutating_sql
+from mcp_server.tools.execute_sql_query import (
+    _query_contains_limit_or_offset,
+    _validate_sql_ast_failure,
+)
+
+QUERIES = [
+    "SELECT id, name FROM customers WHERE region = 'EU' ORDER BY name LIMIT 100",
+    """
+    WITH recent AS (
+        SELECT o.customer_id, SUM(o.total) AS spend
+        FROM orders o
+        WHERE o.created_at > NOW() - INTERVAL '30 days'
+        GROUP BY o.customer_id
+    )
+    SELECT c.id, c.name, r.spend
+    FROM customers c
+    JOIN recent r ON r.customer_id = c.id
+    LEFT JOIN segments s ON s.id = c.segment_id
+    WHERE s.name IN ('gold', 'platinum')
+    ORDER BY r.spend DESC
+    LIMIT 50
+    """,
+    """
+    SELECT p.category, COUNT(*) AS n, AVG(li.price) AS avg_price
+    FROM line_items li
+    JOIN products p ON p.id = li.product_id
+    WHERE li.order_id IN (SELECT id FROM orders WHERE status = 'shipped')
+    GROUP BY p.category
+    HAVING COUNT(*) > 10
+    """,
+]
+
+
+def _run_pipeline(sql: str) -> None:
+    validate_sql(sql, "postgres")
+    _extract_limit(sql)
+    _extract_identifiers(sql)
+    is_mutating_sql(sql, "postgres")
+    analyze_sql_complexity(sql)
+    _validate_sql_ast_failure(sql, "postgres")
+    _query_contains_limit_or_offset(sql, "postgres")
+
+
+def _bench(max_entries: int, runs: int) -> dict:
+    cache = ast_cache.SqlAstCache(max_entries)
+    ast_cache._cache = cache
+    durations = []
+    for i in range(runs):
+        # Vary the text per run so every run starts cold, as a new query would.
+        sql = f"SELECT * FROM ({QUERIES[i % len(QUERIES)]}) AS run_{i}"
+        start = time.perf_counter()
+        _run_pipeline(sql)
+        durations.append((time.perf_counter() - start) * 1000.0)
+    stats = cache.stats()
+    return {
+        "median_ms": statistics.median(durations),
+        "parse_ms_per_run": stats["parse_ms"] / runs,
+        "saved_ms_per_run": stats["saved_ms"] / runs,
+        "hits": stats["hits"],
+        "misses": stats["misses"],
+    }
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+
+    _bench(512, 10)  # warm imports and sqlglot internals
+    print(
+        f"{'cache':>8} {'median ms':>10} {'parse ms/run':>13} {'saved ms/run':>13} "
+        f"{'hits':>6} {'misses':>7}"
+    )
+    for label, max_entries in (("off", 0), ("on", 512)):
+        r = _bench(max_entries, args.runs)
+        print(
+            f"{label:>8} {r['median_ms']:>10.2f} {r['parse_ms_per_run']:>13.2f} "
+            f"{r['saved_ms_per_run']:>13.2f} {r['hits']:>6} {r['misses']:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+-- Migration: 007_agent_checkpoints
+-- Description: Add table for agent graph checkpoints offloaded from agent memory
+--
+-- Usage:
+--   psql -h $CONTROL_DB_HOST -U $CONTROL_DB_USER -d $CONTROL_DB_NAME -f scripts/migrations/007_agent_checkpoints.sql
+--   Or via docker: docker compose exec control-db psql -U postgres -d agent_control -f /migrations/007_agent_checkpoints.sql
+
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM _migrations WHERE name = '007_agent_checkpoints') THEN
+        RAISE NOTICE 'Migration 007_agent_checkpoints already applied, skipping';
+        RETURN;
+    END IF;
+
+    CREATE TABLE IF NOT EXISTS agent_checkpoints (
+        thread_id TEXT PRIMARY KEY,
+        payload BYTEA NOT NULL,
+        size_bytes INT NOT NULL,
+        expires_at TIMESTAMPTZ NOT NULL,
+        updated_at TIMESTAMPTZ DEFAULT NOW()
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_agent_checkpoints_expires_at
+        ON agent_checkpoints(expires_at);
+
+    INSERT INTO _migrations (name) VALUES ('007_agent_checkpoints');
+    RAISE NOTICE 'Migration 007_agent_checkpoints applied successfully';
+
+END $$;
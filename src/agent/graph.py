@@ -9,12 +9,10 @@ import time
 import uuid
 from typing import Any, Optional
 
-from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import END, StateGraph
 
 from agent.audit import AuditEventSource, AuditEventType, emit_audit_event
 from agent.models.termination import TerminationReason
-from agent.nodes.cache_lookup import cache_lookup_node
 from agent.nodes.clarify import clarify_node
 from agent.nodes.correct import correct_sql_node
 from agent.nodes.execute import validate_and_execute_node
@@ -22,6 +20,7 @@ from agent.nodes.generate import generate_sql_node
 from agent.nodes.plan import plan_sql_node
 from agent.nodes.retrieve import retrieve_context_node
 from agent.nodes.router import router_node
+from agent.nodes.speculative_retrieval import speculative_cache_lookup_node
 from agent.nodes.synthesize import synthesize_insight_node
 from agent.nodes.validate import validate_sql_node
 from agent.nodes.visualize import visualize_query_node
@@ -31,6 +30,7 @@ from agent.runtime_metrics import (
     record_truncation_event,
 )
 from agent.state import AgentState
+from agent.state.checkpointer import build_checkpointer, finish_thread
 from agent.state.decision_events import append_decision_event
 from agent.state.decision_summary import (
     build_decision_summary,
@@ -298,9 +298,12 @@ def route_after_cache_lookup(state: AgentState) -> str:
     Routes based on cache status:
     - If hit and valid (from_cache=True): go to AST validation (then execute)
     - If miss or invalid (from_cache=False): go to retrieve (schema lookup)
+    - If miss and retrieval already ran speculatively: go straight to router
     """
     if state.get("from_cache"):
         return "validate"
+    if state.get("speculative_retrieval_applied"):
+        return "router"
     return "retrieve"
 
 
@@ -902,6 +905,8 @@ def create_workflow() -> StateGraph:
     OR [retrieve → router → plan → generate → validate → execute]
 
     The key insight: explicit cache lookup node acts as entry point to optimize latency.
+    With AGENT_SPECULATIVE_RETRIEVAL, retrieval overlaps the cache lookup and a miss
+    continues at router.
 
     Returns:
         StateGraph: Configured workflow graph (not compiled)
@@ -909,7 +914,7 @@ def create_workflow() -> StateGraph:
     workflow = StateGraph(AgentState)
 
     # Add all nodes with telemetry context wrapping
-    workflow.add_node("cache_lookup", with_telemetry_context(cache_lookup_node))
+    workflow.add_node("cache_lookup", with_telemetry_context(speculative_cache_lookup_node))
     workflow.add_node("router", with_telemetry_context(router_node))
     workflow.add_node("clarify", with_telemetry_context(clarify_node))
     workflow.add_node("retrieve", with_telemetry_context(retrieve_context_node))
@@ -932,6 +937,7 @@ def create_workflow() -> StateGraph:
         {
             "validate": "validate",
             "retrieve": "retrieve",
+            "router": "router",
         },
     )
 
@@ -995,8 +1001,8 @@ def create_workflow() -> StateGraph:
     return workflow
 
 
-# Create checkpointer for interrupt support
-memory = MemorySaver()
+# Create checkpointer for interrupt support (bounded; see AGENT_CHECKPOINT_* settings)
+memory = build_checkpointer()
 
 # Compile workflow with checkpointer
 app = create_workflow().compile(checkpointer=memory)
@@ -1372,6 +1378,7 @@ async def run_agent_with_tracing(
                 result = inputs.copy()
                 try:
                     result = await app.ainvoke(inputs, config=config)
+                    finish_thread(memory, thread_id)
                     if "interaction_persisted" not in result:
                         result["interaction_persisted"] = interaction_persisted
                 except Exception as execute_err:
@@ -2056,6 +2063,7 @@ async def run_agent_with_tracing_stream(
                             if name == "LangGraph":
                                 final_output = event["data"]["output"]
 
+                    finish_thread(memory, thread_id)
                     if final_output:
                         result = final_output
                         # Ensure interaction persistence status is preserved
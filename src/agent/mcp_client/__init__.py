@@ -7,11 +7,13 @@ Exports:
 - MCPClient: Handles connection, tool discovery, and tool invocation
 - MCPToolWrapper: LangGraph-compatible tool with ainvoke()
 - McpClientManager: Manages connections with retry and reuse
+- McpSessionPool: Process-wide pool of multiplexed, long-lived sessions
 - RetryConfig: Configuration for retry behavior
 """
 
 from agent.mcp_client.manager import McpClientManager, RetryConfig
 from agent.mcp_client.sdk_client import MCPClient
+from agent.mcp_client.session_pool import McpSessionPool
 from agent.mcp_client.tool_wrapper import MCPToolWrapper
 
-__all__ = ["MCPClient", "MCPToolWrapper", "McpClientManager", "RetryConfig"]
+__all__ = ["MCPClient", "MCPToolWrapper", "McpClientManager", "McpSessionPool", "RetryConfig"]
@@ -2,6 +2,7 @@
 
 Provides resilient MCP tool invocation with:
 - Connection pooling and reuse (avoid per-call client creation)
+- Optional multiplexing over the process-wide session pool
 - Exponential backoff retries for transient failures
 - Transient vs semantic error classification
 """
@@ -247,7 +248,8 @@ class McpClientSession:
         """Initialize session with connected MCP client.
 
         Args:
-            mcp_client: Connected MCPClient instance.
+            mcp_client: Connected MCPClient instance, or an McpSessionPool that
+                leases a pooled session per call.
             retry_config: Retry configuration for tool calls.
         """
         self._mcp = mcp_client
@@ -378,6 +380,7 @@ def create_resilient_invoke_fn(
     tool_name: str,
     headers: Optional[dict] = None,
     retry_config: Optional[RetryConfig] = None,
+    pool: Optional[Any] = None,
 ):
     """Create an async invoke function with retry support.
 
@@ -390,12 +393,22 @@ def create_resilient_invoke_fn(
         tool_name: Name of the tool.
         headers: Optional headers.
         retry_config: Optional retry configuration.
+        pool: Optional McpSessionPool. When set, calls are multiplexed over
+            pooled sessions instead of opening a connection per call.
 
     Returns:
         Async function that invokes the tool with retry support.
     """
     config = retry_config or DEFAULT_RETRY_CONFIG
 
+    if pool is not None:
+        pooled_session = McpClientSession(pool, config)
+
+        async def invoke_pooled(arguments: dict) -> Any:
+            return await pooled_session.call_tool_with_retry(tool_name, arguments)
+
+        return invoke_pooled
+
     async def invoke(arguments: dict) -> Any:
         manager = McpClientManager(
             server_url=server_url,
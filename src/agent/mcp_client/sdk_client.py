@@ -53,6 +53,7 @@ class MCPClient:
         self.transport = transport.lower()
         self.headers = headers or {}
         self._session: Optional[ClientSession] = None
+        self.server_version: Optional[str] = None
         self._streams = None
         self._exit_stack = None
 
@@ -102,7 +103,9 @@ class MCPClient:
                 )
 
             session = await stack.enter_async_context(ClientSession(read_stream, write_stream))
-            await session.initialize()
+            init_result = await session.initialize()
+            server_info = getattr(init_result, "serverInfo", None)
+            self.server_version = getattr(server_info, "version", None)
 
             self._session = session
             try:
@@ -110,6 +113,17 @@ class MCPClient:
             finally:
                 self._session = None
 
+    async def ping(self) -> None:
+        """Send an MCP ping to verify the session is still responsive.
+
+        Raises:
+            RuntimeError: If called outside of connect() context.
+        """
+        if self._session is None:
+            raise RuntimeError("MCPClient.ping() must be called within connect()")
+
+        await self._session.send_ping()
+
     async def list_tools(self) -> list[ToolInfo]:
         """List available tools from the MCP server.
 
@@ -0,0 +1,462 @@
+"""Process-wide pool of long-lived MCP sessions.
+
+Keeps a small set of initialized MCP sessions open for the lifetime of the
+process so agent nodes do not pay an SSE handshake per node or per tool call:
+- Sessions are multiplexed: several in-flight calls share one session
+- The tool catalog is cached and refreshed on TTL or server version change
+- Idle sessions are health-checked before reuse and replaced when broken
+- Pool size, acquire wait time and reconnects are exported as metrics
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from agent.mcp_client.manager import is_transient_error
+from agent.mcp_client.sdk_client import MCPClient, ToolInfo
+from common.config.env import get_env_bool, get_env_float, get_env_int
+from common.observability.metrics import agent_metrics
+
+logger = logging.getLogger(__name__)
+
+# Per-run headers cannot be bound to a shared connection; they travel as
+# reserved tool arguments instead (see agent.mcp_client.tool_wrapper).
+PER_RUN_HEADER_NAMES = frozenset({"x-run-id", "x-request-id"})
+
+
+def _safe_env_int(name: str, default: int, minimum: int) -> int:
+    try:
+        value = get_env_int(name, default)
+    except ValueError:
+        return default
+    if value is None:
+        return default
+    return max(minimum, int(value))
+
+
+def _safe_env_float(name: str, default: float, minimum: float) -> float:
+    try:
+        value = get_env_float(name, default)
+    except ValueError:
+        return default
+    if value is None:
+        return default
+    return max(minimum, float(value))
+
+
+def is_session_pool_enabled() -> bool:
+    """Return whether agent tool calls should use the shared MCP session pool."""
+    try:
+        return get_env_bool("MCP_SESSION_POOL_ENABLED", True) is not False
+    except ValueError:
+        return True
+
+
+@dataclass(frozen=True)
+class SessionPoolConfig:
+    """Sizing and freshness settings for the MCP session pool."""
+
+    max_sessions: int = 4
+    max_concurrent_calls_per_session: int = 16
+    catalog_ttl_seconds: float = 300.0
+    health_check_interval_seconds: float = 30.0
+    health_check_timeout_seconds: float = 5.0
+    connect_timeout_seconds: float = 15.0
+
+    @classmethod
+    def from_env(cls) -> "SessionPoolConfig":
+        """Build pool configuration from environment variables."""
+        return cls(
+            max_sessions=_safe_env_int("MCP_SESSION_POOL_MAX_SESSIONS", 4, 1),
+            max_concurrent_calls_per_session=_safe_env_int(
+                "MCP_SESSION_POOL_MAX_CONCURRENT_CALLS", 16, 1
+            ),
+            catalog_ttl_seconds=_safe_env_float("MCP_TOOL_CATALOG_TTL_SECONDS", 300.0, 0.0),
+            health_check_interval_seconds=_safe_env_float(
+                "MCP_SESSION_HEALTH_CHECK_INTERVAL_SECONDS", 30.0, 0.0
+            ),
+            health_check_timeout_seconds=_safe_env_float(
+                "MCP_SESSION_HEALTH_CHECK_TIMEOUT_SECONDS", 5.0, 0.1
+            ),
+            connect_timeout_seconds=_safe_env_float(
+                "MCP_SESSION_CONNECT_TIMEOUT_SECONDS", 15.0, 0.1
+            ),
+        )
+
+
+class _PooledSession:
+    """One long-lived MCP session owned by a dedicated background task.
+
+    The MCP transports are built on anyio task groups, so the connect context
+    must be entered and exited by the same task. The owner task holds the
+    session open until the pool asks it to close.
+    """
+
+    def __init__(self, client: MCPClient):
+        self.client = client
+        self.mcp: Any = None
+        self.server_version: Optional[str] = None
+        self.in_flight = 0
+        self.last_used_at = time.monotonic()
+        self.broken = False
+        self.error: Optional[BaseException] = None
+        self._ready = asyncio.Event()
+        self._closing = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    async def open(self, timeout_seconds: float) -> None:
+        self._task = asyncio.create_task(self._run(), name="mcp-pooled-session")
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout=timeout_seconds)
+        except asyncio.TimeoutError:
+            await self.close()
+            raise TimeoutError("Timed out opening pooled MCP session")
+        if self.error is not None:
+            raise self.error
+
+    async def _run(self) -> None:
+        try:
+            async with self.client.connect() as mcp:
+                self.mcp = mcp
+                version = getattr(mcp, "server_version", None)
+                self.server_version = version if isinstance(version, str) else None
+                self._ready.set()
+                await self._closing.wait()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            self.error = exc
+            if self._ready.is_set():
+                logger.warning("Pooled MCP session terminated: %s", exc)
+        finally:
+            self.broken = True
+            self._ready.set()
+
+    @property
+    def usable(self) -> bool:
+        return (
+            not self.broken
+            and self.mcp is not None
+            and self._task is not None
+            and not self._task.done()
+        )
+
+    async def ping(self, timeout_seconds: float) -> bool:
+        try:
+            await asyncio.wait_for(self.mcp.ping(), timeout=timeout_seconds)
+            return True
+        except Exception as exc:
+            logger.info("Pooled MCP session failed health check: %s", exc)
+            return False
+
+    async def close(self) -> None:
+        self.broken = True
+        self._closing.set()
+        task = self._task
+        if task is None or task.done():
+            return
+        try:
+            await asyncio.wait_for(asyncio.shield(task), timeout=5.0)
+        except Exception:
+            task.cancel()
+
+
+class McpSessionPool:
+    """Pool of multiplexed MCP sessions with a cached tool catalog.
+
+    Example:
+        pool = get_mcp_session_pool("http://localhost:8000/messages", "sse", headers)
+        tools = await pool.get_tool_catalog()
+        result = await pool.call_tool("list_tables", {"tenant_id": 1})
+    """
+
+    def __init__(
+        self,
+        server_url: str,
+        transport: str = "sse",
+        headers: Optional[dict] = None,
+        config: Optional[SessionPoolConfig] = None,
+        client_factory: Optional[Callable[[], MCPClient]] = None,
+    ):
+        """Initialize an empty pool; sessions are opened lazily.
+
+        Args:
+            server_url: MCP server endpoint URL.
+            transport: Transport protocol ("sse" or "streamable-http").
+            headers: Connection-level headers (auth only; no per-run headers).
+            config: Optional pool configuration. Defaults to values from env.
+            client_factory: Optional factory for MCPClient instances.
+        """
+        self.server_url = server_url
+        self.transport = transport
+        self.headers = dict(headers or {})
+        self.config = config or SessionPoolConfig.from_env()
+        self._client_factory = client_factory or (
+            lambda: MCPClient(
+                server_url=self.server_url, transport=self.transport, headers=self.headers
+            )
+        )
+        self._sessions: List[_PooledSession] = []
+        self._opening = 0
+        self._condition = asyncio.Condition()
+        self._catalog: Optional[List[ToolInfo]] = None
+        self._catalog_fetched_at: float = 0.0
+        self._catalog_server_version: Optional[str] = None
+        self._catalog_lock = asyncio.Lock()
+        self._reconnects = 0
+        self._closed = False
+
+    @property
+    def size(self) -> int:
+        """Return the number of live sessions currently held by the pool."""
+        return sum(1 for session in self._sessions if session.usable)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return a point-in-time summary of pool state for diagnostics."""
+        return {
+            "sessions": self.size,
+            "in_flight": sum(session.in_flight for session in self._sessions),
+            "reconnects": self._reconnects,
+            "catalog_cached": self._catalog is not None,
+            "catalog_server_version": self._catalog_server_version,
+        }
+
+    def _record_size(self) -> None:
+        agent_metrics.record_histogram(
+            "agent.mcp_pool.sessions",
+            float(self.size),
+            description="Live pooled MCP sessions observed at acquire time",
+        )
+
+    def _record_reconnect(self, reason: str) -> None:
+        self._reconnects += 1
+        agent_metrics.add_counter(
+            "agent.mcp_pool.reconnects_total",
+            description="Pooled MCP sessions replaced after failure",
+            attributes={"reason": reason},
+        )
+
+    async def _discard(self, session: _PooledSession, reason: str) -> None:
+        async with self._condition:
+            if session in self._sessions:
+                self._sessions.remove(session)
+                self._record_reconnect(reason)
+            self._condition.notify_all()
+        await session.close()
+
+    def _pick_session(self) -> Optional[_PooledSession]:
+        limit = self.config.max_concurrent_calls_per_session
+        candidates = [s for s in self._sessions if s.usable and s.in_flight < limit]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda s: s.in_flight)
+
+    async def _open_session(self) -> _PooledSession:
+        session = _PooledSession(self._client_factory())
+        await session.open(self.config.connect_timeout_seconds)
+        if (
+            self._catalog_server_version is not None
+            and session.server_version is not None
+            and session.server_version != self._catalog_server_version
+        ):
+            logger.info(
+                "MCP server version changed (%s -> %s); invalidating tool catalog.",
+                self._catalog_server_version,
+                session.server_version,
+            )
+            self.invalidate_catalog()
+        return session
+
+    async def _acquire(self) -> _PooledSession:
+        if self._closed:
+            raise RuntimeError("MCP session pool is closed")
+        started_at = time.monotonic()
+        while True:
+            async with self._condition:
+                # Prune sessions whose owner task has exited.
+                for dead in [s for s in self._sessions if not s.usable]:
+                    self._sessions.remove(dead)
+                    self._record_reconnect("session_closed")
+                session = self._pick_session()
+                # Open one session at a time so a cold-start burst multiplexes
+                # over the first connection instead of stampeding the server.
+                should_open = (
+                    session is None
+                    and self._opening == 0
+                    and len(self._sessions) < self.config.max_sessions
+                )
+                if session is None and not should_open:
+                    await self._condition.wait()
+                    continue
+                if session is not None:
+                    session.in_flight += 1
+                else:
+                    self._opening += 1
+
+            if should_open:
+                opened: Optional[_PooledSession] = None
+                try:
+                    opened = await self._open_session()
+                finally:
+                    async with self._condition:
+                        self._opening -= 1
+                        if opened is not None:
+                            opened.in_flight += 1
+                            self._sessions.append(opened)
+                        self._condition.notify_all()
+                session = opened
+            elif (
+                time.monotonic() - session.last_used_at >= self.config.health_check_interval_seconds
+            ):
+                if not await session.ping(self.config.health_check_timeout_seconds):
+                    await self._release(session)
+                    await self._discard(session, "health_check_failed")
+                    continue
+
+            agent_metrics.record_histogram(
+                "agent.mcp_pool.acquire_wait_ms",
+                (time.monotonic() - started_at) * 1000.0,
+                description="Time spent waiting for a pooled MCP session",
+                unit="ms",
+            )
+            self._record_size()
+            return session
+
+    async def _release(self, session: _PooledSession) -> None:
+        async with self._condition:
+            session.in_flight = max(0, session.in_flight - 1)
+            session.last_used_at = time.monotonic()
+            self._condition.notify_all()
+
+    @asynccontextmanager
+    async def session(self):
+        """Lease a pooled session for one or more calls.
+
+        Yields:
+            Connected MCPClient shared with other concurrent leases.
+        """
+        pooled = await self._acquire()
+        try:
+            yield pooled.mcp
+        except Exception as exc:
+            await self._release(pooled)
+            if _is_session_failure(pooled, exc):
+                await self._discard(pooled, "transient_error")
+            raise
+        else:
+            await self._release(pooled)
+
+    async def call_tool(self, name: str, arguments: dict) -> Any:
+        """Invoke a tool over a pooled session (single attempt)."""
+        async with self.session() as mcp:
+            return await mcp.call_tool(name, arguments)
+
+    async def list_tools(self) -> List[ToolInfo]:
+        """List tools, served from the cached catalog when fresh."""
+        return await self.get_tool_catalog()
+
+    def invalidate_catalog(self) -> None:
+        """Drop the cached tool catalog so the next read refetches it."""
+        self._catalog = None
+        self._catalog_fetched_at = 0.0
+
+    def _catalog_is_fresh(self) -> bool:
+        if self._catalog is None:
+            return False
+        ttl = self.config.catalog_ttl_seconds
+        return ttl > 0 and time.monotonic() - self._catalog_fetched_at < ttl
+
+    async def get_tool_catalog(self) -> List[ToolInfo]:
+        """Return the server tool catalog, refreshing on TTL expiry or version change."""
+        if self._catalog_is_fresh():
+            return list(self._catalog)
+
+        async with self._catalog_lock:
+            if self._catalog_is_fresh():
+                return list(self._catalog)
+            async with self.session() as mcp:
+                tool_infos = await mcp.list_tools()
+                version = getattr(mcp, "server_version", None)
+            self._catalog = list(tool_infos)
+            self._catalog_fetched_at = time.monotonic()
+            self._catalog_server_version = version if isinstance(version, str) else None
+            agent_metrics.add_counter(
+                "agent.mcp_pool.catalog_refresh_total",
+                description="MCP tool catalog fetches from the server",
+            )
+            return list(self._catalog)
+
+    async def close(self) -> None:
+        """Close every pooled session."""
+        self._closed = True
+        async with self._condition:
+            sessions = list(self._sessions)
+            self._sessions.clear()
+            self._condition.notify_all()
+        for session in sessions:
+            await session.close()
+
+
+def _is_session_failure(session: _PooledSession, exc: Exception) -> bool:
+    """Return True when an error means the session itself should be replaced."""
+    if not session.usable:
+        return True
+    # Tool-level failures arrive over a healthy session; keep it.
+    if str(exc).startswith("MCP tool "):
+        return False
+    return is_transient_error(exc)
+
+
+_POOLS: Dict[Tuple[int, str, str, Tuple[Tuple[str, str], ...]], McpSessionPool] = {}
+_POOL_LOOPS: Dict[Tuple[int, str, str, Tuple[Tuple[str, str], ...]], Any] = {}
+
+
+def connection_headers(headers: Optional[dict]) -> dict:
+    """Return only the headers that are safe to bind to a shared connection."""
+    return {
+        key: value
+        for key, value in (headers or {}).items()
+        if key.lower() not in PER_RUN_HEADER_NAMES
+    }
+
+
+def get_mcp_session_pool(
+    server_url: str,
+    transport: str,
+    headers: Optional[dict] = None,
+    client_factory: Optional[Callable[[], MCPClient]] = None,
+) -> McpSessionPool:
+    """Return the process-wide pool for a server endpoint on the running loop."""
+    loop = asyncio.get_running_loop()
+    pooled_headers = connection_headers(headers)
+    key = (id(loop), server_url, transport, tuple(sorted(pooled_headers.items())))
+    pool = _POOLS.get(key)
+    if pool is None or _POOL_LOOPS.get(key) is not loop or pool._closed:
+        pool = McpSessionPool(
+            server_url=server_url,
+            transport=transport,
+            headers=pooled_headers,
+            client_factory=client_factory,
+        )
+        _POOLS[key] = pool
+        _POOL_LOOPS[key] = loop
+    return pool
+
+
+async def close_mcp_session_pools() -> None:
+    """Close all pools bound to the running loop (service shutdown hook)."""
+    loop = asyncio.get_running_loop()
+    for key in [k for k, bound in _POOL_LOOPS.items() if bound is loop]:
+        pool = _POOLS.pop(key, None)
+        _POOL_LOOPS.pop(key, None)
+        if pool is not None:
+            await pool.close()
+
+
+def reset_mcp_session_pools() -> None:
+    """Forget all pools without awaiting shutdown (test utility)."""
+    _POOLS.clear()
+    _POOL_LOOPS.clear()
@@ -26,6 +26,7 @@ from common.models.tool_envelopes import GenericToolMetadata, ToolResponseEnvelo
 from common.models.tool_errors import tool_error_invalid_request
 from mcp_server.utils.reserved_fields import (
     REQUEST_ID_RESERVED_FIELD,
+    RUN_ID_RESERVED_FIELD,
     TRACE_CONTEXT_RESERVED_FIELD,
     split_reserved_tool_metadata,
 )
@@ -166,6 +167,19 @@ class MCPToolWrapper:
             )
             outbound_input[REQUEST_ID_RESERVED_FIELD] = str(request_id)
 
+            # Pooled sessions share one connection, so the run id cannot ride on
+            # the X-Run-ID header; forward it per call instead.
+            sticky_metadata = telemetry.capture_context().sticky_metadata
+            if not isinstance(sticky_metadata, dict):
+                sticky_metadata = {}
+            outbound_run_id = (
+                reserved_metadata.get(RUN_ID_RESERVED_FIELD)
+                or run_id
+                or sticky_metadata.get("run_id")
+            )
+            if outbound_run_id:
+                outbound_input[RUN_ID_RESERVED_FIELD] = str(outbound_run_id)
+
             trace_carrier: dict[str, str] = {}
             telemetry.inject_context(trace_carrier)
             traceparent = trace_carrier.get("traceparent")
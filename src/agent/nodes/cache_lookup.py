@@ -15,6 +15,29 @@ from common.observability.metrics import agent_metrics
 logger = logging.getLogger(__name__)
 
 
+async def _get_current_catalog_snapshot_id(tools, tenant_id: Optional[int]) -> Optional[str]:
+    snapshot_tool = next((t for t in tools if t.name == "get_schema_snapshot_id"), None)
+    if not snapshot_tool:
+        return None
+
+    try:
+        raw = await snapshot_tool.ainvoke({"tenant_id": tenant_id})
+    except Exception as e:
+        logger.warning(
+            "Catalog snapshot fetch failed",
+            extra={"error_type": type(e).__name__, "error": str(e)},
+        )
+        return None
+
+    parsed = parse_tool_output(raw)
+    if isinstance(parsed, list) and parsed:
+        parsed = parsed[0]
+    parsed = unwrap_envelope(parsed)
+    if not isinstance(parsed, dict):
+        return None
+    return parsed.get("schema_snapshot_id")
+
+
 async def _get_current_schema_snapshot_id(
     tools, user_query: str, tenant_id: Optional[int]
 ) -> Optional[str]:
@@ -196,11 +219,21 @@ async def cache_lookup_node(state: AgentState) -> dict:
                 span.set_attribute("cache.cache_id", cache_id)
 
             if get_env_bool("AGENT_CACHE_SCHEMA_VALIDATION", False):
-                cached_snapshot_id = cache_metadata.get("schema_snapshot_id")
+                # Prefer the server's catalog fingerprint: it is one cheap tool call,
+                # whereas resolving a subgraph snapshot id re-runs retrieval.
+                cached_snapshot_id = cache_metadata.get("catalog_snapshot_id")
+                current_snapshot_id = None
+                if cached_snapshot_id:
+                    current_snapshot_id = await _get_current_catalog_snapshot_id(tools, tenant_id)
+                if current_snapshot_id:
+                    span.set_attribute("cache.snapshot_source", "catalog")
+                else:
+                    cached_snapshot_id = cache_metadata.get("schema_snapshot_id")
                 if not cached_snapshot_id:
                     span.set_attribute("cache.snapshot_missing", True)
                 else:
-                    current_snapshot_id = resolve_pinned_schema_snapshot_id(state)
+                    if not current_snapshot_id:
+                        current_snapshot_id = resolve_pinned_schema_snapshot_id(state)
                     if not current_snapshot_id or current_snapshot_id == "unknown":
                         current_snapshot_id = await _get_current_schema_snapshot_id(
                             tools, user_query, tenant_id
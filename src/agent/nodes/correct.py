@@ -72,7 +72,7 @@ def _append_bounded_correction_event(
     return events, (existing_truncated or dropped_now > 0), total_dropped
 
 
-def correct_sql_node(state: AgentState) -> dict:
+async def correct_sql_node(state: AgentState) -> dict:
     """
     Node: CorrectSQL.
 
@@ -414,7 +414,7 @@ Return ONLY the corrected SQL query. No markdown, no explanations.""",
 
             start_time = time.monotonic()
             try:
-                response = chain.invoke(
+                response = await chain.ainvoke(
                     {
                         "correction_strategy": correction_strategy,
                         "taxonomy_context": taxonomy_context,
@@ -316,6 +316,9 @@ async def validate_and_execute_node(state: AgentState) -> dict:
                 "page_token": state.get("page_token"),
                 "page_size": state.get("page_size"),
             }
+            if pinned_snapshot_id:
+                # Scopes the server-side result cache to the schema the SQL was written for
+                execute_payload["schema_snapshot_id"] = pinned_snapshot_id
             interactive_session = bool(state.get("interactive_session"))
             prefetch_enabled, prefetch_max_concurrency, prefetch_reason = get_prefetch_config(
                 interactive_session
@@ -254,16 +254,23 @@ async def generate_sql_node(state: AgentState) -> dict:
         if interaction_id:
             span.set_attribute("interaction_id", interaction_id)
 
-        try:
-            few_shot_examples = await get_few_shot_examples(
-                user_query,
-                tenant_id=tenant_id or 1,
-                span=span,
-                interaction_id=interaction_id,
-            )
-        except Exception as e:
-            logger.warning(f"Could not retrieve few-shot examples: {e}")
-            few_shot_examples = ""
+        prefetched = state.get("prefetched_few_shot") or {}
+        if prefetched.get("query") == user_query and prefetched.get("tenant_id") == (
+            tenant_id or 1
+        ):
+            few_shot_examples = prefetched.get("examples") or ""
+            span.set_attribute("few_shot.prefetched", True)
+        else:
+            try:
+                few_shot_examples = await get_few_shot_examples(
+                    user_query,
+                    tenant_id=tenant_id or 1,
+                    span=span,
+                    interaction_id=interaction_id,
+                )
+            except Exception as e:
+                logger.warning(f"Could not retrieve few-shot examples: {e}")
+                few_shot_examples = ""
 
         # Use schema_context directly from retrieve node (now powered by semantic subgraph)
         # No need for redundant get_table_schema call - graph already contains full schema
@@ -428,7 +435,7 @@ Rules:
         # Generate SQL (MLflow autolog will capture token usage)
         start_time = time.monotonic()
         try:
-            response = chain.invoke(
+            response = await chain.ainvoke(
                 {
                     "schema_context": schema_context_to_use,
                     "question": user_query,
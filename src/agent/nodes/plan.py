@@ -186,7 +186,7 @@ Generate the SQL execution plan:""",
 
         chain = prompt | get_llm(temperature=0, seed=state.get("seed"))
 
-        response = chain.invoke(
+        response = await chain.ainvoke(
             {
                 "schema_context": schema_context,
                 "question": user_query,
@@ -0,0 +1,182 @@
+"""Cache lookup with speculative schema retrieval and few-shot recommendation.
+
+When enabled, retrieval (``get_semantic_subgraph``) and few-shot recommendation
+start concurrently with the cache lookup. A cache hit cancels them; a miss
+hands their results straight to the router so retrieval is not paid in series.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from agent.nodes.cache_lookup import cache_lookup_node
+from agent.nodes.generate import get_few_shot_examples
+from agent.nodes.retrieve import retrieve_context_node
+from agent.state import AgentState
+from agent.telemetry import telemetry
+from agent.telemetry_schema import SpanKind, TelemetryKeys
+from common.config.env import get_env_bool, get_env_list
+from common.observability.metrics import agent_metrics
+
+logger = logging.getLogger(__name__)
+
+
+# Also clears speculative results carried over from an earlier turn
+_NOT_APPLIED = {"speculative_retrieval_applied": False, "prefetched_few_shot": None}
+
+
+def speculative_retrieval_enabled(tenant_id: Optional[int]) -> bool:
+    """Return whether speculative retrieval is enabled for ``tenant_id``.
+
+    ``AGENT_SPECULATIVE_RETRIEVAL`` turns the mode on. When
+    ``AGENT_SPECULATIVE_RETRIEVAL_TENANTS`` is set, only the listed tenants
+    speculate; ``AGENT_SPECULATIVE_RETRIEVAL_DISABLED_TENANTS`` opts tenants out.
+    """
+    try:
+        if not get_env_bool("AGENT_SPECULATIVE_RETRIEVAL", False):
+            return False
+    except ValueError:
+        return False
+    tenant_key = str(tenant_id) if tenant_id is not None else ""
+    if tenant_key in get_env_list("AGENT_SPECULATIVE_RETRIEVAL_DISABLED_TENANTS", []):
+        return False
+    allowlist = get_env_list("AGENT_SPECULATIVE_RETRIEVAL_TENANTS", [])
+    return not allowlist or tenant_key in allowlist
+
+
+class _SpeculativeTask:
+    """A background task that remembers how long it ran."""
+
+    def __init__(self, name: str, coro) -> None:
+        self.name = name
+        self.started = time.monotonic()
+        self.finished: Optional[float] = None
+        self.task = asyncio.create_task(coro, name=f"speculative-{name}")
+        self.task.add_done_callback(self._mark_finished)
+
+    def _mark_finished(self, _task: asyncio.Task) -> None:
+        self.finished = time.monotonic()
+
+    def elapsed_ms(self) -> float:
+        end = self.finished if self.finished is not None else time.monotonic()
+        return max(0.0, (end - self.started) * 1000.0)
+
+    async def cancel(self) -> float:
+        """Cancel the task and return the milliseconds of work it did."""
+        if not self.task.done():
+            self.task.cancel()
+        try:
+            await self.task
+        except BaseException:
+            pass
+        return self.elapsed_ms()
+
+    async def result(self) -> Any:
+        """Return the task result, or None if it failed."""
+        try:
+            return await self.task
+        except Exception as e:
+            logger.warning("Speculative %s failed: %s", self.name, e)
+            return None
+
+
+def _record_outcome(outcome: str) -> None:
+    agent_metrics.add_counter(
+        "agent.speculative_retrieval.total",
+        attributes={"outcome": outcome},
+        description="Speculative retrieval outcomes (used/wasted/failed)",
+    )
+
+
+def _record_ms(name: str, value_ms: float, description: str) -> None:
+    agent_metrics.record_histogram(name, value=value_ms, unit="ms", description=description)
+
+
+async def speculative_cache_lookup_node(state: AgentState) -> dict:
+    """
+    Node: CacheLookup, optionally overlapped with retrieval.
+
+    Always sets ``speculative_retrieval_applied`` and ``prefetched_few_shot``
+    so later nodes never act on values left over from an earlier turn.
+    """
+    tenant_id = state.get("tenant_id")
+    explicit_sql = state.get("from_cache") and state.get("current_sql")
+    if explicit_sql or not speculative_retrieval_enabled(tenant_id):
+        result = await cache_lookup_node(state)
+        return {**result, **_NOT_APPLIED}
+
+    with telemetry.start_span(
+        name="speculative_cache_lookup",
+        span_type=SpanKind.AGENT_NODE,
+    ) as span:
+        span.set_attribute(TelemetryKeys.EVENT_TYPE, SpanKind.AGENT_NODE)
+        span.set_attribute(TelemetryKeys.EVENT_NAME, "speculative_cache_lookup")
+        if tenant_id:
+            span.set_attribute("tenant_id", tenant_id)
+
+        messages = state["messages"]
+        user_query = state.get("active_query") or (messages[-1].content if messages else "")
+        few_shot_tenant = tenant_id or 1
+
+        retrieval = _SpeculativeTask("retrieval", retrieve_context_node(state))
+        few_shot = _SpeculativeTask(
+            "few_shot",
+            get_few_shot_examples(
+                user_query, tenant_id=few_shot_tenant, interaction_id=state.get("interaction_id")
+            ),
+        )
+
+        lookup_start = time.monotonic()
+        try:
+            result = await cache_lookup_node(state)
+        except BaseException:
+            await retrieval.cancel()
+            await few_shot.cancel()
+            raise
+        lookup_ms = (time.monotonic() - lookup_start) * 1000.0
+        span.set_attribute("speculative.cache_lookup_ms", lookup_ms)
+
+        if result.get("from_cache"):
+            wasted_ms = await retrieval.cancel() + await few_shot.cancel()
+            span.set_attribute("speculative.outcome", "wasted")
+            span.set_attribute("speculative.wasted_ms", wasted_ms)
+            _record_outcome("wasted")
+            _record_ms(
+                "agent.speculative_retrieval.wasted_ms",
+                wasted_ms,
+                "Speculative retrieval work discarded after a cache hit",
+            )
+            return {**result, **_NOT_APPLIED}
+
+        retrieved = await retrieval.result()
+        examples = await few_shot.result()
+        if not isinstance(retrieved, dict):
+            span.set_attribute("speculative.outcome", "failed")
+            _record_outcome("failed")
+            return {**result, **_NOT_APPLIED}
+
+        # Retrieval ran under the cache lookup, so the overlap is latency saved
+        saved_ms = min(lookup_ms, retrieval.elapsed_ms())
+        span.set_attribute("speculative.outcome", "used")
+        span.set_attribute("speculative.saved_ms", saved_ms)
+        _record_outcome("used")
+        _record_ms(
+            "agent.speculative_retrieval.saved_ms",
+            saved_ms,
+            "Retrieval latency hidden behind the cache lookup",
+        )
+
+        update: Dict[str, Any] = {
+            **result,
+            **_NOT_APPLIED,
+            **retrieved,
+            "speculative_retrieval_applied": True,
+        }
+        if examples is not None:
+            update["prefetched_few_shot"] = {
+                "query": user_query,
+                "tenant_id": few_shot_tenant,
+                "examples": examples,
+            }
+        return update
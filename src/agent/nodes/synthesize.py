@@ -55,7 +55,7 @@ def _question_implies_existence(question: str) -> bool:
     return False
 
 
-def synthesize_insight_node(state: AgentState) -> dict:
+async def synthesize_insight_node(state: AgentState) -> dict:
     """
     Node 6: SynthesizeInsight.
 
@@ -307,7 +307,7 @@ Be concise but informative. Use numbers and data from the results.
         )
         chain = prompt | get_llm(temperature=synthesize_temperature, seed=state.get("seed"))
 
-        response = chain.invoke(
+        response = await chain.ainvoke(
             {
                 "question": original_question,
                 "results": result_str,
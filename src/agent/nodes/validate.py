@@ -4,7 +4,6 @@ import json
 import time
 from typing import Dict, Optional, Set, Tuple
 
-import sqlglot
 from sqlglot import exp
 
 from agent.state import AgentState
@@ -14,11 +13,12 @@ from agent.validation.ast_validator import validate_sql
 from common.config.env import get_env_bool, get_env_int, get_env_str
 from common.constants.reason_codes import ValidationReportRuleId
 from common.sanitization.text import redact_sensitive_info
+from common.sql.ast_cache import parse_sql_one
 
 
 def _extract_limit(sql_query: str) -> Tuple[bool, Optional[int]]:
     try:
-        expression = sqlglot.parse_one(sql_query)
+        expression = parse_sql_one(sql_query, copy=False)
     except Exception:
         return False, None
 
@@ -60,7 +60,7 @@ def _build_schema_binding(raw_schema_context: list[dict]) -> Dict[str, Set[str]]
 
 def _extract_identifiers(sql_query: str) -> Tuple[Set[str], Set[Tuple[str, str]]]:
     try:
-        expression = sqlglot.parse_one(sql_query)
+        expression = parse_sql_one(sql_query, copy=False)
     except Exception:
         return set(), set()
 
@@ -246,6 +246,13 @@ class AgentState(TypedDict):
     # Structure: {"sql": str, "original_query": str, "reason": str}
     rejected_cache_context: Optional[dict]
 
+    # Whether retrieval ran concurrently with cache lookup (router follows directly)
+    speculative_retrieval_applied: Optional[bool]
+
+    # Few-shot examples fetched during speculative retrieval
+    # Structure: {"query": str, "tenant_id": int, "examples": str}
+    prefetched_few_shot: Optional[dict]
+
     # =========================================================================
     # Feedback and Interaction Fields
     # =========================================================================
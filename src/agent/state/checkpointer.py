@@ -0,0 +1,533 @@
+"""Bounded, evicting LangGraph checkpointer for the agent graph.
+
+``MemorySaver`` keeps every checkpoint of every thread for the life of the
+process. ``BoundedMemorySaver`` adds:
+
+- per-thread LRU and TTL eviction, plus a byte budget across all threads;
+- compaction that keeps only the latest checkpoint of a finished run;
+- optional offload of evicted threads' latest checkpoints to the control-plane
+  database, restored transparently on the next async read of that thread.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import ChannelVersions, Checkpoint, CheckpointMetadata
+from langgraph.checkpoint.memory import InMemorySaver
+
+from common.config.env import get_env_bool, get_env_int
+from common.observability.metrics import agent_metrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_THREADS = 1000
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_TTL_SECONDS = 3600
+DEFAULT_PURGE_INTERVAL_SECONDS = 300
+
+BlobKey = Tuple[str, str, str, Any]  # (thread_id, checkpoint_ns, channel, version)
+CheckpointKey = Tuple[str, str, str]  # (thread_id, checkpoint_ns, checkpoint_id)
+
+
+@dataclass
+class _ThreadUsage:
+    bytes: int = 0
+    last_access: float = 0.0
+    blob_keys: Set[BlobKey] = field(default_factory=set)
+    checkpoint_keys: Set[CheckpointKey] = field(default_factory=set)
+
+
+def _typed_size(value: Tuple[str, bytes]) -> int:
+    return len(value[0]) + len(value[1])
+
+
+def _encode_typed(value: Tuple[str, bytes]) -> List[str]:
+    return [value[0], base64.b64encode(value[1]).decode("ascii")]
+
+
+def _decode_typed(value: Sequence[str]) -> Tuple[str, bytes]:
+    return value[0], base64.b64decode(value[1])
+
+
+class ControlPlaneCheckpointStore:
+    """Stores offloaded thread checkpoints in the control-plane ``agent_checkpoints`` table."""
+
+    def __init__(
+        self,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS * 24,
+        purge_interval_seconds: float = DEFAULT_PURGE_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the store; rows older than ``ttl_seconds`` are ignored and purged.
+
+        ``purge_expired`` deletes expired rows at most once per ``purge_interval_seconds``.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.purge_interval_seconds = purge_interval_seconds
+        self._clock = clock
+        self._last_purge: Optional[float] = None
+        self._init_attempted = False
+
+    async def _ready(self) -> bool:
+        from mcp_server.config.control_plane import ControlPlaneDatabase
+
+        # The agent may run without the MCP server having initialized the pool
+        if not ControlPlaneDatabase.is_configured() and not self._init_attempted:
+            self._init_attempted = True
+            await ControlPlaneDatabase.init()
+        return ControlPlaneDatabase.is_configured()
+
+    async def save(self, thread_id: str, payload: bytes) -> None:
+        """Upsert the offloaded checkpoint payload for ``thread_id``."""
+        from mcp_server.config.control_plane import ControlPlaneDatabase
+
+        if not await self._ready():
+            return
+        async with ControlPlaneDatabase.get_direct_connection() as conn:
+            await conn.execute(
+                """
+                INSERT INTO agent_checkpoints (thread_id, payload, size_bytes, expires_at)
+                VALUES ($1, $2, $3, NOW() + make_interval(secs => $4))
+                ON CONFLICT (thread_id) DO UPDATE SET
+                    payload = EXCLUDED.payload,
+                    size_bytes = EXCLUDED.size_bytes,
+                    expires_at = EXCLUDED.expires_at,
+                    updated_at = NOW()
+                """,
+                thread_id,
+                payload,
+                len(payload),
+                float(self.ttl_seconds),
+            )
+
+    async def load(self, thread_id: str) -> Optional[bytes]:
+        """Return and remove the offloaded payload for ``thread_id``, if unexpired.
+
+        Most lookups are for brand-new threads, so existence is checked with a
+        read first and the row is only claimed (deleted) when there is one.
+        """
+        from mcp_server.config.control_plane import ControlPlaneDatabase
+
+        if not await self._ready():
+            return None
+        async with ControlPlaneDatabase.get_direct_connection() as conn:
+            exists = await conn.fetchval(
+                """
+                SELECT EXISTS (
+                    SELECT 1 FROM agent_checkpoints
+                    WHERE thread_id = $1 AND expires_at > NOW()
+                )
+                """,
+                thread_id,
+            )
+            if not exists:
+                return None
+            return await conn.fetchval(
+                """
+                DELETE FROM agent_checkpoints
+                WHERE thread_id = $1
+                RETURNING CASE WHEN expires_at > NOW() THEN payload END
+                """,
+                thread_id,
+            )
+
+    async def purge_expired(self) -> None:
+        """Delete expired rows, at most once per purge interval."""
+        from mcp_server.config.control_plane import ControlPlaneDatabase
+
+        now = self._clock()
+        if self._last_purge is not None and now - self._last_purge < self.purge_interval_seconds:
+            return
+        self._last_purge = now
+        if not await self._ready():
+            return
+        async with ControlPlaneDatabase.get_direct_connection() as conn:
+            await conn.execute("DELETE FROM agent_checkpoints WHERE expires_at <= NOW()")
+
+
+class BoundedMemorySaver(InMemorySaver):
+    """In-memory checkpointer with thread eviction, compaction and optional offload.
+
+    Byte accounting covers the serialized checkpoints, channel blobs and pending
+    writes held for each thread. Limits are enforced after every ``put``; the
+    thread being written is never evicted by its own write.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_threads: int = DEFAULT_MAX_THREADS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        offload_store: Optional[ControlPlaneCheckpointStore] = None,
+        clock: Callable[[], float] = time.monotonic,
+        serde: Any = None,
+    ) -> None:
+        """Initialize an empty checkpointer; non-positive limits disable that limit."""
+        super().__init__(serde=serde)
+        self.max_threads = max_threads
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.offload_store = offload_store
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._usage: "OrderedDict[str, _ThreadUsage]" = OrderedDict()
+        self._sizes: Dict[Any, int] = {}
+        self._total_bytes = 0
+        self._pending_offloads: List[Tuple[str, bytes]] = []
+
+    # ------------------------------------------------------------------
+    # Accounting
+    # ------------------------------------------------------------------
+
+    def _touch(self, thread_id: str) -> _ThreadUsage:
+        usage = self._usage.get(thread_id)
+        if usage is None:
+            usage = self._usage[thread_id] = _ThreadUsage()
+        usage.last_access = self._clock()
+        self._usage.move_to_end(thread_id)
+        return usage
+
+    def _set_size(self, usage: _ThreadUsage, key: Any, size: int) -> None:
+        delta = size - self._sizes.get(key, 0)
+        self._sizes[key] = size
+        usage.bytes += delta
+        self._total_bytes += delta
+
+    def _drop_size(self, usage: Optional[_ThreadUsage], key: Any) -> None:
+        size = self._sizes.pop(key, 0)
+        self._total_bytes -= size
+        if usage is not None:
+            usage.bytes -= size
+
+    def _writes_size(self, outer_key: CheckpointKey) -> int:
+        return sum(
+            len(task_id) + len(channel) + _typed_size(value) + len(task_path)
+            for task_id, channel, value, task_path in self.writes.get(outer_key, {}).values()
+        )
+
+    def stats(self) -> Dict[str, int]:
+        """Return thread, checkpoint and byte counts."""
+        with self._lock:
+            return {
+                "threads": len(self._usage),
+                "checkpoints": sum(len(u.checkpoint_keys) for u in self._usage.values()),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    # ------------------------------------------------------------------
+    # Saver API
+    # ------------------------------------------------------------------
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Save a checkpoint, then evict threads that exceed the configured limits."""
+        with self._lock:
+            next_config = super().put(config, checkpoint, metadata, new_versions)
+            thread_id = config["configurable"]["thread_id"]
+            checkpoint_ns = config["configurable"]["checkpoint_ns"]
+            usage = self._touch(thread_id)
+
+            for channel, version in new_versions.items():
+                key = (thread_id, checkpoint_ns, channel, version)
+                usage.blob_keys.add(key)
+                self._set_size(usage, key, _typed_size(self.blobs[key]))
+
+            cp_key = (thread_id, checkpoint_ns, checkpoint["id"])
+            saved, saved_metadata, _parent = self.storage[thread_id][checkpoint_ns][
+                checkpoint["id"]
+            ]
+            usage.checkpoint_keys.add(cp_key)
+            self._set_size(usage, cp_key, _typed_size(saved) + _typed_size(saved_metadata))
+
+            self._enforce_limits(keep=thread_id)
+        return next_config
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Save pending writes and account for their size."""
+        with self._lock:
+            super().put_writes(config, writes, task_id, task_path)
+            configurable = config["configurable"]
+            outer_key = (
+                configurable["thread_id"],
+                configurable.get("checkpoint_ns", ""),
+                configurable["checkpoint_id"],
+            )
+            usage = self._touch(configurable["thread_id"])
+            self._set_size(usage, ("writes", outer_key), self._writes_size(outer_key))
+
+    def get_tuple(self, config: RunnableConfig):
+        """Return a checkpoint tuple, refreshing the thread's LRU position."""
+        with self._lock:
+            thread_id = config["configurable"]["thread_id"]
+            if thread_id in self._usage:
+                self._touch(thread_id)
+            return super().get_tuple(config)
+
+    def delete_thread(self, thread_id: str) -> None:
+        """Delete all checkpoints and writes of a thread."""
+        with self._lock:
+            self._forget(thread_id)
+            super().delete_thread(thread_id)
+
+    async def aget_tuple(self, config: RunnableConfig):
+        """Return a checkpoint tuple, restoring an offloaded thread if needed."""
+        thread_id = config["configurable"]["thread_id"]
+        if self.offload_store is not None and thread_id not in self._usage:
+            await self._restore(thread_id)
+        return self.get_tuple(config)
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Save a checkpoint and write out any threads it caused to be offloaded."""
+        next_config = self.put(config, checkpoint, metadata, new_versions)
+        await self.flush_offloads()
+        return next_config
+
+    # ------------------------------------------------------------------
+    # Compaction and eviction
+    # ------------------------------------------------------------------
+
+    def compact_thread(self, thread_id: str) -> int:
+        """Keep only the latest checkpoint (and its blobs and writes) of a thread.
+
+        Returns the number of bytes released.
+        """
+        with self._lock:
+            usage = self._usage.get(thread_id)
+            if usage is None:
+                return 0
+            before = usage.bytes
+            for checkpoint_ns, checkpoints in list(self.storage.get(thread_id, {}).items()):
+                if not checkpoints:
+                    continue
+                latest_id = max(checkpoints.keys())
+                latest = self.serde.loads_typed(checkpoints[latest_id][0])
+                live_blobs = {
+                    (thread_id, checkpoint_ns, channel, version)
+                    for channel, version in latest["channel_versions"].items()
+                }
+                for checkpoint_id in [cid for cid in checkpoints if cid != latest_id]:
+                    del checkpoints[checkpoint_id]
+                    cp_key = (thread_id, checkpoint_ns, checkpoint_id)
+                    usage.checkpoint_keys.discard(cp_key)
+                    self._drop_size(usage, cp_key)
+                    self.writes.pop(cp_key, None)
+                    self._drop_size(usage, ("writes", cp_key))
+                for key in [
+                    k for k in usage.blob_keys if k[1] == checkpoint_ns and k not in live_blobs
+                ]:
+                    usage.blob_keys.discard(key)
+                    self.blobs.pop(key, None)
+                    self._drop_size(usage, key)
+            released = before - usage.bytes
+        self._record_usage()
+        return released
+
+    def _forget(self, thread_id: str) -> None:
+        usage = self._usage.pop(thread_id, None)
+        if usage is None:
+            return
+        for key in list(usage.blob_keys) + list(usage.checkpoint_keys):
+            self._drop_size(None, key)
+        for cp_key in usage.checkpoint_keys:
+            self._drop_size(None, ("writes", cp_key))
+
+    def _enforce_limits(self, keep: str) -> None:
+        now = self._clock()
+        if self.ttl_seconds and self.ttl_seconds > 0:
+            for thread_id, usage in list(self._usage.items()):
+                if thread_id != keep and now - usage.last_access > self.ttl_seconds:
+                    self._evict(thread_id, "ttl")
+
+        def _over() -> Optional[str]:
+            if self.max_threads and self.max_threads > 0 and len(self._usage) > self.max_threads:
+                return "threads"
+            if self.max_bytes and self.max_bytes > 0 and self._total_bytes > self.max_bytes:
+                return "bytes"
+            return None
+
+        while (reason := _over()) is not None:
+            victim = next((t for t in self._usage if t != keep), None)
+            if victim is None:
+                break
+            self._evict(victim, reason)
+        self._record_usage()
+
+    def _evict(self, thread_id: str, reason: str) -> None:
+        if self.offload_store is not None:
+            self.compact_thread(thread_id)
+            self._pending_offloads.append((thread_id, self._export_thread(thread_id)))
+        self._forget(thread_id)
+        super().delete_thread(thread_id)
+        agent_metrics.add_counter(
+            "agent.checkpointer.evictions_total",
+            attributes={"reason": reason, "offloaded": self.offload_store is not None},
+            description="Checkpointer threads evicted from memory",
+        )
+
+    def _record_usage(self) -> None:
+        agent_metrics.record_histogram(
+            "agent.checkpointer.memory_bytes",
+            value=float(self._total_bytes),
+            unit="By",
+            description="Bytes held by the in-memory checkpointer",
+        )
+        agent_metrics.record_histogram(
+            "agent.checkpointer.threads",
+            value=float(len(self._usage)),
+            unit="thread",
+            description="Threads held by the in-memory checkpointer",
+        )
+
+    # ------------------------------------------------------------------
+    # Offload
+    # ------------------------------------------------------------------
+
+    def _export_thread(self, thread_id: str) -> bytes:
+        namespaces = {}
+        for checkpoint_ns, checkpoints in self.storage.get(thread_id, {}).items():
+            if not checkpoints:
+                continue
+            checkpoint_id = max(checkpoints.keys())
+            saved, saved_metadata, parent = checkpoints[checkpoint_id]
+            namespaces[checkpoint_ns] = {
+                "checkpoint_id": checkpoint_id,
+                "checkpoint": _encode_typed(saved),
+                "metadata": _encode_typed(saved_metadata),
+                "parent": parent,
+                "blobs": [
+                    [key[2], key[3], *_encode_typed(self.blobs[key])]
+                    for key in self._usage[thread_id].blob_keys
+                    if key[1] == checkpoint_ns
+                ],
+                "writes": [
+                    [inner[0], inner[1], channel, *_encode_typed(value), task_path]
+                    for inner, (_task, channel, value, task_path) in self.writes.get(
+                        (thread_id, checkpoint_ns, checkpoint_id), {}
+                    ).items()
+                ],
+            }
+        return json.dumps({"namespaces": namespaces}, separators=(",", ":")).encode("utf-8")
+
+    def _import_thread(self, thread_id: str, payload: bytes) -> None:
+        namespaces = json.loads(payload)["namespaces"]
+        with self._lock:
+            usage = self._touch(thread_id)
+            for checkpoint_ns, entry in namespaces.items():
+                checkpoint_id = entry["checkpoint_id"]
+                saved = _decode_typed(entry["checkpoint"])
+                saved_metadata = _decode_typed(entry["metadata"])
+                self.storage[thread_id][checkpoint_ns][checkpoint_id] = (
+                    saved,
+                    saved_metadata,
+                    entry["parent"],
+                )
+                cp_key = (thread_id, checkpoint_ns, checkpoint_id)
+                usage.checkpoint_keys.add(cp_key)
+                self._set_size(usage, cp_key, _typed_size(saved) + _typed_size(saved_metadata))
+                for channel, version, type_, data in entry["blobs"]:
+                    key = (thread_id, checkpoint_ns, channel, version)
+                    self.blobs[key] = _decode_typed([type_, data])
+                    usage.blob_keys.add(key)
+                    self._set_size(usage, key, _typed_size(self.blobs[key]))
+                if entry["writes"]:
+                    outer = self.writes[cp_key] = {}
+                    for task_id, idx, channel, type_, data, task_path in entry["writes"]:
+                        outer[(task_id, idx)] = (
+                            task_id,
+                            channel,
+                            _decode_typed([type_, data]),
+                            task_path,
+                        )
+                    self._set_size(usage, ("writes", cp_key), self._writes_size(cp_key))
+            self._enforce_limits(keep=thread_id)
+
+    async def flush_offloads(self) -> None:
+        """Write evicted threads to the offload store, then purge its expired rows."""
+        if self.offload_store is None or not self._pending_offloads:
+            return
+        with self._lock:
+            pending, self._pending_offloads = self._pending_offloads, []
+        for thread_id, payload in pending:
+            try:
+                await self.offload_store.save(thread_id, payload)
+                agent_metrics.add_counter(
+                    "agent.checkpointer.offloads_total",
+                    description="Checkpointer threads offloaded to the control plane",
+                )
+            except Exception as e:
+                logger.warning("Failed to offload checkpoint for thread %s: %s", thread_id, e)
+        try:
+            await self.offload_store.purge_expired()
+        except Exception as e:
+            logger.warning("Failed to purge expired offloaded checkpoints: %s", e)
+
+    async def _restore(self, thread_id: str) -> None:
+        try:
+            payload = await self.offload_store.load(thread_id)
+        except Exception as e:
+            logger.warning("Failed to restore checkpoint for thread %s: %s", thread_id, e)
+            return
+        if payload and thread_id not in self._usage:
+            self._import_thread(thread_id, bytes(payload))
+            agent_metrics.add_counter(
+                "agent.checkpointer.restores_total",
+                description="Checkpointer threads restored from the control plane",
+            )
+        await self.flush_offloads()
+
+
+def build_checkpointer() -> BoundedMemorySaver:
+    """Build the agent checkpointer from ``AGENT_CHECKPOINT_*`` settings."""
+    offload_store = None
+    if get_env_bool("AGENT_CHECKPOINT_OFFLOAD_ENABLED", False):
+        offload_store = ControlPlaneCheckpointStore(
+            ttl_seconds=get_env_int(
+                "AGENT_CHECKPOINT_OFFLOAD_TTL_SECONDS", DEFAULT_TTL_SECONDS * 24
+            )
+        )
+    return BoundedMemorySaver(
+        max_threads=get_env_int("AGENT_CHECKPOINT_MAX_THREADS", DEFAULT_MAX_THREADS),
+        max_bytes=get_env_int("AGENT_CHECKPOINT_MAX_BYTES", DEFAULT_MAX_BYTES),
+        ttl_seconds=get_env_int("AGENT_CHECKPOINT_TTL_SECONDS", DEFAULT_TTL_SECONDS),
+        offload_store=offload_store,
+    )
+
+
+def finish_thread(checkpointer: Any, thread_id: Optional[str]) -> None:
+    """Compact a finished run's thread down to its latest checkpoint."""
+    if not thread_id or not isinstance(checkpointer, BoundedMemorySaver):
+        return
+    if not get_env_bool("AGENT_CHECKPOINT_COMPACT_ON_FINISH", True):
+        return
+    try:
+        checkpointer.compact_thread(thread_id)
+    except Exception as e:
+        logger.warning("Checkpoint compaction failed for thread %s: %s", thread_id, e)
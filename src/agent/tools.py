@@ -2,6 +2,7 @@
 
 This module bridges MCP tools with LangGraph nodes:
 - get_mcp_tools(): Discovers tools from MCP server and wraps them
+  (served from the pooled session's cached tool catalog by default)
 - _wrap_tool(): Adds telemetry to tool invocations
 - mcp_tools_context(): Context manager for tool lifecycle
 """
@@ -13,6 +14,11 @@ from dotenv import load_dotenv
 
 from agent.mcp_client import MCPClient
 from agent.mcp_client.manager import create_resilient_invoke_fn
+from agent.mcp_client.session_pool import (
+    connection_headers,
+    get_mcp_session_pool,
+    is_session_pool_enabled,
+)
 from agent.mcp_client.tool_wrapper import create_tool_wrapper
 from common.config.env import get_env_str
 
@@ -47,6 +53,33 @@ async def get_mcp_tools():
     if request_id:
         headers["X-Request-ID"] = str(request_id)
 
+    if is_session_pool_enabled():
+        # Long-lived, multiplexed sessions shared by every node and tool call.
+        pool = get_mcp_session_pool(
+            mcp_url,
+            mcp_transport,
+            headers,
+            client_factory=lambda: MCPClient(
+                server_url=mcp_url,
+                transport=mcp_transport,
+                headers=connection_headers(headers),
+            ),
+        )
+        tool_infos = await pool.get_tool_catalog()
+        return [
+            _wrap_tool(
+                create_tool_wrapper(
+                    name=info.name,
+                    description=info.description,
+                    input_schema=info.input_schema,
+                    invoke_fn=create_resilient_invoke_fn(
+                        mcp_url, mcp_transport, info.name, headers, pool=pool
+                    ),
+                )
+            )
+            for info in tool_infos
+        ]
+
     # Create SDK client and discover tools
     client = MCPClient(server_url=mcp_url, transport=mcp_transport, headers=headers)
 
@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
 import threading
 import time
+from collections import deque
 from contextlib import asynccontextmanager, contextmanager
 from dataclasses import dataclass
-from typing import AsyncIterator, Iterator, Optional
+from typing import AsyncIterator, Deque, Iterator, NoReturn, Optional, Tuple
 
 from opentelemetry import trace
 
 from common.config.env import get_env_float, get_env_int
+from common.observability.metrics import agent_metrics
 
 
 @dataclass(frozen=True)
@@ -19,6 +22,7 @@ class LLMConcurrencyLease:
 
     active_calls: int
     limit: int
+    queue_wait_ms: float = 0.0
 
 
 class LLMRateLimitExceededError(RuntimeError):
@@ -60,8 +64,15 @@ class LLMGlobalConcurrencyLimiter:
         circuit_cooldown_seconds: float,
         warm_start_cooldown_seconds: float,
         warm_start_max_concurrent_calls: int,
+        queue_timeout_seconds: float = 0.0,
+        max_queued_calls: int = 0,
     ) -> None:
-        """Initialize limiter and circuit-breaker state."""
+        """Initialize limiter and circuit-breaker state.
+
+        Async callers wait up to ``queue_timeout_seconds`` for a free slot (with at
+        most ``max_queued_calls`` waiters) before failing with a typed limit error.
+        Sync callers always fail fast.
+        """
         self._limit = max(1, int(max_concurrent_calls))
         self._retry_after_seconds = max(0.1, float(retry_after_seconds))
         self._circuit_failure_threshold = max(1, int(circuit_failure_threshold))
@@ -75,6 +86,9 @@ class LLMGlobalConcurrencyLimiter:
         self._active_calls = 0
         self._consecutive_failures = 0
         self._circuit_open_until_monotonic = 0.0
+        self._queue_timeout_seconds = max(0.0, float(queue_timeout_seconds))
+        self._max_queued_calls = max(0, int(max_queued_calls))
+        self._waiters: Deque[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
         self._lock = threading.Lock()
 
     def _warm_start_active(self, now: float) -> bool:
@@ -121,19 +135,20 @@ class LLMGlobalConcurrencyLimiter:
                 consecutive_failures=failures,
             )
 
+    def _claim_slot(self, now: float) -> Tuple[bool, int, int]:
+        effective_limit = self._effective_limit(now)
+        with self._lock:
+            self._grant_waiters_locked(effective_limit)
+            if self._waiters or self._active_calls >= effective_limit:
+                return False, self._active_calls, effective_limit
+            self._active_calls += 1
+            return True, self._active_calls, effective_limit
+
     def _try_acquire(self) -> LLMConcurrencyLease:
         self._assert_circuit_closed()
         now = time.monotonic()
-        effective_limit = self._effective_limit(now)
-        with self._lock:
-            if self._active_calls >= effective_limit:
-                active_calls = self._active_calls
-                rate_limited = True
-            else:
-                self._active_calls += 1
-                active_calls = self._active_calls
-                rate_limited = False
-        if rate_limited:
+        acquired, active_calls, effective_limit = self._claim_slot(now)
+        if not acquired:
             self._record_telemetry(active_calls=active_calls, rate_limited=True, now=now)
             raise LLMRateLimitExceededError(
                 retry_after_seconds=self._retry_after_seconds,
@@ -143,10 +158,118 @@ class LLMGlobalConcurrencyLimiter:
         self._record_telemetry(active_calls=active_calls, rate_limited=False, now=now)
         return LLMConcurrencyLease(active_calls=active_calls, limit=effective_limit)
 
+    async def _acquire_queued(self) -> LLMConcurrencyLease:
+        """Wait in a bounded FIFO queue for a slot, up to the queue timeout.
+
+        New callers never take a slot while others are queued; a released slot is
+        handed straight to the oldest live waiter instead of being put back.
+        """
+        self._assert_circuit_closed()
+        started_at = time.monotonic()
+        acquired, active_calls, effective_limit = self._claim_slot(started_at)
+        if acquired:
+            self._record_queue_wait(0.0, queued=False)
+            self._record_telemetry(active_calls=active_calls, rate_limited=False, now=started_at)
+            return LLMConcurrencyLease(active_calls=active_calls, limit=effective_limit)
+
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        with self._lock:
+            queue_full = len(self._waiters) >= self._max_queued_calls
+            if not queue_full:
+                self._waiters.append((loop, waiter))
+        if queue_full:
+            self._reject_queued("queue_full", active_calls, effective_limit, started_at)
+
+        try:
+            await asyncio.wait({waiter}, timeout=self._queue_timeout_seconds)
+        except BaseException:
+            if self._leave_queue(loop, waiter):
+                self._release()
+            raise
+        now = time.monotonic()
+        if not self._leave_queue(loop, waiter):
+            with self._lock:
+                active_calls = self._active_calls
+            self._reject_queued("queue_timeout", active_calls, self._effective_limit(now), now)
+
+        try:
+            self._assert_circuit_closed()
+        except LLMCircuitOpenError:
+            self._release()
+            raise
+        with self._lock:
+            active_calls = self._active_calls
+        effective_limit = self._effective_limit(now)
+        wait_ms = (now - started_at) * 1000.0
+        self._record_queue_wait(wait_ms, queued=True)
+        self._record_telemetry(active_calls=active_calls, rate_limited=False, now=now)
+        return LLMConcurrencyLease(
+            active_calls=active_calls,
+            limit=effective_limit,
+            queue_wait_ms=wait_ms,
+        )
+
+    def _leave_queue(self, loop: asyncio.AbstractEventLoop, waiter: asyncio.Future) -> bool:
+        """Stop waiting; return True when a slot was already handed to ``waiter``."""
+        with self._lock:
+            if waiter.done() and not waiter.cancelled():
+                return True
+            try:
+                self._waiters.remove((loop, waiter))
+            except ValueError:
+                # Popped by a release whose hand-off has not run yet; cancelling
+                # makes ``_resolve_waiter`` pass the slot on to the next waiter.
+                pass
+            waiter.cancel()
+            return False
+
+    def _reject_queued(self, reason: str, active_calls: int, limit: int, now: float) -> NoReturn:
+        agent_metrics.add_counter(
+            "agent.llm.queue_rejections_total",
+            description="LLM calls rejected after queue timeout or overflow",
+            attributes={"reason": reason},
+        )
+        self._record_telemetry(active_calls=active_calls, rate_limited=True, now=now)
+        raise LLMRateLimitExceededError(
+            retry_after_seconds=self._retry_after_seconds,
+            active_calls=active_calls,
+            limit=limit,
+        )
+
+    def _record_queue_wait(self, wait_ms: float, *, queued: bool) -> None:
+        agent_metrics.record_histogram(
+            "agent.llm.queue_wait_ms",
+            float(wait_ms),
+            description="Time LLM calls spent waiting for a global concurrency slot",
+            unit="ms",
+            attributes={"queued": queued},
+        )
+        span = trace.get_current_span()
+        if span is not None and span.is_recording():
+            span.set_attribute("llm.queue_wait_ms", float(wait_ms))
+            span.set_attribute("llm.queued", bool(queued))
+
+    def _grant_waiters_locked(self, effective_limit: int) -> None:
+        """Hand free slots to queued waiters in arrival order; caller holds the lock."""
+        while self._waiters and self._active_calls < effective_limit:
+            loop, waiter = self._waiters.popleft()
+            if waiter.done() or loop.is_closed():
+                continue
+            self._active_calls += 1
+            loop.call_soon_threadsafe(_resolve_waiter, self, waiter)
+
+    @property
+    def queued_calls(self) -> int:
+        """Return number of async callers currently waiting for a slot."""
+        with self._lock:
+            return len(self._waiters)
+
     def _release(self) -> None:
         now = time.monotonic()
         with self._lock:
             self._active_calls = max(0, self._active_calls - 1)
+            self._grant_waiters_locked(self._effective_limit(now))
             active_calls = self._active_calls
         self._record_telemetry(active_calls=active_calls, rate_limited=False, now=now)
 
@@ -182,8 +305,11 @@ class LLMGlobalConcurrencyLimiter:
 
     @asynccontextmanager
     async def acquire_async(self) -> AsyncIterator[LLMConcurrencyLease]:
-        """Acquire an async lease or raise a typed limit exception."""
-        lease = self._try_acquire()
+        """Acquire an async lease, queueing when enabled, or raise a typed limit exception."""
+        if self._queue_timeout_seconds > 0 and self._max_queued_calls > 0:
+            lease = await self._acquire_queued()
+        else:
+            lease = self._try_acquire()
         try:
             yield lease
         finally:
@@ -193,6 +319,14 @@ class LLMGlobalConcurrencyLimiter:
 _GLOBAL_LLM_LIMITER: Optional[LLMGlobalConcurrencyLimiter] = None
 
 
+def _resolve_waiter(limiter: LLMGlobalConcurrencyLimiter, waiter: asyncio.Future) -> None:
+    if waiter.done():
+        # The waiter gave up after its slot was granted; pass the slot on.
+        limiter._release()
+    else:
+        waiter.set_result(None)
+
+
 def _safe_env_int(name: str, default: int, minimum: int) -> int:
     try:
         value = get_env_int(name, default)
@@ -241,6 +375,12 @@ def get_global_llm_limiter() -> LLMGlobalConcurrencyLimiter:
                 max(1, max_concurrent_calls // 2),
                 minimum=1,
             ),
+            queue_timeout_seconds=_safe_env_float("LLM_QUEUE_TIMEOUT_SECONDS", 10.0, minimum=0.0),
+            max_queued_calls=_safe_env_int(
+                "LLM_MAX_QUEUED_CALLS",
+                max_concurrent_calls * 4,
+                minimum=0,
+            ),
         )
     return _GLOBAL_LLM_LIMITER
 
@@ -5,6 +5,8 @@ from typing import Optional, Set
 import sqlglot
 from sqlglot import exp
 
+from common.sql.facts import SqlFacts
+
 
 def parse_sql(sql: str, dialect: str = "postgres") -> Optional[exp.Expression]:
     """Parse SQL string into AST expression.
@@ -20,13 +22,13 @@ def parse_sql(sql: str, dialect: str = "postgres") -> Optional[exp.Expression]:
         return None
 
 
-def extract_tables(ast: exp.Expression) -> Set[str]:
+def extract_tables(ast: exp.Expression, facts: Optional[SqlFacts] = None) -> Set[str]:
     """Extract fully qualified table names from AST.
 
     Handles catalog.db.table, db.table, and table.
     """
     tables = set()
-    for table in ast.find_all(exp.Table):
+    for table in facts.tables if facts is not None else ast.find_all(exp.Table):
         parts = []
         if table.catalog:
             parts.append(table.catalog)
@@ -41,13 +43,13 @@ def extract_tables(ast: exp.Expression) -> Set[str]:
     return tables
 
 
-def extract_columns(ast: exp.Expression) -> Set[str]:
+def extract_columns(ast: exp.Expression, facts: Optional[SqlFacts] = None) -> Set[str]:
     """Extract qualified column names from AST.
 
     Handles table.column and column.
     """
     columns = set()
-    for column in ast.find_all(exp.Column):
+    for column in facts.columns if facts is not None else ast.find_all(exp.Column):
         parts = []
         if column.table:
             parts.append(column.table)
@@ -59,8 +61,10 @@ def extract_columns(ast: exp.Expression) -> Set[str]:
     return columns
 
 
-def count_joins(ast: exp.Expression) -> int:
+def count_joins(ast: exp.Expression, facts: Optional[SqlFacts] = None) -> int:
     """Count number of JOIN clauses in AST."""
+    if facts is not None:
+        return len(facts.joins)
     return len(list(ast.find_all(exp.Join)))
 
 
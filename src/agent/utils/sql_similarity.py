@@ -4,25 +4,20 @@ import logging
 from typing import Set
 
 import sqlglot
-from sqlglot import exp
+
+from common.sql.facts import SqlFacts, collect_sql_facts
 
 logger = logging.getLogger(__name__)
 
 
-def _extract_tables(expression: exp.Expression) -> Set[str]:
-    """Extract table names from AST."""
-    tables = set()
-    for table in expression.find_all(exp.Table):
-        tables.add(table.name.lower())
-    return tables
+def _extract_tables(facts: SqlFacts) -> Set[str]:
+    """Extract table names from collected AST facts."""
+    return {table.name.lower() for table in facts.tables}
 
 
-def _extract_columns(expression: exp.Expression) -> Set[str]:
-    """Extract column names from AST."""
-    columns = set()
-    for col in expression.find_all(exp.Column):
-        columns.add(col.name.lower())
-    return columns
+def _extract_columns(facts: SqlFacts) -> Set[str]:
+    """Extract column names from collected AST facts."""
+    return {col.name.lower() for col in facts.columns}
 
 
 def compute_sql_similarity(sql1: str, sql2: str) -> float:
@@ -46,8 +41,10 @@ def compute_sql_similarity(sql1: str, sql2: str) -> float:
         # Request said "treat parse failure as 0 similarity unless same raw string")
         return 0.0
 
-    tables1 = _extract_tables(ast1)
-    tables2 = _extract_tables(ast2)
+    facts1 = collect_sql_facts(ast1)
+    facts2 = collect_sql_facts(ast2)
+    tables1 = _extract_tables(facts1)
+    tables2 = _extract_tables(facts2)
 
     if not tables1 and not tables2:
         # No tables in either? Logic check.
@@ -62,8 +59,8 @@ def compute_sql_similarity(sql1: str, sql2: str) -> float:
         table_sim = len(tables1.intersection(tables2)) / len(u_tables)
 
     # Column Jaccard
-    cols1 = _extract_columns(ast1)
-    cols2 = _extract_columns(ast2)
+    cols1 = _extract_columns(facts1)
+    cols2 = _extract_columns(facts2)
 
     u_cols = cols1.union(cols2)
     if not u_cols:
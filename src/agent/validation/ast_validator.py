@@ -19,8 +19,10 @@ from agent.utils.sql_ast import count_joins, extract_columns, extract_tables, no
 from common.config.env import get_env_bool, get_env_int, get_env_str
 from common.constants.reason_codes import ValidationRefusalReason
 from common.policy.sql_policy import classify_blocked_table_reference, is_sensitive_column_name
+from common.sql import ast_cache
 from common.sql.comments import strip_sql_comments
 from common.sql.dialect import normalize_sqlglot_dialect
+from common.sql.facts import SqlFacts, collect_sql_facts
 
 logger = logging.getLogger(__name__)
 
@@ -141,7 +143,7 @@ def parse_sql(
     dialect = normalize_sqlglot_dialect(dialect)
     stripped_sql = strip_sql_comments(sql)
     try:
-        expressions = sqlglot.parse(stripped_sql, dialect=dialect)
+        expressions = ast_cache.parse_sql(stripped_sql, dialect)
 
         if not expressions:
             return None, "Empty SQL query"
@@ -161,6 +163,7 @@ def validate_security(
     ast: exp.Expression,
     allowed_tables: Optional[set[str]] = None,
     policy_snapshot: Optional[dict] = None,
+    facts: Optional[SqlFacts] = None,
 ) -> list[SecurityViolation]:
     """
     Validate SQL AST for security violations.
@@ -175,13 +178,16 @@ def validate_security(
         ast: Parsed SQL AST
         allowed_tables: Optional explicit allowlist of tables
         policy_snapshot: Optional snapshot of policy configuration
+        facts: Optional facts already collected for ``ast``
 
     Returns:
         List of SecurityViolation objects (empty if valid)
     """
+    if facts is None:
+        facts = collect_sql_facts(ast)
     violations = []
     normalized_allowed_tables = _normalize_allowed_tables(allowed_tables)
-    cte_names = _extract_cte_names(ast)
+    cte_names = _extract_cte_names(facts)
 
     # 1. Enforce strict Root Node Policy (SELECT / CTE / UNION)
     # Only allow read-only query structures at the root level
@@ -199,8 +205,8 @@ def validate_security(
         )
 
     # 2. Recursive Forbidden Command Check (Deep Walk)
-    # Traverses the entire tree to find nested forbidden commands
-    for node in ast.walk():
+    # Covers nested forbidden commands anywhere in the tree
+    for node in facts.write_statements:
         if isinstance(node, tuple(FORBIDDEN_COMMANDS)):
             violations.append(
                 SecurityViolation(
@@ -214,7 +220,7 @@ def validate_security(
             )
 
     # Check for restricted table access
-    for table in ast.find_all(exp.Table):
+    for table in facts.tables:
         table_name = table.name.lower() if table.name else ""
         schema_name = table.db.lower() if table.db else ""
         full_name = f"{schema_name}.{table_name}" if schema_name else table_name
@@ -267,9 +273,9 @@ def validate_security(
 
     # Check for dangerous UNION patterns with subqueries
     # (these can sometimes be used for SQL injection via UNION-based attacks)
-    unions = list(ast.find_all(exp.Union))
+    unions = [node for node in facts.set_operations if isinstance(node, exp.Union)]
     if len(unions) > 2:  # Allow simple unions, flag complex ones
-        subqueries = list(ast.find_all(exp.Subquery))
+        subqueries = facts.subqueries
         if subqueries:
             violations.append(
                 SecurityViolation(
@@ -283,7 +289,7 @@ def validate_security(
             )
 
     # Enforce allowlist for UNION / INTERSECT / EXCEPT branches when provided.
-    violations.extend(_validate_set_operation_allowlist(ast, allowed_tables))
+    violations.extend(_validate_set_operation_allowlist(facts, allowed_tables))
 
     return violations
 
@@ -294,9 +300,9 @@ def _normalize_allowed_tables(allowed_tables: Optional[set[str]]) -> set[str]:
     return {str(table).strip().lower() for table in allowed_tables if str(table).strip()}
 
 
-def _extract_cte_names(ast: exp.Expression) -> set[str]:
+def _extract_cte_names(facts: SqlFacts) -> set[str]:
     cte_names: set[str] = set()
-    for cte in ast.find_all(exp.CTE):
+    for cte in facts.ctes:
         alias = cte.alias_or_name
         if isinstance(alias, str) and alias.strip():
             cte_names.add(alias.strip().lower())
@@ -334,17 +340,21 @@ def _disallowed_tables_in_branch(
 
 
 def _validate_set_operation_allowlist(
-    ast: exp.Expression,
+    facts: SqlFacts,
     allowed_tables: Optional[set[str]],
 ) -> list[SecurityViolation]:
     """Block set-operation branches that reference non-allowlisted tables."""
     normalized_allowed = _normalize_allowed_tables(allowed_tables)
     if not normalized_allowed:
         return []
-    cte_names = _extract_cte_names(ast)
+    cte_names = _extract_cte_names(facts)
 
     violations: list[SecurityViolation] = []
-    set_operations = tuple(ast.find_all((exp.Union, exp.Intersect, exp.Except)))
+    set_operations = tuple(
+        node
+        for node in facts.set_operations
+        if isinstance(node, (exp.Union, exp.Intersect, exp.Except))
+    )
     for set_op in set_operations:
         operation = type(set_op).__name__.upper()
         branches = {"left": set_op.left, "right": set_op.right}
@@ -372,9 +382,9 @@ def _validate_set_operation_allowlist(
     return violations
 
 
-def _extract_sensitive_columns(ast: exp.Expression) -> list[str]:
+def _extract_sensitive_columns(facts: SqlFacts) -> list[str]:
     sensitive: set[str] = set()
-    for column in ast.find_all(exp.Column):
+    for column in facts.columns:
         column_name = column.name.lower() if column.name else ""
         if is_sensitive_column_name(column_name):
             sensitive.add(column_name)
@@ -402,9 +412,9 @@ def _normalize_allowed_columns(
     return normalized
 
 
-def _extract_table_alias_map(ast: exp.Expression, cte_names: set[str]) -> dict[str, str]:
+def _extract_table_alias_map(facts: SqlFacts, cte_names: set[str]) -> dict[str, str]:
     alias_map: dict[str, str] = {}
-    for table in ast.find_all(exp.Table):
+    for table in facts.tables:
         table_name = table.name.lower() if table.name else ""
         if not table_name or table_name in cte_names:
             continue
@@ -415,7 +425,7 @@ def _extract_table_alias_map(ast: exp.Expression, cte_names: set[str]) -> dict[s
 
 
 def _validate_column_allowlist(
-    ast: exp.Expression,
+    facts: SqlFacts,
     allowed_columns: Optional[dict[str, set[str]]],
     mode: str,
 ) -> tuple[list[SecurityViolation], list[str]]:
@@ -428,13 +438,13 @@ def _validate_column_allowlist(
     if not normalized_allowed_columns or mode == "off":
         return [], []
 
-    cte_names = _extract_cte_names(ast)
-    alias_map = _extract_table_alias_map(ast, cte_names)
+    cte_names = _extract_cte_names(facts)
+    alias_map = _extract_table_alias_map(facts, cte_names)
 
     violations: list[SecurityViolation] = []
     warnings: list[str] = []
 
-    for select_node in ast.find_all(exp.Select):
+    for select_node in facts.selects:
         for projection in select_node.expressions or []:
             projected_columns: list[exp.Column] = []
             if isinstance(projection, exp.Star):
@@ -504,7 +514,12 @@ def _validate_column_allowlist(
     return violations, warnings
 
 
-def extract_metadata(ast: exp.Expression, *, detected_cartesian_flag: bool = False) -> SQLMetadata:
+def extract_metadata(
+    ast: exp.Expression,
+    *,
+    detected_cartesian_flag: bool = False,
+    facts: Optional[SqlFacts] = None,
+) -> SQLMetadata:
     """
     Extract metadata from SQL AST for audit logging and complexity analysis.
 
@@ -518,24 +533,27 @@ def extract_metadata(ast: exp.Expression, *, detected_cartesian_flag: bool = Fal
 
     Args:
         ast: Parsed SQL AST
+        facts: Optional facts already collected for ``ast``
 
     Returns:
         SQLMetadata object with extracted information
     """
+    if facts is None:
+        facts = collect_sql_facts(ast)
     metadata = SQLMetadata()
 
     # Extract table lineage
-    metadata.table_lineage = sorted(extract_tables(ast))
+    metadata.table_lineage = sorted(extract_tables(ast, facts))
 
     # Extract column usage
-    metadata.column_usage = sorted(extract_columns(ast))
+    metadata.column_usage = sorted(extract_columns(ast, facts))
 
     # Count join complexity
-    metadata.join_complexity = count_joins(ast)
+    metadata.join_complexity = count_joins(ast, facts)
     metadata.join_count = metadata.join_complexity
     metadata.estimated_table_count = len(metadata.table_lineage)
     metadata.estimated_scan_columns = len(metadata.column_usage)
-    metadata.union_count = len(list(ast.find_all(exp.Union)))
+    metadata.union_count = sum(1 for node in facts.set_operations if isinstance(node, exp.Union))
     metadata.detected_cartesian_flag = bool(detected_cartesian_flag)
     metadata.query_complexity_score = (
         (metadata.join_count * 3)
@@ -545,18 +563,20 @@ def extract_metadata(ast: exp.Expression, *, detected_cartesian_flag: bool = Fal
 
     # Check for aggregation
     agg_funcs = (exp.Count, exp.Sum, exp.Avg, exp.Min, exp.Max, exp.AggFunc)
-    metadata.has_aggregation = any(ast.find_all(agg_funcs))
+    metadata.has_aggregation = any(isinstance(node, agg_funcs) for node in facts.functions)
 
     # Check for subqueries
-    metadata.has_subquery = bool(list(ast.find_all(exp.Subquery)))
+    metadata.has_subquery = bool(facts.subqueries)
 
     # Check for window functions
-    metadata.has_window_function = bool(list(ast.find_all(exp.Window)))
+    metadata.has_window_function = bool(facts.windows)
 
     return metadata
 
 
-def validate_complexity(ast: exp.Expression) -> list[SecurityViolation]:
+def validate_complexity(
+    ast: exp.Expression, facts: Optional[SqlFacts] = None
+) -> list[SecurityViolation]:
     """
     Validate SQL AST for complexity limits.
 
@@ -565,6 +585,7 @@ def validate_complexity(ast: exp.Expression) -> list[SecurityViolation]:
 
     Args:
         ast: Parsed SQL AST
+        facts: Optional facts already collected for ``ast``
 
     Returns:
         List of SecurityViolation objects (empty if valid)
@@ -574,7 +595,7 @@ def validate_complexity(ast: exp.Expression) -> list[SecurityViolation]:
     # Join Complexity
     # Default to 10 as per conservative default
     max_joins = get_env_int("AGENT_MAX_JOIN_COMPLEXITY", 10)
-    join_count = count_joins(ast)
+    join_count = count_joins(ast, facts)
     if join_count > max_joins:
         violations.append(
             SecurityViolation(
@@ -594,7 +615,7 @@ def validate_complexity(ast: exp.Expression) -> list[SecurityViolation]:
 
 
 def _detect_cartesian_join_patterns(
-    ast: exp.Expression, mode: str
+    facts: SqlFacts, mode: str
 ) -> tuple[list[SecurityViolation], list[str]]:
     """Detect likely Cartesian joins and constant join predicates."""
     normalized_mode = (mode or "warn").strip().lower()
@@ -604,7 +625,7 @@ def _detect_cartesian_join_patterns(
     violations: list[SecurityViolation] = []
     warnings: list[str] = []
 
-    for join in ast.find_all(exp.Join):
+    for join in facts.joins:
         on_clause = join.args.get("on")
         using_clause = join.args.get("using")
 
@@ -679,11 +700,14 @@ def validate_sql(
             ],
         )
 
+    facts = collect_sql_facts(ast)
+
     # Validate security
     violations = validate_security(
         ast,
         allowed_tables=allowed_tables,
         policy_snapshot=policy_snapshot,
+        facts=facts,
     )
     warnings: list[str] = []
 
@@ -699,12 +723,12 @@ def validate_sql(
         cartesian_mode = "warn"
 
     # Validate complexity
-    complexity_violations = validate_complexity(ast)
+    complexity_violations = validate_complexity(ast, facts)
     violations.extend(complexity_violations)
 
     # Optional column-level allowlist
     column_violations, column_warnings = _validate_column_allowlist(
-        ast,
+        facts,
         allowed_columns=allowed_columns,
         mode=column_mode,
     )
@@ -715,7 +739,7 @@ def validate_sql(
     cartesian_warnings: list[str] = []
     if cartesian_mode != "off":
         cartesian_violations, cartesian_warnings = _detect_cartesian_join_patterns(
-            ast,
+            facts,
             mode=cartesian_mode,
         )
         violations.extend(cartesian_violations)
@@ -723,7 +747,7 @@ def validate_sql(
     detected_cartesian_flag = bool(cartesian_violations or cartesian_warnings)
 
     # Optional sensitive-column guardrail
-    sensitive_columns = _extract_sensitive_columns(ast)
+    sensitive_columns = _extract_sensitive_columns(facts)
     if sensitive_columns:
         sensitive_message = (
             "Sensitive column reference detected: " + ", ".join(sensitive_columns) + "."
@@ -747,7 +771,7 @@ def validate_sql(
             )
 
     # Extract metadata (even if there are violations, for audit purposes)
-    metadata = extract_metadata(ast, detected_cartesian_flag=detected_cartesian_flag)
+    metadata = extract_metadata(ast, detected_cartesian_flag=detected_cartesian_flag, facts=facts)
 
     # Transpile to normalized form (useful for caching and comparison)
     try:
@@ -8,7 +8,6 @@ import threading
 import time
 from typing import Optional, Set
 
-import sqlglot
 from sqlglot import exp
 
 from agent.audit import AuditEventSource, AuditEventType, emit_audit_event
@@ -20,7 +19,9 @@ from common.policy.sql_policy import (
     classify_sql_policy_violation,
     is_sensitive_column_name,
 )
+from common.sql.ast_cache import parse_sql
 from common.sql.comments import strip_sql_comments
+from common.sql.facts import get_sql_facts
 
 logger = logging.getLogger(__name__)
 
@@ -191,11 +192,11 @@ class PolicyEnforcer:
         stripped_sql = strip_sql_comments(sql)
         try:
             # Parse SQL to AST
-            parsed = sqlglot.parse(stripped_sql)
+            parsed = parse_sql(stripped_sql, copy=False)
         except Exception:
             try:
                 # Fallback for PostgreSQL-specific statements (e.g., DO, PREPARE).
-                parsed = sqlglot.parse(stripped_sql, read="postgres")
+                parsed = parse_sql(stripped_sql, "postgres", copy=False)
             except Exception as e:
                 cls._emit_policy_rejection(
                     reason="invalid_sql_syntax",
@@ -221,7 +222,7 @@ class PolicyEnforcer:
             sensitive_columns: set[str] = set()
 
             # 1. Enforce shared statement/function policy checks.
-            policy_violation = classify_sql_policy_violation(statement)
+            policy_violation = classify_sql_policy_violation(statement, get_sql_facts(statement))
             if policy_violation is not None:
                 cls._emit_policy_rejection(
                     reason=policy_violation.reason_code,
@@ -6,13 +6,13 @@ Rewrites SQL queries to inject tenant isolation predicates dynamically.
 import logging
 from typing import Dict
 
-import sqlglot
 from sqlglot import exp
 
 from agent.telemetry import telemetry
 from agent.utils.sql_ast import normalize_sql
 from agent.validation.policy_loader import PolicyDefinition, PolicyLoader
 from common.sanitization.bounding import bound_payload, redact_recursive
+from common.sql.ast_cache import parse_sql_one
 from common.utils.hashing import canonical_json_hash
 
 logger = logging.getLogger(__name__)
@@ -40,7 +40,7 @@ class TenantRewriter:
 
         # 2. Parse SQL
         try:
-            expression = sqlglot.parse_one(sql)
+            expression = parse_sql_one(sql)
         except Exception as e:
             telemetry.add_event(
                 "tenant_rewriter.failure",
@@ -58,6 +58,14 @@ async def validate_startup_configuration() -> None:
     validate_runtime_configuration()
 
 
+@app.on_event("shutdown")
+async def close_mcp_sessions() -> None:
+    """Close pooled MCP sessions so the server sees clean disconnects."""
+    from agent.mcp_client.session_pool import close_mcp_session_pools
+
+    await close_mcp_session_pools()
+
+
 class AgentRunRequest(BaseModel):
     """Request payload for agent execution."""
 
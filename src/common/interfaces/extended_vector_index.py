@@ -4,7 +4,7 @@ import numpy as np
 
 from schema.rag import FilterCriteria
 
-from .vector_index import SearchResult
+from .vector_index import BatchSearchResult, SearchResult
 
 
 @runtime_checkable
@@ -39,6 +39,24 @@ class ExtendedVectorIndex(Protocol):
         """
         ...
 
+    def search_batch(
+        self,
+        query_matrix: np.ndarray,
+        k: int,
+        filter: Optional[FilterCriteria] = None,
+    ) -> BatchSearchResult:
+        """Search for k nearest neighbors of many queries in one call.
+
+        Args:
+            query_matrix: 2D numpy array of shape (n_queries, dimension).
+            k: Number of neighbors to return per query.
+            filter: Optional structured filter criteria applied to every query.
+
+        Returns:
+            BatchSearchResult with one row per query.
+        """
+        ...
+
     def add_items(
         self,
         vectors: np.ndarray,
@@ -11,6 +11,10 @@ class RegistryStore(Protocol):
         """Upsert a query pair into the registry."""
         ...
 
+    async def store_pairs(self, pairs: List[QueryPair]) -> List[str]:
+        """Upsert many pairs; return "inserted", "updated" or "duplicate" per pair."""
+        ...
+
     async def lookup_by_signature(self, signature_key: str, tenant_id: int) -> Optional[QueryPair]:
         """Fetch a specific pair by its canonical signature."""
         ...
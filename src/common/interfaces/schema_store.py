@@ -1,4 +1,4 @@
-from typing import List, Protocol, runtime_checkable
+from typing import List, Optional, Protocol, runtime_checkable
 
 from schema.rag import SchemaEmbedding
 
@@ -25,3 +25,14 @@ class SchemaStore(Protocol):
             embedding: The schema embedding to save.
         """
         ...
+
+    async def fetch_schema_fingerprint(self) -> Optional[str]:
+        """Return a cheap fingerprint of the stored schema embeddings.
+
+        The fingerprint changes whenever an embedding is added or updated, and
+        is computed without transferring the vectors themselves.
+
+        Returns:
+            Opaque fingerprint string, or None if the store is empty.
+        """
+        ...
@@ -4,7 +4,7 @@ Defines the interface for vector similarity search backends.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Protocol
+from typing import Any, List, Mapping, Optional, Protocol
 
 import numpy as np
 
@@ -24,11 +24,51 @@ class SearchResult:
     metadata: Optional[dict] = field(default=None)
 
 
+@dataclass
+class BatchSearchResult:
+    """Array-backed results from a batched similarity search.
+
+    Row ``i`` holds the hits for query ``i``, best first. Slots without a hit
+    (e.g. for a zero query vector) have id None and score -inf.
+
+    Attributes:
+        ids: Object array of shape (n_queries, k) with matched item ids.
+        scores: float32 array of shape (n_queries, k) with similarity scores.
+        metadata: Optional read-only mapping of id -> metadata dict.
+    """
+
+    ids: np.ndarray
+    scores: np.ndarray
+    metadata: Optional[Mapping[Any, dict]] = field(default=None)
+
+    def __len__(self) -> int:
+        """Return the number of queries in the batch."""
+        return len(self.ids)
+
+    def row(self, i: int) -> List[SearchResult]:
+        """Materialize the hits for query ``i`` as SearchResult objects."""
+        metadata = self.metadata or {}
+        return [
+            SearchResult(id=item_id, score=float(score), metadata=metadata.get(item_id))
+            for item_id, score in zip(self.ids[i], self.scores[i])
+            if item_id is not None
+        ]
+
+    @classmethod
+    def empty(cls, n_queries: int) -> "BatchSearchResult":
+        """Return a result with no hits for ``n_queries`` queries."""
+        return cls(
+            ids=np.empty((n_queries, 0), dtype=object),
+            scores=np.empty((n_queries, 0), dtype=np.float32),
+        )
+
+
 class VectorIndex(Protocol):
     """Protocol for vector similarity search backends.
 
     Implementations must provide:
     - search: Find k nearest neighbors for a query vector.
+    - search_batch: Find k nearest neighbors for each row of a query matrix.
     - add_items: Add vectors with their IDs to the index.
     - save: Persist the index to disk.
     - load: Load the index from disk.
@@ -46,6 +86,18 @@ class VectorIndex(Protocol):
         """
         ...
 
+    def search_batch(self, query_matrix: np.ndarray, k: int) -> BatchSearchResult:
+        """Search for k nearest neighbors of many queries in one call.
+
+        Args:
+            query_matrix: 2D numpy array of shape (n_queries, dimension).
+            k: Number of neighbors to return per query.
+
+        Returns:
+            BatchSearchResult with one row per query.
+        """
+        ...
+
     def add_items(self, vectors: np.ndarray, ids: List[int]) -> None:
         """Add items to the index.
 
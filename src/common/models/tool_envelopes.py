@@ -126,6 +126,36 @@ class ExecuteSQLQueryMetadata(BaseModel):
     execution_timeout_applied: Optional[bool] = None
     execution_timeout_triggered: Optional[bool] = None
     resource_capability_mismatch: Optional[str] = None
+    result_cache_hit: Optional[bool] = Field(
+        None,
+        description="Whether the result was served from the executed-result cache",
+        validation_alias="result_cache.hit",
+        serialization_alias="result_cache.hit",
+    )
+    result_cache_age_ms: Optional[int] = Field(
+        None,
+        description="Age of the cached result in milliseconds when served from cache",
+        validation_alias="result_cache.age_ms",
+        serialization_alias="result_cache.age_ms",
+    )
+    result_cache_bypassed: Optional[bool] = Field(
+        None,
+        description="Whether the caller bypassed the executed-result cache",
+        validation_alias="result_cache.bypassed",
+        serialization_alias="result_cache.bypassed",
+    )
+    pagination_spool_hit: Optional[bool] = Field(
+        None,
+        description="Whether an offset continuation page was served from the result spool",
+        validation_alias="pagination.spool.hit",
+        serialization_alias="pagination.spool.hit",
+    )
+    pagination_spool_written: Optional[bool] = Field(
+        None,
+        description="Whether the first offset page spooled the result for later pages",
+        validation_alias="pagination.spool.written",
+        serialization_alias="pagination.spool.written",
+    )
     pagination_mode_used: Optional[Literal["offset", "keyset"]] = Field(
         None, description="The pagination strategy applied for this result"
     )
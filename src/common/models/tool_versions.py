@@ -14,6 +14,7 @@ TOOL_VERSION_REGISTRY: dict[str, str] = {
     "get_few_shot_examples": DEFAULT_TOOL_VERSION,
     "get_interaction_details": DEFAULT_TOOL_VERSION,
     "get_sample_data": DEFAULT_TOOL_VERSION,
+    "get_schema_snapshot_id": DEFAULT_TOOL_VERSION,
     "get_semantic_definitions": DEFAULT_TOOL_VERSION,
     "get_semantic_subgraph": DEFAULT_TOOL_VERSION,
     "get_table_schema": DEFAULT_TOOL_VERSION,
@@ -13,6 +13,7 @@ from sqlglot import exp
 from common.config.env import get_env_str
 from common.errors.error_codes import ErrorCode
 from common.models.error_metadata import ErrorCategory
+from common.sql.facts import SqlFacts, collect_sql_facts
 
 # Statement types allowed for execution
 # Using strings for easy comparison with AST node keys or type names
@@ -274,11 +275,10 @@ def classify_blocked_statement(
 # perform mutations or acquire exclusive locks.
 # ---------------------------------------------------------------------------
 
-# CTE body node types whose presence makes a CTE "data-modifying".
-_MODIFYING_CTE_TYPES = (exp.Insert, exp.Update, exp.Delete, exp.Merge)
 
-
-def classify_readonly_bypass(statement: exp.Expression) -> str | None:  # noqa: C901
+def classify_readonly_bypass(
+    statement: exp.Expression, facts: SqlFacts | None = None
+) -> str | None:
     """Detect SELECT-adjacent forms that violate strict read-only posture.
 
     Checks (in order):
@@ -288,44 +288,40 @@ def classify_readonly_bypass(statement: exp.Expression) -> str | None:  # noqa:
     3. Locking clauses — ``FOR UPDATE``, ``FOR SHARE``, ``FOR NO KEY UPDATE``,
        ``FOR KEY SHARE``.
 
+    ``facts`` may be passed when the caller already collected them for
+    ``statement``.
+
     Returns a short label string describing the violation, or ``None`` when the
     statement passes all read-only checks.
     """
+    if facts is None:
+        facts = collect_sql_facts(statement)
+
     # 1. Data-modifying CTEs ---------------------------------------------------
-    for with_node in statement.find_all(exp.With):
-        for cte in with_node.expressions:
-            # Each CTE is an exp.CTE whose .this is the body expression.
-            body = cte.this if isinstance(cte, exp.CTE) else cte
-            if body is None:
-                continue
-            # Direct modifying node types.
-            if isinstance(body, _MODIFYING_CTE_TYPES):
-                return "MODIFYING_CTE"
-            # Recursively blocked statements (COPY, DO, CALL, …).
-            if classify_blocked_statement(body) is not None:
-                return "MODIFYING_CTE"
-            # Nested modifying nodes inside the CTE body.
-            for child in body.walk():
-                if isinstance(child, _MODIFYING_CTE_TYPES):
-                    return "MODIFYING_CTE"
+    if facts.has_modifying_cte:
+        return "MODIFYING_CTE"
+    for cte in facts.ctes:
+        # Recursively blocked statements (COPY, DO, CALL, …).
+        if cte.this is not None and classify_blocked_statement(cte.this) is not None:
+            return "MODIFYING_CTE"
 
     # 2. SELECT INTO -----------------------------------------------------------
     # sqlglot represents Postgres SELECT...INTO as exp.Select with an "into"
     # argument, OR as a top-level exp.Create with SELECT source, depending on
     # the dialect.  Cover both representations.
-    for select_node in statement.find_all(exp.Select):
-        if select_node.args.get("into"):
-            return "SELECT INTO"
+    if any(select_node.args.get("into") for select_node in facts.selects):
+        return "SELECT INTO"
 
     # 3. Locking clauses (FOR UPDATE / FOR SHARE / …) -------------------------
-    for lock_node in statement.find_all(exp.Lock):
-        _ = lock_node  # presence alone is sufficient
+    if facts.locks:
         return "LOCKING_CLAUSE"
 
     return None
 
 
-def classify_sql_policy_violation(statement: exp.Expression) -> SQLPolicyViolation | None:
+def classify_sql_policy_violation(
+    statement: exp.Expression, facts: SqlFacts | None = None
+) -> SQLPolicyViolation | None:
     """Return the first shared SQL policy violation detected in a statement AST.
 
     Classification hierarchy:
@@ -336,6 +332,7 @@ def classify_sql_policy_violation(statement: exp.Expression) -> SQLPolicyViolati
 
     Both the Agent ``PolicyEnforcer`` and the MCP ``_validate_sql_ast_failure``
     call this routine so classification is always identical across layers.
+    Callers holding ``SqlFacts`` for ``statement`` pass them to skip the walk.
     """
     blocked_statement = classify_blocked_statement(statement)
     if blocked_statement:
@@ -352,7 +349,10 @@ def classify_sql_policy_violation(statement: exp.Expression) -> SQLPolicyViolati
             statement=str(statement.key).upper(),
         )
 
-    readonly_bypass = classify_readonly_bypass(statement)
+    if facts is None:
+        facts = collect_sql_facts(statement)
+
+    readonly_bypass = classify_readonly_bypass(statement, facts)
     if readonly_bypass:
         return SQLPolicyViolation(
             reason_code="readonly_violation",
@@ -360,7 +360,7 @@ def classify_sql_policy_violation(statement: exp.Expression) -> SQLPolicyViolati
             statement=readonly_bypass,
         )
 
-    for node in statement.find_all(exp.Func):
+    for node in facts.functions:
         for function_name in extract_function_names(node):
             if function_name in BLOCKED_FUNCTIONS:
                 return SQLPolicyViolation(
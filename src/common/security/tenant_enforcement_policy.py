@@ -78,14 +78,15 @@ class TenantSQLShapeClassifier:
 
     def classify(self, sql: str, provider: str = "sqlite") -> TenantSQLShape:
         """Classify the provided SQL shape for enforcement capability."""
-        import sqlglot
         from sqlglot import exp
 
+        from common.sql.ast_cache import parse_sql
         from common.sql.dialect import normalize_sqlglot_dialect
+        from common.sql.facts import get_sql_facts
 
         dialect = normalize_sqlglot_dialect(provider.strip().lower())
         try:
-            expressions = sqlglot.parse(sql, read=dialect)
+            expressions = parse_sql(sql, dialect, copy=False)
         except Exception:
             return TenantSQLShape.PARSE_ERROR
 
@@ -93,8 +94,8 @@ class TenantSQLShapeClassifier:
             return TenantSQLShape.UNSUPPORTED_STATEMENT_TYPE
 
         expression = expressions[0]
-        ast_node_count = sum(1 for _ in expression.walk())
-        if ast_node_count > self.max_ast_nodes:
+        facts = get_sql_facts(expression)
+        if facts.node_count > self.max_ast_nodes:
             return TenantSQLShape.UNSUPPORTED_COMPLEXITY
 
         from common.sql.tenant_sql_rewriter import (
@@ -115,7 +116,7 @@ class TenantSQLShapeClassifier:
         has_cte_args = expression.args.get("with_") is not None
         if has_cte_args and classify_cte_query(expression) == CTEClassification.UNSUPPORTED_CTE:
             return TenantSQLShape.UNSUPPORTED_CTE
-        if any(True for _ in expression.find_all(exp.Window)):
+        if facts.windows:
             return TenantSQLShape.UNSUPPORTED_WINDOW_FUNCTION
         if _has_nested_from_subquery(expression):
             return TenantSQLShape.UNSUPPORTED_NESTED_FROM
@@ -123,7 +124,7 @@ class TenantSQLShapeClassifier:
             return TenantSQLShape.UNSUPPORTED_CORRELATED_SUBQUERY
 
         with_ = expression.args.get("with_")
-        for select in expression.find_all(exp.Select):
+        for select in facts.selects:
             if select is expression:
                 continue
             is_cte_body = False
@@ -873,14 +874,14 @@ class TenantEnforcementPolicy:
         provider: str,
         global_table_allowlist: set[str] | None,
     ) -> bool:
-        import sqlglot
         from sqlglot import exp
 
+        from common.sql.ast_cache import parse_sql_one
         from common.sql.dialect import normalize_sqlglot_dialect
 
         dialect = normalize_sqlglot_dialect((provider or "").strip().lower())
         try:
-            expression = sqlglot.parse_one(sql, read=dialect)
+            expression = parse_sql_one(sql, dialect, copy=False)
         except Exception:
             return False
         if not isinstance(expression, exp.Select):
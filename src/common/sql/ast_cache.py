@@ -0,0 +1,160 @@
+"""Process-wide parse-once cache of sqlglot syntax trees.
+
+A generated SQL string is parsed by validation, policy enforcement, complexity
+analysis, tenant rewriting, pagination and execution. ``parse_sql`` and
+``parse_sql_one`` are drop-in replacements for ``sqlglot.parse`` and
+``sqlglot.parse_one`` that parse each (SQL, dialect) pair once and serve later
+calls from a bounded LRU.
+
+Cached trees are shared, so callers receive a copy by default. Callers that
+only inspect the tree may pass ``copy=False`` to skip the copy; they must not
+mutate the result. Parse errors are cached too; every call raises a fresh copy
+of the cached error, so repeat failures neither share one exception object
+across threads nor grow its traceback.
+"""
+
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import sqlglot
+from sqlglot import exp
+from sqlglot.errors import ParseError
+
+from common.config.env import get_env_int
+
+DEFAULT_MAX_ENTRIES = 512
+
+_CacheKey = Tuple[bytes, str]
+
+
+@dataclass
+class _Entry:
+    expressions: Optional[List[Optional[exp.Expression]]]
+    error: Optional[Exception]
+    parse_seconds: float
+
+
+class SqlAstCache:
+    """Thread-safe LRU of parsed statements keyed by (SQL hash, dialect)."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """Initialize an empty cache; ``max_entries <= 0`` disables caching."""
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[_CacheKey, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.parse_seconds = 0.0
+        self.saved_seconds = 0.0
+
+    def parse(
+        self, sql: str, dialect: Any = None, *, copy: bool = True
+    ) -> List[Optional[exp.Expression]]:
+        """Parse ``sql`` like ``sqlglot.parse``, serving repeats from the cache."""
+        entry = self._get_or_parse(sql, dialect)
+        if entry.error is not None:
+            raise _fresh_error(entry.error) from None
+        if not copy:
+            return list(entry.expressions)
+        return [e.copy() if e is not None else None for e in entry.expressions]
+
+    def parse_one(self, sql: str, dialect: Any = None, *, copy: bool = True):
+        """Parse ``sql`` like ``sqlglot.parse_one``, serving repeats from the cache."""
+        expressions = self.parse(sql, dialect, copy=copy)
+        if not expressions or expressions[0] is None:
+            raise ParseError(f"No expression was parsed from '{sql}'")
+        if len(expressions) > 1:
+            # Multi-statement handling differs across sqlglot versions; defer to it
+            return sqlglot.parse_one(sql, read=dialect)
+        return expressions[0]
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+            self.parse_seconds = self.saved_seconds = 0.0
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """Return hit/miss counts and parse time spent and saved."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "parse_ms": self.parse_seconds * 1000.0,
+                "saved_ms": self.saved_seconds * 1000.0,
+            }
+
+    def _get_or_parse(self, sql: str, dialect: Any) -> _Entry:
+        key = (hashlib.blake2b(sql.encode("utf-8"), digest_size=16).digest(), _dialect_key(dialect))
+        if self.max_entries > 0:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    self.saved_seconds += entry.parse_seconds
+                    return entry
+
+        start = time.perf_counter()
+        try:
+            entry = _Entry(sqlglot.parse(sql, read=dialect), None, 0.0)
+        except Exception as e:
+            # Keep only the error itself; its traceback would pin parser frames.
+            entry = _Entry(None, e.with_traceback(None), 0.0)
+        entry.parse_seconds = time.perf_counter() - start
+
+        with self._lock:
+            self.misses += 1
+            self.parse_seconds += entry.parse_seconds
+            if self.max_entries > 0:
+                self._entries[key] = entry
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return entry
+
+
+def _fresh_error(error: Exception) -> Exception:
+    """Return a traceback-free copy of a cached parse error."""
+    fresh = copy.copy(error)
+    errors = getattr(fresh, "errors", None)
+    if isinstance(errors, list):
+        fresh.errors = list(errors)
+    return fresh
+
+
+def _dialect_key(dialect: Any) -> str:
+    if dialect is None or isinstance(dialect, str):
+        return dialect or ""
+    # sqlglot Dialect instances or classes (e.g. from sqlglot.Dialect.get)
+    cls = dialect if isinstance(dialect, type) else type(dialect)
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+_cache: Optional[SqlAstCache] = None
+
+
+def get_sql_ast_cache() -> SqlAstCache:
+    """Return the process-wide cache sized by ``SQL_AST_CACHE_MAX_ENTRIES``."""
+    global _cache
+    if _cache is None:
+        _cache = SqlAstCache(get_env_int("SQL_AST_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES))
+    return _cache
+
+
+def parse_sql(
+    sql: str, dialect: Any = None, *, copy: bool = True
+) -> List[Optional[exp.Expression]]:
+    """Parse ``sql`` through the process-wide cache; see ``SqlAstCache.parse``."""
+    return get_sql_ast_cache().parse(sql, dialect, copy=copy)
+
+
+def parse_sql_one(sql: str, dialect: Any = None, *, copy: bool = True):
+    """Parse one statement through the process-wide cache."""
+    return get_sql_ast_cache().parse_one(sql, dialect, copy=copy)
@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, Optional
+from typing import Optional
 
-import sqlglot
 from sqlglot import exp
 
 from common.config.env import get_env_bool, get_env_int
+from common.sql.ast_cache import parse_sql_one
+from common.sql.facts import SqlFacts, collect_sql_facts, get_sql_facts
 
 
 @dataclass(frozen=True)
@@ -84,17 +85,21 @@ def get_mcp_complexity_limits() -> ComplexityLimits:
 
 def analyze_sql_complexity(sql: str, *, dialect: str = "postgres") -> ComplexityMetrics:
     """Parse SQL and compute complexity metrics."""
-    expression = sqlglot.parse_one(sql, read=dialect)
-    return compute_complexity_metrics(expression)
+    expression = parse_sql_one(sql, dialect, copy=False)
+    return compute_complexity_metrics(expression, get_sql_facts(expression))
 
 
-def compute_complexity_metrics(expression: exp.Expression) -> ComplexityMetrics:
+def compute_complexity_metrics(
+    expression: exp.Expression, facts: Optional[SqlFacts] = None
+) -> ComplexityMetrics:
     """Compute complexity metrics from a parsed sqlglot expression."""
-    joins = _count_joins(expression)
-    ctes = len(tuple(expression.find_all(exp.CTE)))
-    subquery_depth = _max_subquery_depth(expression)
-    has_cartesian = _has_cartesian_join(expression)
-    projection_count = _projection_count(expression)
+    if facts is None:
+        facts = collect_sql_facts(expression)
+    joins = facts.join_count
+    ctes = len(facts.ctes)
+    subquery_depth = facts.subquery_depth
+    has_cartesian = any(_is_join_cartesian(join_node) for join_node in facts.joins)
+    projection_count = facts.projection_count
     score = _complexity_score(
         joins=joins,
         ctes=ctes,
@@ -156,19 +161,6 @@ def find_complexity_violation(
     return None
 
 
-def _count_joins(expression: exp.Expression) -> int:
-    joins = len(tuple(expression.find_all(exp.Join)))
-    # Some dialect/parser combinations may keep implicit comma tables in from_.expressions.
-    implicit_joins = 0
-    for select in expression.find_all(exp.Select):
-        from_clause = select.args.get("from_")
-        if from_clause is None:
-            continue
-        extra_from_entries = max(0, len(from_clause.expressions) - 1)
-        implicit_joins += extra_from_entries
-    return joins + implicit_joins
-
-
 def _is_join_cartesian(join_node: exp.Join) -> bool:
     kind = str(join_node.args.get("kind") or "").upper()
     method = str(join_node.args.get("method") or "").upper()
@@ -182,40 +174,6 @@ def _is_join_cartesian(join_node: exp.Join) -> bool:
     return not has_on and not has_using
 
 
-def _has_cartesian_join(expression: exp.Expression) -> bool:
-    return any(_is_join_cartesian(join_node) for join_node in expression.find_all(exp.Join))
-
-
-def _children(node: exp.Expression) -> Iterable[exp.Expression]:
-    for value in node.args.values():
-        if isinstance(value, exp.Expression):
-            yield value
-            continue
-        if isinstance(value, list):
-            for item in value:
-                if isinstance(item, exp.Expression):
-                    yield item
-
-
-def _max_subquery_depth(node: exp.Expression, depth: int = 0) -> int:
-    current_depth = depth + 1 if isinstance(node, exp.Subquery) else depth
-    max_depth = current_depth
-    for child in _children(node):
-        child_depth = _max_subquery_depth(child, current_depth)
-        if child_depth > max_depth:
-            max_depth = child_depth
-    return max_depth
-
-
-def _projection_count(expression: exp.Expression) -> int | None:
-    top_level_select = (
-        expression if isinstance(expression, exp.Select) else expression.find(exp.Select)
-    )
-    if not isinstance(top_level_select, exp.Select):
-        return None
-    return len(top_level_select.expressions or [])
-
-
 def _complexity_score(
     *,
     joins: int,
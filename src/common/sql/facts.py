@@ -0,0 +1,189 @@
+"""Single-pass structural facts about a parsed SQL statement.
+
+Complexity limits, the shared SQL policy, tenant rewrite targeting and keyset
+table extraction all need the same node inventories (joins, selects, tables,
+functions, ...). ``collect_sql_facts`` gathers them in one breadth-first walk,
+visiting nodes in the same order as ``Expression.find_all``, so consumers can
+swap a ``find_all`` for the matching ``SqlFacts`` field without changing which
+node is reported first.
+
+``get_sql_facts`` memoizes facts for shared, read-only trees such as those
+returned by ``common.sql.ast_cache`` with ``copy=False``. Trees that are going
+to be mutated must use ``collect_sql_facts`` directly.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlglot import exp
+
+# Node types that make a CTE body data-modifying.
+_MODIFYING_NODE_TYPES = (exp.Insert, exp.Update, exp.Delete, exp.Merge)
+
+# DML, DDL and opaque command nodes; never legitimate inside a read-only query.
+_WRITE_STATEMENT_TYPES = _MODIFYING_NODE_TYPES + (
+    exp.Drop,
+    exp.Alter,
+    exp.Create,
+    exp.Grant,
+    exp.Revoke,
+    exp.Command,
+)
+
+_MEMO_MAX_ENTRIES = 256
+
+
+@dataclass(frozen=True)
+class SqlFacts:
+    """Node inventories and shape measurements gathered in one AST walk."""
+
+    root: exp.Expression
+    node_count: int
+    selects: tuple[exp.Select, ...]
+    joins: tuple[exp.Join, ...]
+    implicit_joins: int
+    ctes: tuple[exp.CTE, ...]
+    subqueries: tuple[exp.Subquery, ...]
+    subquery_depth: int
+    scope_depth: int
+    tables: tuple[exp.Table, ...]
+    columns: tuple[exp.Column, ...]
+    functions: tuple[exp.Func, ...]
+    locks: tuple[exp.Lock, ...]
+    windows: tuple[exp.Window, ...]
+    set_operations: tuple[exp.SetOperation, ...]
+    write_statements: tuple[exp.Expression, ...]
+    has_modifying_cte: bool
+
+    @property
+    def join_count(self) -> int:
+        """Explicit joins plus implicit comma joins."""
+        return len(self.joins) + self.implicit_joins
+
+    @property
+    def projection_count(self) -> Optional[int]:
+        """Projection count of the outermost SELECT, if any."""
+        if not self.selects:
+            return None
+        return len(self.selects[0].expressions or [])
+
+    @property
+    def cte_names(self) -> set[str]:
+        """Lower-cased names of every CTE defined in the statement."""
+        return {cte.alias_or_name.lower() for cte in self.ctes if cte.alias_or_name}
+
+    @property
+    def blocked_statement(self) -> Optional[str]:
+        """Blocked-statement label for the root statement, if any."""
+        from common.policy.sql_policy import classify_blocked_statement
+
+        return classify_blocked_statement(self.root)
+
+
+def collect_sql_facts(expression: exp.Expression) -> SqlFacts:  # noqa: C901
+    """Walk ``expression`` once and return its structural facts."""
+    selects: list[exp.Select] = []
+    joins: list[exp.Join] = []
+    ctes: list[exp.CTE] = []
+    subqueries: list[exp.Subquery] = []
+    tables: list[exp.Table] = []
+    columns: list[exp.Column] = []
+    functions: list[exp.Func] = []
+    locks: list[exp.Lock] = []
+    windows: list[exp.Window] = []
+    set_operations: list[exp.SetOperation] = []
+    write_statements: list[exp.Expression] = []
+    implicit_joins = 0
+    node_count = 0
+    max_subquery_depth = 0
+    max_scope_depth = 0
+    has_modifying_cte = False
+
+    # (node, enclosing subquery depth, enclosing SELECT depth, inside a CTE body)
+    queue: deque[tuple[exp.Expression, int, int, bool]] = deque([(expression, 0, 0, False)])
+    while queue:
+        node, subquery_depth, scope_depth, in_cte = queue.popleft()
+        node_count += 1
+
+        if isinstance(node, exp.Subquery):
+            subquery_depth += 1
+            subqueries.append(node)
+            max_subquery_depth = max(max_subquery_depth, subquery_depth)
+        if isinstance(node, exp.Select):
+            scope_depth += 1
+            selects.append(node)
+            max_scope_depth = max(max_scope_depth, scope_depth)
+            from_clause = node.args.get("from_")
+            if from_clause is not None:
+                # Some dialects keep implicit comma tables in from_.expressions.
+                implicit_joins += max(0, len(from_clause.expressions) - 1)
+        elif isinstance(node, exp.Join):
+            joins.append(node)
+        elif isinstance(node, exp.Table):
+            tables.append(node)
+        elif isinstance(node, exp.Column):
+            columns.append(node)
+        elif isinstance(node, exp.CTE):
+            ctes.append(node)
+        elif isinstance(node, exp.Lock):
+            locks.append(node)
+        elif isinstance(node, exp.Window):
+            windows.append(node)
+        elif isinstance(node, exp.SetOperation):
+            set_operations.append(node)
+        elif isinstance(node, _WRITE_STATEMENT_TYPES):
+            write_statements.append(node)
+        if isinstance(node, exp.Func):
+            functions.append(node)
+        if in_cte and isinstance(node, _MODIFYING_NODE_TYPES):
+            has_modifying_cte = True
+
+        child_in_cte = in_cte or isinstance(node, exp.CTE)
+        for child in node.iter_expressions():
+            queue.append((child, subquery_depth, scope_depth, child_in_cte))
+
+    return SqlFacts(
+        root=expression,
+        node_count=node_count,
+        selects=tuple(selects),
+        joins=tuple(joins),
+        implicit_joins=implicit_joins,
+        ctes=tuple(ctes),
+        subqueries=tuple(subqueries),
+        subquery_depth=max_subquery_depth,
+        scope_depth=max_scope_depth,
+        tables=tuple(tables),
+        columns=tuple(columns),
+        functions=tuple(functions),
+        locks=tuple(locks),
+        windows=tuple(windows),
+        set_operations=tuple(set_operations),
+        write_statements=tuple(write_statements),
+        has_modifying_cte=has_modifying_cte,
+    )
+
+
+_memo: "OrderedDict[int, SqlFacts]" = OrderedDict()
+_memo_lock = threading.Lock()
+
+
+def get_sql_facts(expression: exp.Expression) -> SqlFacts:
+    """Return memoized facts for a shared tree that is never mutated."""
+    key = id(expression)
+    with _memo_lock:
+        facts = _memo.get(key)
+        # SqlFacts holds the root, so a live entry's id cannot be reused.
+        if facts is not None and facts.root is expression:
+            _memo.move_to_end(key)
+            return facts
+
+    facts = collect_sql_facts(expression)
+    with _memo_lock:
+        _memo[key] = facts
+        while len(_memo) > _MEMO_MAX_ENTRIES:
+            _memo.popitem(last=False)
+    return facts
@@ -7,11 +7,12 @@ from dataclasses import dataclass, field, replace
 from enum import Enum
 from typing import Mapping, Sequence
 
-import sqlglot
 from sqlglot import exp
 
 from common.config.env import get_env_bool, get_env_int
+from common.sql.ast_cache import parse_sql, parse_sql_one
 from common.sql.dialect import normalize_sqlglot_dialect
+from common.sql.facts import collect_sql_facts
 
 SUPPORTED_SQL_REWRITE_PROVIDERS = {"sqlite", "duckdb"}
 _SET_OPERATION_TYPES = (exp.Union, exp.Intersect, exp.Except)
@@ -291,7 +292,7 @@ def _build_rewrite_failure(
 def _canonicalize_rewritten_sql(expression: exp.Expression, *, dialect: str) -> str:
     rendered = expression.sql(dialect=dialect, pretty=False)
     try:
-        canonical = sqlglot.parse_one(rendered, read=dialect)
+        canonical = parse_sql_one(rendered, dialect, copy=False)
     except Exception:
         return rendered
     return canonical.sql(dialect=dialect, pretty=False)
@@ -380,7 +381,7 @@ def _validate_transform_result(
 
     dialect = normalize_sqlglot_dialect(request.provider.strip().lower())
     try:
-        expressions = sqlglot.parse(result.rewritten_sql, read=dialect)
+        expressions = parse_sql(result.rewritten_sql, dialect)
     except Exception:
         return _build_rewrite_failure(
             kind=TransformerErrorKind.REWRITTEN_SQL_INVALID,
@@ -393,7 +394,7 @@ def _validate_transform_result(
         )
 
     try:
-        original_expressions = sqlglot.parse(request.sql, read=dialect)
+        original_expressions = parse_sql(request.sql, dialect)
     except Exception:
         original_expressions = []
 
@@ -454,7 +455,7 @@ def _transform_tenant_scoped_sql_impl(request: RewriteRequest) -> RewriteSuccess
 
     dialect = normalize_sqlglot_dialect(normalized_provider)
     try:
-        expressions = sqlglot.parse(sql, read=dialect)
+        expressions = parse_sql(sql, dialect)
     except Exception as exc:
         raise TenantSQLTransformerError(
             TransformerErrorKind.PARSE_ERROR,
@@ -474,8 +475,8 @@ def _transform_tenant_scoped_sql_impl(request: RewriteRequest) -> RewriteSuccess
             "Tenant rewrite supports SELECT statements only.",
         )
 
-    ast_node_count = _sql_ast_node_count(expression)
-    if ast_node_count > max_ast_nodes:
+    facts = collect_sql_facts(expression)
+    if facts.node_count > max_ast_nodes:
         raise TenantSQLTransformerError(
             TransformerErrorKind.AST_COMPLEXITY_EXCEEDED,
             (
@@ -494,13 +495,13 @@ def _transform_tenant_scoped_sql_impl(request: RewriteRequest) -> RewriteSuccess
             )
 
     rewrite_has_cte = expression.args.get("with_") is not None
-    rewrite_has_subquery = _has_subquery(expression)
-    rewrite_scope_depth = _scope_depth(expression)
+    rewrite_has_subquery = bool(facts.subqueries)
+    rewrite_scope_depth = max(1, facts.scope_depth)
 
     allowlist = {entry.strip().lower() for entry in (global_table_allowlist or set()) if entry}
     normalized_columns = _normalize_table_columns(table_columns)
 
-    targets = _collect_all_rewrite_targets(expression, classification)
+    targets = _collect_all_rewrite_targets(expression, classification, facts.selects)
     if len(targets) > max_targets:
         raise TenantSQLTransformerError(
             TransformerErrorKind.TARGET_LIMIT_EXCEEDED,
@@ -701,7 +702,7 @@ def rewrite_tenant_scoped_sql(
 
     dialect = normalize_sqlglot_dialect(normalized_provider)
     try:
-        expressions = sqlglot.parse(sql, read=dialect)
+        expressions = parse_sql(sql, dialect)
     except Exception as exc:
         raise TenantSQLRewriteError(
             "SQL parse failed for tenant rewrite.", reason_code="PARSE_ERROR"
@@ -713,8 +714,8 @@ def rewrite_tenant_scoped_sql(
         )
 
     expression = expressions[0]
-    ast_node_count = _sql_ast_node_count(expression)
-    if ast_node_count > settings.max_ast_nodes:
+    facts = collect_sql_facts(expression)
+    if facts.node_count > settings.max_ast_nodes:
         raise TenantSQLRewriteError(
             "Tenant rewrite AST complexity exceeded the maximum allowed node count "
             f"({settings.max_ast_nodes}).",
@@ -723,14 +724,14 @@ def rewrite_tenant_scoped_sql(
     classification = _assert_rewrite_eligible(expression, strict_mode=settings.strict_mode)
     assert isinstance(expression, exp.Select)
     rewrite_has_cte = expression.args.get("with_") is not None
-    rewrite_has_subquery = _has_subquery(expression)
-    rewrite_scope_depth = _scope_depth(expression)
+    rewrite_has_subquery = bool(facts.subqueries)
+    rewrite_scope_depth = max(1, facts.scope_depth)
 
     allowlist = {entry.strip().lower() for entry in (global_table_allowlist or set()) if entry}
     normalized_columns = _normalize_table_columns(table_columns)
 
     # 1. Collect all rewrite targets across all scopes
-    targets = _collect_all_rewrite_targets(expression, classification)
+    targets = _collect_all_rewrite_targets(expression, classification, facts.selects)
 
     if len(targets) > settings.max_targets:
         raise TenantSQLRewriteError(
@@ -891,8 +892,11 @@ def rewrite_tenant_scoped_sql(
 
 
 def _collect_all_rewrite_targets(
-    expression: exp.Select, classification: CTEClassification | None
+    expression: exp.Select,
+    classification: CTEClassification | None,
+    selects: Sequence[exp.Select] | None = None,
 ) -> list[RewriteTarget]:
+    """Collect rewrite targets; ``selects`` reuses a prior ``find_all(exp.Select)``."""
     targets: list[RewriteTarget] = []
 
     # 1. Collect from CTEs
@@ -913,7 +917,9 @@ def _collect_all_rewrite_targets(
 
     # 2. Collect from final SELECT and all its nested subqueries
     with_ = expression.args.get("with_")
-    for select in expression.find_all(exp.Select):
+    if selects is None:
+        selects = tuple(expression.find_all(exp.Select))
+    for select in selects:
         is_cte_body = False
         if with_:
             for cte in with_.expressions:
@@ -1018,31 +1024,6 @@ def _table_keys(table: exp.Table) -> list[str]:
     return keys
 
 
-def _sql_ast_node_count(expression: exp.Expression) -> int:
-    """Count AST nodes to bound rewrite traversal complexity."""
-    return sum(1 for _ in expression.walk())
-
-
-def _scope_depth(expression: exp.Select) -> int:
-    """Return max nested SELECT scope depth for rewrite diagnostics."""
-    max_depth = 1
-    for select in expression.find_all(exp.Select):
-        depth = 1
-        parent = select.parent
-        while parent is not None:
-            if isinstance(parent, exp.Select):
-                depth += 1
-            parent = parent.parent
-        if depth > max_depth:
-            max_depth = depth
-    return max_depth
-
-
-def _has_subquery(expression: exp.Select) -> bool:
-    """Return True if query contains an explicit subquery expression."""
-    return any(True for _ in expression.find_all(exp.Subquery))
-
-
 def _should_run_invariant_checks(settings: TenantRewriteSettings | None = None) -> bool:
     """Run rewrite invariants only in debug/test modes."""
     rewrite_settings = settings or load_tenant_rewrite_settings()
@@ -1186,8 +1167,8 @@ def assert_rewrite_invariants(
 
     normalized_provider = (provider or "").strip().lower()
     dialect = normalize_sqlglot_dialect(normalized_provider)
-    original_expressions = sqlglot.parse(sql, read=dialect)
-    rewritten_expressions = sqlglot.parse(rewritten_sql, read=dialect)
+    original_expressions = parse_sql(sql, dialect)
+    rewritten_expressions = parse_sql(rewritten_sql, dialect)
 
     if len(original_expressions) != 1 or original_expressions[0] is None:
         raise AssertionError("Invariant input must contain exactly one original SQL statement.")
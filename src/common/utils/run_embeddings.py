@@ -0,0 +1,129 @@
+"""Run-scoped memo for query embeddings.
+
+A single agent run sends the same question to several MCP tools (cache lookup,
+subgraph retrieval, few-shot recommendation), and each used to embed it again.
+Embedding entry points route through ``run_embedding_memo`` so a question is
+embedded once per run and per model; concurrent requests for the same text
+share one in-flight computation.
+
+The scope is the ``run_id`` (falling back to ``request_id``) from
+``common.observability.context``. Code that fans one question out to several
+lookups outside a run can open a local scope with ``embedding_scope()``.
+Calls with no scope at all are not memoized.
+"""
+
+import asyncio
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from common.observability.context import request_id_var, run_id_var
+
+DEFAULT_MAX_RUNS = 512
+DEFAULT_TTL_SECONDS = 600.0
+
+_Entry = Union[List[float], "asyncio.Future[Optional[List[float]]]"]
+
+
+_local_scope_var: ContextVar[Optional[str]] = ContextVar("embedding_scope", default=None)
+
+
+def current_run_scope() -> Optional[str]:
+    """Return the identifier embeddings are memoized under, if any."""
+    return run_id_var.get() or request_id_var.get() or _local_scope_var.get()
+
+
+@contextmanager
+def embedding_scope() -> Iterator[None]:
+    """Memoize embeddings for the duration of the block if no run scope is active."""
+    if current_run_scope() is not None:
+        yield
+        return
+    token = _local_scope_var.set(f"local:{uuid.uuid4().hex}")
+    try:
+        yield
+    finally:
+        _local_scope_var.reset(token)
+
+
+class RunEmbeddingMemo:
+    """Bounded map of run id -> {(model, text): embedding}."""
+
+    def __init__(
+        self, max_runs: int = DEFAULT_MAX_RUNS, ttl_seconds: float = DEFAULT_TTL_SECONDS
+    ) -> None:
+        """Initialize the memo.
+
+        Args:
+            max_runs: Number of runs kept before the least recent is dropped.
+            ttl_seconds: Age after which a run's embeddings are discarded.
+        """
+        self.max_runs = max_runs
+        self.ttl_seconds = ttl_seconds
+        self._runs: "OrderedDict[str, Tuple[float, Dict[Tuple[str, str], _Entry]]]" = OrderedDict()
+
+    def _entries(self, scope: str) -> Dict[Tuple[str, str], _Entry]:
+        now = time.monotonic()
+        run = self._runs.get(scope)
+        if run is None or now - run[0] > self.ttl_seconds:
+            run = (now, {})
+            self._runs[scope] = run
+        self._runs.move_to_end(scope)
+        while len(self._runs) > self.max_runs:
+            self._runs.popitem(last=False)
+        return run[1]
+
+    async def get_or_compute(
+        self,
+        model_name: str,
+        text: str,
+        compute: Callable[[], Awaitable[List[float]]],
+    ) -> List[float]:
+        """Return the run's embedding of ``text``, computing it at most once.
+
+        Args:
+            model_name: Model identifier; different models never share entries.
+            text: Text to embed (whitespace differences are ignored).
+            compute: Coroutine factory producing the embedding on a miss.
+        """
+        scope = current_run_scope()
+        if scope is None:
+            return await compute()
+
+        entries = self._entries(scope)
+        key = (model_name, " ".join(text.split()))
+        entry = entries.get(key)
+        if isinstance(entry, list):
+            return entry
+
+        loop = asyncio.get_running_loop()
+        if entry is not None and entry.get_loop() is loop:
+            shared = await asyncio.shield(entry)
+            if shared is not None:
+                return shared
+            # The computation we waited on failed; compute our own below
+
+        pending: "asyncio.Future[Optional[List[float]]]" = loop.create_future()
+        entries[key] = pending
+        try:
+            embedding = await compute()
+        except BaseException:
+            if entries.get(key) is pending:
+                del entries[key]
+            pending.set_result(None)
+            raise
+
+        if entries.get(key) is pending:
+            entries[key] = embedding
+        pending.set_result(embedding)
+        return embedding
+
+    def clear(self) -> None:
+        """Forget every run."""
+        self._runs.clear()
+
+
+run_embedding_memo = RunEmbeddingMemo()
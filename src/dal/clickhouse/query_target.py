@@ -108,11 +108,9 @@ class _ClickHouseConnection:
         enforce_read_only_sql(sql, provider="clickhouse", read_only=self._read_only)
 
         async def _run():
-            rows = await self._run_query(sql, list(params))
-            limit = self._max_rows
-            if self._sync_max_rows:
-                limit = min(limit, self._sync_max_rows) if limit else self._sync_max_rows
-            capped_rows, truncated = cap_rows_with_metadata(rows, limit)
+            capped_rows, truncated = await self._run_query(
+                sql, list(params), max_rows=self._row_limit()
+            )
             self._last_truncated = truncated
             self._last_truncated_reason = "PROVIDER_CAP" if truncated else None
             return capped_rows
@@ -130,11 +128,9 @@ class _ClickHouseConnection:
         enforce_read_only_sql(sql, provider="clickhouse", read_only=self._read_only)
 
         async def _run():
-            rows, columns = await self._run_query_with_columns(sql, list(params))
-            limit = self._max_rows
-            if self._sync_max_rows:
-                limit = min(limit, self._sync_max_rows) if limit else self._sync_max_rows
-            capped_rows, truncated = cap_rows_with_metadata(rows, limit)
+            capped_rows, truncated, columns = await self._run_query_with_columns(
+                sql, list(params), max_rows=self._row_limit()
+            )
             self._last_truncated = truncated
             self._last_truncated_reason = "PROVIDER_CAP" if truncated else None
             return capped_rows, columns
@@ -157,7 +153,15 @@ class _ClickHouseConnection:
             return None
         return next(iter(row.values()))
 
-    async def _run_query(self, sql: str, params: List[Any]) -> List[Dict[str, Any]]:
+    def _row_limit(self) -> int:
+        limit = self._max_rows
+        if self._sync_max_rows:
+            limit = min(limit, self._sync_max_rows) if limit else self._sync_max_rows
+        return limit
+
+    async def _run_query(
+        self, sql: str, params: List[Any], max_rows: int = 0
+    ) -> tuple[List[Dict[str, Any]], bool]:
         translated_sql, bound_params = translate_postgres_params_to_clickhouse(sql, params)
         if self._read_only:
             validate_no_mutation_keywords(translated_sql)
@@ -167,7 +171,9 @@ class _ClickHouseConnection:
                 translated_sql, bound_params, columnar=False, with_column_types=True
             )
             col_names = [col[0] for col in columns]
-            return [dict(zip(col_names, row)) for row in rows]
+            # The client returns the result as one block; cap before building dicts.
+            rows, truncated = cap_rows_with_metadata(rows, max_rows)
+            return [dict(zip(col_names, row)) for row in rows], truncated
 
         return await run_with_timeout(
             _execute,
@@ -177,8 +183,8 @@ class _ClickHouseConnection:
         )
 
     async def _run_query_with_columns(
-        self, sql: str, params: List[Any]
-    ) -> tuple[List[Dict[str, Any]], list]:
+        self, sql: str, params: List[Any], max_rows: int = 0
+    ) -> tuple[List[Dict[str, Any]], bool, list]:
         translated_sql, bound_params = translate_postgres_params_to_clickhouse(sql, params)
         if self._read_only:
             validate_no_mutation_keywords(translated_sql)
@@ -188,8 +194,9 @@ class _ClickHouseConnection:
                 translated_sql, bound_params, columnar=False, with_column_types=True
             )
             col_names = [col[0] for col in columns]
+            rows, truncated = cap_rows_with_metadata(rows, max_rows)
             row_dicts = [dict(zip(col_names, row)) for row in rows]
-            return row_dicts, _columns_from_clickhouse_types(columns)
+            return row_dicts, truncated, _columns_from_clickhouse_types(columns)
 
         return await run_with_timeout(
             _execute,
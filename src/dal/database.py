@@ -1,4 +1,5 @@
 import logging
+import time
 from contextlib import asynccontextmanager
 from typing import Optional
 
@@ -34,6 +35,9 @@ from dal.session_guardrails import (
 
 logger = logging.getLogger(__name__)
 
+# undefined_object / insufficient_privilege raised while switching the execution role
+_ROLE_SWITCH_SQLSTATES = frozenset({"42704", "42501"})
+
 
 class Database:
     """Manages connection pools for PostgreSQL and Memgraph."""
@@ -283,9 +287,11 @@ class Database:
                     await DatabricksQueryTargetDatabase.init(DatabricksConfig.from_env())
             elif cls._query_target_provider == "duckdb":
                 from dal.duckdb import DuckDBConfig, DuckDBQueryTargetDatabase
+                from dal.duckdb.config import pool_settings_from_env
 
                 if runtime_config:
                     guardrails = runtime_config.guardrails
+                    pool_size, pool_health_check_seconds = pool_settings_from_env()
                     config = DuckDBConfig(
                         path=runtime_config.metadata["path"],
                         query_timeout_seconds=guardrail_int(
@@ -293,6 +299,8 @@ class Database:
                         ),
                         max_rows=guardrail_int(guardrails.get("max_rows"), 1000),
                         read_only=guardrail_bool(guardrails.get("read_only"), True),
+                        pool_size=pool_size,
+                        pool_health_check_seconds=pool_health_check_seconds,
                     )
                     await DuckDBQueryTargetDatabase.init(config)
                 else:
@@ -354,6 +362,7 @@ class Database:
                         max_size=20,
                         command_timeout=60,
                         server_settings={"application_name": "bi_agent_mcp"},
+                        init=cls._init_postgres_pool_connection,
                     )
                     print(f"✓ Database connection pool established: {db_user}@{db_host}/{db_name}")
                 except Exception as e:
@@ -487,6 +496,14 @@ class Database:
     @classmethod
     async def close(cls):
         """Close connection pools."""
+        # Flush write-behind state (buffered cache hit counts) while the pools are open
+        flush_hits = getattr(cls._cache_store, "flush_hits", None)
+        if flush_hits is not None:
+            try:
+                await flush_hits()
+            except Exception as e:
+                logger.warning("Failed to flush cache hit counts on shutdown: %s", e)
+
         if cls._pool:
             await cls._pool.close()
             try:
@@ -626,11 +643,6 @@ class Database:
             )
         return cls._query_target_capabilities
 
-    @staticmethod
-    def _quote_postgres_identifier(identifier: str) -> str:
-        """Return a safely quoted Postgres identifier."""
-        return '"' + identifier.replace('"', '""') + '"'
-
     @classmethod
     def _load_postgres_session_guardrail_settings(cls) -> PostgresSessionGuardrailSettings:
         """Resolve and validate guardrail settings at initialization time."""
@@ -668,8 +680,13 @@ class Database:
         conn: asyncpg.Connection,
         *,
         cache_key: str,
+        execution_role: str,
     ) -> tuple[bool, bool]:
-        """Return cached (installed, executable) capability for dblink extension."""
+        """Return cached (installed, executable) capability for dblink extension.
+
+        Privileges are checked for ``execution_role`` explicitly, so the probe can run
+        from the pool ``init`` hook before any role switch.
+        """
         cached = cls._postgres_extension_capability_cache.get(cache_key)
         if cached is not None:
             return cached
@@ -694,9 +711,10 @@ class Database:
                         JOIN pg_proc proc
                             ON proc.oid = dep.objid
                         WHERE ext.extname = 'dblink'
-                            AND has_function_privilege(proc.oid, 'EXECUTE')
+                            AND has_function_privilege($1, proc.oid, 'EXECUTE')
                     ) AS dblink_accessible
-                """
+                """,
+                execution_role,
             )
             if row is not None:
                 installed = bool(row["dblink_installed"])
@@ -711,6 +729,25 @@ class Database:
         cls._postgres_extension_capability_cache[cache_key] = (installed, accessible)
         return installed, accessible
 
+    @classmethod
+    async def _init_postgres_pool_connection(cls, conn: asyncpg.Connection) -> None:
+        """Warm the execution-role capability probe when the pool opens a connection."""
+        if cls._query_target_provider != "postgres":
+            return
+        try:
+            settings = cls._get_postgres_session_guardrail_settings()
+        except SessionGuardrailPolicyError:
+            # Misconfiguration fails closed on acquire; pool creation must not.
+            return
+        execution_role = settings.execution_role_name
+        if not settings.execution_role_enabled or not execution_role:
+            return
+        await cls._probe_postgres_dangerous_extension_capabilities(
+            conn,
+            cache_key=execution_role.lower(),
+            execution_role=execution_role,
+        )
+
     @classmethod
     def _record_postgres_extension_capability_signals(
         cls,
@@ -753,36 +790,37 @@ class Database:
         )
 
     @classmethod
-    async def _apply_postgres_restricted_session(
+    def _plan_postgres_restricted_session(
         cls,
-        conn: asyncpg.Connection,
         *,
         read_only: bool,
-    ) -> dict[str, object]:
-        """Apply optional Postgres-only transaction-local session hardening."""
+    ) -> tuple[dict[str, object], list[tuple[str, str]], Optional[str]]:
+        """Resolve guardrail metadata, transaction-local settings and execution role."""
         if not read_only:
-            return build_session_guardrail_metadata(
+            metadata = build_session_guardrail_metadata(
                 applied=False,
                 outcome=SESSION_GUARDRAIL_SKIPPED,
                 execution_role_applied=False,
                 execution_role_name=None,
                 restricted_session_mode=RESTRICTED_SESSION_MODE_OFF,
             )
+            return metadata, [], None
 
-        from common.config.env import get_env_bool, get_env_int, get_env_str
+        from common.config.env import get_env_int, get_env_str
 
         settings = cls._get_postgres_session_guardrail_settings()
         restricted_session_enabled = settings.restricted_session_enabled
         execution_role_enabled = settings.execution_role_enabled
 
+        metadata = build_session_guardrail_metadata(
+            applied=False,
+            outcome=SESSION_GUARDRAIL_SKIPPED,
+            execution_role_applied=False,
+            execution_role_name=settings.execution_role_name,
+            restricted_session_mode=RESTRICTED_SESSION_MODE_OFF,
+        )
         if not restricted_session_enabled and not execution_role_enabled:
-            return build_session_guardrail_metadata(
-                applied=False,
-                outcome=SESSION_GUARDRAIL_SKIPPED,
-                execution_role_applied=False,
-                execution_role_name=settings.execution_role_name,
-                restricted_session_mode=RESTRICTED_SESSION_MODE_OFF,
-            )
+            return metadata, [], None
 
         capabilities = cls.get_query_target_capabilities()
         settings.validate_capabilities(
@@ -805,21 +843,7 @@ class Database:
             )
 
         if cls._query_target_provider != "postgres":
-            return build_session_guardrail_metadata(
-                applied=False,
-                outcome=SESSION_GUARDRAIL_SKIPPED,
-                execution_role_applied=False,
-                execution_role_name=settings.execution_role_name,
-                restricted_session_mode=RESTRICTED_SESSION_MODE_OFF,
-            )
-
-        metadata = build_session_guardrail_metadata(
-            applied=False,
-            outcome=SESSION_GUARDRAIL_SKIPPED,
-            execution_role_applied=False,
-            execution_role_name=settings.execution_role_name,
-            restricted_session_mode=RESTRICTED_SESSION_MODE_OFF,
-        )
+            return metadata, [], None
 
         def _timeout_value(env_name: str, default_ms: int) -> Optional[str]:
             timeout_ms = get_env_int(env_name, default_ms)
@@ -827,8 +851,9 @@ class Database:
                 return None
             return f"{timeout_ms}ms"
 
+        session_settings: list[tuple[str, str]] = []
         if restricted_session_enabled:
-            await conn.execute("SELECT set_config('default_transaction_read_only', 'on', true)")
+            session_settings.append(("default_transaction_read_only", "on"))
             metadata = build_session_guardrail_metadata(
                 applied=True,
                 outcome=SESSION_GUARDRAIL_APPLIED,
@@ -837,81 +862,142 @@ class Database:
                 restricted_session_mode=RESTRICTED_SESSION_MODE_SET_LOCAL_CONFIG,
             )
 
-            statement_timeout = _timeout_value("POSTGRES_RESTRICTED_STATEMENT_TIMEOUT_MS", 15000)
-            if statement_timeout:
-                await conn.execute(
-                    "SELECT set_config('statement_timeout', $1, true)",
-                    statement_timeout,
-                )
+            for name, env_name, default_ms in (
+                ("statement_timeout", "POSTGRES_RESTRICTED_STATEMENT_TIMEOUT_MS", 15000),
+                ("lock_timeout", "POSTGRES_RESTRICTED_LOCK_TIMEOUT_MS", 5000),
+                (
+                    "idle_in_transaction_session_timeout",
+                    "POSTGRES_RESTRICTED_IDLE_IN_TRANSACTION_SESSION_TIMEOUT_MS",
+                    15000,
+                ),
+            ):
+                timeout = _timeout_value(env_name, default_ms)
+                if timeout:
+                    session_settings.append((name, timeout))
 
-            lock_timeout = _timeout_value("POSTGRES_RESTRICTED_LOCK_TIMEOUT_MS", 5000)
-            if lock_timeout:
-                await conn.execute(
-                    "SELECT set_config('lock_timeout', $1, true)",
-                    lock_timeout,
-                )
+            search_path = (get_env_str("POSTGRES_RESTRICTED_SEARCH_PATH", "") or "").strip()
+            if search_path:
+                session_settings.append(("search_path", search_path))
 
-            idle_in_txn_timeout = _timeout_value(
-                "POSTGRES_RESTRICTED_IDLE_IN_TRANSACTION_SESSION_TIMEOUT_MS", 15000
+        execution_role = settings.execution_role_name if execution_role_enabled else None
+        if execution_role:
+            # set_config('role', ..., true) is the function form of SET LOCAL ROLE; the
+            # role is passed as a value, so it needs no identifier quoting.
+            session_settings.append(("role", execution_role))
+            metadata = build_session_guardrail_metadata(
+                applied=True,
+                outcome=SESSION_GUARDRAIL_APPLIED,
+                execution_role_applied=True,
+                execution_role_name=execution_role,
+                restricted_session_mode=str(metadata["restricted_session_mode"]),
             )
-            if idle_in_txn_timeout:
-                await conn.execute(
-                    "SELECT set_config('idle_in_transaction_session_timeout', $1, true)",
-                    idle_in_txn_timeout,
-                )
 
-            search_path = (get_env_str("POSTGRES_RESTRICTED_SEARCH_PATH", "") or "").strip()
-            if search_path:
-                await conn.execute(
-                    "SELECT set_config('search_path', $1, true)",
-                    search_path,
-                )
+        return metadata, session_settings, execution_role or None
 
-        if execution_role_enabled:
-            execution_role = settings.execution_role_name
-            if execution_role:
-                quoted_role = cls._quote_postgres_identifier(execution_role)
-                try:
-                    await conn.execute(f"SET LOCAL ROLE {quoted_role}")
-                except Exception as exc:
-                    raise PostgresSandboxExecutionError(
-                        "Failed to apply Postgres execution role in transaction sandbox.",
-                        failure_reason="ROLE_SWITCH_FAILURE",
-                    ) from exc
-                metadata = build_session_guardrail_metadata(
-                    applied=True,
-                    outcome=SESSION_GUARDRAIL_APPLIED,
-                    execution_role_applied=True,
-                    execution_role_name=execution_role,
-                    restricted_session_mode=str(metadata["restricted_session_mode"]),
-                )
+    @staticmethod
+    def _postgres_set_config_batch_sql(names: list[str]) -> str:
+        """Return one SELECT applying a transaction-local ``set_config`` per name."""
+        calls = []
+        for position, name in enumerate(names, start=1):
+            if "'" in name:
+                raise ValueError(f"Invalid Postgres setting name: {name!r}")
+            calls.append(f"set_config('{name}', ${position}, true)")
+        return "SELECT " + ", ".join(calls)
 
-                cache_key = execution_role.lower()
-                dblink_installed, dblink_accessible = (
-                    await cls._probe_postgres_dangerous_extension_capabilities(
-                        conn,
-                        cache_key=cache_key,
-                    )
-                )
-                cls._record_postgres_extension_capability_signals(
-                    cache_key=cache_key,
-                    execution_role=execution_role,
-                    dblink_installed=dblink_installed,
-                    dblink_accessible=dblink_accessible,
-                )
+    @staticmethod
+    def _is_role_switch_error(exc: Exception, execution_role: str) -> bool:
+        """Return True when a batched ``set_config`` failed on the execution role.
 
-                if (
-                    dblink_installed
-                    and dblink_accessible
-                    and bool(get_env_bool("POSTGRES_DANGEROUS_EXTENSION_STRICT_MODE", False))
-                ):
-                    raise PermissionError(
-                        "Execution role has dblink EXECUTE permissions while strict mode "
-                        "is enabled."
-                    )
+        Postgres reports an unknown role as ``22023`` (the same SQLSTATE as a bad
+        timeout value), so that code also needs the role named in the message.
+        """
+        sqlstate = getattr(exc, "sqlstate", None)
+        if sqlstate in _ROLE_SWITCH_SQLSTATES:
+            return True
+        return sqlstate == "22023" and f'role "{execution_role}"' in str(exc)
+
+    @classmethod
+    async def _apply_postgres_restricted_session(
+        cls,
+        conn: asyncpg.Connection,
+        *,
+        read_only: bool,
+        tenant_id: Optional[int] = None,
+    ) -> dict[str, object]:
+        """Apply Postgres session hardening and tenant context in one round trip.
+
+        Guardrail settings, the execution role and ``app.current_tenant`` are all
+        transaction-local and issued as a single batched ``set_config`` statement.
+        Only errors raised by the role's ``set_config`` are reported as
+        ``ROLE_SWITCH_FAILURE``; any other setting's error propagates unchanged.
+        """
+        from common.config.env import get_env_bool
+
+        metadata, session_settings, execution_role = cls._plan_postgres_restricted_session(
+            read_only=read_only
+        )
+        if tenant_id is not None:
+            session_settings.append(("app.current_tenant", str(tenant_id)))
+
+        if session_settings:
+            names = [name for name, _ in session_settings]
+            values = [value for _, value in session_settings]
+            try:
+                await conn.execute(cls._postgres_set_config_batch_sql(names), *values)
+            except Exception as exc:
+                if execution_role is None or not cls._is_role_switch_error(exc, execution_role):
+                    raise
+                raise PostgresSandboxExecutionError(
+                    "Failed to apply Postgres execution role in transaction sandbox.",
+                    failure_reason="ROLE_SWITCH_FAILURE",
+                ) from exc
+
+        if execution_role is None:
+            return metadata
+
+        cache_key = execution_role.lower()
+        dblink_installed, dblink_accessible = (
+            await cls._probe_postgres_dangerous_extension_capabilities(
+                conn,
+                cache_key=cache_key,
+                execution_role=execution_role,
+            )
+        )
+        cls._record_postgres_extension_capability_signals(
+            cache_key=cache_key,
+            execution_role=execution_role,
+            dblink_installed=dblink_installed,
+            dblink_accessible=dblink_accessible,
+        )
+
+        if (
+            dblink_installed
+            and dblink_accessible
+            and bool(get_env_bool("POSTGRES_DANGEROUS_EXTENSION_STRICT_MODE", False))
+        ):
+            raise PermissionError(
+                "Execution role has dblink EXECUTE permissions while strict mode is enabled."
+            )
 
         return metadata
 
+    @staticmethod
+    def _record_connection_setup_latency(
+        started: float, *, provider: str, read_only: bool, transactional: bool
+    ) -> None:
+        """Export time from pool acquire until the connection is handed to the caller."""
+        mcp_metrics.record_histogram(
+            "mcp.db.connection_setup.duration_ms",
+            (time.perf_counter() - started) * 1000.0,
+            description="Pool acquire, transaction begin and session setup before a query",
+            unit="ms",
+            attributes={
+                "provider": provider,
+                "read_only": read_only,
+                "transactional": transactional,
+            },
+        )
+
     @classmethod
     @asynccontextmanager
     async def get_connection(cls, tenant_id: Optional[int] = None, read_only: bool = False):
@@ -1001,6 +1087,7 @@ class Database:
         if cls._pool is None:
             raise RuntimeError("Database pool not initialized. Call Database.init() first.")
 
+        setup_started = time.perf_counter()
         async with cls._pool.acquire() as conn:
             sandbox_metadata = build_postgres_sandbox_metadata(
                 applied=False,
@@ -1032,17 +1119,17 @@ class Database:
                     else conn.transaction(readonly=read_only)
                 )
                 async with transaction_scope:
+                    # Guardrails and app.current_tenant are set with is_local=True in one
+                    # statement; they are automatically unset when the transaction exits.
                     session_guardrail_metadata = await cls._apply_postgres_restricted_session(
-                        conn, read_only=read_only
+                        conn, read_only=read_only, tenant_id=tenant_id
+                    )
+                    cls._record_connection_setup_latency(
+                        setup_started,
+                        provider=cls._query_target_provider,
+                        read_only=read_only,
+                        transactional=True,
                     )
-
-                    if tenant_id is not None:
-                        # set_config with is_local=True scopes the setting to this transaction.
-                        # It will be automatically unset when the transaction block exits.
-                        await conn.execute(
-                            "SELECT set_config('app.current_tenant', $1, true)",
-                            str(tenant_id),
-                        )
 
                     # Yield the configured connection to the caller
                     from dal.tracing import TracedAsyncpgConnection, trace_enabled
@@ -1070,12 +1157,14 @@ class Database:
                     # Connection is returned to pool, tenant context is cleared
             else:
                 session_guardrail_metadata = await cls._apply_postgres_restricted_session(
-                    conn, read_only=read_only
+                    conn, read_only=read_only, tenant_id=tenant_id
+                )
+                cls._record_connection_setup_latency(
+                    setup_started,
+                    provider=cls._query_target_provider,
+                    read_only=read_only,
+                    transactional=False,
                 )
-                if tenant_id is not None:
-                    await conn.execute(
-                        "SELECT set_config('app.current_tenant', $1, true)", str(tenant_id)
-                    )
                 from dal.tracing import TracedAsyncpgConnection, trace_enabled
                 from dal.util.row_limits import get_sync_max_rows
 
@@ -1107,6 +1196,7 @@ class Database:
         include_columns: bool = False,
     ):
         """Fetch rows with optional column metadata when supported."""
+        from dal.feature_flags import columnar_results_enabled
         from dal.query_result import QueryResult
 
         async with cls.get_connection(tenant_id=tenant_id, read_only=True) as conn:
@@ -1120,6 +1210,14 @@ class Database:
             supports_prepare = (
                 include_columns and callable(prepare) and "prepare" in type(conn).__dict__
             )
+            fetch_columnar = getattr(conn, "fetch_columnar", None)
+            if (
+                supports_fetch_with_columns
+                and callable(fetch_columnar)
+                and "fetch_columnar" in type(conn).__dict__
+                and columnar_results_enabled()
+            ):
+                fetch_with_columns = fetch_columnar
 
             result = None
             if params:
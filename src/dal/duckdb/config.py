@@ -11,6 +11,8 @@ class DuckDBConfig:
     query_timeout_seconds: int
     max_rows: int
     read_only: bool = True
+    pool_size: int = 0
+    pool_health_check_seconds: int = 30
 
     @classmethod
     def from_env(cls) -> "DuckDBConfig":
@@ -19,9 +21,19 @@ class DuckDBConfig:
         query_timeout_seconds = get_env_int("DUCKDB_QUERY_TIMEOUT_SECS", 30)
         max_rows = get_env_int("DUCKDB_MAX_ROWS", 1000)
         read_only = get_env_bool("DUCKDB_READ_ONLY", True)
+        pool_size, pool_health_check_seconds = pool_settings_from_env()
         return cls(
             path=path,
             query_timeout_seconds=query_timeout_seconds,
             max_rows=max_rows,
             read_only=read_only,
+            pool_size=pool_size,
+            pool_health_check_seconds=pool_health_check_seconds,
         )
+
+
+def pool_settings_from_env() -> tuple[int, int]:
+    """Return (pool size, health-check interval seconds) for pooled DuckDB cursors."""
+    pool_size = get_env_int("DUCKDB_POOL_SIZE", 0)
+    health_check_seconds = get_env_int("DUCKDB_POOL_HEALTH_CHECK_SECS", 30)
+    return max(0, pool_size or 0), max(0, health_check_seconds or 0)
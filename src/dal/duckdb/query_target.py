@@ -3,27 +3,56 @@ from contextlib import asynccontextmanager
 from typing import Any, Dict, List, Optional
 
 from dal.duckdb.config import DuckDBConfig
+from dal.query_result import ColumnarRows, RowSequence
 from dal.tracing import trace_query_operation
+from dal.util.connection_pool import EmbeddedConnectionPool, file_identity
 from dal.util.read_only import enforce_read_only_sql, validate_no_mutation_keywords
-from dal.util.row_limits import cap_rows_with_metadata, get_sync_max_rows
+from dal.util.row_limits import fetch_capped_rows, get_sync_max_rows
 from dal.util.timeouts import run_with_timeout
 
 
 class DuckDBQueryTargetDatabase:
-    """DuckDB query-target database wrapper."""
+    """DuckDB query-target database wrapper.
+
+    When pooling is enabled (``DUCKDB_POOL_SIZE``) for a read-only file target,
+    requests share one read-only database instance and check out cursors from a
+    bounded pool, so DuckDB's buffer cache and catalog survive between queries. The
+    instance and its cursors are recycled when the file is replaced or modified.
+    Otherwise a connection is opened per request.
+    """
 
     supports_tenant_enforcement: bool = False
     _config: Optional[DuckDBConfig] = None
+    _shared_database: Optional["_SharedDuckDBDatabase"] = None
+    _pool: Optional[EmbeddedConnectionPool[Any]] = None
 
     @classmethod
     async def init(cls, config: DuckDBConfig) -> None:
         """Initialize DuckDB query-target config."""
+        await cls.close()
         cls._config = config
+        if config.read_only and config.pool_size > 0 and config.path not in (":memory:", ""):
+            shared_database = _SharedDuckDBDatabase(config.path)
+            cls._shared_database = shared_database
+            cls._pool = EmbeddedConnectionPool(
+                provider="duckdb",
+                max_size=config.pool_size,
+                open_connection=shared_database.cursor,
+                close_connection=shared_database.close_cursor,
+                check_connection=_check_cursor,
+                health_check_interval_seconds=config.pool_health_check_seconds,
+                source_version=lambda: file_identity(config.path),
+            )
 
     @classmethod
     async def close(cls) -> None:
-        """Close DuckDB resources (no-op)."""
-        return None
+        """Close pooled cursors and the shared database instance."""
+        pool, cls._pool = cls._pool, None
+        shared_database, cls._shared_database = cls._shared_database, None
+        if pool is not None:
+            await pool.close()
+        if shared_database is not None:
+            await shared_database.close()
 
     @classmethod
     @asynccontextmanager
@@ -36,25 +65,89 @@ class DuckDBQueryTargetDatabase:
                 "DuckDB config not initialized. Call DuckDBQueryTargetDatabase.init()."
             )
 
+        if cls._pool is not None:
+            async with cls._pool.acquire() as cursor:
+                yield cls._wrap(cursor, read_only=True)
+            return
+
         import duckdb
 
         # Connect at context enter time so tests can patch duckdb.connect
         db_read_only = read_only or cls._config.read_only
         conn = await asyncio.to_thread(duckdb.connect, cls._config.path, read_only=db_read_only)
-        sync_max_rows = get_sync_max_rows()
-        wrapper = _DuckDBConnection(
+        try:
+            yield cls._wrap(conn, read_only=db_read_only)
+        finally:
+            await asyncio.to_thread(conn.close)
+
+    @classmethod
+    def _wrap(cls, conn, *, read_only: bool) -> "_DuckDBConnection":
+        return _DuckDBConnection(
             conn,
             query_timeout_seconds=cls._config.query_timeout_seconds,
             max_rows=cls._config.max_rows,
-            sync_max_rows=sync_max_rows,
-            read_only=db_read_only,
+            sync_max_rows=get_sync_max_rows(),
+            read_only=read_only,
         )
-        try:
-            yield wrapper
-        finally:
+
+
+class _SharedDuckDBDatabase:
+    """One read-only DuckDB instance whose cursors back the connection pool.
+
+    When the database file changes, the next ``cursor`` call opens a new instance;
+    the old one is closed once its last cursor has been closed.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._conn = None
+        self._identity = None
+        self._cursor_parents: Dict[int, Any] = {}
+        self._lock = asyncio.Lock()
+
+    async def cursor(self):
+        """Open a cursor on the shared instance, (re)connecting when the file changed."""
+        async with self._lock:
+            identity = file_identity(self._path)
+            if self._conn is not None and identity != self._identity:
+                retired, self._conn = self._conn, None
+                await self._close_if_unused(retired)
+            if self._conn is None:
+                import duckdb
+
+                self._conn = await asyncio.to_thread(duckdb.connect, self._path, read_only=True)
+                self._identity = identity
+            conn = self._conn
+            cursor = await asyncio.to_thread(conn.cursor)
+            self._cursor_parents[id(cursor)] = conn
+        return cursor
+
+    async def close_cursor(self, cursor) -> None:
+        """Close a pooled cursor, and its instance if that has been replaced."""
+        # Stop a query that outlived its timeout; close() would otherwise wait for it.
+        cursor.interrupt()
+        await asyncio.to_thread(cursor.close)
+        async with self._lock:
+            parent = self._cursor_parents.pop(id(cursor), None)
+            if parent is not None and parent is not self._conn:
+                await self._close_if_unused(parent)
+
+    async def close(self) -> None:
+        """Close the shared instance."""
+        async with self._lock:
+            conn, self._conn = self._conn, None
+            if conn is not None:
+                await self._close_if_unused(conn)
+
+    async def _close_if_unused(self, conn) -> None:
+        if not any(parent is conn for parent in self._cursor_parents.values()):
             await asyncio.to_thread(conn.close)
 
 
+async def _check_cursor(cursor) -> None:
+    await asyncio.to_thread(lambda: cursor.execute("SELECT 1").fetchall())
+
+
 class _DuckDBConnection:
     """Adapter providing asyncpg-like helpers over DuckDB."""
 
@@ -103,11 +196,9 @@ class _DuckDBConnection:
         enforce_read_only_sql(sql, "duckdb", self._read_only)
 
         async def _run():
-            rows = await self._run_query(sql, list(params))
-            limit = self._max_rows
-            if self._sync_max_rows:
-                limit = min(limit, self._sync_max_rows) if limit else self._sync_max_rows
-            capped_rows, truncated = cap_rows_with_metadata(rows, limit)
+            capped_rows, truncated = await self._run_query(
+                sql, list(params), max_rows=self._row_limit()
+            )
             self._last_truncated = truncated
             self._last_truncated_reason = "PROVIDER_CAP" if truncated else None
             return capped_rows
@@ -122,14 +213,19 @@ class _DuckDBConnection:
 
     async def fetch_with_columns(self, sql: str, *params: Any) -> tuple[List[Dict[str, Any]], list]:
         """Fetch rows with column metadata when supported."""
+        return await self._fetch_with_columns(sql, list(params), columnar=False)
+
+    async def fetch_columnar(self, sql: str, *params: Any) -> tuple[ColumnarRows, list]:
+        """Fetch rows as per-column arrays with column metadata."""
+        return await self._fetch_with_columns(sql, list(params), columnar=True)
+
+    async def _fetch_with_columns(self, sql: str, params: List[Any], columnar: bool):
         enforce_read_only_sql(sql, "duckdb", self._read_only)
 
         async def _run():
-            rows, columns = await self._run_query_with_columns(sql, list(params))
-            limit = self._max_rows
-            if self._sync_max_rows:
-                limit = min(limit, self._sync_max_rows) if limit else self._sync_max_rows
-            capped_rows, truncated = cap_rows_with_metadata(rows, limit)
+            capped_rows, truncated, columns = await self._run_query_with_columns(
+                sql, params, max_rows=self._row_limit(), columnar=columnar
+            )
             self._last_truncated = truncated
             self._last_truncated_reason = "PROVIDER_CAP" if truncated else None
             return capped_rows, columns
@@ -152,14 +248,23 @@ class _DuckDBConnection:
             return None
         return next(iter(row.values()))
 
-    async def _run_query(self, sql: str, params: List[Any]) -> List[Dict[str, Any]]:
+    def _row_limit(self) -> int:
+        limit = self._max_rows
+        if self._sync_max_rows:
+            limit = min(limit, self._sync_max_rows) if limit else self._sync_max_rows
+        return limit
+
+    async def _run_query(
+        self, sql: str, params: List[Any], max_rows: int = 0
+    ) -> tuple[List[Dict[str, Any]], bool]:
         if self._read_only:
             validate_no_mutation_keywords(sql)
 
         def _execute():
             cursor = self._conn.execute(sql, params)
             cols = [desc[0] for desc in cursor.description] if cursor.description else []
-            return [dict(zip(cols, row)) for row in cursor.fetchall()]
+            rows, truncated = _fetch_rows(cursor, max_rows)
+            return [dict(zip(cols, row)) for row in rows], truncated
 
         return await run_with_timeout(
             lambda: asyncio.to_thread(_execute),
@@ -169,8 +274,8 @@ class _DuckDBConnection:
         )
 
     async def _run_query_with_columns(
-        self, sql: str, params: List[Any]
-    ) -> tuple[List[Dict[str, Any]], list]:
+        self, sql: str, params: List[Any], max_rows: int = 0, columnar: bool = False
+    ) -> tuple[RowSequence, bool, list]:
         if self._read_only:
             validate_no_mutation_keywords(sql)
 
@@ -179,9 +284,11 @@ class _DuckDBConnection:
 
             cursor = self._conn.execute(sql, params)
             cols = [desc[0] for desc in cursor.description] if cursor.description else []
-            rows = [dict(zip(cols, row)) for row in cursor.fetchall()]
+            rows, truncated = _fetch_rows(cursor, max_rows)
             columns = columns_from_cursor_description(cursor.description, provider="duckdb")
-            return rows, columns
+            if columnar:
+                return ColumnarRows.from_records(cols, rows), truncated, columns
+            return [dict(zip(cols, row)) for row in rows], truncated, columns
 
         return await run_with_timeout(
             lambda: asyncio.to_thread(_execute),
@@ -189,3 +296,10 @@ class _DuckDBConnection:
             provider="duckdb",
             operation_name="query.fetch_with_columns",
         )
+
+
+def _fetch_rows(cursor, max_rows: int) -> tuple[list, bool]:
+    """Fetch all rows, or stop after ``max_rows + 1`` when a cap is set."""
+    if not max_rows:
+        return cursor.fetchall(), False
+    return fetch_capped_rows(cursor.fetchmany, max_rows)
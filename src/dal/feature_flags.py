@@ -9,3 +9,8 @@ def experimental_features_enabled() -> bool:
 def allow_non_postgres_tenant_bypass() -> bool:
     """Return True when legacy non-Postgres tenant bypass is explicitly enabled."""
     return bool(get_env_bool("ALLOW_NON_POSTGRES_TENANT_BYPASS", False))
+
+
+def columnar_results_enabled() -> bool:
+    """Return True when capable providers should return column-backed result rows."""
+    return bool(get_env_bool("DAL_COLUMNAR_RESULTS", False))
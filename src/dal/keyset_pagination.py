@@ -10,6 +10,8 @@ from typing import Any, Dict, List, Optional, Protocol, runtime_checkable
 import sqlglot
 from sqlglot import exp
 
+from common.sql.ast_cache import parse_sql, parse_sql_one
+from common.sql.facts import get_sql_facts
 from dal.execution_budget import (
     PAGINATION_BUDGET_SNAPSHOT_INVALID,
     ExecutionBudget,
@@ -858,7 +860,7 @@ def extract_keyset_order_keys(sql: str, provider: str = "postgres") -> List[Keys
     dialect = sqlglot.Dialect.get(provider)
     postgres_null_semantics = _is_postgres_provider(provider)
     try:
-        expressions = sqlglot.parse(sql, read=dialect)
+        expressions = parse_sql(sql, dialect)
     except Exception as e:
         raise ValueError(f"Failed to parse SQL: {str(e)}")
 
@@ -918,21 +920,20 @@ def extract_keyset_table_names(sql: str, provider: str = "postgres") -> List[str
     """Extract base table names referenced by a SELECT query."""
     dialect = sqlglot.Dialect.get(provider)
     try:
-        expression = sqlglot.parse_one(sql, read=dialect)
+        expression = parse_sql_one(sql, dialect, copy=False)
     except Exception as e:
         raise ValueError(f"Failed to parse SQL: {str(e)}")
 
     if not isinstance(expression, exp.Select):
         raise ValueError("Keyset pagination only supports a single SELECT statement.")
 
+    facts = get_sql_facts(expression)
     cte_names = {
-        _normalize_identifier(cte.alias_or_name)
-        for cte in expression.find_all(exp.CTE)
-        if cte.alias_or_name
+        _normalize_identifier(cte.alias_or_name) for cte in facts.ctes if cte.alias_or_name
     }
     table_names: List[str] = []
     seen: set[str] = set()
-    for table in expression.find_all(exp.Table):
+    for table in facts.tables:
         table_name = _normalize_identifier(table.name)
         if not table_name or table_name in cte_names:
             continue
@@ -0,0 +1,202 @@
+"""In-process embedding matrix for Memgraph node seed search.
+
+Memgraph deployments without the ``vector_search`` module used to stream every
+candidate node (embedding included) over Bolt and score it in pure Python on each
+query. ``NodeEmbeddingIndex`` loads a label's embeddings once into a contiguous,
+L2-normalized float32 matrix so a seed search is a single matmul plus
+``argpartition``. The index remembers the hydration version it was loaded for and
+accepts incremental upserts/removals as the owning store writes to the graph.
+"""
+
+import logging
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_MIN_CAPACITY = 64
+
+
+def _as_unit_vector(values: Sequence[float]) -> Optional[np.ndarray]:
+    """Return a normalized float32 copy of ``values`` (zero vectors stay zero)."""
+    try:
+        vector = np.asarray(values, dtype=np.float32)
+    except (TypeError, ValueError):
+        return None
+    if vector.ndim != 1 or vector.size == 0:
+        return None
+    norm = float(np.linalg.norm(vector))
+    if norm > 0:
+        vector = vector / norm
+    return vector
+
+
+class NodeEmbeddingIndex:
+    """Contiguous float32 embedding matrix for all nodes of one label.
+
+    Rows are L2-normalized on insert so cosine similarity reduces to a dot
+    product. Node properties (minus the embedding) are kept alongside each row
+    so hits can be returned without another graph round trip. Removal swaps
+    the last row into the hole, keeping the live rows contiguous.
+    """
+
+    def __init__(self, label: str, embedding_property: str = "embedding") -> None:
+        """Initialize an empty index for ``label``."""
+        self.label = label
+        self.embedding_property = embedding_property
+        self.version: Optional[int] = None
+        self._lock = threading.RLock()
+        self._dim: Optional[int] = None
+        self._matrix = np.zeros((0, 0), dtype=np.float32)
+        self._size = 0
+        self._ids: List[str] = []
+        self._props: List[Dict[str, Any]] = []
+        self._row_by_id: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Return the number of indexed nodes."""
+        return self._size
+
+    @property
+    def dim(self) -> Optional[int]:
+        """Return the embedding dimension, if any rows have been loaded."""
+        return self._dim
+
+    def load(
+        self,
+        nodes: Iterable[Tuple[str, Dict[str, Any]]],
+        version: Optional[int] = None,
+    ) -> None:
+        """Replace the index contents with ``nodes`` in one pass.
+
+        Args:
+            nodes: ``(node_id, properties)`` pairs; properties carry the embedding.
+            version: Hydration version the snapshot corresponds to.
+        """
+        ids: List[str] = []
+        props_list: List[Dict[str, Any]] = []
+        vectors: List[np.ndarray] = []
+        dim: Optional[int] = None
+        skipped = 0
+
+        for node_id, props in nodes:
+            vector = _as_unit_vector(props.get(self.embedding_property) or ())
+            if vector is None:
+                continue
+            if dim is None:
+                dim = vector.shape[0]
+            elif vector.shape[0] != dim:
+                skipped += 1
+                continue
+            ids.append(node_id)
+            props_list.append(self._strip_embedding(props))
+            vectors.append(vector)
+
+        if skipped:
+            logger.warning(
+                "Skipped %d %s embeddings with mismatched dimension (expected %s)",
+                skipped,
+                self.label,
+                dim,
+            )
+
+        with self._lock:
+            self._dim = dim
+            if vectors:
+                self._matrix = np.vstack(vectors).astype(np.float32, copy=False)
+            else:
+                self._matrix = np.zeros((0, dim or 0), dtype=np.float32)
+            self._size = len(ids)
+            self._ids = ids
+            self._props = props_list
+            self._row_by_id = {node_id: row for row, node_id in enumerate(ids)}
+            self.version = version
+
+    def apply_node(self, node_id: str, props: Dict[str, Any]) -> None:
+        """Upsert ``node_id`` from its full property map, or drop it if unembedded."""
+        vector = _as_unit_vector(props.get(self.embedding_property) or ())
+        with self._lock:
+            if vector is None or (self._dim is not None and vector.shape[0] != self._dim):
+                self._remove_locked(node_id)
+                return
+            if self._dim is None:
+                self._dim = vector.shape[0]
+                self._matrix = np.zeros((0, self._dim), dtype=np.float32)
+
+            row = self._row_by_id.get(node_id)
+            if row is None:
+                self._ensure_capacity(self._size + 1)
+                row = self._size
+                self._size += 1
+                self._ids.append(node_id)
+                self._props.append({})
+                self._row_by_id[node_id] = row
+            self._matrix[row] = vector
+            self._props[row] = self._strip_embedding(props)
+
+    def remove(self, node_ids: Iterable[str]) -> int:
+        """Remove nodes by id and return how many were present."""
+        removed = 0
+        with self._lock:
+            for node_id in node_ids:
+                if self._remove_locked(node_id):
+                    removed += 1
+        return removed
+
+    def search(self, embedding: Sequence[float], k: int) -> List[Dict[str, Any]]:
+        """Return the top ``k`` nodes by cosine similarity.
+
+        Returns:
+            List of dicts: {"node": dict, "score": float}, best first.
+        """
+        query = _as_unit_vector(embedding)
+        with self._lock:
+            if k <= 0 or self._size == 0 or query is None:
+                return []
+            if query.shape[0] != self._dim:
+                logger.warning(
+                    "Query embedding dimension %d does not match %s index dimension %s",
+                    query.shape[0],
+                    self.label,
+                    self._dim,
+                )
+                return []
+
+            scores = self._matrix[: self._size] @ query
+            if k < self._size:
+                top = np.argpartition(-scores, k - 1)[:k]
+            else:
+                top = np.arange(self._size)
+            top = top[np.argsort(-scores[top], kind="stable")]
+
+            return [{"node": dict(self._props[row]), "score": float(scores[row])} for row in top]
+
+    def _ensure_capacity(self, needed: int) -> None:
+        capacity = self._matrix.shape[0]
+        if needed <= capacity:
+            return
+        new_capacity = max(_MIN_CAPACITY, capacity * 2, needed)
+        grown = np.zeros((new_capacity, self._dim or 0), dtype=np.float32)
+        grown[: self._size] = self._matrix[: self._size]
+        self._matrix = grown
+
+    def _remove_locked(self, node_id: str) -> bool:
+        row = self._row_by_id.pop(node_id, None)
+        if row is None:
+            return False
+        last = self._size - 1
+        if row != last:
+            moved_id = self._ids[last]
+            self._matrix[row] = self._matrix[last]
+            self._ids[row] = moved_id
+            self._props[row] = self._props[last]
+            self._row_by_id[moved_id] = row
+        self._ids.pop()
+        self._props.pop()
+        self._size = last
+        return True
+
+    def _strip_embedding(self, props: Dict[str, Any]) -> Dict[str, Any]:
+        return {key: value for key, value in props.items() if key != self.embedding_property}
@@ -1,15 +1,23 @@
 import logging
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
 from neo4j import GraphDatabase
 
+from common.config.env import get_env_bool, get_env_float
 from common.interfaces import GraphStore
+from dal.memgraph.embedding_index import NodeEmbeddingIndex
 from schema.graph.data import GraphData
 from schema.graph.edge import Edge
 from schema.graph.node import Node
 
 logger = logging.getLogger(__name__)
 
+# Singleton node tracking the graph's hydration version across processes.
+HYDRATION_STATE_LABEL = "HydrationState"
+HYDRATION_STATE_ID = "__hydration_state__"
+
 
 class MemgraphStore(GraphStore):
     """Memgraph implementation of GraphStore.
@@ -20,6 +28,17 @@ class MemgraphStore(GraphStore):
     def __init__(self, uri: str, user: str, password: str):
         """Initialize Memgraph driver."""
         self.driver = GraphDatabase.driver(uri, auth=(user, password))
+        self._embedding_index_enabled = get_env_bool("MEMGRAPH_EMBEDDING_INDEX_ENABLED", True)
+        self._version_check_seconds = max(
+            0.0, get_env_float("MEMGRAPH_EMBEDDING_INDEX_VERSION_CHECK_SECONDS", 5.0)
+        )
+        self._embedding_indexes: Dict[Tuple[str, str], NodeEmbeddingIndex] = {}
+        # Guards the index dict and version state; held only for in-memory work.
+        self._embedding_index_lock = threading.Lock()
+        # One lock per (label, property) so a Bolt load blocks only its own label.
+        self._embedding_index_load_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._hydration_version: Optional[int] = None
+        self._version_checked_at: Optional[float] = None
 
     def close(self):
         """Close driver connection."""
@@ -59,6 +78,8 @@ class MemgraphStore(GraphStore):
             if "id" not in props:
                 props["id"] = node_id
 
+            self._refresh_embedding_indexes(label, str(props["id"]), props)
+
             return Node(
                 id=str(props["id"]),
                 label=list(neo4j_node.labels)[0] if neo4j_node.labels else label,
@@ -239,7 +260,12 @@ class MemgraphStore(GraphStore):
 
         with self.driver.session() as session:
             result = session.run(query, root_id=root_id)
-            return [record["deleted_id"] for record in result if record["deleted_id"]]
+            deleted_ids = [record["deleted_id"] for record in result if record["deleted_id"]]
+
+        if deleted_ids:
+            for index in list(self._embedding_indexes.values()):
+                index.remove(str(node_id) for node_id in deleted_ids)
+        return deleted_ids
 
     def search_ann_seeds(
         self,
@@ -253,7 +279,9 @@ class MemgraphStore(GraphStore):
 
         Strategies:
         1. If label is 'Table', use Memgraph HNSW index via vector_search module.
-        2. Otherwise (e.g. 'Column'), use brute-force cosine similarity scan.
+        2. Otherwise (e.g. 'Column'), score against an in-process float32 embedding
+           matrix that is loaded once per hydration version and kept in sync with
+           writes made through this store.
 
         Returns:
             List of dicts: {"node": dict, "score": float}
@@ -268,53 +296,144 @@ class MemgraphStore(GraphStore):
                 embedding_property=embedding_property,
             )
 
-        # CURRENT FIX: Client-side cosine similarity (Memgraph vector modules missing)
-        # 1. Fetch all candidate nodes
+        if not self._embedding_index_enabled:
+            index = NodeEmbeddingIndex(label, embedding_property)
+            index.load(self._fetch_embedded_nodes(label, embedding_property))
+            return index.search(embedding, k)
+
+        return self._get_embedding_index(label, embedding_property).search(embedding, k)
+
+    def get_hydration_version(self) -> Optional[int]:
+        """Return the graph's hydration version, or None if it cannot be read."""
+        query = f"""
+        MATCH (s:`{HYDRATION_STATE_LABEL}` {{id: $state_id}})
+        RETURN s.version AS version
+        """
+        try:
+            with self.driver.session() as session:
+                records = list(session.run(query, state_id=HYDRATION_STATE_ID))
+            if not records:
+                return 0
+            return int(records[0]["version"] or 0)
+        except Exception as exc:
+            logger.debug("Failed to read hydration version: %s", exc)
+            return None
+
+    def bump_hydration_version(self) -> Optional[int]:
+        """Advance the graph's hydration version after a batch of schema writes.
+
+        Other processes reload their embedding indexes when they observe the new
+        version. Indexes in this process already absorbed the writes
+        incrementally, so they are re-stamped with the new version, but only
+        when this bump was the sole change since the version they were loaded
+        at. If another process bumped in between, they are dropped and reload.
+        """
+        query = f"""
+        MERGE (s:`{HYDRATION_STATE_LABEL}` {{id: $state_id}})
+        SET s.version = coalesce(s.version, 0) + 1
+        RETURN s.version AS version
+        """
+        try:
+            with self.driver.session() as session:
+                records = list(session.run(query, state_id=HYDRATION_STATE_ID))
+            version = int(records[0]["version"]) if records else None
+        except Exception as exc:
+            logger.warning("Failed to bump hydration version: %s", exc)
+            return None
+
+        with self._embedding_index_lock:
+            previous = self._hydration_version
+            self._hydration_version = version
+            self._version_checked_at = time.monotonic()
+            if previous is not None and version == previous + 1:
+                for index in self._embedding_indexes.values():
+                    if index.version == previous:
+                        index.version = version
+            else:
+                self._embedding_indexes.clear()
+        return version
+
+    def invalidate_embedding_indexes(self) -> None:
+        """Drop in-process embedding indexes so the next search reloads them."""
+        with self._embedding_index_lock:
+            self._embedding_indexes.clear()
+            self._hydration_version = None
+            self._version_checked_at = None
+
+    def _current_hydration_version(self) -> Optional[int]:
+        """Return the hydration version, re-reading it at most every check interval."""
+        now = time.monotonic()
+        with self._embedding_index_lock:
+            if (
+                self._version_checked_at is not None
+                and now - self._version_checked_at < self._version_check_seconds
+            ):
+                return self._hydration_version
+            # Claim this check so concurrent callers keep the cached version.
+            self._version_checked_at = now
+        version = self.get_hydration_version()
+        with self._embedding_index_lock:
+            if version is not None:
+                self._hydration_version = version
+            return self._hydration_version
+
+    def _get_embedding_index(self, label: str, embedding_property: str) -> NodeEmbeddingIndex:
+        """Return a loaded embedding index for ``label``, reloading it when stale.
+
+        The Bolt load runs under a per-label lock, outside the shared lock, and the
+        finished index is swapped in afterwards.
+        """
+        key = (label, embedding_property)
+        version = self._current_hydration_version()
+        with self._embedding_index_lock:
+            index = self._embedding_indexes.get(key)
+            if index is not None and index.version == version:
+                return index
+            load_lock = self._embedding_index_load_locks.setdefault(key, threading.Lock())
+
+        with load_lock:
+            # Another caller may have loaded this label while we waited.
+            with self._embedding_index_lock:
+                index = self._embedding_indexes.get(key)
+                if index is not None and index.version == version:
+                    return index
+
+            index = NodeEmbeddingIndex(label, embedding_property)
+            index.load(self._fetch_embedded_nodes(label, embedding_property), version=version)
+            with self._embedding_index_lock:
+                self._embedding_indexes[key] = index
+            logger.info(
+                "Loaded %d %s embeddings into in-process index (hydration version %s)",
+                len(index),
+                label,
+                version,
+            )
+            return index
+
+    def _fetch_embedded_nodes(self, label: str, embedding_property: str):
+        """Stream ``(node_id, properties)`` for every node of ``label`` with an embedding."""
         query = f"""
         MATCH (n:`{label}`)
         WHERE n.{embedding_property} IS NOT NULL
         RETURN n AS node
         """
-
         with self.driver.session() as session:
             result = session.run(query)
-            candidates = []
-
             for record in result:
                 neo_node = record["node"]
                 props = dict(neo_node)
-
-                # Extract embedding
-                node_embedding = props.get(embedding_property)
-                if not node_embedding or not isinstance(node_embedding, list):
-                    continue
-
-                # Calculate Cosine Similarity in Python
-                # Dot product
-                dot_product = sum(a * b for a, b in zip(embedding, node_embedding))
-                # Magnitudes
-                mag_a = sum(a * a for a in embedding) ** 0.5
-                mag_b = sum(b * b for b in node_embedding) ** 0.5
-
-                score = 0.0
-                if mag_a * mag_b > 0:
-                    score = dot_product / (mag_a * mag_b)
-
-                # Remove embedding from props to save memory/bandwidth in return
-                props.pop(embedding_property, None)
-
-                # Ensure ID
                 if "id" not in props:
                     try:
                         props["id"] = str(neo_node.element_id)
                     except AttributeError:
-                        pass
-
-                candidates.append({"node": props, "score": score})
-
-            # 2. Sort by score DESC and take top K
-            candidates.sort(key=lambda x: x["score"], reverse=True)
-            return candidates[:k]
+                        continue
+                yield str(props["id"]), props
+
+    def _refresh_embedding_indexes(self, label: str, node_id: str, props: Dict[str, Any]) -> None:
+        """Apply an upserted node to any loaded embedding index for its label."""
+        for (index_label, _), index in list(self._embedding_indexes.items()):
+            if index_label == label:
+                index.apply_node(node_id, props)
 
     def supports_vector_search(self) -> bool:
         """Return True if vector_search module is available."""
@@ -7,7 +7,7 @@ from dal.mysql.param_translation import translate_postgres_params_to_mysql
 from dal.mysql.quoting import translate_double_quotes_to_backticks
 from dal.tracing import trace_query_operation
 from dal.util.read_only import enforce_read_only_sql, validate_no_mutation_keywords
-from dal.util.row_limits import cap_rows_with_metadata, get_sync_max_rows
+from dal.util.row_limits import afetch_capped_rows, get_sync_max_rows
 
 
 class MysqlQueryTargetDatabase:
@@ -131,6 +131,11 @@ class _MysqlConnection:
             operation=_run(),
         )
 
+    def _fetch_cursor_args(self) -> tuple:
+        # Capped reads use an unbuffered cursor so rows past the cap are never
+        # materialized client-side; uncapped reads keep the pool's DictCursor.
+        return (aiomysql.SSDictCursor,) if self._max_rows else ()
+
     async def fetch(self, sql: str, *params: Any) -> List[Dict[str, Any]]:
         enforce_read_only_sql(sql, "mysql", self._read_only)
         sql = translate_double_quotes_to_backticks(sql)
@@ -139,10 +144,9 @@ class _MysqlConnection:
             validate_no_mutation_keywords(sql)
 
         async def _run():
-            async with self._conn.cursor() as cursor:
+            async with self._conn.cursor(*self._fetch_cursor_args()) as cursor:
                 await cursor.execute(sql, bound_params)
-                rows = await cursor.fetchall()
-                capped_rows, truncated = cap_rows_with_metadata(list(rows), self._max_rows)
+                capped_rows, truncated = await _fetch_rows(cursor, self._max_rows)
                 self._last_truncated = truncated
                 self._last_truncated_reason = "PROVIDER_CAP" if truncated else None
                 return capped_rows
@@ -166,10 +170,9 @@ class _MysqlConnection:
         async def _run():
             from dal.util.column_metadata import columns_from_cursor_description
 
-            async with self._conn.cursor() as cursor:
+            async with self._conn.cursor(*self._fetch_cursor_args()) as cursor:
                 await cursor.execute(sql, bound_params)
-                rows = await cursor.fetchall()
-                capped_rows, truncated = cap_rows_with_metadata(list(rows), self._max_rows)
+                capped_rows, truncated = await _fetch_rows(cursor, self._max_rows)
                 self._last_truncated = truncated
                 self._last_truncated_reason = "PROVIDER_CAP" if truncated else None
                 columns = columns_from_cursor_description(cursor.description, provider="mysql")
@@ -221,3 +224,10 @@ def _format_execute_status(sql: str, rowcount: int) -> str:
     if op in {"INSERT", "UPDATE", "DELETE"} and rowcount >= 0:
         return f"{op} {rowcount}"
     return "OK"
+
+
+async def _fetch_rows(cursor: aiomysql.Cursor, max_rows: int) -> tuple[list, bool]:
+    """Fetch all rows, or stop after ``max_rows + 1`` when a cap is set."""
+    if not max_rows:
+        return list(await cursor.fetchall()), False
+    return await afetch_capped_rows(cursor.fetchmany, max_rows)
@@ -320,9 +320,18 @@ def revoke_session(
     *,
     registry: PaginationSessionRegistry | None = None,
 ) -> PaginationSession | None:
-    """Revoke a pagination session in the provided/default registry."""
+    """Revoke a pagination session in the provided/default registry.
+
+    Any result spool bound to the session is deleted as well.
+    """
+    from dal.result_spool import discard_result_spool
+
     active_registry = registry or get_default_pagination_session_registry()
-    return active_registry.revoke_session(session_id)
+    revoked = active_registry.revoke_session(session_id)
+    normalized_session_id = normalize_pagination_session_id(session_id)
+    if normalized_session_id is not None:
+        discard_result_spool(normalized_session_id)
+    return revoked
 
 
 def record_session_access(
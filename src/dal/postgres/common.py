@@ -1,6 +1,22 @@
-from typing import List
+import re
+from typing import Any, List
+
+_ROLE_LITERAL = re.compile(r"[a-z][a-z0-9_]{0,31}")
 
 
 def _format_vector(embedding: List[float]) -> str:
     """Format Python list as PostgreSQL vector string."""
     return "[" + ",".join(str(float(x)) for x in embedding) + "]"
+
+
+def _role_predicate(role: str, args: List[Any]) -> str:
+    """Return a ``query_pairs.roles`` membership predicate for ``role``.
+
+    Simple role names are inlined as literals so the clause matches the per-role
+    partial ANN indexes (a bind parameter cannot prove a partial index predicate
+    in a generic plan). Anything else is appended to ``args`` and bound.
+    """
+    if _ROLE_LITERAL.fullmatch(role):
+        return f"'{role}' = ANY(roles)"
+    args.append(role)
+    return f"${len(args)} = ANY(roles)"
@@ -0,0 +1,114 @@
+"""Write-behind aggregation of cache hit counters."""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FLUSH_INTERVAL_SECONDS = 5.0
+DEFAULT_MAX_PENDING_KEYS = 1000
+
+# (cache_id, tenant_id) -> hits since the last flush
+HitCounts = Dict[Tuple[str, int], int]
+
+
+class HitCountBuffer:
+    """Aggregates hit increments in memory and hands them to ``flush_fn`` in batches.
+
+    A background task flushes every ``interval_seconds``, or sooner once
+    ``max_pending_keys`` distinct keys are buffered. ``flush_fn`` is called once
+    per tenant, so one tenant's failure never re-queues counts already written
+    for another; only the failed tenant's counts are merged back and retried.
+    """
+
+    def __init__(
+        self,
+        flush_fn: Callable[[HitCounts], Awaitable[None]],
+        interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        max_pending_keys: int = DEFAULT_MAX_PENDING_KEYS,
+    ) -> None:
+        """Initialize an empty buffer; the flush task starts on the first hit."""
+        self._flush_fn = flush_fn
+        self.interval_seconds = interval_seconds
+        self.max_pending_keys = max_pending_keys
+        self._pending: HitCounts = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    @property
+    def pending(self) -> int:
+        """Return the number of buffered hits."""
+        return sum(self._pending.values())
+
+    def add(self, cache_id: str, tenant_id: int, hits: int = 1) -> None:
+        """Buffer ``hits`` for an entry. Must be called from the event loop."""
+        key = (cache_id, tenant_id)
+        self._pending[key] = self._pending.get(key, 0) + hits
+        self._ensure_task()
+        if len(self._pending) >= self.max_pending_keys:
+            self._wakeup.set()
+
+    async def flush(self) -> None:
+        """Write out everything buffered so far."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if not self._pending:
+                return
+            batch, self._pending = self._pending, {}
+            by_tenant: Dict[int, HitCounts] = {}
+            for key, hits in batch.items():
+                by_tenant.setdefault(key[1], {})[key] = hits
+
+            unwritten = sorted(by_tenant)
+            while unwritten:
+                tenant_batch = by_tenant[unwritten[0]]
+                try:
+                    await self._flush_fn(tenant_batch)
+                except asyncio.CancelledError:
+                    for tenant_id in unwritten:
+                        self._restore(by_tenant[tenant_id])
+                    raise
+                except Exception as e:
+                    logger.warning(
+                        "Failed to flush %d cache hit counters for tenant %s: %s",
+                        len(tenant_batch),
+                        unwritten[0],
+                        e,
+                    )
+                    self._restore(tenant_batch)
+                unwritten.pop(0)
+
+    def _restore(self, batch: HitCounts) -> None:
+        for key, hits in batch.items():
+            self._pending[key] = self._pending.get(key, 0) + hits
+
+    async def close(self) -> None:
+        """Stop the background task and flush what is left."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    def _ensure_task(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(
+            self._run(), name="cache-hit-count-flusher"
+        )
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
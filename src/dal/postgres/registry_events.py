@@ -0,0 +1,208 @@
+"""Change notifications for ``public.query_pairs`` via Postgres LISTEN/NOTIFY.
+
+Writers call :func:`notify_registry_event` on the connection that performed the
+write, so the notification is delivered only if (and when) the write commits.
+Processes holding in-memory copies of registry rows run a
+:class:`RegistryEventListener` to drop stale entries.
+"""
+
+import asyncio
+import json
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+REGISTRY_EVENTS_CHANNEL = "query_registry_events"
+
+# A pair was inserted or updated.
+EVENT_STORE = "store"
+# A pair was tombstoned.
+EVENT_TOMBSTONE = "tombstone"
+# The schema was re-indexed; previously generated SQL may no longer apply.
+EVENT_SCHEMA = "schema"
+# Rows were removed in bulk (tenant-scoped when tenant_id is set, else global).
+EVENT_RESET = "reset"
+
+
+def encode_registry_event(
+    event: str, tenant_id: Optional[int] = None, signature_key: Optional[str] = None
+) -> str:
+    """Serialize an event into a NOTIFY payload."""
+    return json.dumps({"event": event, "tenant_id": tenant_id, "signature_key": signature_key})
+
+
+def decode_registry_event(payload: str) -> Dict[str, Any]:
+    """Parse a NOTIFY payload.
+
+    Raises:
+        ValueError: If the payload is not a registry event.
+    """
+    try:
+        data = json.loads(payload)
+    except (TypeError, json.JSONDecodeError) as e:
+        raise ValueError(f"Malformed registry event payload: {payload!r}") from e
+    if not isinstance(data, dict) or not isinstance(data.get("event"), str):
+        raise ValueError(f"Malformed registry event payload: {payload!r}")
+    return data
+
+
+async def notify_registry_event(
+    conn, event: str, tenant_id: Optional[int] = None, signature_key: Optional[str] = None
+) -> None:
+    """Queue a registry event on ``conn``; delivered when its transaction commits."""
+    await conn.execute(
+        "SELECT pg_notify($1, $2)",
+        REGISTRY_EVENTS_CHANNEL,
+        encode_registry_event(event, tenant_id, signature_key),
+    )
+
+
+def _registry_pool():
+    """Return the asyncpg pool that holds ``query_pairs``, or None."""
+    import asyncpg
+
+    from dal.control_plane import ControlPlaneDatabase
+    from dal.database import Database
+
+    pool = ControlPlaneDatabase._pool if ControlPlaneDatabase.is_enabled() else Database._pool
+    return pool if isinstance(pool, asyncpg.Pool) else None
+
+
+@asynccontextmanager
+async def _registry_connection():
+    from dal.control_plane import ControlPlaneDatabase
+    from dal.database import Database
+
+    if ControlPlaneDatabase.is_enabled():
+        async with ControlPlaneDatabase.get_connection() as conn:
+            yield conn
+    else:
+        async with Database.get_connection() as conn:
+            yield conn
+
+
+async def publish_registry_event(
+    event: str, tenant_id: Optional[int] = None, signature_key: Optional[str] = None
+) -> None:
+    """Send a registry event on its own connection (for writes outside the registry store).
+
+    Failures are logged, not raised.
+    """
+    try:
+        async with _registry_connection() as conn:
+            await notify_registry_event(conn, event, tenant_id, signature_key)
+    except Exception as e:
+        logger.warning("Failed to publish registry event %s: %s", event, e)
+
+
+class RegistryEventListener:
+    """Holds a dedicated connection LISTENing on the registry channel.
+
+    ``on_event`` receives each decoded event (or None for an undecodable
+    payload). ``on_state`` is called with True once LISTEN is active and with
+    False whenever the connection is lost, since events may have been missed
+    until the next successful reconnect.
+    """
+
+    def __init__(
+        self,
+        on_event: Callable[[Optional[Dict[str, Any]]], None],
+        on_state: Callable[[bool], None],
+        health_check_interval: float = 30.0,
+        max_reconnect_delay: float = 30.0,
+    ) -> None:
+        """Initialize the listener; call start() to connect."""
+        self._on_event = on_event
+        self._on_state = on_state
+        self._health_check_interval = health_check_interval
+        self._max_reconnect_delay = max_reconnect_delay
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+
+    @property
+    def running(self) -> bool:
+        """Return True while the supervisor task is alive."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> bool:
+        """Start listening in the background.
+
+        Returns:
+            False if the registry is not backed by an asyncpg pool.
+        """
+        if self.running:
+            return True
+        if _registry_pool() is None:
+            return False
+        self._stopping.clear()
+        self._task = asyncio.create_task(self._supervise(), name="registry-event-listener")
+        return True
+
+    async def stop(self) -> None:
+        """Stop listening and release the connection."""
+        if self._task is None:
+            return
+        self._stopping.set()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def _dispatch(self, _conn, _pid, _channel, payload: str) -> None:
+        try:
+            event = decode_registry_event(payload)
+        except ValueError as e:
+            logger.warning("%s", e)
+            event = None
+        try:
+            self._on_event(event)
+        except Exception:
+            logger.exception("Registry event handler failed")
+
+    async def _supervise(self) -> None:
+        delay = 1.0
+        while not self._stopping.is_set():
+            pool = _registry_pool()
+            if pool is None:
+                return
+            try:
+                await self._listen_once(pool)
+                delay = 1.0
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Registry event listener disconnected: %s", e)
+            if self._stopping.is_set():
+                return
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self._max_reconnect_delay)
+
+    async def _listen_once(self, pool) -> None:
+        lost = asyncio.Event()
+        conn = await pool.acquire()
+        try:
+            conn.add_termination_listener(lambda _conn: lost.set())
+            await conn.add_listener(REGISTRY_EVENTS_CHANNEL, self._dispatch)
+            self._on_state(True)
+            try:
+                while not self._stopping.is_set():
+                    try:
+                        await asyncio.wait_for(lost.wait(), self._health_check_interval)
+                    except asyncio.TimeoutError:
+                        # Half-open TCP connections never fire the termination listener
+                        await asyncio.wait_for(conn.execute("SELECT 1"), timeout=5)
+                        continue
+                    raise ConnectionError("listener connection terminated")
+            finally:
+                self._on_state(False)
+        finally:
+            try:
+                if not conn.is_closed():
+                    await conn.remove_listener(REGISTRY_EVENTS_CHANNEL, self._dispatch)
+                await pool.release(conn)
+            except Exception as e:
+                logger.debug("Failed to release registry listener connection: %s", e)
@@ -1,16 +1,56 @@
 import json
 import logging
 from contextlib import asynccontextmanager
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from common.interfaces.registry_store import RegistryStore
 from dal.database import Database
-from dal.postgres.common import _format_vector
+from dal.postgres.common import _format_vector, _role_predicate
+from dal.postgres.registry_events import (
+    EVENT_RESET,
+    EVENT_STORE,
+    EVENT_TOMBSTONE,
+    notify_registry_event,
+)
+from dal.tracing import TracedAsyncpgConnection
 from schema.registry import QueryPair
 
 logger = logging.getLogger(__name__)
 
 
+# Merge rule shared by single and bulk upserts
+_UPSERT_CONFLICT_CLAUSE = """
+            ON CONFLICT (signature_key, tenant_id)
+            DO UPDATE SET
+                question = EXCLUDED.question,
+                sql_query = EXCLUDED.sql_query,
+                embedding = EXCLUDED.embedding,
+                roles = ARRAY(SELECT DISTINCT unnest(query_pairs.roles || EXCLUDED.roles)),
+                status = CASE
+                    WHEN EXCLUDED.status = 'verified' THEN 'verified'
+                    ELSE query_pairs.status
+                END,
+                metadata = query_pairs.metadata || EXCLUDED.metadata,
+                performance = query_pairs.performance || EXCLUDED.performance,
+                updated_at = NOW()
+"""
+
+_STAGING_TABLE = "query_pairs_staging"
+_STAGING_COLUMNS = (
+    "ord",
+    "signature_key",
+    "tenant_id",
+    "fingerprint",
+    "question",
+    "sql_query",
+    "embedding",
+    "roles",
+    "status",
+    "metadata",
+    "performance",
+)
+
+
 class PostgresRegistryStore(RegistryStore):
     """PostgreSQL implementation of the Unified Registry."""
 
@@ -31,26 +71,16 @@ class PostgresRegistryStore(RegistryStore):
         """Upsert a query pair into the unified registry."""
         pg_vector = _format_vector(pair.embedding) if pair.embedding else None
 
-        query = """
+        query = (
+            """
             INSERT INTO public.query_pairs (
                 signature_key, tenant_id, fingerprint, question,
                 sql_query, embedding, roles, status, metadata, performance
             )
             VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
-            ON CONFLICT (signature_key, tenant_id)
-            DO UPDATE SET
-                question = EXCLUDED.question,
-                sql_query = EXCLUDED.sql_query,
-                embedding = EXCLUDED.embedding,
-                roles = ARRAY(SELECT DISTINCT unnest(query_pairs.roles || EXCLUDED.roles)),
-                status = CASE
-                    WHEN EXCLUDED.status = 'verified' THEN 'verified'
-                    ELSE query_pairs.status
-                END,
-                metadata = query_pairs.metadata || EXCLUDED.metadata,
-                performance = query_pairs.performance || EXCLUDED.performance,
-                updated_at = NOW()
         """
+            + _UPSERT_CONFLICT_CLAUSE
+        )
 
         async with self._get_connection(pair.tenant_id) as conn:
             await conn.execute(
@@ -66,6 +96,91 @@ class PostgresRegistryStore(RegistryStore):
                 json.dumps(pair.metadata),
                 json.dumps(pair.performance),
             )
+            await notify_registry_event(conn, EVENT_STORE, pair.tenant_id, pair.signature_key)
+
+    async def store_pairs(self, pairs: List[QueryPair]) -> List[str]:
+        """Upsert many pairs: COPY into a temporary staging table, then one upsert per tenant.
+
+        Rows sharing a (signature_key, tenant_id) within the batch collapse to
+        the last occurrence, since one statement cannot update a row twice.
+
+        Returns:
+            Per-pair outcome aligned with ``pairs``: "inserted", "updated", or
+            "duplicate" (superseded by a later row in the same batch).
+        """
+        by_tenant: Dict[int, List[int]] = {}
+        for i, pair in enumerate(pairs):
+            by_tenant.setdefault(pair.tenant_id, []).append(i)
+
+        outcomes = ["duplicate"] * len(pairs)
+        for tenant_id, positions in by_tenant.items():
+            # Row-level security scopes each statement to a single tenant
+            last = {pairs[i].signature_key: i for i in positions}
+            records = [
+                (
+                    i,
+                    pairs[i].signature_key,
+                    tenant_id,
+                    pairs[i].fingerprint,
+                    pairs[i].question,
+                    pairs[i].sql_query,
+                    _format_vector(pairs[i].embedding) if pairs[i].embedding else None,
+                    list(pairs[i].roles),
+                    pairs[i].status,
+                    json.dumps(pairs[i].metadata),
+                    json.dumps(pairs[i].performance),
+                )
+                for i in last.values()
+            ]
+            async with self._get_connection(tenant_id) as conn:
+                rows = await self._upsert_staged(conn, records)
+                await notify_registry_event(conn, EVENT_RESET, tenant_id)
+            for row in rows:
+                outcomes[last[row["signature_key"]]] = "inserted" if row["inserted"] else "updated"
+        return outcomes
+
+    @staticmethod
+    async def _upsert_staged(conn, records: List[tuple]) -> list:
+        if isinstance(conn, TracedAsyncpgConnection):
+            # The tracing proxy caps fetch() at DAL_SYNC_MAX_ROWS, which would drop
+            # RETURNING rows, and hides COPY; the upsert needs the driver connection.
+            conn = conn.raw_connection
+        await conn.execute(
+            f"""
+            CREATE TEMPORARY TABLE IF NOT EXISTS {_STAGING_TABLE} (
+                ord INT, signature_key TEXT, tenant_id INT, fingerprint TEXT,
+                question TEXT, sql_query TEXT, embedding TEXT, roles TEXT[],
+                status TEXT, metadata TEXT, performance TEXT
+            ) ON COMMIT DELETE ROWS
+            """
+        )
+        if hasattr(conn, "copy_records_to_table"):
+            await conn.copy_records_to_table(
+                _STAGING_TABLE, records=records, columns=list(_STAGING_COLUMNS)
+            )
+        else:
+            # Non-asyncpg connections only expose the query API
+            placeholders = ", ".join(f"${i + 1}" for i in range(len(_STAGING_COLUMNS)))
+            await conn.executemany(f"INSERT INTO {_STAGING_TABLE} VALUES ({placeholders})", records)
+
+        # xmax = 0 only for rows this statement inserted (not updated)
+        return await conn.fetch(
+            f"""
+            INSERT INTO public.query_pairs (
+                signature_key, tenant_id, fingerprint, question,
+                sql_query, embedding, roles, status, metadata, performance
+            )
+            SELECT signature_key, tenant_id, fingerprint, question, sql_query,
+                   embedding::vector, roles::varchar[], status,
+                   metadata::jsonb, performance::jsonb
+            FROM {_STAGING_TABLE}
+            ORDER BY ord
+            """
+            + _UPSERT_CONFLICT_CLAUSE
+            + """
+            RETURNING signature_key, (xmax = 0) AS inserted
+            """
+        )
 
     async def lookup_by_signature(self, signature_key: str, tenant_id: int) -> Optional[QueryPair]:
         """Fetch a specific pair by its canonical signature."""
@@ -94,15 +209,19 @@ class PostgresRegistryStore(RegistryStore):
         role: Optional[str] = None,
         status: Optional[str] = None,
     ) -> List[QueryPair]:
-        """Search for semantically similar pairs with optional role and status filtering."""
+        """Search for semantically similar pairs with optional role and status filtering.
+
+        The nearest ``limit`` rows are found with ``ORDER BY embedding <=> $1`` so
+        the HNSW index drives the scan; the similarity threshold is applied to
+        that top-k afterwards.
+        """
         pg_vector = _format_vector(embedding)
 
-        filters = ["(1 - (embedding <=> $1)) >= $2"]
+        filters = ["embedding IS NOT NULL"]
         args = [pg_vector, threshold, limit]
 
         if role:
-            args.append(role)
-            filters.append(f"${len(args)} = ANY(roles)")
+            filters.append(_role_predicate(role, args))
 
         if status:
             args.append(status)
@@ -111,14 +230,19 @@ class PostgresRegistryStore(RegistryStore):
         where_clause = " WHERE " + " AND ".join(filters)
 
         query = f"""
-            SELECT signature_key, tenant_id, fingerprint, question,
-                   sql_query, (embedding) as embedding, roles, status, metadata, performance,
-                   created_at, updated_at,
-                   (1 - (embedding <=> $1)) as similarity
-            FROM public.query_pairs
-            {where_clause}
-            ORDER BY similarity DESC
-            LIMIT $3
+            SELECT *, (1 - distance) as similarity
+            FROM (
+                SELECT signature_key, tenant_id, fingerprint, question,
+                       sql_query, (embedding) as embedding, roles, status, metadata,
+                       performance, created_at, updated_at,
+                       (embedding <=> $1) as distance
+                FROM public.query_pairs
+                {where_clause}
+                ORDER BY embedding <=> $1
+                LIMIT $3
+            ) AS nearest
+            WHERE (1 - distance) >= $2
+            ORDER BY distance
         """
 
         async with self._get_connection(tenant_id) as conn:
@@ -208,7 +332,10 @@ class PostgresRegistryStore(RegistryStore):
         """
         async with self._get_connection(tenant_id) as conn:
             result = await conn.execute(query, signature_key, tenant_id, reason)
-            return int(result.split(" ")[-1]) > 0
+            updated = int(result.split(" ")[-1]) > 0
+            if updated:
+                await notify_registry_event(conn, EVENT_TOMBSTONE, tenant_id, signature_key)
+            return updated
 
     async def fetch_by_signatures(
         self, signature_keys: List[str], tenant_id: int
@@ -1,6 +1,6 @@
 import json
 from contextlib import asynccontextmanager
-from typing import List
+from typing import List, Optional
 
 from common.interfaces.schema_store import SchemaStore
 from dal.postgres.common import _format_vector
@@ -61,6 +61,23 @@ class PostgresSchemaStore(SchemaStore):
 
         return results
 
+    async def fetch_schema_fingerprint(self) -> Optional[str]:
+        """Return an md5 over table names and update times of embedded rows.
+
+        Returns:
+            Fingerprint string, or None if no embeddings are stored.
+        """
+        query = """
+            SELECT md5(
+                string_agg(table_name || '@' || updated_at::text, ',' ORDER BY table_name)
+            ) AS fingerprint
+            FROM public.schema_embeddings
+            WHERE embedding IS NOT NULL
+        """
+
+        async with self._get_connection() as conn:
+            return await conn.fetchval(query)
+
     async def save_schema_embedding(self, embedding: SchemaEmbedding) -> None:
         """Save (upsert) a schema embedding.
 
@@ -1,10 +1,22 @@
 import logging
 from contextlib import asynccontextmanager
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from common.interfaces.cache_store import CacheStore
 from dal.database import Database
-from dal.postgres.common import _format_vector
+from dal.postgres.common import _format_vector, _role_predicate
+from dal.postgres.hit_counts import (
+    DEFAULT_FLUSH_INTERVAL_SECONDS,
+    DEFAULT_MAX_PENDING_KEYS,
+    HitCountBuffer,
+    HitCounts,
+)
+from dal.postgres.registry_events import (
+    EVENT_RESET,
+    EVENT_STORE,
+    EVENT_TOMBSTONE,
+    notify_registry_event,
+)
 from schema.cache import CacheLookupResult
 
 logger = logging.getLogger(__name__)
@@ -16,6 +28,10 @@ class PgSemanticCache(CacheStore):
     # Schema Versioning: Stored in metadata.schema_version
     CURRENT_SCHEMA_VERSION = "v1"
 
+    def __init__(self) -> None:
+        """Initialize the cache; the hit buffer is created on first use."""
+        self._hits: Optional[HitCountBuffer] = None
+
     @staticmethod
     @asynccontextmanager
     async def _get_connection(tenant_id: Optional[int] = None):
@@ -29,6 +45,36 @@ class PgSemanticCache(CacheStore):
             async with Database.get_connection(tenant_id) as conn:
                 yield conn
 
+    @staticmethod
+    def _nearest_query(cache_type: str, args: List) -> str:
+        """Build the top-k similarity query over ``query_pairs``.
+
+        ``args`` holds $1 vector, $2 threshold, $3 limit and $4 schema version.
+        Ordering by the raw ``embedding <=> $1`` distance lets Postgres walk the
+        (per-role partial) HNSW index instead of scanning every row to evaluate a
+        similarity predicate; the threshold is applied to the nearest rows only.
+        """
+        role_filter = _role_predicate(cache_type, args)
+        return f"""
+            SELECT cache_id, generated_sql, user_query, (1 - distance) as similarity
+            FROM (
+                SELECT
+                    signature_key as cache_id,
+                    sql_query as generated_sql,
+                    question as user_query,
+                    (embedding <=> $1) as distance
+                FROM public.query_pairs
+                WHERE (metadata->>'schema_version') = $4
+                AND {role_filter}
+                AND embedding IS NOT NULL
+                AND status != 'tombstoned'
+                ORDER BY embedding <=> $1
+                LIMIT $3
+            ) AS nearest
+            WHERE (1 - distance) >= $2
+            ORDER BY distance
+        """
+
     async def lookup(
         self,
         query_embedding: List[float],
@@ -37,32 +83,11 @@ class PgSemanticCache(CacheStore):
         cache_type: str = "sql",
     ) -> Optional[CacheLookupResult]:
         """Lookup a cached result by embedding similarity (Global/Cross-Tenant)."""
-        pg_vector = _format_vector(query_embedding)
-
-        query = """
-            SELECT
-                signature_key as cache_id,
-                sql_query as generated_sql,
-                question as user_query,
-                (1 - (embedding <=> $1)) as similarity
-            FROM public.query_pairs
-            WHERE (metadata->>'schema_version') = $3
-            AND $4 = ANY(roles)
-            AND embedding IS NOT NULL
-            AND status != 'tombstoned'
-            AND (1 - (embedding <=> $1)) >= $2
-            ORDER BY similarity DESC
-            LIMIT 1
-        """
+        args = [_format_vector(query_embedding), threshold, 1, self.CURRENT_SCHEMA_VERSION]
+        query = self._nearest_query(cache_type, args)
 
         async with self._get_connection(tenant_id) as conn:
-            row = await conn.fetchrow(
-                query,
-                pg_vector,
-                threshold,
-                self.CURRENT_SCHEMA_VERSION,
-                cache_type,
-            )
+            row = await conn.fetchrow(query, *args)
 
         if row:
             return CacheLookupResult(
@@ -110,33 +135,11 @@ class PgSemanticCache(CacheStore):
         cache_type: str = "sql",
     ) -> List[CacheLookupResult]:
         """Lookup multiple cache candidates for margin checking."""
-        pg_vector = _format_vector(query_embedding)
-
-        query = """
-            SELECT
-                signature_key as cache_id,
-                sql_query as generated_sql,
-                question as user_query,
-                (1 - (embedding <=> $1)) as similarity
-            FROM public.query_pairs
-            WHERE (metadata->>'schema_version') = $4
-            AND $5 = ANY(roles)
-            AND embedding IS NOT NULL
-            AND status != 'tombstoned'
-            AND (1 - (embedding <=> $1)) >= $2
-            ORDER BY similarity DESC
-            LIMIT $3
-        """
+        args = [_format_vector(query_embedding), threshold, limit, self.CURRENT_SCHEMA_VERSION]
+        query = self._nearest_query(cache_type, args)
 
         async with self._get_connection(tenant_id) as conn:
-            rows = await conn.fetch(
-                query,
-                pg_vector,
-                threshold,
-                limit,
-                self.CURRENT_SCHEMA_VERSION,
-                cache_type,
-            )
+            rows = await conn.fetch(query, *args)
 
         return [
             CacheLookupResult(
@@ -155,12 +158,25 @@ class PgSemanticCache(CacheStore):
         payload = f"{user_query}".encode("utf-8")
         return hashlib.sha256(payload).hexdigest()
 
-    async def _execute_dual_write(self, query: str, *args, tenant_id: Optional[int] = None):
-        """Execute a write operation on both pools (Primary + Shadow)."""
+    async def _execute_dual_write(
+        self,
+        query: str,
+        *args,
+        tenant_id: Optional[int] = None,
+        event: Optional[str] = None,
+        signature_key: Optional[str] = None,
+    ):
+        """Execute a write operation on both pools (Primary + Shadow).
+
+        ``event`` is announced on the primary connection only, which is the one
+        registry readers listen on.
+        """
         from dal.control_plane import ControlPlaneDatabase
 
         async with self._get_connection(tenant_id) as conn:
             await conn.execute(query, *args)
+            if event:
+                await notify_registry_event(conn, event, tenant_id, signature_key)
 
         try:
             is_iso = ControlPlaneDatabase.is_enabled()
@@ -174,19 +190,75 @@ class PgSemanticCache(CacheStore):
         except Exception as e:
             logger.warning(f"Shadow write failed: {e}")
 
+    def _hit_buffer(self) -> Optional[HitCountBuffer]:
+        """Return the write-behind hit buffer, or None when hits are written through."""
+        if self._hits is None:
+            from common.config.env import get_env_float, get_env_int
+
+            interval = get_env_float(
+                "SEMANTIC_CACHE_HIT_FLUSH_INTERVAL_SECONDS", DEFAULT_FLUSH_INTERVAL_SECONDS
+            )
+            if interval <= 0:
+                return None
+            self._hits = HitCountBuffer(
+                self._flush_hit_counts,
+                interval_seconds=interval,
+                max_pending_keys=get_env_int(
+                    "SEMANTIC_CACHE_HIT_FLUSH_MAX_PENDING", DEFAULT_MAX_PENDING_KEYS
+                ),
+            )
+        return self._hits
+
     async def record_hit(self, cache_id: str, tenant_id: int) -> None:
-        """Record a cache hit."""
+        """Record a cache hit.
+
+        Hits are buffered in memory and applied in batches by a background
+        flush; set SEMANTIC_CACHE_HIT_FLUSH_INTERVAL_SECONDS=0 to write each
+        hit through immediately.
+        """
+        buffer = self._hit_buffer()
+        if buffer is None:
+            await self._flush_hit_counts({(cache_id, tenant_id): 1})
+            return
+        buffer.add(cache_id, tenant_id)
+
+    async def flush_hits(self) -> None:
+        """Write out buffered hit counts (called on shutdown)."""
+        if self._hits is not None:
+            await self._hits.close()
+
+    async def _flush_hit_counts(self, counts: HitCounts) -> None:
+        """Apply aggregated hit counts with one UPDATE per tenant and pool.
+
+        Batches are split by tenant because ``query_pairs`` is row-level
+        secured on ``app.current_tenant``. ``HitCountBuffer`` passes one tenant
+        per call, so a failure never re-queues another tenant's written counts.
+        """
         query = """
-            UPDATE public.query_pairs
+            UPDATE public.query_pairs AS qp
             SET performance = jsonb_set(
-                    coalesce(performance, '{}'),
+                    coalesce(qp.performance, '{}'),
                     '{hit_count}',
-                    (coalesce(performance->>'hit_count', '0')::int + 1)::text::jsonb
+                    (coalesce(qp.performance->>'hit_count', '0')::int + v.hits)::text::jsonb
                 ),
                 updated_at = NOW()
-            WHERE signature_key = $1 AND tenant_id = $2
+            FROM unnest($1::text[], $2::int[]) AS v(signature_key, hits)
+            WHERE qp.signature_key = v.signature_key AND qp.tenant_id = $3
         """
-        await self._execute_dual_write(query, cache_id, tenant_id, tenant_id=tenant_id)
+        by_tenant: Dict[int, List[Tuple[str, int]]] = {}
+        for (cache_id, tenant_id), hits in counts.items():
+            by_tenant.setdefault(tenant_id, []).append((str(cache_id), hits))
+
+        for tenant_id, rows in sorted(by_tenant.items()):
+            # Sorted keys give concurrent flushers a consistent row-lock order
+            rows.sort()
+            await self._execute_dual_write(
+                query,
+                [cache_id for cache_id, _ in rows],
+                [hits for _, hits in rows],
+                tenant_id,
+                tenant_id=tenant_id,
+            )
 
     async def store(
         self,
@@ -237,6 +309,8 @@ class PgSemanticCache(CacheStore):
             cache_type,
             signature_key,
             tenant_id=tenant_id,
+            event=EVENT_STORE,
+            signature_key=signature_key,
         )
 
     async def tombstone_entry(self, cache_id: str, tenant_id: int, reason: str) -> bool:
@@ -256,6 +330,7 @@ class PgSemanticCache(CacheStore):
             result = await conn.execute(query, cache_id, tenant_id, reason)
             if int(result.split(" ")[-1]) > 0:
                 success = True
+                await notify_registry_event(conn, EVENT_TOMBSTONE, tenant_id, cache_id)
 
         try:
             from dal.control_plane import ControlPlaneDatabase
@@ -278,6 +353,7 @@ class PgSemanticCache(CacheStore):
         query = "DELETE FROM public.query_pairs WHERE question = $1 AND tenant_id = $2"
         async with self._get_connection(tenant_id) as conn:
             await conn.execute(query, user_query, tenant_id)
+            await notify_registry_event(conn, EVENT_RESET, tenant_id)
 
     async def prune_legacy_entries(self) -> int:
         """Prune cache entries dependent on obsolete schema versions."""
@@ -287,6 +363,8 @@ class PgSemanticCache(CacheStore):
             async with self._get_connection() as conn:
                 result = await conn.execute(query, self.CURRENT_SCHEMA_VERSION)
                 count = int(result.split(" ")[-1])
+                if count:
+                    await notify_registry_event(conn, EVENT_RESET)
             await self._execute_dual_write(query, self.CURRENT_SCHEMA_VERSION)
             return count
         except Exception as e:
@@ -305,6 +383,8 @@ class PgSemanticCache(CacheStore):
             async with self._get_connection() as conn:
                 result = await conn.execute(query)
                 count = int(result.split(" ")[-1])
+                if count:
+                    await notify_registry_event(conn, EVENT_RESET)
             await self._execute_dual_write(query)
             return count
         except Exception as e:
@@ -1,17 +1,194 @@
+import json
+import math
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from json.encoder import encode_basestring_ascii
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Union
 
 ColumnMeta = Dict[str, Any]
 
+# Matches json.dumps(value, default=str, separators=(",", ":")), the encoding used for
+# row-size accounting, without building a new encoder per call.
+_JSON_ENCODER = json.JSONEncoder(default=str, separators=(",", ":"))
+_UNENCODABLE = -1
+
+
+class ColumnarRows(Sequence[Mapping[str, Any]]):
+    """Query rows stored as per-column lists and exposed as lazy row views.
+
+    Providers build this straight from driver tuples, so no per-row dict (and no
+    repeated column names) exists until ``to_dicts`` is called. Row views behave
+    like ``dict(zip(names, record))``: duplicate names resolve to the last column.
+    Slices share the underlying column lists.
+    """
+
+    __slots__ = ("_names", "_columns", "_index", "_start", "_stop")
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        columns: Sequence[Sequence[Any]],
+        *,
+        start: int = 0,
+        stop: Optional[int] = None,
+    ) -> None:
+        """Wrap per-column value lists; all columns must have the same length."""
+        if len(names) != len(columns):
+            raise ValueError("ColumnarRows needs exactly one value list per column name.")
+        self._names = list(names)
+        self._columns = list(columns)
+        self._index = {name: position for position, name in enumerate(self._names)}
+        total = len(self._columns[0]) if self._columns else 0
+        self._start = start
+        self._stop = total if stop is None else stop
+
+    @classmethod
+    def from_records(cls, names: Sequence[str], records: Iterable[Sequence[Any]]) -> "ColumnarRows":
+        """Transpose driver records (tuples, asyncpg Records, sqlite3.Row) into columns."""
+        names = list(names)
+        records = list(records)
+        if records and names:
+            columns: List[Sequence[Any]] = list(zip(*records))
+        else:
+            columns = [() for _ in names]
+        return cls(names, columns, stop=len(records))
+
+    @property
+    def column_names(self) -> List[str]:
+        """Distinct row keys in first-seen order."""
+        return list(self._index)
+
+    def __len__(self) -> int:
+        """Return the number of rows in this view."""
+        return self._stop - self._start
+
+    def __getitem__(self, item: Union[int, slice]) -> Union["RowView", "ColumnarRows"]:
+        """Return a lazy row view, or a column-sharing slice."""
+        if isinstance(item, slice):
+            start, stop, step = item.indices(len(self))
+            if step == 1:
+                return ColumnarRows(
+                    self._names,
+                    self._columns,
+                    start=self._start + start,
+                    stop=self._start + max(start, stop),
+                )
+            positions = range(self._start + start, self._start + stop, step)
+            return ColumnarRows(
+                self._names,
+                [[column[i] for i in positions] for column in self._columns],
+                stop=len(positions),
+            )
+        length = len(self)
+        if item < 0:
+            item += length
+        if not 0 <= item < length:
+            raise IndexError("row index out of range")
+        return RowView(self, self._start + item)
+
+    def __iter__(self) -> Iterator["RowView"]:
+        """Iterate lazy row views."""
+        for position in range(self._start, self._stop):
+            yield RowView(self, position)
+
+    def _live_columns(self) -> List[Sequence[Any]]:
+        return [self._columns[position] for position in self._index.values()]
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Materialize this view as plain row dicts."""
+        keys = list(self._index)
+        if not keys:
+            return [{} for _ in range(len(self))]
+        columns = [column[self._start : self._stop] for column in self._live_columns()]
+        return [dict(zip(keys, values)) for values in zip(*columns)]
+
+    def json_row_sizes(self) -> List[int]:
+        """Return each row's compact JSON size in bytes, computed column by column.
+
+        Sizes equal ``len(json.dumps(dict(row), default=str, separators=(",", ":")))``;
+        rows holding a value that cannot be encoded report 0, as the row-wise
+        estimators do.
+        """
+        length = len(self)
+        keys = list(self._index)
+        # "{" + "}" + the commas between members.
+        base = 2 + max(0, len(keys) - 1)
+        sizes = [base] * length
+        for key, column in zip(keys, self._live_columns()):
+            member = len(encode_basestring_ascii(key)) + 1
+            values = _json_value_sizes(column[self._start : self._stop])
+            sizes = [
+                _UNENCODABLE if row < 0 or value < 0 else row + member + value
+                for row, value in zip(sizes, values)
+            ]
+        return [max(0, size) for size in sizes]
+
+
+class RowView(Mapping[str, Any]):
+    """Read-only mapping over one row of a ``ColumnarRows`` container."""
+
+    __slots__ = ("_rows", "_position")
+
+    def __init__(self, rows: ColumnarRows, position: int) -> None:
+        """Bind the view to an absolute row position."""
+        self._rows = rows
+        self._position = position
+
+    def __getitem__(self, key: str) -> Any:
+        """Return the value of ``key`` in this row."""
+        return self._rows._columns[self._rows._index[key]][self._position]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate column names."""
+        return iter(self._rows._index)
+
+    def __len__(self) -> int:
+        """Return the number of distinct columns."""
+        return len(self._rows._index)
+
+    def __repr__(self) -> str:
+        """Render like the equivalent dict."""
+        return repr(dict(self))
+
+
+def _json_value_sizes(values: Sequence[Any]) -> List[int]:
+    sizes = []
+    for value in values:
+        value_type = type(value)
+        if value is None:
+            sizes.append(4)
+        elif value_type is bool:
+            sizes.append(4 if value else 5)
+        elif value_type is int:
+            sizes.append(len(int.__repr__(value)))
+        elif value_type is float and math.isfinite(value):
+            sizes.append(len(float.__repr__(value)))
+        elif value_type is str:
+            sizes.append(len(encode_basestring_ascii(value)))
+        else:
+            try:
+                sizes.append(len(_JSON_ENCODER.encode(value).encode("utf-8")))
+            except Exception:
+                sizes.append(_UNENCODABLE)
+    return sizes
+
+
+RowSequence = Union[List[Dict[str, Any]], ColumnarRows]
+
 
 @dataclass
 class QueryResult:
     """Container for query rows with optional column metadata."""
 
-    rows: List[Dict[str, Any]]
+    rows: RowSequence
     columns: Optional[List[ColumnMeta]] = None
     next_page_token: Optional[str] = None
     page_size: Optional[int] = None
     is_truncated: bool = False
     is_limited: bool = False
     partial_reason: Optional[str] = None
+
+    def row_dicts(self) -> List[Dict[str, Any]]:
+        """Return rows as plain dicts, materializing a columnar backing if present."""
+        if isinstance(self.rows, ColumnarRows):
+            return self.rows.to_dicts()
+        return self.rows
@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
-from typing import Any, Iterable, Mapping
+from typing import Any, Iterable, Mapping, Sequence
 
 from common.constants.reason_codes import PayloadTruncationReason
+from dal.query_result import ColumnarRows
 
 
 class ResourceContainmentPolicyError(RuntimeError):
@@ -23,7 +24,7 @@ class ResourceContainmentPolicyError(RuntimeError):
 class RowContainmentResult:
     """Result of hard row-limit enforcement."""
 
-    rows: list[dict[str, Any]]
+    rows: Sequence[Mapping[str, Any]]
     partial: bool
     partial_reason: str | None
     items_returned: int
@@ -87,7 +88,21 @@ def enforce_row_limit(
     max_rows: int,
     enforce: bool,
 ) -> RowContainmentResult:
-    """Apply a deterministic hard row cap while preserving row order."""
+    """Apply a deterministic hard row cap while preserving row order.
+
+    Columnar rows are sliced in place and stay columnar; they are materialized
+    once, by ``enforce_byte_limit``.
+    """
+    if isinstance(rows, ColumnarRows):
+        truncated = enforce and max_rows > 0 and len(rows) > max_rows
+        bounded = rows[:max_rows] if truncated else rows
+        return RowContainmentResult(
+            rows=bounded,
+            partial=truncated,
+            partial_reason=PayloadTruncationReason.MAX_ROWS.value if truncated else None,
+            items_returned=len(bounded),
+        )
+
     bounded_rows: list[dict[str, Any]] = []
     if not enforce or max_rows <= 0:
         for row in rows:
@@ -130,9 +145,18 @@ def enforce_byte_limit(
     enforce: bool,
     envelope_overhead: Mapping[str, Any] | None = None,
 ) -> ByteContainmentResult:
-    """Apply a deterministic byte cap without emitting partial rows."""
-    bounded_rows: list[dict[str, Any]] = []
+    """Apply a deterministic byte cap without emitting partial rows.
+
+    Columnar rows are sized column by column and only the rows that fit are
+    materialized as dicts.
+    """
     bytes_used = _json_size_bytes(dict(envelope_overhead or {}))
+    if isinstance(rows, ColumnarRows):
+        return _enforce_columnar_byte_limit(
+            rows, max_bytes=max_bytes, enforce=enforce, bytes_used=bytes_used
+        )
+
+    bounded_rows: list[dict[str, Any]] = []
     row_dicts = [dict(row) for row in rows]
 
     if not enforce or max_bytes <= 0:
@@ -163,3 +187,26 @@ def enforce_byte_limit(
         items_returned=len(bounded_rows),
         bytes_returned=bytes_used,
     )
+
+
+def _enforce_columnar_byte_limit(
+    rows: ColumnarRows, *, max_bytes: int, enforce: bool, bytes_used: int
+) -> ByteContainmentResult:
+    enforced = enforce and max_bytes > 0
+    kept = 0
+    truncated = False
+    for row_size in rows.json_row_sizes():
+        if enforced and bytes_used + row_size > max_bytes:
+            truncated = True
+            break
+        bytes_used += row_size
+        kept += 1
+
+    bounded_rows = rows[:kept].to_dicts()
+    return ByteContainmentResult(
+        rows=bounded_rows,
+        partial=truncated,
+        partial_reason=PayloadTruncationReason.MAX_BYTES.value if truncated else None,
+        items_returned=len(bounded_rows),
+        bytes_returned=bytes_used,
+    )
@@ -0,0 +1,340 @@
+"""Local result spools that serve offset pagination without re-executing queries.
+
+When spooling is enabled, the first page of an offset-paginated query fetches the
+whole reachable result once (bounded by the page-offset limit, the provider row
+cap and byte quotas) and writes it to a spill file bound to the request's
+``PaginationSession``. Continuation tokens for that session are then served by
+slicing the file through ``mmap`` instead of running ``LIMIT/OFFSET`` again.
+
+Spill files hold one compact JSON document per row, newline-terminated; row start
+offsets are kept in memory so a page is one contiguous read. Values are encoded
+with pydantic's JSON encoder, so spooled pages serialize exactly like freshly
+fetched ones in the response envelope.
+
+Spools expire with a TTL, are bounded per spool and per tenant in bytes, and are
+deleted when their pagination session is revoked. Expired spools are swept on
+every store access and, for the process-wide store, by a background sweeper so an
+idle server does not keep them on disk; ``close_result_spool_store`` removes the
+spill directory at shutdown.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import mmap
+import os
+import shutil
+import tempfile
+from array import array
+from dataclasses import dataclass, field
+from threading import Event, Lock, Thread
+from typing import Any, Callable, Iterable, Mapping
+
+from pydantic_core import to_json
+
+from common.config.env import get_env_bool, get_env_int, get_env_str
+from dal.pagination_cursor import cursor_now_epoch_milliseconds
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SPOOL_TTL_SECONDS = 900
+DEFAULT_SPOOL_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_SPOOL_TENANT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_SPOOL_MAX_ENTRIES = 1_000
+DEFAULT_SPOOL_MAX_ROWS = 100_000
+DEFAULT_SPOOL_SWEEP_INTERVAL_SECONDS = 60
+
+
+@dataclass(frozen=True)
+class ResultSpool:
+    """A spilled, immutable query result bound to one pagination session."""
+
+    session_id: str
+    tenant_key: str | None
+    query_fingerprint: str
+    path: str
+    row_offsets: array = field(repr=False)
+    byte_size: int
+    created_at_ms: int
+    complete: bool
+
+    @property
+    def row_count(self) -> int:
+        """Number of rows held in the spill file."""
+        return len(self.row_offsets)
+
+    def covers(self, offset: int, count: int) -> bool:
+        """Return True when rows ``[offset, offset + count)`` can be served from the spool.
+
+        A complete spool answers every range (short pages included); a capped one only
+        ranges that end inside it.
+        """
+        return self.complete or offset + count <= self.row_count
+
+    def read(self, offset: int, count: int) -> list[dict[str, Any]]:
+        """Decode up to ``count`` rows starting at ``offset``."""
+        start_row = max(0, int(offset))
+        end_row = min(self.row_count, start_row + max(0, int(count)))
+        if start_row >= end_row:
+            return []
+        start = self.row_offsets[start_row]
+        end = self.row_offsets[end_row] if end_row < self.row_count else self.byte_size
+        with open(self.path, "rb") as handle:
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                chunk = mapped[start:end]
+        return [json.loads(line) for line in chunk.splitlines()]
+
+
+class ResultSpoolStore:
+    """Thread-safe registry of result spools with TTL and byte quotas."""
+
+    def __init__(
+        self,
+        *,
+        directory: str | None = None,
+        ttl_ms: int = DEFAULT_SPOOL_TTL_SECONDS * 1000,
+        max_spool_bytes: int = DEFAULT_SPOOL_MAX_BYTES,
+        max_tenant_bytes: int = DEFAULT_SPOOL_TENANT_MAX_BYTES,
+        max_entries: int = DEFAULT_SPOOL_MAX_ENTRIES,
+        max_rows: int = DEFAULT_SPOOL_MAX_ROWS,
+        now_ms: Callable[[], int] | None = None,
+        sweep_interval_seconds: float | None = None,
+    ) -> None:
+        """Create an empty store; spill files go to a private directory.
+
+        With ``sweep_interval_seconds``, a daemon thread deletes expired spools on
+        that interval until ``close`` is called.
+        """
+        self._directory = tempfile.mkdtemp(prefix="text2sql-spool-", dir=directory)
+        self._ttl_ms = max(1, int(ttl_ms))
+        self._max_spool_bytes = max(0, int(max_spool_bytes))
+        self._max_tenant_bytes = max(0, int(max_tenant_bytes))
+        self._max_entries = max(1, int(max_entries))
+        self._max_rows = max(1, int(max_rows))
+        self._now_ms: Callable[[], int] = now_ms or cursor_now_epoch_milliseconds
+        self._spools: dict[str, ResultSpool] = {}
+        self._tenant_bytes: dict[str | None, int] = {}
+        self._lock = Lock()
+        self._sweeper_stop = Event()
+        self._sweeper: Thread | None = None
+        if sweep_interval_seconds and sweep_interval_seconds > 0:
+            self._sweeper = Thread(
+                target=self._sweep_loop,
+                args=(float(sweep_interval_seconds),),
+                name="result-spool-sweeper",
+                daemon=True,
+            )
+            self._sweeper.start()
+
+    @property
+    def max_rows(self) -> int:
+        """Most rows a single spool may hold; callers cap their fetch to this."""
+        return self._max_rows
+
+    @property
+    def directory(self) -> str:
+        """Directory holding this store's spill files."""
+        return self._directory
+
+    def write(
+        self,
+        session_id: str,
+        *,
+        tenant_id: Any,
+        query_fingerprint: str,
+        rows: Iterable[Mapping[str, Any]],
+        complete: bool,
+    ) -> ResultSpool | None:
+        """Spill ``rows`` for ``session_id`` and register the spool.
+
+        Rows are written until the per-spool or per-tenant byte quota would be
+        exceeded; the spool then keeps the prefix and is marked incomplete.
+        Returns None when not even one row fits.
+        """
+        tenant_key = _tenant_key(tenant_id)
+        self.discard(session_id)
+        with self._lock:
+            self._evict_expired_locked(self._now_ms())
+            tenant_budget = self._max_tenant_bytes - self._tenant_bytes.get(tenant_key, 0)
+        budget = min(self._max_spool_bytes, tenant_budget)
+
+        descriptor, path = tempfile.mkstemp(dir=self._directory, suffix=".rows")
+        offsets = array("Q")
+        size = 0
+        with os.fdopen(descriptor, "wb") as handle:
+            for row in rows:
+                encoded = to_json(dict(row), fallback=str) + b"\n"
+                if size + len(encoded) > budget:
+                    complete = False
+                    break
+                offsets.append(size)
+                handle.write(encoded)
+                size += len(encoded)
+
+        if not offsets:
+            _unlink_quietly(path)
+            return None
+
+        spool = ResultSpool(
+            session_id=session_id,
+            tenant_key=tenant_key,
+            query_fingerprint=query_fingerprint,
+            path=path,
+            row_offsets=offsets,
+            byte_size=size,
+            created_at_ms=int(self._now_ms()),
+            complete=complete,
+        )
+        with self._lock:
+            self._spools[session_id] = spool
+            self._tenant_bytes[tenant_key] = self._tenant_bytes.get(tenant_key, 0) + size
+            while len(self._spools) > self._max_entries:
+                self._remove_locked(next(iter(self._spools)))
+        return spool
+
+    def get(
+        self, session_id: str | None, *, tenant_id: Any, query_fingerprint: str
+    ) -> ResultSpool | None:
+        """Return the live spool for a session when it matches tenant and query."""
+        if not session_id:
+            return None
+        with self._lock:
+            self._evict_expired_locked(self._now_ms())
+            spool = self._spools.get(session_id)
+        if spool is None:
+            return None
+        if spool.tenant_key != _tenant_key(tenant_id):
+            return None
+        if spool.query_fingerprint != query_fingerprint:
+            return None
+        return spool
+
+    def discard(self, session_id: str) -> bool:
+        """Delete the spool bound to ``session_id``; return whether one existed."""
+        with self._lock:
+            removed = self._remove_locked(session_id)
+            self._evict_expired_locked(self._now_ms())
+            return removed
+
+    def sweep_expired(self) -> int:
+        """Delete every expired spool; return how many were removed."""
+        with self._lock:
+            before = len(self._spools)
+            self._evict_expired_locked(self._now_ms())
+            return before - len(self._spools)
+
+    def tenant_bytes(self, tenant_id: Any) -> int:
+        """Return spilled bytes currently held for a tenant."""
+        with self._lock:
+            return self._tenant_bytes.get(_tenant_key(tenant_id), 0)
+
+    def clear(self) -> None:
+        """Delete every spool (test-only helper)."""
+        with self._lock:
+            for session_id in list(self._spools):
+                self._remove_locked(session_id)
+
+    def close(self) -> None:
+        """Stop the sweeper, then delete every spool and the spill directory."""
+        self._sweeper_stop.set()
+        if self._sweeper is not None:
+            self._sweeper.join()
+        self.clear()
+        shutil.rmtree(self._directory, ignore_errors=True)
+
+    def _sweep_loop(self, interval_seconds: float) -> None:
+        while not self._sweeper_stop.wait(interval_seconds):
+            try:
+                self.sweep_expired()
+            except Exception:
+                logger.warning("Result spool sweep failed", exc_info=True)
+
+    def _evict_expired_locked(self, now_ms: int) -> None:
+        # Spools are registered in creation order, so the oldest come first.
+        while self._spools:
+            session_id, spool = next(iter(self._spools.items()))
+            if now_ms - spool.created_at_ms <= self._ttl_ms:
+                break
+            self._remove_locked(session_id)
+
+    def _remove_locked(self, session_id: str) -> bool:
+        spool = self._spools.pop(session_id, None)
+        if spool is None:
+            return False
+        remaining = self._tenant_bytes.get(spool.tenant_key, 0) - spool.byte_size
+        if remaining > 0:
+            self._tenant_bytes[spool.tenant_key] = remaining
+        else:
+            self._tenant_bytes.pop(spool.tenant_key, None)
+        _unlink_quietly(spool.path)
+        return True
+
+
+def _tenant_key(tenant_id: Any) -> str | None:
+    if tenant_id is None:
+        return None
+    return str(tenant_id).strip() or None
+
+
+def _unlink_quietly(path: str) -> None:
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    except OSError:
+        logger.warning("Failed to delete result spool file", exc_info=True)
+
+
+def result_spool_enabled() -> bool:
+    """Return True when offset pagination should be served from result spools."""
+    return bool(get_env_bool("EXECUTION_PAGINATION_SPOOL_ENABLED", False))
+
+
+_STORE_LOCK = Lock()
+_STORE: ResultSpoolStore | None = None
+
+
+def get_result_spool_store() -> ResultSpoolStore:
+    """Return the process-wide spool store, creating it from env on first use."""
+    global _STORE
+    if _STORE is not None:
+        return _STORE
+    with _STORE_LOCK:
+        if _STORE is None:
+            ttl_seconds = get_env_int(
+                "EXECUTION_PAGINATION_SPOOL_TTL_SECONDS", DEFAULT_SPOOL_TTL_SECONDS
+            )
+            _STORE = ResultSpoolStore(
+                directory=get_env_str("EXECUTION_PAGINATION_SPOOL_DIR", None) or None,
+                ttl_ms=int(ttl_seconds or DEFAULT_SPOOL_TTL_SECONDS) * 1000,
+                max_spool_bytes=get_env_int(
+                    "EXECUTION_PAGINATION_SPOOL_MAX_BYTES", DEFAULT_SPOOL_MAX_BYTES
+                ),
+                max_tenant_bytes=get_env_int(
+                    "EXECUTION_PAGINATION_SPOOL_TENANT_MAX_BYTES", DEFAULT_SPOOL_TENANT_MAX_BYTES
+                ),
+                max_rows=get_env_int("EXECUTION_PAGINATION_SPOOL_MAX_ROWS", DEFAULT_SPOOL_MAX_ROWS),
+                sweep_interval_seconds=get_env_int(
+                    "EXECUTION_PAGINATION_SPOOL_SWEEP_INTERVAL_SECONDS",
+                    DEFAULT_SPOOL_SWEEP_INTERVAL_SECONDS,
+                ),
+            )
+        return _STORE
+
+
+def close_result_spool_store() -> None:
+    """Close the process-wide store, deleting its spill directory, if it was created."""
+    global _STORE
+    with _STORE_LOCK:
+        store, _STORE = _STORE, None
+    if store is not None:
+        store.close()
+
+
+def discard_result_spool(session_id: str) -> bool:
+    """Delete the spool for a session if the store has been created."""
+    store = _STORE
+    if store is None:
+        return False
+    return store.discard(session_id)
@@ -4,29 +4,65 @@ from typing import Any, Dict, List, Optional
 
 import aiosqlite
 
+from common.config.env import get_env_int
+from dal.query_result import ColumnarRows, RowSequence
 from dal.sqlite.param_translation import translate_postgres_params_to_sqlite
 from dal.tracing import trace_query_operation
+from dal.util.connection_pool import EmbeddedConnectionPool, file_identity
 from dal.util.read_only import enforce_read_only_sql, validate_no_mutation_keywords
-from dal.util.row_limits import cap_rows_with_metadata, get_sync_max_rows
+from dal.util.row_limits import afetch_capped_rows, get_sync_max_rows
+
+DEFAULT_SQLITE_POOL_SIZE = 0
+DEFAULT_SQLITE_POOL_HEALTH_CHECK_SECS = 30
+DEFAULT_SQLITE_MMAP_SIZE_BYTES = 256 * 1024 * 1024
+DEFAULT_SQLITE_CACHE_SIZE_KIB = 64 * 1024
 
 
 class SqliteQueryTargetDatabase:
-    """SQLite query-target database for local/dev use."""
+    """SQLite query-target database for local/dev use.
+
+    When ``SQLITE_POOL_SIZE`` is set, read-only connections to a database file are
+    served from a bounded pool of long-lived ``mode=ro`` connections with
+    ``query_only`` and tuned page-cache pragmas; they are recycled when the file is
+    replaced or modified. Otherwise, and for writable or ``:memory:`` connections,
+    a connection is opened per request.
+    """
 
     supports_tenant_enforcement: bool = False
     _db_path: Optional[str] = None
     _max_rows: int = 0
+    _pool: Optional[EmbeddedConnectionPool[aiosqlite.Connection]] = None
 
     @classmethod
     async def init(cls, db_path: Optional[str], max_rows: Optional[int] = None) -> None:
         """Initialize SQLite query-target config."""
+        await cls.close()
         cls._db_path = db_path or ":memory:"
         cls._max_rows = max_rows if max_rows is not None else get_sync_max_rows()
 
+        pool_size = get_env_int("SQLITE_POOL_SIZE", DEFAULT_SQLITE_POOL_SIZE) or 0
+        if pool_size > 0 and not _is_memory_path(cls._db_path):
+            pragmas = _pooled_connection_pragmas()
+            path = cls._db_path
+            cls._pool = EmbeddedConnectionPool(
+                provider="sqlite",
+                max_size=pool_size,
+                open_connection=lambda: _open_pooled_connection(path, pragmas),
+                close_connection=_close_connection,
+                check_connection=_check_connection,
+                health_check_interval_seconds=get_env_int(
+                    "SQLITE_POOL_HEALTH_CHECK_SECS", DEFAULT_SQLITE_POOL_HEALTH_CHECK_SECS
+                )
+                or 0,
+                source_version=lambda: file_identity(path),
+            )
+
     @classmethod
     async def close(cls) -> None:
-        """Close SQLite resources (no-op for per-connection usage)."""
-        return None
+        """Close pooled SQLite connections."""
+        pool, cls._pool = cls._pool, None
+        if pool is not None:
+            await pool.close()
 
     @classmethod
     @asynccontextmanager
@@ -36,6 +72,11 @@ class SqliteQueryTargetDatabase:
         if cls._db_path is None:
             raise RuntimeError("SQLite DB path not configured. Set SQLITE_DB_PATH.")
 
+        if read_only and cls._pool is not None:
+            async with cls._pool.acquire() as conn:
+                yield _SqliteConnection(conn, max_rows=cls._max_rows, read_only=True)
+            return
+
         db_path, uri = _resolve_sqlite_path(cls._db_path, read_only)
         conn = await aiosqlite.connect(db_path, uri=uri, isolation_level=None)
         conn.row_factory = sqlite3.Row
@@ -92,10 +133,8 @@ class _SqliteConnection:
 
         async def _run():
             cursor = await self._conn.execute(sql, bound_params)
-            rows = await cursor.fetchall()
-            capped_rows, truncated = cap_rows_with_metadata(
-                [dict(row) for row in rows], self._max_rows
-            )
+            rows, truncated = await _fetch_rows(cursor, self._max_rows)
+            capped_rows = [dict(row) for row in rows]
             self._last_truncated = truncated
             self._last_truncated_reason = "PROVIDER_CAP" if truncated else None
             return capped_rows
@@ -110,8 +149,15 @@ class _SqliteConnection:
 
     async def fetch_with_columns(self, sql: str, *params: Any) -> tuple[List[Dict[str, Any]], list]:
         """Fetch rows with column metadata when supported."""
+        return await self._fetch_with_columns(sql, list(params), columnar=False)
+
+    async def fetch_columnar(self, sql: str, *params: Any) -> tuple[ColumnarRows, list]:
+        """Fetch rows as per-column arrays with column metadata."""
+        return await self._fetch_with_columns(sql, list(params), columnar=True)
+
+    async def _fetch_with_columns(self, sql: str, params: List[Any], columnar: bool):
         enforce_read_only_sql(sql, "sqlite", self._read_only)
-        sql, bound_params = translate_postgres_params_to_sqlite(sql, list(params))
+        sql, bound_params = translate_postgres_params_to_sqlite(sql, params)
         if self._read_only:
             validate_no_mutation_keywords(sql)
 
@@ -119,10 +165,12 @@ class _SqliteConnection:
             from dal.util.column_metadata import columns_from_cursor_description
 
             cursor = await self._conn.execute(sql, bound_params)
-            rows = await cursor.fetchall()
-            capped_rows, truncated = cap_rows_with_metadata(
-                [dict(row) for row in rows], self._max_rows
-            )
+            rows, truncated = await _fetch_rows(cursor, self._max_rows)
+            if columnar:
+                names = [desc[0] for desc in cursor.description or ()]
+                capped_rows: RowSequence = ColumnarRows.from_records(names, rows)
+            else:
+                capped_rows = [dict(row) for row in rows]
             self._last_truncated = truncated
             self._last_truncated_reason = "PROVIDER_CAP" if truncated else None
             columns = columns_from_cursor_description(cursor.description, provider="sqlite")
@@ -154,11 +202,57 @@ class _SqliteConnection:
 
 
 def _resolve_sqlite_path(db_path: str, read_only: bool) -> tuple[str, bool]:
-    if read_only and db_path not in (":memory:", ""):
+    if read_only and not _is_memory_path(db_path):
         return f"file:{db_path}?mode=ro", True
     return db_path, False
 
 
+def _is_memory_path(db_path: str) -> bool:
+    return db_path in (":memory:", "")
+
+
+def _pooled_connection_pragmas() -> list[str]:
+    """Return the pragmas applied to every pooled read-only connection."""
+    pragmas = ["PRAGMA query_only = ON"]
+    mmap_size = get_env_int("SQLITE_MMAP_SIZE_BYTES", DEFAULT_SQLITE_MMAP_SIZE_BYTES) or 0
+    if mmap_size > 0:
+        pragmas.append(f"PRAGMA mmap_size = {int(mmap_size)}")
+    cache_size_kib = get_env_int("SQLITE_CACHE_SIZE_KIB", DEFAULT_SQLITE_CACHE_SIZE_KIB) or 0
+    if cache_size_kib > 0:
+        # Negative cache_size values are a size in KiB rather than a page count.
+        pragmas.append(f"PRAGMA cache_size = -{int(cache_size_kib)}")
+    return pragmas
+
+
+async def _open_pooled_connection(db_path: str, pragmas: list[str]) -> aiosqlite.Connection:
+    path, uri = _resolve_sqlite_path(db_path, True)
+    conn = await aiosqlite.connect(path, uri=uri, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    try:
+        for pragma in pragmas:
+            await conn.execute(pragma)
+    except BaseException:
+        await conn.close()
+        raise
+    return conn
+
+
+async def _close_connection(conn: aiosqlite.Connection) -> None:
+    # Stop a query that outlived its timeout; close() would otherwise queue behind it.
+    try:
+        await conn.interrupt()
+    except ValueError:
+        # aiosqlite raises ValueError when the connection is already gone.
+        pass
+    await conn.close()
+
+
+async def _check_connection(conn: aiosqlite.Connection) -> None:
+    cursor = await conn.execute("SELECT 1")
+    await cursor.fetchone()
+    await cursor.close()
+
+
 def _format_execute_status(sql: str, rowcount: int) -> str:
     verb = sql.strip().split(maxsplit=1)
     if not verb:
@@ -167,3 +261,10 @@ def _format_execute_status(sql: str, rowcount: int) -> str:
     if op in {"INSERT", "UPDATE", "DELETE"} and rowcount >= 0:
         return f"{op} {rowcount}"
     return "OK"
+
+
+async def _fetch_rows(cursor: aiosqlite.Cursor, max_rows: int) -> tuple[list, bool]:
+    """Fetch all rows, or stop after ``max_rows + 1`` when a cap is set."""
+    if not max_rows:
+        return list(await cursor.fetchall()), False
+    return await afetch_capped_rows(cursor.fetchmany, max_rows)
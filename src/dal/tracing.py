@@ -4,8 +4,9 @@ from typing import Any, Awaitable, Dict, Optional
 
 from common.observability.context import run_id_var
 from common.observability.metrics import is_metrics_enabled
+from dal.query_result import ColumnarRows
 from dal.util.read_only import enforce_read_only_sql
-from dal.util.row_limits import cap_rows_with_metadata
+from dal.util.row_limits import afetch_capped_rows, cap_rows_with_metadata
 
 
 def trace_enabled() -> bool:
@@ -82,6 +83,11 @@ class TracedAsyncpgConnection:
         """Return the reason when the last fetch was truncated."""
         return self._last_truncated_reason
 
+    @property
+    def raw_connection(self) -> Any:
+        """Return the wrapped driver connection, without tracing or row caps."""
+        return self._conn
+
     @property
     def session_guardrail_metadata(self) -> Dict[str, Any]:
         """Return bounded session guardrail metadata attached by the DAL."""
@@ -92,6 +98,17 @@ class TracedAsyncpgConnection:
         """Return bounded sandbox metadata attached by the DAL."""
         return dict(self._postgres_sandbox_metadata)
 
+    def _can_stream(self) -> bool:
+        """Return True when a capped fetch can stop early via a server-side cursor.
+
+        asyncpg cursors only exist inside a transaction; outside one (or with no
+        cap) the full result is fetched and capped afterwards.
+        """
+        if not self._max_rows:
+            return False
+        in_transaction = getattr(self._conn, "is_in_transaction", None)
+        return callable(in_transaction) and in_transaction() is True
+
     async def execute(self, sql: str, *params: Any) -> str:
         """Execute a statement with tracing when enabled."""
         enforce_read_only_sql(sql, self._provider, self._read_only)
@@ -112,13 +129,16 @@ class TracedAsyncpgConnection:
         enforce_read_only_sql(sql, self._provider, self._read_only)
 
         async def _run():
-            rows = await self._conn.fetch(sql, *params)
-            capped_rows, truncated = cap_rows_with_metadata(
-                [dict(row) for row in rows], self._max_rows
-            )
+            if self._can_stream():
+                cursor = await self._conn.cursor(sql, *params)
+                rows, truncated = await afetch_capped_rows(cursor.fetch, self._max_rows)
+            else:
+                rows, truncated = cap_rows_with_metadata(
+                    await self._conn.fetch(sql, *params), self._max_rows
+                )
             self._last_truncated = truncated
             self._last_truncated_reason = "PROVIDER_CAP" if truncated else None
-            return capped_rows
+            return [dict(row) for row in rows]
 
         return await trace_query_operation(
             "dal.query.execute",
@@ -130,6 +150,13 @@ class TracedAsyncpgConnection:
 
     async def fetch_with_columns(self, sql: str, *params: Any) -> tuple[list[Dict[str, Any]], list]:
         """Fetch rows with column metadata when supported."""
+        return await self._fetch_with_columns(sql, params, columnar=False)
+
+    async def fetch_columnar(self, sql: str, *params: Any) -> tuple[ColumnarRows, list]:
+        """Fetch rows as per-column arrays with column metadata."""
+        return await self._fetch_with_columns(sql, params, columnar=True)
+
+    async def _fetch_with_columns(self, sql: str, params: tuple, columnar: bool):
         enforce_read_only_sql(sql, self._provider, self._read_only)
 
         async def _run():
@@ -137,13 +164,21 @@ class TracedAsyncpgConnection:
 
             statement = await self._conn.prepare(sql)
             attrs = statement.get_attributes()
-            rows = await statement.fetch(*params)
-            capped_rows, truncated = cap_rows_with_metadata(
-                [dict(row) for row in rows], self._max_rows
-            )
+            if self._can_stream():
+                cursor = await statement.cursor(*params)
+                rows, truncated = await afetch_capped_rows(cursor.fetch, self._max_rows)
+            else:
+                rows, truncated = cap_rows_with_metadata(
+                    await statement.fetch(*params), self._max_rows
+                )
             self._last_truncated = truncated
             self._last_truncated_reason = "PROVIDER_CAP" if truncated else None
-            return capped_rows, columns_from_asyncpg_attributes(attrs)
+            if columnar:
+                names = [attr.name for attr in attrs]
+                return ColumnarRows.from_records(names, rows), columns_from_asyncpg_attributes(
+                    attrs
+                )
+            return [dict(row) for row in rows], columns_from_asyncpg_attributes(attrs)
 
         return await trace_query_operation(
             "dal.query.execute",
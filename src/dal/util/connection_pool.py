@@ -0,0 +1,172 @@
+"""Bounded pool of long-lived connections for embedded query targets.
+
+DuckDB and SQLite run in-process, so opening a connection per request throws away
+buffer caches, catalog state and page caches. ``EmbeddedConnectionPool`` keeps up
+to ``max_size`` connections open and hands them out most-recently-used first.
+
+Idle connections are health-checked before reuse once they have been idle longer
+than the health-check interval. A connection whose use raised is closed instead of
+returned: a timed-out query may still be running on it in a worker thread.
+
+When a ``source_version`` callable is given (e.g. ``file_identity`` of the database
+file), each connection remembers the version it was opened against and is recycled
+on checkout once the version changes, so a file replaced by rename is picked up.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Generic,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from common.observability.metrics import mcp_metrics
+
+ConnT = TypeVar("ConnT")
+logger = logging.getLogger(__name__)
+
+
+class EmbeddedConnectionPool(Generic[ConnT]):
+    """Async pool of reusable connections with health checks and metrics."""
+
+    def __init__(
+        self,
+        *,
+        provider: str,
+        max_size: int,
+        open_connection: Callable[[], Awaitable[ConnT]],
+        close_connection: Callable[[ConnT], Awaitable[None]],
+        check_connection: Callable[[ConnT], Awaitable[None]],
+        health_check_interval_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+        source_version: Optional[Callable[[], Any]] = None,
+    ) -> None:
+        """Create an empty pool; connections are opened on demand."""
+        if max_size < 1:
+            raise ValueError("Connection pool max_size must be at least 1.")
+        self._provider = provider
+        self._max_size = int(max_size)
+        self._open_connection = open_connection
+        self._close_connection = close_connection
+        self._check_connection = check_connection
+        self._health_check_interval = max(0.0, float(health_check_interval_seconds))
+        self._clock = clock
+        self._source_version = source_version
+        self._slots = asyncio.Semaphore(self._max_size)
+        self._idle: Deque[Tuple[ConnT, float, Any]] = deque()
+        self._in_use = 0
+        self._opened = 0
+        self._discarded = 0
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        """Return True once ``close`` has been called."""
+        return self._closed
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[ConnT]:
+        """Check out a connection, waiting while all ``max_size`` are in use."""
+        if self._closed:
+            raise RuntimeError(f"{self._provider} connection pool is closed.")
+        started = time.perf_counter()
+        async with self._slots:
+            conn, version = await self._checkout()
+            mcp_metrics.record_histogram(
+                "mcp.db.pool.acquire_wait_ms",
+                (time.perf_counter() - started) * 1000.0,
+                description="Time spent waiting for an embedded query-target connection",
+                unit="ms",
+                attributes={"provider": self._provider},
+            )
+            self._in_use += 1
+            healthy = False
+            try:
+                yield conn
+                healthy = True
+            finally:
+                self._in_use -= 1
+                if healthy and not self._closed:
+                    self._idle.append((conn, self._clock(), version))
+                else:
+                    await self._discard(conn, reason="closed" if healthy else "error")
+
+    async def close(self) -> None:
+        """Close idle connections; connections in use are closed on release."""
+        self._closed = True
+        while self._idle:
+            conn, _, _ = self._idle.pop()
+            await self._discard(conn, reason="closed")
+
+    def stats(self) -> Dict[str, int]:
+        """Return point-in-time pool counters."""
+        return {
+            "max_size": self._max_size,
+            "idle": len(self._idle),
+            "in_use": self._in_use,
+            "opened": self._opened,
+            "discarded": self._discarded,
+        }
+
+    async def _checkout(self) -> Tuple[ConnT, Any]:
+        current_version = self._source_version() if self._source_version else None
+        while self._idle:
+            conn, released_at, version = self._idle.pop()
+            if version != current_version:
+                await self._discard(conn, reason="stale")
+                continue
+            if self._clock() - released_at < self._health_check_interval:
+                return conn, version
+            try:
+                await self._check_connection(conn)
+            except Exception:
+                logger.warning(
+                    "Discarding %s pooled connection that failed its health check.",
+                    self._provider,
+                    exc_info=True,
+                )
+                await self._discard(conn, reason="health_check")
+                continue
+            return conn, version
+
+        conn = await self._open_connection()
+        self._opened += 1
+        mcp_metrics.add_counter(
+            "mcp.db.pool.connections_opened_total",
+            description="Embedded query-target connections opened by the pool",
+            attributes={"provider": self._provider},
+        )
+        return conn, current_version
+
+    async def _discard(self, conn: ConnT, *, reason: str) -> None:
+        self._discarded += 1
+        mcp_metrics.add_counter(
+            "mcp.db.pool.connections_discarded_total",
+            description="Embedded query-target connections closed by the pool",
+            attributes={"provider": self._provider, "reason": reason},
+        )
+        try:
+            await self._close_connection(conn)
+        except Exception:
+            logger.debug("Failed to close pooled %s connection.", self._provider, exc_info=True)
+
+
+def file_identity(path: str) -> Optional[Tuple[int, int, int]]:
+    """Return ``(st_dev, st_ino, st_mtime_ns)`` for ``path``, or None if it is missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_dev, stat.st_ino, stat.st_mtime_ns
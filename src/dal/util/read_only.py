@@ -2,12 +2,12 @@
 
 import re
 
-import sqlglot
 from opentelemetry import trace
 from sqlglot import exp
 
 from common.models.error_metadata import ErrorCategory
 from common.policy.sql_policy import ALLOWED_STATEMENT_TYPES
+from common.sql.ast_cache import parse_sql
 from common.sql.dialect import normalize_sqlglot_dialect
 
 _FALLBACK_MUTATION_PREFIX = {
@@ -38,7 +38,7 @@ def is_mutating_sql(sql: str, provider: str) -> bool:
     # Strip comments to ensure consistent parsing behavior (aligns with AST validator)
     stripped = _SQL_COMMENT_RE.sub(" ", sql).strip()
     try:
-        expressions = sqlglot.parse(stripped, read=dialect)
+        expressions = parse_sql(stripped, dialect, copy=False)
     except Exception:
         expressions = None
 
@@ -1,5 +1,10 @@
+from typing import Any, Awaitable, Callable, Sequence
+
 from common.config.env import get_env_int
 
+# Rows pulled per round trip when streaming a capped result.
+FETCH_BATCH_ROWS = 1000
+
 
 def get_sync_max_rows() -> int:
     """Return the optional sync max rows guardrail (0 disables)."""
@@ -20,3 +25,39 @@ def cap_rows_with_metadata(rows: list, max_rows: int) -> tuple[list, bool]:
     if max_rows and len(rows) > max_rows:
         return rows[:max_rows], True
     return rows, False
+
+
+def fetch_capped_rows(
+    fetchmany: Callable[[int], Sequence[Any]],
+    max_rows: int,
+    batch_size: int = FETCH_BATCH_ROWS,
+) -> tuple[list, bool]:
+    """Pull at most ``max_rows + 1`` rows in batches and cap them.
+
+    The extra row only proves truncation, so peak memory is bounded by the cap
+    rather than by the full result size.
+    """
+    target = max_rows + 1
+    rows: list = []
+    while len(rows) < target:
+        batch = fetchmany(min(batch_size, target - len(rows)))
+        if not batch:
+            break
+        rows.extend(batch)
+    return cap_rows_with_metadata(rows, max_rows)
+
+
+async def afetch_capped_rows(
+    fetchmany: Callable[[int], Awaitable[Sequence[Any]]],
+    max_rows: int,
+    batch_size: int = FETCH_BATCH_ROWS,
+) -> tuple[list, bool]:
+    """Async variant of ``fetch_capped_rows`` for awaitable cursors."""
+    target = max_rows + 1
+    rows: list = []
+    while len(rows) < target:
+        batch = await fetchmany(min(batch_size, target - len(rows)))
+        if not batch:
+            break
+        rows.extend(batch)
+    return cap_rows_with_metadata(rows, max_rows)
@@ -193,6 +193,10 @@ class GraphHydrator:
             if fks:
                 self._create_fk_relationships(table.name, fks)
 
+        bump_version = getattr(self.store, "bump_hydration_version", None)
+        if callable(bump_version):
+            bump_version()
+
         logger.info("Graph hydration complete.")
 
     def _create_table_node(self, table: TableDef, columns: list[ColumnDef]):
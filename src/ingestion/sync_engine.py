@@ -77,12 +77,14 @@ class SyncEngine:
 
         live_tables = set(live_schema["tables"].keys())
         graph_tables = set(graph_state["tables"].keys())
+        changed = False
 
         # 1. Prune missing tables
         tables_to_remove = graph_tables - live_tables
         if tables_to_remove:
             logger.info(f"Pruning {len(tables_to_remove)} tables: {tables_to_remove}")
             self._prune_tables(list(tables_to_remove))
+            changed = True
 
         # 2. Check for missing/extra columns in existing tables
         common_tables = live_tables.intersection(graph_tables)
@@ -95,6 +97,7 @@ class SyncEngine:
             if cols_to_remove:
                 logger.info(f"Pruning columns from {table}: {cols_to_remove}")
                 self._prune_columns(table, list(cols_to_remove))
+                changed = True
 
             # Update types
             common_cols = live_cols.intersection(graph_cols)
@@ -106,6 +109,13 @@ class SyncEngine:
                 if graph_type and live_type != graph_type:
                     logger.info(f"Updating type for {table}.{col}: {graph_type} -> {live_type}")
                     self._update_column_type(table, col, live_type)
+                    changed = True
+
+        if changed:
+            # Signal in-process embedding indexes in other processes to reload.
+            bump_version = getattr(self.store, "bump_hydration_version", None)
+            if callable(bump_version):
+                bump_version()
 
         logger.info("Reconciliation complete.")
 
@@ -1,10 +1,11 @@
-"""Utility for Memgraph Vector Index DDL operations.
+"""Utility for vector index DDL operations.
 
-This module isolates the logic for creating vector indexes in Memgraph,
-ensuring idempotency and correct syntax.
+This module isolates the logic for creating vector indexes in Memgraph and the
+pgvector indexes behind registry lookups, ensuring idempotency and correct syntax.
 """
 
 import logging
+from typing import List, Sequence
 
 from common.interfaces import GraphStore
 
@@ -90,3 +91,85 @@ def ensure_table_embedding_hnsw_index(store: GraphStore, *, dims: int = 1536) ->
             },
         )
         raise e
+
+
+# Roles whose query_pairs rows are searched by embedding similarity. Each gets a
+# partial HNSW index so a lookup only walks the graph of its own role.
+QUERY_PAIR_ANN_ROLES = ("cache", "example", "interaction", "sql", "subgraph")
+
+
+def query_pair_embedding_index_name(role: str) -> str:
+    """Return the name of the partial ANN index for ``role``."""
+    return f"idx_query_pairs_embedding_{role}"
+
+
+def query_pair_embedding_index_ddl(role: str, *, m: int = 16, ef_construction: int = 64) -> str:
+    """Return DDL for the partial HNSW index on ``query_pairs.embedding`` for ``role``.
+
+    The predicate text matches the inlined role filter the registry and semantic
+    cache lookups emit, which is what lets the planner pick the partial index.
+    """
+    if role not in QUERY_PAIR_ANN_ROLES:
+        raise ValueError(f"Unsupported query_pairs ANN role: {role!r}")
+    return (
+        f"CREATE INDEX IF NOT EXISTS {query_pair_embedding_index_name(role)} "
+        "ON public.query_pairs USING hnsw (embedding vector_cosine_ops) "
+        f"WITH (m = {int(m)}, ef_construction = {int(ef_construction)}) "
+        f"WHERE '{role}' = ANY(roles)"
+    )
+
+
+async def ensure_query_pair_embedding_indexes(
+    conn, *, roles: Sequence[str] = QUERY_PAIR_ANN_ROLES
+) -> List[str]:
+    """Ensure per-role partial HNSW indexes exist on ``query_pairs.embedding``.
+
+    Idempotent (``CREATE INDEX IF NOT EXISTS``). Failures are logged per index
+    and do not stop the remaining roles.
+
+    Args:
+        conn: An asyncpg-style connection to the control-plane database.
+        roles: Roles to index (defaults to every semantically searched role).
+
+    Returns:
+        Names of the indexes that were created by this call.
+    """
+    import time
+
+    existing = {
+        row["indexname"]
+        for row in await conn.fetch(
+            "SELECT indexname FROM pg_indexes "
+            "WHERE schemaname = 'public' AND tablename = 'query_pairs'"
+        )
+    }
+
+    created = []
+    for role in roles:
+        index_name = query_pair_embedding_index_name(role)
+        if index_name in existing:
+            continue
+        start_time = time.monotonic()
+        try:
+            await conn.execute(query_pair_embedding_index_ddl(role))
+        except Exception as e:
+            logger.error(
+                f"Failed to create vector index '{index_name}': {e}",
+                extra={
+                    "event": "pgvector_index_failure",
+                    "index": index_name,
+                    "error": str(e),
+                },
+            )
+            continue
+        created.append(index_name)
+        logger.info(
+            f"✓ Created vector index '{index_name}'",
+            extra={
+                "event": "pgvector_index_ensure",
+                "index": index_name,
+                "created": True,
+                "elapsed_ms": (time.monotonic() - start_time) * 1000,
+            },
+        )
+    return created
@@ -16,6 +16,7 @@ from openai import AsyncOpenAI
 
 from common.interfaces import GraphStore
 from common.telemetry import Telemetry
+from common.utils.run_embeddings import run_embedding_memo
 
 logger = logging.getLogger(__name__)
 
@@ -114,10 +115,15 @@ class EmbeddingService:
         if not text:
             return [0.0] * 1536
 
-        try:
-            text = text.replace("\n", " ")
-            response = await self.client.embeddings.create(input=[text], model=self.model)
+        async def _create() -> List[float]:
+            response = await self.client.embeddings.create(
+                input=[text.replace("\n", " ")], model=self.model
+            )
             return response.data[0].embedding
+
+        try:
+            # Memoized per agent run; failures are not memoized
+            return await run_embedding_memo.get_or_compute(self.model, text, _create)
         except Exception as e:
             logger.error(f"Failed to generate embedding: {e}")
             return [0.0] * 1536
@@ -243,14 +249,20 @@ class VectorIndexer:
         k: int = 5,
         apply_threshold: bool = True,
         use_column_cache: bool = False,
+        query_vector: Optional[List[float]] = None,
     ) -> tuple[List[dict], dict]:
         """Search for nearest nodes and return metadata for telemetry.
 
+        Args:
+            query_vector: Precomputed embedding of ``query_text`` (same model as
+                ``embedding_service``); skips embedding when provided.
+
         Returns:
             Tuple of (hits, metadata) where metadata includes threshold and timing.
         """
         embed_start = time.monotonic()
-        query_vector = await self.embedding_service.embed_text(query_text)
+        if query_vector is None:
+            query_vector = await self.embedding_service.embed_text(query_text)
         embed_ms = (time.monotonic() - embed_start) * 1000
         cache_hit = False
         if use_column_cache and label == "Column" and _column_cache_enabled():
@@ -4,18 +4,20 @@ Provides pluggable vector similarity search backends.
 Currently uses HNSW (hnswlib) as the sole implementation.
 """
 
-from common.interfaces.vector_index import SearchResult, VectorIndex
+from common.interfaces.vector_index import BatchSearchResult, SearchResult, VectorIndex
 
 from .factory import create_vector_index
 from .hnsw import HNSWIndex
-from .reranker import search_with_rerank
+from .reranker import search_batch_with_rerank, search_with_rerank
 from .thread_safe import ThreadSafeIndex
 
 __all__ = [
     "VectorIndex",
     "SearchResult",
+    "BatchSearchResult",
     "HNSWIndex",
     "create_vector_index",
     "search_with_rerank",
+    "search_batch_with_rerank",
     "ThreadSafeIndex",
 ]
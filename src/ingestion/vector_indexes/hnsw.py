@@ -5,9 +5,11 @@ High-performance approximate nearest neighbor search optimized for millions of v
 
 from __future__ import annotations
 
-import pickle
-from pathlib import Path
-from typing import TYPE_CHECKING, List, Optional
+import hashlib
+import json
+import os
+import tempfile
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, List, Optional
 
 import numpy as np
 
@@ -15,7 +17,14 @@ if TYPE_CHECKING:
     import hnswlib  # noqa: F401
 
 
-from common.interfaces.vector_index import SearchResult
+from common.interfaces.vector_index import BatchSearchResult, SearchResult
+
+# On-disk snapshot layout written by HNSWIndex.save()
+SNAPSHOT_FORMAT = "hnsw-index"
+SNAPSHOT_FORMAT_VERSION = 2
+VECTORS_SUFFIX = ".vectors.npy"
+IDS_SUFFIX = ".ids.npy"
+MANIFEST_SUFFIX = ".manifest.json"
 
 
 class HNSWIndex:
@@ -36,6 +45,11 @@ class HNSWIndex:
     DEFAULT_EF_CONSTRUCTION = 200
     DEFAULT_EF_SEARCH = 100
 
+    # Initial row capacity of the normalized vector buffer
+    MIN_VECTOR_CAPACITY = 64
+    # Rebuild the graph once this fraction of internal slots are tombstones
+    COMPACT_DELETED_FRACTION = 0.5
+
     def __init__(
         self,
         dim: Optional[int] = None,
@@ -70,10 +84,15 @@ class HNSWIndex:
         self._ef_search = ef_search
 
         self._index: Optional[hnswlib.Index] = None
-        self._ids: List[int] = []
+        # Internal label -> external id; None marks a deleted slot awaiting reuse
+        self._ids: List[Optional[int]] = []
         self._id_to_idx: dict[int, int] = {}  # Maps external id -> internal index
+        self._free_slots: List[int] = []
+        # Object-array view of self._ids for vectorized label -> id lookup
+        self._ids_lookup: Optional[np.ndarray] = None
         self._metadata: dict[int, dict] = {}
-        # Store normalized vectors for reranking (hnswlib doesn't expose them)
+        # Store normalized vectors for reranking (hnswlib doesn't expose them).
+        # Preallocated with doubling capacity; rows [:len(self._ids)] are in use.
         self._vectors_normalized: Optional[np.ndarray] = None
 
         # Initialize index if dimension is known
@@ -117,7 +136,7 @@ class HNSWIndex:
         Returns:
             List of SearchResult sorted by score descending.
         """
-        if self._index is None or len(self._ids) == 0:
+        if self._index is None or len(self._id_to_idx) == 0:
             return []
 
         # Ensure 2D and normalize
@@ -129,8 +148,8 @@ class HNSWIndex:
 
         query_normalized = self._normalize(query)
 
-        # Limit k to number of elements
-        k = min(k, len(self._ids))
+        # Limit k to number of live elements (hnswlib skips deleted ones)
+        k = min(k, len(self._id_to_idx))
 
         # hnswlib returns (labels, distances), each of shape (n_queries, k)
         labels, distances = self._index.knn_query(query_normalized, k=k)
@@ -138,7 +157,7 @@ class HNSWIndex:
         results = []
         for idx, dist in zip(labels[0], distances[0]):
             # Convert internal index to external id
-            if idx < len(self._ids):
+            if idx < len(self._ids) and self._ids[idx] is not None:
                 item_id = self._ids[idx]
 
                 # hnswlib IP space returns 1 - dot_product as "distance"
@@ -155,6 +174,58 @@ class HNSWIndex:
 
         return results
 
+    def search_batch(
+        self,
+        query_matrix: np.ndarray,
+        k: int,
+        num_threads: int = -1,
+    ) -> BatchSearchResult:
+        """Search for k nearest neighbors of many queries in one native call.
+
+        hnswlib fans the queries out across ``num_threads`` threads; ids and
+        scores come back as arrays without per-hit Python objects.
+
+        Args:
+            query_matrix: 2D numpy array of shape (n_queries, dimension).
+            k: Number of neighbors to return per query.
+            num_threads: hnswlib worker threads (-1 uses all cores).
+
+        Returns:
+            BatchSearchResult with one row per query, sorted by score descending.
+        """
+        queries = np.asarray(query_matrix, dtype=np.float32)
+        if queries.ndim == 1:
+            queries = queries.reshape(1, -1)
+        n_queries = len(queries)
+
+        if self._index is None or len(self._id_to_idx) == 0 or k <= 0:
+            return BatchSearchResult.empty(n_queries)
+
+        # Limit k to number of live elements (hnswlib skips deleted ones)
+        k = min(k, len(self._id_to_idx))
+
+        ids = np.full((n_queries, k), None, dtype=object)
+        scores = np.full((n_queries, k), -np.inf, dtype=np.float32)
+
+        # Zero query vectors have no direction; leave their rows empty
+        norms = np.linalg.norm(queries, axis=1)
+        valid = norms > 0
+        if valid.any():
+            labels, distances = self._index.knn_query(
+                queries[valid] / norms[valid, None], k=k, num_threads=num_threads
+            )
+            ids[valid] = self._id_lookup_array()[labels]
+            scores[valid] = 1.0 - distances
+
+        return BatchSearchResult(ids=ids, scores=scores, metadata=self._metadata)
+
+    def _id_lookup_array(self) -> np.ndarray:
+        if self._ids_lookup is None or len(self._ids_lookup) != len(self._ids):
+            lookup = np.empty(len(self._ids), dtype=object)
+            lookup[:] = self._ids
+            self._ids_lookup = lookup
+        return self._ids_lookup
+
     def add_items(
         self,
         vectors: np.ndarray,
@@ -163,11 +234,95 @@ class HNSWIndex:
     ) -> None:
         """Add items to the index with L2 normalization.
 
+        Ids that are already present are updated in place rather than
+        duplicated. Cost is proportional to the batch, not the index size.
+
+        Args:
+            vectors: 2D numpy array of shape (n_items, dimension).
+            ids: List of unique identifiers for each vector.
+            metadata: Optional dict mapping id -> metadata dict.
+        """
+        self._upsert(vectors, ids, metadata, replace_metadata=False)
+
+    def replace_items(
+        self,
+        vectors: np.ndarray,
+        ids: List[int],
+        metadata: Optional[dict[int, dict]] = None,
+    ) -> None:
+        """Insert or overwrite items by id.
+
+        Unlike add_items, metadata of replaced ids is dropped unless new
+        metadata is supplied for them.
+
         Args:
             vectors: 2D numpy array of shape (n_items, dimension).
             ids: List of unique identifiers for each vector.
             metadata: Optional dict mapping id -> metadata dict.
         """
+        self._upsert(vectors, ids, metadata, replace_metadata=True)
+
+    def mark_deleted(self, ids: List[int]) -> int:
+        """Remove items from search results and free their slots for reuse.
+
+        Args:
+            ids: External ids to delete. Unknown ids are ignored.
+
+        Returns:
+            Number of items that were deleted.
+        """
+        if self._index is None:
+            return 0
+
+        deleted = 0
+        for ext_id in ids:
+            slot = self._id_to_idx.pop(ext_id, None)
+            if slot is None:
+                continue
+            self._index.mark_deleted(slot)
+            self._ids[slot] = None
+            self._ids_lookup = None
+            self._free_slots.append(slot)
+            self._metadata.pop(ext_id, None)
+            self._vectors_normalized[slot] = 0.0
+            deleted += 1
+
+        if deleted and len(self._free_slots) > self.COMPACT_DELETED_FRACTION * len(self._ids):
+            self.compact()
+
+        return deleted
+
+    def compact(self) -> None:
+        """Rebuild the graph from live items only, dropping all tombstones.
+
+        Live items are re-labelled densely, so buffers shrink back to the
+        live count.
+        """
+        if self._index is None or not self._free_slots:
+            return
+
+        live_slots = [slot for slot, ext_id in enumerate(self._ids) if ext_id is not None]
+        live_ids = [self._ids[slot] for slot in live_slots]
+        live_vectors = self._vectors_normalized[live_slots].copy()
+        metadata = self._metadata
+
+        self._init_index(self._dim)
+        self._ids = []
+        self._ids_lookup = None
+        self._id_to_idx = {}
+        self._free_slots = []
+        self._metadata = {}
+        self._vectors_normalized = None
+
+        self._upsert(live_vectors, live_ids, metadata, replace_metadata=False)
+
+    def _upsert(
+        self,
+        vectors: np.ndarray,
+        ids: List[int],
+        metadata: Optional[dict[int, dict]],
+        replace_metadata: bool,
+    ) -> None:
         if len(vectors) == 0:
             return
 
@@ -183,98 +338,194 @@ class HNSWIndex:
         if self._index is None:
             self._init_index(vectors.shape[1])
 
+        # Last occurrence wins for ids repeated within one batch
+        rows_by_id = {ext_id: row for row, ext_id in enumerate(ids)}
+        if len(rows_by_id) != len(ids):
+            vectors = vectors[list(rows_by_id.values())]
+        batch_ids = list(rows_by_id.keys())
+
         # L2 normalize before adding
         vectors_normalized = self._normalize(vectors)
 
-        # Assign internal indices
-        start_idx = len(self._ids)
-        internal_ids = np.arange(start_idx, start_idx + len(ids))
-
-        # Check capacity and resize if needed
-        current_count = self._index.get_current_count()
-        new_count = current_count + len(ids)
+        # Existing ids keep their slot; new ids reuse freed slots first
+        self._ids_lookup = None
+        slots = np.empty(len(batch_ids), dtype=np.int64)
+        for i, ext_id in enumerate(batch_ids):
+            slot = self._id_to_idx.get(ext_id)
+            if slot is None:
+                if self._free_slots:
+                    slot = self._free_slots.pop()
+                    self._ids[slot] = ext_id
+                else:
+                    slot = len(self._ids)
+                    self._ids.append(ext_id)
+                self._id_to_idx[ext_id] = slot
+            slots[i] = slot
+
+        # Check capacity and resize if needed. Reused labels update existing
+        # hnswlib elements, so the element count only grows with new slots.
+        new_count = len(self._ids)
         if new_count > self._max_elements:
             self._index.resize_index(max(new_count * 2, self._max_elements * 2))
             self._max_elements = self._index.get_max_elements()
 
-        # Add to index
-        self._index.add_items(vectors_normalized, internal_ids)
+        # Add to index (re-adding a deleted label un-deletes it)
+        self._index.add_items(vectors_normalized, slots)
 
         # Store normalized vectors for reranking
-        if self._vectors_normalized is None:
-            self._vectors_normalized = vectors_normalized.copy()
-        else:
-            self._vectors_normalized = np.vstack([self._vectors_normalized, vectors_normalized])
-
-        # Track mappings
-        for i, ext_id in enumerate(ids):
-            self._ids.append(ext_id)
-            self._id_to_idx[ext_id] = start_idx + i
+        self._ensure_vector_capacity(new_count, vectors_normalized.shape[1])
+        self._vectors_normalized[slots] = vectors_normalized
 
+        if replace_metadata:
+            for ext_id in batch_ids:
+                self._metadata.pop(ext_id, None)
         if metadata:
             self._metadata.update(metadata)
 
+    def _ensure_vector_capacity(self, needed: int, dim: int) -> None:
+        """Grow the vector buffer geometrically so appends are amortized O(1)."""
+        current = self._vectors_normalized
+        capacity = 0 if current is None else current.shape[0]
+        if needed <= capacity:
+            return
+
+        new_capacity = max(self.MIN_VECTOR_CAPACITY, capacity * 2, needed)
+        grown = np.zeros((new_capacity, dim), dtype=np.float32)
+        if current is not None:
+            grown[:capacity] = current
+        self._vectors_normalized = grown
+
     def save(self, path: str) -> None:
-        """Persist the index to disk.
+        """Persist the index to disk without pickle.
 
-        Creates two files:
+        Creates four files:
         - {path}: The hnswlib binary index
-        - {path}.meta: Pickle file with ids and metadata
+        - {path}.vectors.npy: Raw float32 normalized vectors, one row per slot
+        - {path}.ids.npy: External id per slot (int64 or unicode array)
+        - {path}.manifest.json: Format version, parameters, free slots and
+          columnar metadata
+
+        Each file is written to a unique temporary file in the target directory
+        and renamed into place, so concurrent saves never share a temp file. The
+        renames are not one atomic step: the manifest goes last and records the
+        size and digest of the other three files, and ``load`` rejects a snapshot
+        whose files do not match it (a crash or a concurrent save in between).
 
         Args:
             path: Base file path to save the index.
+
+        Raises:
+            ValueError: If the index is empty.
+            TypeError: If ids are not all int or all str.
         """
         if self._index is None:
             raise ValueError("Cannot save empty index")
 
-        # Save hnswlib index
-        self._index.save_index(path)
-
-        # Save metadata separately
-        meta_path = Path(path).with_suffix(".meta")
-        state = {
+        count = len(self._ids)
+        live_ids = [ext_id for ext_id in self._ids if ext_id is not None]
+        id_kind = _id_kind(live_ids)
+        placeholder = "" if id_kind == "str" else 0
+        ids_array = np.array(
+            [placeholder if ext_id is None else ext_id for ext_id in self._ids],
+            dtype=np.str_ if id_kind == "str" else np.int64,
+        )
+        if self._vectors_normalized is None:
+            vectors = np.zeros((0, self._dim), dtype=np.float32)
+        else:
+            vectors = self._vectors_normalized[:count]
+
+        files = {
+            "": _replace_atomic(path, self._index.save_index),
+            VECTORS_SUFFIX: _write_atomic(
+                _sidecar(path, VECTORS_SUFFIX), lambda f: np.save(f, vectors)
+            ),
+            IDS_SUFFIX: _write_atomic(_sidecar(path, IDS_SUFFIX), lambda f: np.save(f, ids_array)),
+        }
+        manifest = {
+            "format": SNAPSHOT_FORMAT,
+            "format_version": SNAPSHOT_FORMAT_VERSION,
             "dim": self._dim,
             "max_elements": self._max_elements,
             "m": self._m,
             "ef_construction": self._ef_construction,
             "ef_search": self._ef_search,
-            "ids": self._ids,
-            "id_to_idx": self._id_to_idx,
-            "metadata": self._metadata,
-            "vectors_normalized": self._vectors_normalized,
+            "count": count,
+            "id_kind": id_kind,
+            "free_slots": list(self._free_slots),
+            "metadata": _metadata_columns(self._ids, self._metadata),
+            "files": files,
         }
-        with open(meta_path, "wb") as f:
-            pickle.dump(state, f)
+        _write_atomic(
+            _sidecar(path, MANIFEST_SUFFIX),
+            lambda f: f.write(json.dumps(manifest).encode("utf-8")),
+        )
 
-    def load(self, path: str) -> None:
+    def load(self, path: str, mmap: bool = True) -> None:
         """Load the index from disk.
 
+        Vectors are memory-mapped copy-on-write by default, so processes
+        loading the same snapshot share its pages until they modify a row.
+
         Args:
             path: Base file path to load the index from.
+            mmap: Memory-map the vector file instead of reading it into memory.
+
+        Raises:
+            ValueError: If the snapshot format or version is not supported, or its
+                files do not match the manifest.
         """
         try:
             import hnswlib  # noqa: F811
         except ImportError:
             raise ImportError("hnswlib is required to load HNSWIndex")
 
-        # Load metadata first to get dimension
-        meta_path = Path(path).with_suffix(".meta")
-        with open(meta_path, "rb") as f:
-            state = pickle.load(f)
-
-        self._dim = state["dim"]
-        self._max_elements = state["max_elements"]
-        self._m = state["m"]
-        self._ef_construction = state["ef_construction"]
-        self._ef_search = state["ef_search"]
-        self._ids = state["ids"]
-        self._id_to_idx = state["id_to_idx"]
-        self._metadata = state["metadata"]
-        self._vectors_normalized = state.get("vectors_normalized")
+        # Load the manifest first to get dimension
+        with open(_sidecar(path, MANIFEST_SUFFIX), "rb") as f:
+            manifest = json.loads(f.read().decode("utf-8"))
+
+        if (
+            manifest.get("format") != SNAPSHOT_FORMAT
+            or manifest.get("format_version") != SNAPSHOT_FORMAT_VERSION
+        ):
+            raise ValueError(
+                f"Unsupported HNSW snapshot format: "
+                f"{manifest.get('format')} v{manifest.get('format_version')}"
+            )
 
-        # Initialize and load hnswlib index
-        import hnswlib  # noqa: F811
+        for suffix, expected in manifest["files"].items():
+            if _file_fingerprint(_sidecar(path, suffix)) != expected:
+                raise ValueError(
+                    f"HNSW snapshot file {_sidecar(path, suffix)!r} does not match its manifest"
+                )
+
+        count = manifest["count"]
+        free_slots = list(manifest["free_slots"])
+        ids_array = np.load(_sidecar(path, IDS_SUFFIX), allow_pickle=False)
+        ids: List[Optional[int]] = ids_array.tolist()
+        for slot in free_slots:
+            ids[slot] = None
+
+        vectors: Optional[np.ndarray] = None
+        if count:
+            vectors = np.load(
+                _sidecar(path, VECTORS_SUFFIX),
+                mmap_mode="c" if mmap else None,
+                allow_pickle=False,
+            )
 
+        self._dim = manifest["dim"]
+        self._max_elements = manifest["max_elements"]
+        self._m = manifest["m"]
+        self._ef_construction = manifest["ef_construction"]
+        self._ef_search = manifest["ef_search"]
+        self._ids = ids
+        self._ids_lookup = None
+        self._id_to_idx = {ext_id: slot for slot, ext_id in enumerate(ids) if ext_id is not None}
+        self._free_slots = free_slots
+        self._metadata = _metadata_from_columns(ids, manifest["metadata"])
+        self._vectors_normalized = vectors
+
+        # Initialize and load hnswlib index
         self._index = hnswlib.Index(space="ip", dim=self._dim)
         self._index.load_index(path, max_elements=self._max_elements)
         self._index.set_ef(self._ef_search)
@@ -292,8 +543,8 @@ class HNSWIndex:
             self._index.set_ef(ef)
 
     def __len__(self) -> int:
-        """Return number of items in the index."""
-        return len(self._ids)
+        """Return number of live items in the index."""
+        return len(self._id_to_idx)
 
     def get_vectors_by_ids(self, ids: List[int]) -> Optional[np.ndarray]:
         """Retrieve normalized vectors for given IDs.
@@ -323,6 +574,83 @@ class HNSWIndex:
         Returns:
             Tuple of (vectors array, list of IDs), or (None, []) if empty.
         """
-        if self._vectors_normalized is None:
+        if self._vectors_normalized is None or not self._id_to_idx:
             return None, []
-        return self._vectors_normalized.copy(), self._ids.copy()
+        live_ids = [ext_id for ext_id in self._ids if ext_id is not None]
+        live_slots = [self._id_to_idx[ext_id] for ext_id in live_ids]
+        return self._vectors_normalized[live_slots].copy(), live_ids
+
+
+def _sidecar(path: str, suffix: str) -> str:
+    return f"{path}{suffix}"
+
+
+def _replace_atomic(path: str, write_to: Callable[[str], Any]) -> dict:
+    """Write via ``write_to(tmp_path)`` and rename over ``path``; return its fingerprint."""
+    descriptor, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path) or ".", prefix=f"{os.path.basename(path)}.", suffix=".tmp"
+    )
+    os.close(descriptor)
+    try:
+        write_to(tmp_path)
+        fingerprint = _file_fingerprint(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return fingerprint
+
+
+def _write_atomic(path: str, write: Callable[[BinaryIO], Any]) -> dict:
+    def _write_to(tmp_path: str) -> None:
+        with open(tmp_path, "wb") as f:
+            write(f)
+
+    return _replace_atomic(path, _write_to)
+
+
+def _file_fingerprint(path: str) -> dict:
+    """Return the size and BLAKE2b digest recorded for a snapshot file."""
+    digest = hashlib.blake2b(digest_size=16)
+    size = 0
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+            size += len(chunk)
+    return {"size": size, "blake2b": digest.hexdigest()}
+
+
+def _id_kind(ids: List[Any]) -> str:
+    """Return the on-disk id kind ("int" or "str") for a list of external ids."""
+    if all(isinstance(ext_id, str) for ext_id in ids):
+        return "str"
+    if all(isinstance(ext_id, (int, np.integer)) for ext_id in ids):
+        return "int"
+    raise TypeError("HNSWIndex can only save ids that are all int or all str")
+
+
+def _metadata_columns(ids: List[Any], metadata: dict) -> dict:
+    """Lay out per-id metadata dicts as slot-aligned columns."""
+    rows = [None if ext_id is None else metadata.get(ext_id) for ext_id in ids]
+    keys: dict[str, None] = {}
+    for row in rows:
+        if row:
+            keys.update(dict.fromkeys(row))
+    return {
+        "present": [row is not None for row in rows],
+        "columns": {key: [row.get(key) if row else None for row in rows] for key in keys},
+    }
+
+
+def _metadata_from_columns(ids: List[Any], layout: dict) -> dict:
+    """Rebuild the id -> metadata dict from slot-aligned columns."""
+    columns = layout["columns"]
+    metadata = {}
+    for slot, (ext_id, present) in enumerate(zip(ids, layout["present"])):
+        if ext_id is None or not present:
+            continue
+        metadata[ext_id] = {
+            key: values[slot] for key, values in columns.items() if values[slot] is not None
+        }
+    return metadata
@@ -15,13 +15,16 @@ import numpy as np
 if TYPE_CHECKING:
     from common.interfaces.vector_index import VectorIndex
 
-from common.interfaces.vector_index import SearchResult
+from common.interfaces.vector_index import BatchSearchResult, SearchResult
 
 logger = logging.getLogger(__name__)
 
 # Expansion factor for candidate retrieval
 RERANK_EXPANSION_FACTOR = 10
 
+# Queries rescored per chunk in search_batch_with_rerank (bounds temp memory)
+RERANK_BATCH_CHUNK = 256
+
 
 def search_with_rerank(
     index: "VectorIndex",
@@ -102,6 +105,91 @@ def search_with_rerank(
     return results
 
 
+def search_batch_with_rerank(
+    index: "VectorIndex",
+    query_matrix: np.ndarray,
+    k: int,
+    expansion_factor: int = RERANK_EXPANSION_FACTOR,
+    brute_force_index: "Optional[VectorIndex]" = None,
+) -> BatchSearchResult:
+    """Batched retrieve-and-rerank over many query vectors.
+
+    Same strategy as search_with_rerank, but candidates for all queries come
+    from one index.search_batch call and their vectors are fetched once for
+    the union of candidate ids.
+
+    Args:
+        index: The VectorIndex to search (typically HNSW).
+        query_matrix: 2D numpy array of shape (n_queries, dimension).
+        k: Number of final results to return per query.
+        expansion_factor: Multiply k by this for candidate retrieval.
+        brute_force_index: Optional brute-force index for recall loss validation.
+
+    Returns:
+        BatchSearchResult sorted by exact score descending within each row.
+    """
+    queries = np.asarray(query_matrix, dtype=np.float32)
+    if queries.ndim == 1:
+        queries = queries.reshape(1, -1)
+
+    # 1. Expansion: one batched ANN call for all queries
+    candidates = index.search_batch(queries, k=k * expansion_factor)
+    if candidates.ids.shape[1] == 0:
+        return candidates
+
+    if not hasattr(index, "get_vectors_by_ids"):
+        logger.warning("Index doesn't support get_vectors_by_ids, skipping rerank")
+        return _truncate_batch(candidates, k)
+
+    # 2. Vector Fetch: one lookup for the union of candidate ids
+    hit_mask = np.isfinite(candidates.scores)
+    unique_ids = list(dict.fromkeys(candidates.ids[hit_mask].tolist()))
+    candidate_vectors = index.get_vectors_by_ids(unique_ids)
+    if candidate_vectors is None or len(candidate_vectors) != len(unique_ids):
+        return _truncate_batch(candidates, k)
+
+    position = {item_id: i for i, item_id in enumerate(unique_ids)}
+    rows = np.zeros(candidates.ids.shape, dtype=np.int64)
+    rows[hit_mask] = [position[item_id] for item_id in candidates.ids[hit_mask]]
+
+    # 3. Vectorized Scoring: exact cosine per (query, candidate) pair
+    norms = np.linalg.norm(queries, axis=1, keepdims=True)
+    queries_normalized = queries / np.where(norms == 0, 1, norms)
+    exact_scores = np.empty(candidates.scores.shape, dtype=np.float32)
+    for start in range(0, len(queries), RERANK_BATCH_CHUNK):
+        end = start + RERANK_BATCH_CHUNK
+        exact_scores[start:end] = np.einsum(
+            "nkd,nd->nk", candidate_vectors[rows[start:end]], queries_normalized[start:end]
+        )
+    exact_scores[~hit_mask] = -np.inf
+
+    # 4. Sort & Slice per row
+    order = np.argsort(-exact_scores, axis=1, kind="stable")[:, :k]
+    results = BatchSearchResult(
+        ids=np.take_along_axis(candidates.ids, order, axis=1),
+        scores=np.take_along_axis(exact_scores, order, axis=1),
+        metadata=candidates.metadata,
+    )
+
+    # 5. Validation: Log recall loss if RECORD_GOLDEN_SET is on
+    from common.config.env import get_env_bool
+
+    if get_env_bool("RECORD_GOLDEN_SET", False):
+        for i in range(len(results)):
+            _log_recall_loss(results.row(i), brute_force_index, queries[i], k)
+
+    return results
+
+
+def _truncate_batch(candidates: BatchSearchResult, k: int) -> BatchSearchResult:
+    """Keep the first k ANN candidates of every row."""
+    return BatchSearchResult(
+        ids=candidates.ids[:, :k],
+        scores=candidates.scores[:, :k],
+        metadata=candidates.metadata,
+    )
+
+
 def _log_recall_loss(
     reranked_results: List[SearchResult],
     brute_force_index: "Optional[VectorIndex]",
@@ -14,7 +14,7 @@ import numpy as np
 if TYPE_CHECKING:
     from common.interfaces.vector_index import VectorIndex
 
-from common.interfaces.vector_index import SearchResult
+from common.interfaces.vector_index import BatchSearchResult, SearchResult
 
 logger = logging.getLogger(__name__)
 
@@ -88,6 +88,19 @@ class ThreadSafeIndex:
         index = self._active_index
         return index.search(query_vector, k)
 
+    def search_batch(self, query_matrix: np.ndarray, k: int) -> BatchSearchResult:
+        """Thread-safe batched search using active index.
+
+        Args:
+            query_matrix: 2D numpy array of shape (n_queries, dimension).
+            k: Number of neighbors to return per query.
+
+        Returns:
+            BatchSearchResult with one row per query.
+        """
+        index = self._active_index
+        return index.search_batch(query_matrix, k)
+
     def add_items(
         self,
         vectors: np.ndarray,
@@ -106,6 +119,37 @@ class ThreadSafeIndex:
         # Direct write to active index - caller must ensure no concurrent updates
         self._active_index.add_items(vectors, ids, metadata)
 
+    def replace_items(
+        self,
+        vectors: np.ndarray,
+        ids: List[int],
+        metadata: Optional[dict[int, dict]] = None,
+    ) -> None:
+        """Insert or overwrite items in the active index without a rebuild.
+
+        Serialized with update() so an incremental write never lands on an
+        index that is about to be swapped out.
+
+        Args:
+            vectors: 2D numpy array of shape (n_items, dimension).
+            ids: List of unique identifiers for each vector.
+            metadata: Optional dict mapping id -> metadata dict.
+        """
+        with self._update_lock:
+            self._active_index.replace_items(vectors, ids, metadata)
+
+    def mark_deleted(self, ids: List[int]) -> int:
+        """Delete items from the active index without a rebuild.
+
+        Args:
+            ids: External ids to delete. Unknown ids are ignored.
+
+        Returns:
+            Number of items that were deleted.
+        """
+        with self._update_lock:
+            return self._active_index.mark_deleted(ids)
+
     def update(self, build_func: Callable[[], "VectorIndex"]) -> bool:
         """Build new index synchronously and hot-swap.
 
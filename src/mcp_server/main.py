@@ -200,6 +200,17 @@ async def lifespan(app):
         logger.exception("Schema embeddings indexing failed")
         init_state.record_failure("schema_embeddings", e, required=False)
 
+    # Registry L1 cache, kept coherent via LISTEN/NOTIFY (optional)
+    try:
+        from mcp_server.services.cache.l1_cache import start_l1_cache
+
+        if start_l1_cache():
+            logger.info("Registry L1 cache enabled")
+        init_state.record_success("registry_l1_cache", required=False)
+    except Exception as e:
+        logger.exception("Registry L1 cache initialization failed")
+        init_state.record_failure("registry_l1_cache", e, required=False)
+
     init_state.complete()
 
     if init_state.is_ready:
@@ -210,7 +221,19 @@ async def lifespan(app):
 
     yield
 
-    # Shutdown: Close database connection pool
+    # Shutdown: Release the L1 cache listener connection, then the pool
+    try:
+        from mcp_server.services.cache.l1_cache import stop_l1_cache
+
+        await stop_l1_cache()
+    except Exception:
+        logger.exception("Registry L1 cache shutdown failed")
+    try:
+        from dal.result_spool import close_result_spool_store
+
+        close_result_spool_store()
+    except Exception:
+        logger.exception("Result spool shutdown failed")
     await Database.close()
 
 
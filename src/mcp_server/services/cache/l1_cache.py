@@ -0,0 +1,401 @@
+"""In-process L1 cache in front of the query registry for ``lookup_cache``.
+
+Two tiers, both tenant-scoped:
+- Signature: exact ``(tenant_id, signature_key)`` entries for pairs recently
+  served from the registry, plus aliases from a question's signature to the
+  pair a semantic hit resolved it to.
+- Semantic: a small per-tenant HNSW index over the embeddings of those entries.
+
+The cache only serves while a :class:`RegistryEventListener` is connected; it
+is emptied whenever the listener (dis)connects, so events missed in between can
+never leave stale SQL behind. Every hit is still validated by the caller
+exactly like a registry hit. Entries also expire after a TTL as a backstop.
+
+The cache is not thread-safe; it is used from the server's event loop only.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from common.observability.metrics import mcp_metrics
+from dal.postgres.registry_events import (
+    EVENT_RESET,
+    EVENT_SCHEMA,
+    EVENT_STORE,
+    EVENT_TOMBSTONE,
+    RegistryEventListener,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+DEFAULT_TTL_SECONDS = 300.0
+
+# Approximate per-entry bookkeeping cost (dataclass, key tuple, OrderedDict node)
+_ENTRY_OVERHEAD_BYTES = 400
+_ALIAS_OVERHEAD_BYTES = 160
+
+# Small graphs: recently-hit entries only
+_HNSW_M = 16
+_HNSW_EF_CONSTRUCTION = 64
+_HNSW_EF_SEARCH = 32
+_HNSW_INITIAL_ELEMENTS = 256
+
+_Key = Tuple[int, str]
+
+
+@dataclass
+class L1Entry:
+    """A registry pair that passed the ``lookup_cache`` checks."""
+
+    tenant_id: int
+    signature_key: str
+    sql_query: str
+    metadata: Dict[str, Any]
+    expires_at: float
+    embedding: Optional[np.ndarray] = None
+    nbytes: int = 0
+    aliases: Set[str] = field(default_factory=set)
+
+
+class RegistryL1Cache:
+    """Byte-bounded LRU of registry pairs with a per-tenant semantic index."""
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_bytes: Upper bound on the approximate memory footprint.
+            ttl_seconds: Maximum age of an entry.
+            clock: Monotonic time source (injectable for tests).
+        """
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[_Key, L1Entry]" = OrderedDict()
+        self._aliases: Dict[_Key, str] = {}
+        # tenant_id -> (dimension, HNSWIndex keyed by signature_key)
+        self._indexes: Dict[int, Tuple[int, Any]] = {}
+        self._bytes = 0
+        self._generation = 0
+        self._coherent = False
+
+    @property
+    def coherent(self) -> bool:
+        """Return True while invalidation events are being received."""
+        return self._coherent
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped by every invalidation.
+
+        Capture it before reading the registry and pass it to :meth:`put`, so a
+        row invalidated while the read was in flight is not cached.
+        """
+        return self._generation
+
+    def set_coherent(self, coherent: bool) -> None:
+        """Record the listener state; the cache restarts empty either way."""
+        self.clear()
+        self._coherent = coherent
+
+    def lookup_signature(self, tenant_id: int, signature_key: str) -> Optional[L1Entry]:
+        """Return the entry for an exact signature (or alias), if cached."""
+        entry = self._get(tenant_id, signature_key, follow_alias=True)
+        self._record("signature", entry is not None)
+        return entry
+
+    def lookup_semantic(
+        self, tenant_id: int, embedding: Sequence[float], threshold: float, limit: int = 3
+    ) -> List[L1Entry]:
+        """Return cached entries at least ``threshold`` similar, best first."""
+        entries: List[L1Entry] = []
+        dim, index = self._indexes.get(tenant_id, (0, None))
+        query = np.asarray(embedding, dtype=np.float32)
+        if index is not None and dim == query.shape[0]:
+            for result in index.search(query, limit):
+                if result.score < threshold:
+                    continue
+                entry = self._get(tenant_id, result.id, follow_alias=False)
+                if entry is not None:
+                    entries.append(entry)
+        self._record("semantic", bool(entries))
+        return entries
+
+    def put(
+        self,
+        tenant_id: int,
+        signature_key: str,
+        sql_query: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        embedding: Optional[Sequence[float]] = None,
+        alias: Optional[str] = None,
+        generation: Optional[int] = None,
+    ) -> None:
+        """Cache a validated registry pair.
+
+        Args:
+            tenant_id: Tenant scope.
+            signature_key: The pair's signature.
+            sql_query: The pair's SQL.
+            metadata: Result metadata to hand back on hits.
+            embedding: The pair's question embedding, for the semantic tier.
+            alias: Signature of the question that resolved to this pair, if different.
+            generation: :attr:`generation` observed before the registry read.
+        """
+        if not self._coherent:
+            return
+        if generation is not None and generation != self._generation:
+            return
+
+        key = (tenant_id, signature_key)
+        aliases: Set[str] = set()
+        previous = self._entries.get(key)
+        if previous is not None:
+            aliases = set(previous.aliases)
+            self._drop(previous, reason=None)
+
+        vector = None
+        if embedding is not None and len(embedding) > 0:
+            vector = np.asarray(embedding, dtype=np.float32)
+        entry = L1Entry(
+            tenant_id=tenant_id,
+            signature_key=signature_key,
+            sql_query=sql_query,
+            metadata=dict(metadata or {}),
+            expires_at=self._clock() + self.ttl_seconds,
+            embedding=vector,
+        )
+        entry.nbytes = _entry_size(entry)
+        if entry.nbytes > self.max_bytes:
+            return
+
+        self._entries[key] = entry
+        self._bytes += entry.nbytes
+        if vector is not None:
+            self._index_for(tenant_id, vector.shape[0]).add_items(
+                vector.reshape(1, -1), [signature_key]
+            )
+        for name in aliases | ({alias} if alias else set()):
+            self._add_alias(entry, name)
+        self._evict()
+
+    def add_alias(self, tenant_id: int, signature_key: str, alias: str) -> None:
+        """Point the signature ``alias`` at the cached pair ``signature_key``."""
+        entry = self._entries.get((tenant_id, signature_key))
+        if entry is not None:
+            self._add_alias(entry, alias)
+            self._evict()
+
+    def invalidate(self, tenant_id: int, signature_key: str) -> None:
+        """Drop a pair and any alias named by its signature."""
+        self._generation += 1
+        entry = self._entries.get((tenant_id, signature_key))
+        if entry is not None:
+            self._drop(entry, reason="invalidated")
+        self._remove_alias(tenant_id, signature_key)
+
+    def invalidate_tenant(self, tenant_id: int) -> None:
+        """Drop every entry for ``tenant_id``."""
+        self._generation += 1
+        for entry in [e for (tid, _), e in self._entries.items() if tid == tenant_id]:
+            self._drop(entry, reason="invalidated")
+
+    def clear(self) -> None:
+        """Drop everything."""
+        self._generation += 1
+        if self._entries:
+            self._count_evictions(len(self._entries), "invalidated")
+        self._entries.clear()
+        self._aliases.clear()
+        self._indexes.clear()
+        self._bytes = 0
+
+    def handle_event(self, event: Optional[Dict[str, Any]]) -> None:
+        """Apply a registry change event; anything unrecognized clears the cache."""
+        kind = event.get("event") if event else None
+        tenant_id = event.get("tenant_id") if event else None
+        signature_key = event.get("signature_key") if event else None
+
+        if kind in (EVENT_STORE, EVENT_TOMBSTONE) and tenant_id is not None and signature_key:
+            self.invalidate(int(tenant_id), signature_key)
+        elif kind == EVENT_RESET and tenant_id is not None:
+            self.invalidate_tenant(int(tenant_id))
+        else:
+            if kind not in (EVENT_RESET, EVENT_SCHEMA):
+                logger.warning("Clearing registry L1 cache on unexpected event: %s", event)
+            self.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return occupancy figures."""
+        return {
+            "coherent": self._coherent,
+            "entries": len(self._entries),
+            "aliases": len(self._aliases),
+            "indexed_tenants": len(self._indexes),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+    def _get(self, tenant_id: int, signature_key: str, follow_alias: bool) -> Optional[L1Entry]:
+        entry = self._entries.get((tenant_id, signature_key))
+        if entry is None and follow_alias:
+            target = self._aliases.get((tenant_id, signature_key))
+            if target is not None:
+                entry = self._entries.get((tenant_id, target))
+        if entry is None:
+            return None
+        if entry.expires_at <= self._clock():
+            self._drop(entry, reason="expired")
+            return None
+        self._entries.move_to_end((tenant_id, entry.signature_key))
+        return entry
+
+    def _index_for(self, tenant_id: int, dim: int):
+        from ingestion.vector_indexes.hnsw import HNSWIndex
+
+        index_dim, index = self._indexes.get(tenant_id, (dim, None))
+        if index is not None and index_dim != dim:
+            # Embedding model changed; the old vectors are not comparable
+            for entry in self._entries.values():
+                if entry.tenant_id == tenant_id:
+                    entry.embedding = None
+            index = None
+        if index is None:
+            index = HNSWIndex(
+                dim=dim,
+                max_elements=_HNSW_INITIAL_ELEMENTS,
+                m=_HNSW_M,
+                ef_construction=_HNSW_EF_CONSTRUCTION,
+                ef_search=_HNSW_EF_SEARCH,
+            )
+            self._indexes[tenant_id] = (dim, index)
+        return index
+
+    def _add_alias(self, entry: L1Entry, alias: str) -> None:
+        if alias == entry.signature_key:
+            return
+        self._remove_alias(entry.tenant_id, alias)
+        self._aliases[(entry.tenant_id, alias)] = entry.signature_key
+        entry.aliases.add(alias)
+        entry.nbytes += _ALIAS_OVERHEAD_BYTES
+        self._bytes += _ALIAS_OVERHEAD_BYTES
+
+    def _remove_alias(self, tenant_id: int, alias: str) -> None:
+        target = self._aliases.pop((tenant_id, alias), None)
+        if target is None:
+            return
+        owner = self._entries.get((tenant_id, target))
+        if owner is not None and alias in owner.aliases:
+            owner.aliases.discard(alias)
+            owner.nbytes -= _ALIAS_OVERHEAD_BYTES
+            self._bytes -= _ALIAS_OVERHEAD_BYTES
+
+    def _drop(self, entry: L1Entry, reason: Optional[str]) -> None:
+        key = (entry.tenant_id, entry.signature_key)
+        if self._entries.get(key) is not entry:
+            return
+        del self._entries[key]
+        self._bytes -= entry.nbytes
+        for alias in entry.aliases:
+            self._aliases.pop((entry.tenant_id, alias), None)
+        if entry.embedding is not None:
+            _, index = self._indexes.get(entry.tenant_id, (0, None))
+            if index is not None:
+                index.mark_deleted([entry.signature_key])
+                if len(index) == 0:
+                    del self._indexes[entry.tenant_id]
+        if reason:
+            self._count_evictions(1, reason)
+
+    def _evict(self) -> None:
+        while self._bytes > self.max_bytes and self._entries:
+            _, oldest = next(iter(self._entries.items()))
+            self._drop(oldest, reason="capacity")
+
+    @staticmethod
+    def _count_evictions(count: int, reason: str) -> None:
+        mcp_metrics.add_counter(
+            "mcp.cache.l1.evictions_total",
+            count,
+            description="Count of entries removed from the registry L1 cache",
+            attributes={"reason": reason},
+        )
+
+    @staticmethod
+    def _record(tier: str, hit: bool) -> None:
+        mcp_metrics.add_counter(
+            "mcp.cache.l1.hits_total" if hit else "mcp.cache.l1.misses_total",
+            1,
+            description=(
+                "Count of registry L1 cache hits" if hit else "Count of registry L1 cache misses"
+            ),
+            attributes={"tier": tier},
+        )
+
+
+def _entry_size(entry: L1Entry) -> int:
+    size = _ENTRY_OVERHEAD_BYTES + len(entry.sql_query) + len(entry.signature_key)
+    size += sum(len(str(k)) + len(str(v)) for k, v in entry.metadata.items())
+    if entry.embedding is not None:
+        # Raw vector, the index's normalized copy, its hnswlib copy and level-0 links
+        size += 3 * entry.embedding.nbytes + 2 * _HNSW_M * 4
+    return size
+
+
+_cache: Optional[RegistryL1Cache] = None
+_listener: Optional[RegistryEventListener] = None
+
+
+def get_l1_cache() -> Optional[RegistryL1Cache]:
+    """Return the registry L1 cache if it may currently serve, else None."""
+    if _cache is not None and _cache.coherent:
+        return _cache
+    return None
+
+
+def start_l1_cache() -> bool:
+    """Create the L1 cache and start its invalidation listener.
+
+    Must be called from the server's event loop.
+
+    Returns:
+        False if the cache is disabled or the registry does not support LISTEN.
+    """
+    global _cache, _listener
+    from common.config.env import get_env_bool, get_env_float, get_env_int
+
+    if _listener is not None and _listener.running:
+        return True
+    if not get_env_bool("MCP_CACHE_L1_ENABLED", True):
+        return False
+
+    cache = RegistryL1Cache(
+        max_bytes=get_env_int("MCP_CACHE_L1_MAX_BYTES", DEFAULT_MAX_BYTES),
+        ttl_seconds=get_env_float("MCP_CACHE_L1_TTL_SECONDS", DEFAULT_TTL_SECONDS),
+    )
+    listener = RegistryEventListener(cache.handle_event, cache.set_coherent)
+    if not listener.start():
+        return False
+    _cache, _listener = cache, listener
+    return True
+
+
+async def stop_l1_cache() -> None:
+    """Stop the invalidation listener and drop the cache."""
+    global _cache, _listener
+    if _listener is not None:
+        await _listener.stop()
+    if _cache is not None:
+        _cache.set_coherent(False)
+    _cache, _listener = None, None
@@ -0,0 +1,262 @@
+"""In-process cache of executed ``execute_sql_query`` results.
+
+Entries are keyed by the SQL actually sent to the warehouse (after tenant
+rewriting), its bound parameters, the tenant, the provider, the schema snapshot
+the SQL was generated against, the tenant-enforcement policy fingerprint and the
+result-shaping limits. Values are the serialized response envelope, stored
+zlib-compressed.
+
+Only complete, non-paginated results are cached; paginated requests carry
+signed cursors and session state that must never be replayed.
+
+The cache is not thread-safe; it is used from the server's event loop only.
+"""
+
+import hashlib
+import json
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from common.config.env import get_env_bool, get_env_float, get_env_int
+from common.observability.metrics import mcp_metrics
+
+DEFAULT_TTL_SECONDS = 60.0
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_ENTRY_BYTES = 1024 * 1024
+
+# Approximate per-entry bookkeeping cost (dataclass, key, OrderedDict node)
+_ENTRY_OVERHEAD_BYTES = 200
+
+
+@dataclass
+class _Entry:
+    tenant_id: Optional[int]
+    schema_snapshot_id: Optional[str]
+    payload: bytes
+    stored_at: float
+    expires_at: float
+
+
+@dataclass(frozen=True)
+class CachedResult:
+    """A cached response envelope and how old it is."""
+
+    envelope: Dict[str, Any]
+    age_ms: int
+
+
+def build_result_cache_key(
+    *,
+    sql: str,
+    params: Optional[Sequence[Any]],
+    tenant_id: Optional[int],
+    provider: str,
+    schema_snapshot_id: Optional[str],
+    policy_fingerprint: str,
+    shape: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Return the cache key for an execution request.
+
+    ``sql`` and ``params`` must be the values bound after tenant rewriting.
+    ``shape`` holds any request option that changes the returned payload
+    (column metadata, row and byte caps).
+    """
+    payload = {
+        "sql": sql,
+        "params": list(params or []),
+        "tenant_id": tenant_id,
+        "provider": provider,
+        "schema_snapshot_id": schema_snapshot_id,
+        "policy": policy_fingerprint,
+        "shape": shape or {},
+    }
+    encoded = json.dumps(payload, separators=(",", ":"), sort_keys=True, default=repr)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """Byte-bounded LRU of compressed result envelopes with per-provider TTLs."""
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_entry_bytes: int = DEFAULT_MAX_ENTRY_BYTES,
+        default_ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        provider_ttl_seconds: Optional[Dict[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize an empty cache."""
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.default_ttl_seconds = default_ttl_seconds
+        self.provider_ttl_seconds = {
+            name.lower(): ttl for name, ttl in (provider_ttl_seconds or {}).items()
+        }
+        self._clock = clock
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._bytes = 0
+        # Latest schema snapshot seen per tenant
+        self._snapshots: Dict[Optional[int], str] = {}
+
+    def ttl_for(self, provider: str) -> float:
+        """Return the TTL for ``provider``; 0 disables caching for it."""
+        return self.provider_ttl_seconds.get(provider.lower(), self.default_ttl_seconds)
+
+    def get(
+        self, key: str, tenant_id: Optional[int], schema_snapshot_id: Optional[str]
+    ) -> Optional[CachedResult]:
+        """Return the cached envelope for ``key``, or None."""
+        self.observe_snapshot(tenant_id, schema_snapshot_id)
+        entry = self._entries.get(key)
+        now = self._clock()
+        if entry is not None and entry.expires_at <= now:
+            self._remove(key, reason="expired")
+            entry = None
+        if entry is None:
+            self._record_lookup(hit=False)
+            return None
+
+        self._entries.move_to_end(key)
+        self._record_lookup(hit=True)
+        envelope = json.loads(zlib.decompress(entry.payload))
+        return CachedResult(envelope=envelope, age_ms=int((now - entry.stored_at) * 1000))
+
+    def put(
+        self,
+        key: str,
+        envelope_json: str,
+        *,
+        tenant_id: Optional[int],
+        provider: str,
+        schema_snapshot_id: Optional[str],
+    ) -> bool:
+        """Store a serialized envelope. Returns False if it was not cached."""
+        ttl = self.ttl_for(provider)
+        if ttl <= 0:
+            return False
+        self.observe_snapshot(tenant_id, schema_snapshot_id)
+
+        payload = zlib.compress(envelope_json.encode("utf-8"))
+        size = len(payload) + len(key) + _ENTRY_OVERHEAD_BYTES
+        if size > self.max_entry_bytes or size > self.max_bytes:
+            self._record_eviction("oversize")
+            return False
+
+        if key in self._entries:
+            self._remove(key, reason=None)
+        now = self._clock()
+        self._entries[key] = _Entry(
+            tenant_id=tenant_id,
+            schema_snapshot_id=schema_snapshot_id,
+            payload=payload,
+            stored_at=now,
+            expires_at=now + ttl,
+        )
+        self._bytes += size
+        while self._bytes > self.max_bytes and self._entries:
+            self._remove(next(iter(self._entries)), reason="capacity")
+        return True
+
+    def observe_snapshot(self, tenant_id: Optional[int], schema_snapshot_id: Optional[str]) -> None:
+        """Record the tenant's current schema snapshot, dropping entries for older ones."""
+        if not schema_snapshot_id:
+            return
+        if self._snapshots.get(tenant_id) == schema_snapshot_id:
+            return
+        self._snapshots[tenant_id] = schema_snapshot_id
+        stale = [
+            key
+            for key, entry in self._entries.items()
+            if entry.tenant_id == tenant_id
+            and entry.schema_snapshot_id is not None
+            and entry.schema_snapshot_id != schema_snapshot_id
+        ]
+        for key in stale:
+            self._remove(key, reason="schema_change")
+
+    def clear(self) -> None:
+        """Drop every entry (e.g. after the schema was re-indexed)."""
+        if self._entries:
+            self._record_eviction("schema_change", len(self._entries))
+        self._entries.clear()
+        self._snapshots.clear()
+        self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return entry count and compressed byte usage."""
+        return {"entries": len(self._entries), "bytes": self._bytes, "max_bytes": self.max_bytes}
+
+    def _remove(self, key: str, reason: Optional[str]) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= len(entry.payload) + len(key) + _ENTRY_OVERHEAD_BYTES
+        if reason is not None:
+            self._record_eviction(reason)
+
+    @staticmethod
+    def _record_lookup(hit: bool) -> None:
+        mcp_metrics.add_counter(
+            "mcp.result_cache.hits_total" if hit else "mcp.result_cache.misses_total",
+            description=(
+                "Count of executed-result cache hits"
+                if hit
+                else "Count of executed-result cache misses"
+            ),
+        )
+
+    @staticmethod
+    def _record_eviction(reason: str, count: int = 1) -> None:
+        mcp_metrics.add_counter(
+            "mcp.result_cache.evictions_total",
+            value=count,
+            description="Count of executed-result cache evictions",
+            attributes={"reason": reason},
+        )
+
+
+_cache: Optional[ResultCache] = None
+_cache_config: Optional[Tuple[Any, ...]] = None
+
+
+def _provider_ttls() -> Dict[str, float]:
+    from dal.query_target_validation import SUPPORTED_PROVIDERS
+
+    ttls = {}
+    for provider in sorted(SUPPORTED_PROVIDERS):
+        name = f"EXECUTION_RESULT_CACHE_TTL_SECONDS_{provider.upper()}"
+        ttl = get_env_float(name, None)
+        if ttl is not None:
+            ttls[provider] = ttl
+    return ttls
+
+
+def get_result_cache() -> Optional[ResultCache]:
+    """Return the process-wide result cache, or None when it is disabled."""
+    global _cache, _cache_config
+    if not get_env_bool("EXECUTION_RESULT_CACHE_ENABLED", False):
+        return None
+
+    config = (
+        get_env_int("EXECUTION_RESULT_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES),
+        get_env_int("EXECUTION_RESULT_CACHE_MAX_ENTRY_BYTES", DEFAULT_MAX_ENTRY_BYTES),
+        get_env_float("EXECUTION_RESULT_CACHE_TTL_SECONDS", DEFAULT_TTL_SECONDS),
+        tuple(sorted(_provider_ttls().items())),
+    )
+    if _cache is None or config != _cache_config:
+        max_bytes, max_entry_bytes, ttl, provider_ttls = config
+        _cache = ResultCache(
+            max_bytes=max_bytes,
+            max_entry_bytes=max_entry_bytes,
+            default_ttl_seconds=ttl,
+            provider_ttl_seconds=dict(provider_ttls),
+        )
+        _cache_config = config
+    return _cache
+
+
+def clear_result_cache() -> None:
+    """Drop all cached results, if the cache exists."""
+    if _cache is not None:
+        _cache.clear()
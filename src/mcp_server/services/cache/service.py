@@ -3,9 +3,12 @@ import re
 from typing import Optional
 
 from mcp_server.models import CacheLookupResult
+from mcp_server.services.rag import RagEngine
+from mcp_server.services.rag.catalog_snapshot import get_catalog_snapshot
 from mcp_server.services.registry import RegistryService
 
 from .constraint_extractor import extract_constraints
+from .l1_cache import get_l1_cache
 from .sql_constraint_validator import validate_sql_constraints
 
 logger = logging.getLogger(__name__)
@@ -24,23 +27,68 @@ def _check_tenant_leak(sql: str, tenant_id: int) -> bool:
     return False
 
 
+def _result_metadata(match_type: str, source_metadata: Optional[dict]) -> dict:
+    metadata = {"match_type": match_type}
+    for key in ("schema_snapshot_id", "catalog_snapshot_id"):
+        if source_metadata and source_metadata.get(key):
+            metadata[key] = source_metadata.get(key)
+    return metadata
+
+
 async def lookup_cache(user_query: str, tenant_id: int) -> Optional[CacheLookupResult]:
     """Check cache using the Unified Registry.
 
     Tier 1: Fingerprint exact match (from registry)
     Tier 2: Vector similarity with constraint validation (from registry)
+
+    While the in-process L1 cache is coherent, each tier consults it before
+    the registry and is filled from validated registry hits.
     """
+    l1 = get_l1_cache()
+    signature_key = None
+    generation = None
+    constraints = None
+
+    # === L1: exact signature (or a question already resolved semantically) ===
+    if l1 is not None:
+        generation = l1.generation
+        signature_key = await RegistryService.compute_signature_key(user_query)
+        entry = l1.lookup_signature(tenant_id, signature_key)
+        # An alias hit replays an earlier semantic resolution, so it gets the same checks
+        resolved = entry is not None and entry.signature_key != signature_key
+        if entry is not None and not (resolved and _check_tenant_leak(entry.sql_query, tenant_id)):
+            constraints = extract_constraints(user_query)
+            if validate_sql_constraints(entry.sql_query, constraints).is_valid:
+                logger.info(f"✓ L1 signature hit: {entry.signature_key[:16]}...")
+                return CacheLookupResult(
+                    cache_id=entry.signature_key,
+                    value=entry.sql_query,
+                    similarity=0.95 if resolved else 1.0,
+                    metadata=_result_metadata(
+                        "semantic" if resolved else "signature", entry.metadata
+                    ),
+                )
+
     # === Tier 1: Canonical Registry Lookup (exact signature match) ===
-    pair = await RegistryService.lookup_canonical(user_query, tenant_id)
+    pair = await RegistryService.lookup_canonical(
+        user_query, tenant_id, signature_key=signature_key
+    )
     if pair and "cache" in pair.roles and pair.status != "tombstoned":
         # SAFETY: Validate even Tier-1 hits to catch subtle poisoning or stale entries
-        constraints = extract_constraints(user_query)
+        constraints = constraints or extract_constraints(user_query)
         validation = validate_sql_constraints(pair.sql_query, constraints)
         if validation.is_valid:
             logger.info(f"✓ Registry signature hit: {pair.signature_key[:16]}...")
-            metadata = {"match_type": "signature"}
-            if pair.metadata and pair.metadata.get("schema_snapshot_id"):
-                metadata["schema_snapshot_id"] = pair.metadata.get("schema_snapshot_id")
+            metadata = _result_metadata("signature", pair.metadata)
+            if l1 is not None:
+                l1.put(
+                    tenant_id,
+                    pair.signature_key,
+                    pair.sql_query,
+                    metadata,
+                    embedding=pair.embedding,
+                    generation=generation,
+                )
             return CacheLookupResult(
                 cache_id=pair.signature_key,
                 value=pair.sql_query,
@@ -53,16 +101,39 @@ async def lookup_cache(user_query: str, tenant_id: int) -> Optional[CacheLookupR
             logger.warning(f"{msg}: {reasons}")
             # Fall through to semantic lookup
 
+    # === L1: semantic neighbours among recently served pairs ===
+    embedding = None
+    if l1 is not None:
+        embedding = await RagEngine.embed_text(user_query)
+        constraints = constraints or extract_constraints(user_query)
+        for entry in l1.lookup_semantic(tenant_id, embedding, SIMILARITY_THRESHOLD, limit=3):
+            if _check_tenant_leak(entry.sql_query, tenant_id):
+                continue
+            if validate_sql_constraints(entry.sql_query, constraints).is_valid:
+                logger.info(f"✓ L1 semantic hit: {entry.signature_key[:16]}...")
+                l1.add_alias(tenant_id, entry.signature_key, signature_key)
+                return CacheLookupResult(
+                    cache_id=entry.signature_key,
+                    value=entry.sql_query,
+                    similarity=0.95,  # Estimated
+                    metadata=_result_metadata("semantic", entry.metadata),
+                )
+
     # === Tier 2: Semantic Registry Fallback with Validation ===
     candidates = await RegistryService.lookup_semantic(
-        user_query, tenant_id, threshold=SIMILARITY_THRESHOLD, limit=3, role="cache"
+        user_query,
+        tenant_id,
+        threshold=SIMILARITY_THRESHOLD,
+        limit=3,
+        role="cache",
+        embedding=embedding,
     )
 
     if not candidates:
         return None
 
     # Extract constraints for deterministic validation
-    constraints = extract_constraints(user_query)
+    constraints = constraints or extract_constraints(user_query)
 
     for cand in candidates:
         if cand.status == "tombstoned":
@@ -77,9 +148,17 @@ async def lookup_cache(user_query: str, tenant_id: int) -> Optional[CacheLookupR
         validation = validate_sql_constraints(cand.sql_query, constraints)
         if validation.is_valid:
             logger.info(f"✓ Validated Registry hit: {cand.signature_key[:16]}...")
-            metadata = {"match_type": "semantic"}
-            if cand.metadata and cand.metadata.get("schema_snapshot_id"):
-                metadata["schema_snapshot_id"] = cand.metadata.get("schema_snapshot_id")
+            metadata = _result_metadata("semantic", cand.metadata)
+            if l1 is not None:
+                l1.put(
+                    tenant_id,
+                    cand.signature_key,
+                    cand.sql_query,
+                    metadata,
+                    embedding=cand.embedding,
+                    alias=signature_key,
+                    generation=generation,
+                )
             return CacheLookupResult(
                 cache_id=cand.signature_key,
                 value=cand.sql_query,
@@ -100,6 +179,11 @@ async def update_cache(
     metadata = {}
     if schema_snapshot_id:
         metadata["schema_snapshot_id"] = schema_snapshot_id
+    try:
+        # Lets clients validate hits against get_schema_snapshot_id without retrieval
+        metadata["catalog_snapshot_id"] = (await get_catalog_snapshot()).snapshot_id
+    except Exception as e:
+        logger.warning(f"Catalog snapshot unavailable; caching without it: {e}")
     await RegistryService.register_pair(
         question=user_query,
         sql_query=sql,
@@ -8,9 +8,9 @@ validation without LLM calls.
 import re
 from typing import Optional
 
-import sqlglot
 from sqlglot import exp
 
+from common.sql.ast_cache import parse_sql_one
 from mcp_server.services.cache.constraint_extractor import QueryConstraints
 from mcp_server.services.cache.models.validation import ConstraintMismatch, ValidationResult
 
@@ -20,7 +20,7 @@ VALID_RATINGS = frozenset({"G", "PG", "PG-13", "R", "NC-17"})
 def extract_rating_from_sql(sql: str) -> Optional[str]:
     """Extract rating predicate value from SQL WHERE clause."""
     try:
-        ast = sqlglot.parse_one(sql, dialect="postgres")
+        ast = parse_sql_one(sql, "postgres", copy=False)
     except Exception:
         return _extract_rating_regex(sql)
 
@@ -60,7 +60,7 @@ def _extract_rating_regex(sql: str) -> Optional[str]:
 def extract_limit_from_sql(sql: str) -> Optional[int]:
     """Extract LIMIT value from SQL query."""
     try:
-        ast = sqlglot.parse_one(sql, dialect="postgres")
+        ast = parse_sql_one(sql, "postgres", copy=False)
     except Exception:
         return _extract_limit_regex(sql)
 
@@ -86,7 +86,7 @@ def _extract_limit_regex(sql: str) -> Optional[int]:
 def extract_order_direction_from_sql(sql: str) -> Optional[str]:
     """Extract first ORDER BY direction (ASC/DESC) from SQL."""
     try:
-        ast = sqlglot.parse_one(sql, dialect="postgres")
+        ast = parse_sql_one(sql, "postgres", copy=False)
     except Exception:
         return _extract_order_regex(sql)
 
@@ -4,12 +4,17 @@ Provides deterministic extraction of constraints from natural language
 queries using EntityRuler and DependencyMatcher.
 """
 
+import asyncio
 import hashlib
+import itertools
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 
-from common.config.env import get_env_bool, get_env_str
+from common.config.env import get_env_bool, get_env_int, get_env_str
 from common.telemetry import Telemetry
 
 logger = logging.getLogger(__name__)
@@ -17,6 +22,59 @@ logger = logging.getLogger(__name__)
 # Feature flag for gradual rollout
 SPACY_ENABLED = get_env_bool("SPACY_ENABLED", False)
 
+DEFAULT_MEMO_SIZE = 4096
+DEFAULT_PIPE_BATCH_SIZE = 64
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the dedicated pool that runs the spaCy pipeline off the event loop."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=get_env_int("SPACY_WORKER_THREADS", 1),
+                thread_name_prefix="spacy-canon",
+            )
+        return _executor
+
+
+def normalize_query(query: str) -> str:
+    """Collapse whitespace; the pipeline and the memo both see this form."""
+    return " ".join(query.split())
+
+
+class _ConstraintMemo:
+    """Thread-safe LRU of extracted constraints keyed by (pipeline version, query)."""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[int, str], dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, version: int, query: str) -> Optional[dict]:
+        with self._lock:
+            constraints = self._entries.get((version, query))
+            if constraints is None:
+                return None
+            self._entries.move_to_end((version, query))
+            return dict(constraints)
+
+    def put(self, version: int, query: str, constraints: dict) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[(version, query)] = dict(constraints)
+            self._entries.move_to_end((version, query))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
 
 class CanonicalizationService:
     """Linguistic canonicalization using SpaCy NLP.
@@ -33,14 +91,20 @@ class CanonicalizationService:
 
     _instance: Optional["CanonicalizationService"] = None
     _initialized: bool = False
+    _pipeline_versions = itertools.count(1)
 
     class PipelineState:
         """Immutable container for thread-safe atomic swapping."""
 
-        def __init__(self, nlp, matcher):
-            """Initialize pipeline state."""
+        def __init__(self, nlp, matcher, version: int = 0):
+            """Initialize pipeline state.
+
+            ``version`` identifies the pattern set, so memoized results from a
+            previous pipeline are never reused.
+            """
             self.nlp = nlp
             self.matcher = matcher
+            self.version = version
 
     def __init__(self, model: str = "en_core_web_sm"):
         """Initialize SpaCy pipeline with EntityRuler and DependencyMatcher.
@@ -49,6 +113,9 @@ class CanonicalizationService:
             model: SpaCy model name (default: en_core_web_sm for speed)
         """
         self._state: Optional[CanonicalizationService.PipelineState] = None
+        self._memo = _ConstraintMemo(
+            get_env_int("SPACY_CANONICALIZATION_CACHE_SIZE", DEFAULT_MEMO_SIZE)
+        )
         if CanonicalizationService._initialized:
             return
 
@@ -110,7 +177,7 @@ class CanonicalizationService:
             nlp, has_custom_patterns=(custom_patterns_count > 0)
         )
 
-        return self.PipelineState(nlp, matcher)
+        return self.PipelineState(nlp, matcher, version=next(self._pipeline_versions))
 
     @classmethod
     def get_instance(cls) -> "CanonicalizationService":
@@ -246,12 +313,17 @@ class CanonicalizationService:
                 )
 
         # Build NEW pipeline with DB patterns
-        # This is the "Atomic Swap" preparation - heavy lifting done on local var
-        new_state = self._build_pipeline(self.model, extra_patterns=patterns)
+        # This is the "Atomic Swap" preparation - heavy lifting done on local var,
+        # off the event loop
+        loop = asyncio.get_running_loop()
+        new_state = await loop.run_in_executor(
+            None, lambda: self._build_pipeline(self.model, extra_patterns=patterns)
+        )
 
         if new_state:
-            # Atomic swap
+            # Atomic swap; memoized constraints belong to the old pattern set
             self._state = new_state
+            self._memo.clear()
             logger.info(f"Swapped pipeline with {len(patterns)} DB patterns.")
             return len(patterns)
         else:
@@ -262,30 +334,70 @@ class CanonicalizationService:
         """Check if SpaCy is properly initialized."""
         return self._state is not None and SPACY_ENABLED
 
+    @staticmethod
+    def _empty_constraints() -> dict:
+        return {
+            "rating": None,
+            "limit": None,
+            "entity": None,
+            "metric": None,
+            "negated": False,
+            "confidence": 0.0,
+        }
+
     def extract_constraints(self, query: str) -> dict:
         """Extract constraints from natural language query.
 
+        Results are memoized per pattern set; callers get their own copy.
+
         Args:
             query: Raw user query (e.g., "Top 10 PG rated movies")
 
         Returns:
             dict with keys: rating, limit, entity, metric, negated, confidence
         """
-        constraints = {
-            "rating": None,
-            "limit": None,
-            "entity": None,
-            "metric": None,
-            "negated": False,
-            "confidence": 0.0,
-        }
+        return self.extract_constraints_batch([query])[0]
+
+    def extract_constraints_batch(
+        self, queries: Sequence[str], batch_size: int = DEFAULT_PIPE_BATCH_SIZE
+    ) -> List[dict]:
+        """Extract constraints for many queries, running misses through ``nlp.pipe``.
+
+        Args:
+            queries: Raw user queries.
+            batch_size: spaCy pipe batch size.
 
+        Returns:
+            Constraint dicts aligned with ``queries``.
+        """
         # Local atomic reference
         state = self._state
         if not state or not SPACY_ENABLED:
-            return constraints
-
-        doc = state.nlp(query)
+            return [self._empty_constraints() for _ in queries]
+
+        texts = [normalize_query(query) for query in queries]
+        results: List[Optional[dict]] = [self._memo.get(state.version, text) for text in texts]
+        misses = list(dict.fromkeys(text for text, hit in zip(texts, results) if hit is None))
+
+        if misses:
+            if len(misses) == 1:
+                docs = [state.nlp(misses[0])]
+            else:
+                docs = state.nlp.pipe(misses, batch_size=batch_size)
+            computed = {
+                text: self._constraints_from_doc(doc, state) for text, doc in zip(misses, docs)
+            }
+            for text, constraints in computed.items():
+                self._memo.put(state.version, text, constraints)
+            results = [
+                hit if hit is not None else dict(computed[text])
+                for text, hit in zip(texts, results)
+            ]
+        return results
+
+    def _constraints_from_doc(self, doc, state: "CanonicalizationService.PipelineState") -> dict:
+        """Read constraints off a processed Doc."""
+        constraints = self._empty_constraints()
 
         # Extract from named entities (EntityRuler)
         for ent in doc.ents:
@@ -403,7 +515,13 @@ class CanonicalizationService:
             },
         ) as span:
             try:
-                constraints = self.extract_constraints(query)
+                constraints = self._memo_lookup(query)
+                span.set_attribute("spacy.cache_hit", constraints is not None)
+                if constraints is None:
+                    loop = asyncio.get_running_loop()
+                    constraints = await loop.run_in_executor(
+                        _get_executor(), self.extract_constraints, query
+                    )
                 fingerprint = self.generate_fingerprint(constraints)
                 key = self.compute_fingerprint_key(fingerprint)
 
@@ -415,3 +533,45 @@ class CanonicalizationService:
             except Exception as e:
                 Telemetry.set_span_status(span, False, e)
                 raise
+
+    async def process_queries(
+        self, queries: Sequence[str], batch_size: int = DEFAULT_PIPE_BATCH_SIZE
+    ) -> List[Tuple[dict, str, str]]:
+        """Batch form of :meth:`process_query` for seeding and reindexing.
+
+        Args:
+            queries: Raw user queries.
+            batch_size: spaCy pipe batch size.
+
+        Returns:
+            (constraints, fingerprint, fingerprint_key) tuples aligned with ``queries``.
+        """
+        if not queries:
+            return []
+        with Telemetry.start_span(
+            "canonicalize.spacy_batch",
+            attributes={"spacy.batch_size": len(queries), "spacy.model": self.model},
+        ) as span:
+            try:
+                loop = asyncio.get_running_loop()
+                all_constraints = await loop.run_in_executor(
+                    _get_executor(), self.extract_constraints_batch, list(queries), batch_size
+                )
+                results = []
+                for constraints in all_constraints:
+                    fingerprint = self.generate_fingerprint(constraints)
+                    results.append(
+                        (constraints, fingerprint, self.compute_fingerprint_key(fingerprint))
+                    )
+                Telemetry.set_span_status(span, True)
+                return results
+            except Exception as e:
+                Telemetry.set_span_status(span, False, e)
+                raise
+
+    def _memo_lookup(self, query: str) -> Optional[dict]:
+        """Return memoized constraints (or the disabled-pipeline default) without parsing."""
+        state = self._state
+        if not state or not SPACY_ENABLED:
+            return self._empty_constraints()
+        return self._memo.get(state.version, normalize_query(query))
@@ -1,6 +1,12 @@
 """RAG services for semantic search and schema linking."""
 
-from .engine import RagEngine, reload_schema_index, search_similar_tables
+from .engine import (
+    RagEngine,
+    reload_schema_index,
+    search_similar_tables,
+    search_similar_tables_batch,
+    upsert_schema_embeddings,
+)
 from .indexer import index_all_tables
 from .linker import SchemaLinker
 from .retrieval import get_relevant_examples
@@ -12,4 +18,6 @@ __all__ = [
     "SchemaLinker",
     "reload_schema_index",
     "search_similar_tables",
+    "search_similar_tables_batch",
+    "upsert_schema_embeddings",
 ]
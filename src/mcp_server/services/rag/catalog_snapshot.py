@@ -0,0 +1,107 @@
+"""Maintained fingerprint of the full introspected schema catalog.
+
+The fingerprint is recorded whenever the schema is indexed or hydrated, so
+reading it is an in-memory lookup. It is recomputed by introspection (no
+embeddings or graph traversal) only when it is missing or older than
+``SCHEMA_CATALOG_SNAPSHOT_MAX_AGE_SECONDS``.
+
+Ids use the same ``fp-<hash>`` form as the agent's subgraph snapshot ids, over
+every table and column in the catalog.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from agent.utils.schema_fingerprint import fingerprint_schema_nodes
+from common.config.env import get_env_float
+from schema import TableDef
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_AGE_SECONDS = 300.0
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """The current catalog fingerprint and when it was computed."""
+
+    snapshot_id: str
+    table_count: int
+    computed_at: float
+
+    @property
+    def age_seconds(self) -> float:
+        """Return seconds since the fingerprint was computed."""
+        return max(0.0, time.time() - self.computed_at)
+
+
+_snapshot: Optional[CatalogSnapshot] = None
+_refresh_lock: Optional[asyncio.Lock] = None
+
+
+def fingerprint_table_defs(table_defs: Iterable[TableDef]) -> str:
+    """Return the snapshot id for a set of table definitions."""
+    nodes = []
+    for table_def in table_defs:
+        nodes.append({"type": "Table", "name": table_def.name})
+        nodes.extend(
+            {
+                "type": "Column",
+                "table": table_def.name,
+                "name": column.name,
+                "data_type": column.data_type,
+            }
+            for column in table_def.columns
+        )
+    return f"fp-{fingerprint_schema_nodes(nodes)}"
+
+
+def record_catalog(table_defs: Iterable[TableDef]) -> CatalogSnapshot:
+    """Record the fingerprint of freshly introspected table definitions."""
+    global _snapshot
+    table_defs = list(table_defs)
+    _snapshot = CatalogSnapshot(
+        snapshot_id=fingerprint_table_defs(table_defs),
+        table_count=len(table_defs),
+        computed_at=time.time(),
+    )
+    return _snapshot
+
+
+def invalidate_catalog_snapshot() -> None:
+    """Forget the recorded fingerprint; the next read re-introspects."""
+    global _snapshot
+    _snapshot = None
+
+
+async def get_catalog_snapshot(refresh: bool = False) -> CatalogSnapshot:
+    """Return the current catalog snapshot, introspecting only if it is missing or stale."""
+    global _refresh_lock
+    if not refresh and _is_fresh(_snapshot):
+        return _snapshot
+
+    if _refresh_lock is None:
+        _refresh_lock = asyncio.Lock()
+    async with _refresh_lock:
+        if not refresh and _is_fresh(_snapshot):
+            return _snapshot
+        from dal.database import Database
+
+        introspector = Database.get_schema_introspector()
+        table_names = await introspector.list_table_names()
+        table_defs = [await introspector.get_table_def(name) for name in table_names]
+        snapshot = record_catalog(table_defs)
+        logger.info(
+            f"Schema catalog snapshot {snapshot.snapshot_id} ({snapshot.table_count} tables)"
+        )
+        return snapshot
+
+
+def _is_fresh(snapshot: Optional[CatalogSnapshot]) -> bool:
+    if snapshot is None:
+        return False
+    max_age = get_env_float("SCHEMA_CATALOG_SNAPSHOT_MAX_AGE_SECONDS", DEFAULT_MAX_AGE_SECONDS)
+    return not max_age or max_age <= 0 or snapshot.age_seconds < max_age
@@ -0,0 +1,323 @@
+"""Content-addressed cache for RagEngine embeddings.
+
+Entries are keyed by a hash of (model name, normalized text). The memory tier
+is a byte-bounded LRU; the optional disk tier keeps raw float32 vectors in
+per-dimension append-only files (read via ``np.memmap``) with a SQLite index
+mapping keys to rows, so embeddings survive restarts and are shared by
+processes pointing at the same directory.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from common.observability.metrics import mcp_metrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Approximate per-entry bookkeeping cost (key string, OrderedDict node, ndarray header)
+_ENTRY_OVERHEAD_BYTES = 200
+
+_SQLITE_MAX_PARAMS = 500
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text so trivially different strings share a cache entry.
+
+    Only transformations that do not change the tokenizer input are applied:
+    Unicode NFC and whitespace collapsing.
+    """
+    return unicodedata.normalize("NFC", " ".join(text.split()))
+
+
+def embedding_cache_key(model_name: str, text: str) -> str:
+    """Return the content address for ``text`` embedded by ``model_name``."""
+    payload = f"{model_name}\0{normalize_text(text)}".encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+class DiskEmbeddingStore:
+    """Persistent embedding tier: memory-mapped vector files plus a SQLite index."""
+
+    def __init__(self, directory: str) -> None:
+        """Open (or create) the store in ``directory``."""
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._lock = threading.Lock()
+        self._maps: Dict[int, np.memmap] = {}
+        self._db = sqlite3.connect(
+            os.path.join(directory, "index.sqlite3"),
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "key TEXT PRIMARY KEY, dim INTEGER NOT NULL, row INTEGER NOT NULL)"
+        )
+
+    def _vector_path(self, dim: int) -> str:
+        return os.path.join(self._directory, f"vectors_{dim}.f32")
+
+    def _row(self, dim: int, row: int) -> Optional[np.ndarray]:
+        mapped = self._maps.get(dim)
+        if mapped is None or row >= mapped.shape[0]:
+            path = self._vector_path(dim)
+            rows = os.path.getsize(path) // (dim * 4) if os.path.exists(path) else 0
+            if row >= rows:
+                return None
+            mapped = np.memmap(path, dtype=np.float32, mode="r", shape=(rows, dim))
+            self._maps[dim] = mapped
+        return np.array(mapped[row])
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, np.ndarray]:
+        """Return the stored vectors for whichever ``keys`` are present."""
+        found: Dict[str, np.ndarray] = {}
+        with self._lock:
+            for start in range(0, len(keys), _SQLITE_MAX_PARAMS):
+                chunk = list(keys[start : start + _SQLITE_MAX_PARAMS])
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._db.execute(
+                    f"SELECT key, dim, row FROM embeddings WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for key, dim, row in rows:
+                    vector = self._row(dim, row)
+                    if vector is not None:
+                        found[key] = vector
+        return found
+
+    def put_many(self, items: Dict[str, np.ndarray]) -> None:
+        """Append vectors for keys that are not stored yet."""
+        if not items:
+            return
+        with self._lock:
+            # BEGIN IMMEDIATE serializes appends across processes sharing the directory
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                keys = list(items)
+                existing = set()
+                for start in range(0, len(keys), _SQLITE_MAX_PARAMS):
+                    chunk = keys[start : start + _SQLITE_MAX_PARAMS]
+                    placeholders = ",".join("?" * len(chunk))
+                    existing.update(
+                        key
+                        for (key,) in self._db.execute(
+                            f"SELECT key FROM embeddings WHERE key IN ({placeholders})", chunk
+                        )
+                    )
+
+                by_dim: Dict[int, List[str]] = {}
+                for key in keys:
+                    if key not in existing:
+                        by_dim.setdefault(items[key].shape[0], []).append(key)
+
+                for dim, dim_keys in by_dim.items():
+                    row_bytes = dim * 4
+                    with open(self._vector_path(dim), "a+b") as f:
+                        f.seek(0, os.SEEK_END)
+                        size = f.tell()
+                        if size % row_bytes:
+                            # Drop a torn row left behind by an interrupted append
+                            f.truncate(size - size % row_bytes)
+                            size -= size % row_bytes
+                        first_row = size // row_bytes
+                        block = np.stack([items[key] for key in dim_keys]).astype(np.float32)
+                        f.write(block.tobytes())
+                    self._db.executemany(
+                        "INSERT OR IGNORE INTO embeddings (key, dim, row) VALUES (?, ?, ?)",
+                        [(key, dim, first_row + i) for i, key in enumerate(dim_keys)],
+                    )
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+
+    def close(self) -> None:
+        """Close the SQLite index and drop memory maps."""
+        with self._lock:
+            self._maps.clear()
+            self._db.close()
+
+
+class EmbeddingCache:
+    """Two-tier embedding cache for a single model.
+
+    Thread-safe; RagEngine consults it from executor threads.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        disk: Optional[DiskEmbeddingStore] = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            model_name: Embedding model name, part of every cache key.
+            max_bytes: Upper bound on the memory tier's approximate size.
+            disk: Optional persistent tier.
+        """
+        self.model_name = model_name
+        self.max_bytes = max_bytes
+        self._disk = disk
+        self._entries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def get_many(self, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """Return cached embeddings aligned with ``texts`` (None for misses)."""
+        keys = [embedding_cache_key(self.model_name, text) for text in texts]
+        results: List[Optional[List[float]]] = [None] * len(texts)
+        pending: Dict[str, List[int]] = {}
+
+        with self._lock:
+            for i, key in enumerate(keys):
+                vector = self._entries.get(key)
+                if vector is None:
+                    pending.setdefault(key, []).append(i)
+                    continue
+                self._entries.move_to_end(key)
+                results[i] = vector.tolist()
+        memory_hits = len(texts) - sum(len(positions) for positions in pending.values())
+
+        disk_hits = 0
+        if pending and self._disk is not None:
+            try:
+                found = self._disk.get_many(list(pending))
+            except Exception as exc:
+                logger.warning("Embedding disk cache read failed: %s", exc)
+                found = {}
+            if found:
+                with self._lock:
+                    for key, vector in found.items():
+                        self._store_locked(key, vector)
+                for key, vector in found.items():
+                    as_list = vector.tolist()
+                    for i in pending.pop(key):
+                        results[i] = as_list
+                        disk_hits += 1
+
+        misses = sum(len(positions) for positions in pending.values())
+        self._record(memory_hits, disk_hits, misses)
+        return results
+
+    def get(self, text: str) -> Optional[List[float]]:
+        """Return the cached embedding for ``text``, or None."""
+        return self.get_many([text])[0]
+
+    def put_many(
+        self, texts: Sequence[str], embeddings: Sequence[Sequence[float]]
+    ) -> List[List[float]]:
+        """Store freshly computed embeddings in both tiers.
+
+        Returns:
+            The embeddings as stored (float32 precision), so callers hand out
+            the same values on a miss as later hits will.
+        """
+        vectors = [np.asarray(embedding, dtype=np.float32) for embedding in embeddings]
+        items = {
+            embedding_cache_key(self.model_name, text): vector
+            for text, vector in zip(texts, vectors)
+        }
+        with self._lock:
+            for key, vector in items.items():
+                self._store_locked(key, vector)
+        if self._disk is not None:
+            try:
+                self._disk.put_many(items)
+            except Exception as exc:
+                logger.warning("Embedding disk cache write failed: %s", exc)
+        return [vector.tolist() for vector in vectors]
+
+    def put(self, text: str, embedding: Sequence[float]) -> List[float]:
+        """Store a single embedding and return it as stored."""
+        return self.put_many([text], [embedding])[0]
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and memory-tier occupancy."""
+        with self._lock:
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def clear(self) -> None:
+        """Drop the memory tier (the disk tier is left intact)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _store_locked(self, key: str, vector: np.ndarray) -> None:
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= previous.nbytes + _ENTRY_OVERHEAD_BYTES
+        size = vector.nbytes + _ENTRY_OVERHEAD_BYTES
+        if size > self.max_bytes:
+            return
+        self._entries[key] = vector
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.nbytes + _ENTRY_OVERHEAD_BYTES
+
+    def _record(self, memory_hits: int, disk_hits: int, misses: int) -> None:
+        with self._lock:
+            self.memory_hits += memory_hits
+            self.disk_hits += disk_hits
+            self.misses += misses
+        if memory_hits:
+            mcp_metrics.add_counter(
+                "mcp.rag.embedding_cache.hits_total",
+                memory_hits,
+                description="Count of embedding cache hits",
+                attributes={"tier": "memory"},
+            )
+        if disk_hits:
+            mcp_metrics.add_counter(
+                "mcp.rag.embedding_cache.hits_total",
+                disk_hits,
+                description="Count of embedding cache hits",
+                attributes={"tier": "disk"},
+            )
+        if misses:
+            mcp_metrics.add_counter(
+                "mcp.rag.embedding_cache.misses_total",
+                misses,
+                description="Count of embedding cache misses",
+            )
+
+
+def build_embedding_cache(model_name: str) -> Optional[EmbeddingCache]:
+    """Create the embedding cache configured by environment, or None if disabled."""
+    from common.config.env import get_env_bool, get_env_int, get_env_str
+
+    if not get_env_bool("RAG_EMBEDDING_CACHE_ENABLED", True):
+        return None
+
+    max_bytes = get_env_int("RAG_EMBEDDING_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES)
+    disk = None
+    directory = get_env_str("RAG_EMBEDDING_CACHE_DIR")
+    if directory:
+        try:
+            disk = DiskEmbeddingStore(directory)
+        except Exception as exc:
+            logger.warning("Embedding disk cache disabled (%s): %s", directory, exc)
+
+    return EmbeddingCache(model_name, max_bytes=max_bytes, disk=disk)
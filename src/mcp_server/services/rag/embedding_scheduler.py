@@ -0,0 +1,144 @@
+"""Micro-batching scheduler for single-text embedding requests.
+
+Concurrent ``RagEngine.embed_text`` calls each used to run a one-item model
+call on the default executor. The scheduler collects requests for a short
+window (or until the batch is full), runs a single batched model call on a
+dedicated worker thread, and resolves each caller's future. While a batch is
+running, new requests queue up and form the next batch.
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+from common.observability.metrics import mcp_metrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WINDOW_MS = 2.0
+DEFAULT_MAX_BATCH_SIZE = 32
+DEFAULT_MAX_QUEUE = 1024
+
+_Request = Tuple[str, "asyncio.Future[List[float]]", float]
+
+
+class EmbeddingBatcher:
+    """Coalesce concurrent embedding requests into batched model calls."""
+
+    def __init__(
+        self,
+        embed_many: Callable[[List[str]], List[List[float]]],
+        window_ms: float = DEFAULT_WINDOW_MS,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+    ) -> None:
+        """Initialize the batcher.
+
+        Args:
+            embed_many: Blocking function embedding a list of texts, in order.
+            window_ms: How long to wait for more requests after the first one.
+            max_batch_size: Largest batch handed to ``embed_many``.
+            max_queue: Pending requests allowed before callers wait for space.
+        """
+        self._embed_many = embed_many
+        self.window_seconds = max(0.0, window_ms) / 1000.0
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_queue = max(1, max_queue)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rag-embed")
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional["asyncio.Queue[_Request]"] = None
+        self._worker: Optional["asyncio.Task[None]"] = None
+
+    def _ensure_worker(self) -> "asyncio.Queue[_Request]":
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+            self._worker = loop.create_task(self._run(self._queue), name="rag-embedding-batcher")
+        return self._queue
+
+    async def embed(self, text: str) -> List[float]:
+        """Embed ``text`` as part of the next batch."""
+        queue = self._ensure_worker()
+        future: "asyncio.Future[List[float]]" = asyncio.get_running_loop().create_future()
+        await queue.put((text, future, time.monotonic()))
+        return await future
+
+    async def _collect(self, queue: "asyncio.Queue[_Request]") -> List[_Request]:
+        batch = [await queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.window_seconds
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - loop.time()
+            try:
+                if remaining <= 0:
+                    batch.append(queue.get_nowait())
+                else:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+            except (asyncio.QueueEmpty, asyncio.TimeoutError):
+                break
+        return batch
+
+    async def _run(self, queue: "asyncio.Queue[_Request]") -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect(queue)
+            # Callers that were cancelled while queued do not need a result
+            batch = [request for request in batch if not request[1].done()]
+            if not batch:
+                continue
+
+            started = time.monotonic()
+            for _, _, enqueued in batch:
+                mcp_metrics.record_histogram(
+                    "mcp.rag.embedding_batch.queue_ms",
+                    (started - enqueued) * 1000.0,
+                    description="Time an embedding request waited for its batch",
+                    unit="ms",
+                )
+            mcp_metrics.record_histogram(
+                "mcp.rag.embedding_batch.size",
+                len(batch),
+                description="Number of texts per batched embedding call",
+            )
+
+            texts = [text for text, _, _ in batch]
+            try:
+                vectors = await loop.run_in_executor(self._executor, self._embed_many, texts)
+            except Exception as exc:
+                logger.warning("Batched embedding of %d texts failed: %s", len(texts), exc)
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+
+            if len(vectors) != len(batch):
+                exc = RuntimeError(
+                    f"Embedding model returned {len(vectors)} vectors for {len(batch)} texts"
+                )
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+
+            for (_, future, _), vector in zip(batch, vectors):
+                if not future.done():
+                    future.set_result(vector)
+
+
+def build_embedding_batcher(
+    embed_many: Callable[[List[str]], List[List[float]]],
+) -> Optional[EmbeddingBatcher]:
+    """Create the batcher configured by environment, or None if disabled."""
+    from common.config.env import get_env_bool, get_env_float, get_env_int
+
+    if not get_env_bool("RAG_EMBED_BATCH_ENABLED", True):
+        return None
+    return EmbeddingBatcher(
+        embed_many,
+        window_ms=get_env_float("RAG_EMBED_BATCH_WINDOW_MS", DEFAULT_WINDOW_MS),
+        max_batch_size=get_env_int("RAG_EMBED_BATCH_MAX_SIZE", DEFAULT_MAX_BATCH_SIZE),
+        max_queue=get_env_int("RAG_EMBED_BATCH_MAX_QUEUE", DEFAULT_MAX_QUEUE),
+    )
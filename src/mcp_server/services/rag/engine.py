@@ -1,23 +1,36 @@
 """RAG Engine for semantic schema retrieval."""
 
 import asyncio
+import os
+import tempfile
 from typing import Optional
 
 import numpy as np
 from fastembed import TextEmbedding
 
 from common.interfaces.vector_index import VectorIndex
+from common.utils.run_embeddings import run_embedding_memo
 from dal.feature_flags import experimental_features_enabled
 from dal.type_normalization import normalize_type_for_display
 from ingestion.vector_indexes.factory import create_vector_index
 
+from .embedding_cache import EmbeddingCache, build_embedding_cache
+from .embedding_scheduler import EmbeddingBatcher, build_embedding_batcher
 from .schema_loader import SchemaLoader
 
+# RagEngine serves a single embedding model per process
+RAG_EMBEDDING_MEMO_NAMESPACE = "rag_engine"
+
 
 class RagEngine:
     """Manages embedding model lifecycle and vector generation."""
 
     _model: Optional[TextEmbedding] = None
+    _model_name: Optional[str] = None
+    _embedding_cache: Optional[EmbeddingCache] = None
+    _batcher: Optional[EmbeddingBatcher] = None
+    # True once build_embedding_batcher ran, so a disabled batcher is not rebuilt
+    _batcher_resolved: bool = False
 
     @classmethod
     def _get_model(cls):
@@ -29,51 +42,80 @@ class RagEngine:
 
             if provider == "mock":
                 cls._model = MockEmbeddingModel()
+                cls._model_name = "mock"
                 print("✓ Embedding model loaded: MockEmbeddingModel")
             else:
                 # BAAI/bge-small-en-v1.5: 384 dimensions, optimized for retrieval
                 cls._model = TextEmbedding(model_name="BAAI/bge-small-en-v1.5")
+                cls._model_name = "BAAI/bge-small-en-v1.5"
                 print("✓ Embedding model loaded: BAAI/bge-small-en-v1.5")
+
+            # Cache entries live as long as the model they were computed by
+            cls._embedding_cache = build_embedding_cache(cls._model_name)
         return cls._model
 
+    @classmethod
+    def get_embedding_cache_stats(cls) -> Optional[dict]:
+        """Return embedding cache hit/miss counters, or None if caching is off."""
+        cache = cls._embedding_cache
+        return cache.stats() if cache is not None else None
+
     @classmethod
     async def embed_text(cls, text: str) -> list[float]:
-        """Generate embedding vector for a text string."""
+        """Generate embedding vector for a text string.
 
-        def _embed():
-            model = cls._get_model()
-            # Handle different model interfaces if necessary
-            if isinstance(model, MockEmbeddingModel):
-                return list(model.embed([text]))[0]
+        Within an agent run the result is memoized, so every tool that embeds
+        the user's question reuses the first computation.
+        """
+        return await run_embedding_memo.get_or_compute(
+            RAG_EMBEDDING_MEMO_NAMESPACE, text, lambda: cls._embed_text(text)
+        )
 
-            # fastembed returns an iterator, convert to list
-            embedding = list(model.embed([text]))[0]
-            if hasattr(embedding, "tolist"):
-                return embedding.tolist()
-            return embedding
+    @classmethod
+    async def _embed_text(cls, text: str) -> list[float]:
+        if not cls._batcher_resolved:
+            cls._batcher = build_embedding_batcher(cls._embed_many)
+            cls._batcher_resolved = True
+        if cls._batcher is not None:
+            return await cls._batcher.embed(text)
 
         loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, _embed)
+        return (await loop.run_in_executor(None, cls._embed_many, [text]))[0]
 
     @classmethod
     async def embed_batch(cls, texts: list[str]) -> list[list[float]]:
-        """Generate embeddings for multiple texts efficiently."""
-
-        def _embed_batch():
-            model = cls._get_model()
-            embeddings = list(model.embed(texts))
-
-            # Convert to list of lists
-            results = []
-            for emb in embeddings:
-                if hasattr(emb, "tolist"):
-                    results.append(emb.tolist())
-                else:
-                    results.append(emb)
-            return results
+        """Generate embeddings for multiple texts efficiently.
 
+        Only texts missing from the embedding cache are sent to the model.
+        """
         loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, _embed_batch)
+        return await loop.run_in_executor(None, cls._embed_many, texts)
+
+    @classmethod
+    def _embed_many(cls, texts: list[str]) -> list[list[float]]:
+        """Embed ``texts`` (blocking), consulting the embedding cache first."""
+        model = cls._get_model()
+        cache = cls._embedding_cache
+        if cache is None:
+            return _to_lists(model.embed(texts))
+
+        results = cache.get_many(texts)
+        missing = list(dict.fromkeys(t for t, r in zip(texts, results) if r is None))
+        if missing:
+            computed = dict(zip(missing, cache.put_many(missing, _to_lists(model.embed(missing)))))
+            results = [r if r is not None else computed[t] for t, r in zip(texts, results)]
+        return results
+
+
+def _to_lists(embeddings) -> list[list[float]]:
+    """Convert model output (arrays or lists) to a list of lists."""
+    results = []
+    for emb in embeddings:
+        if hasattr(emb, "tolist"):
+            results.append(emb.tolist())
+        else:
+            results.append(emb)
+    return results
 
 
 class MockEmbeddingModel:
@@ -167,16 +209,33 @@ def format_vector_for_postgres(embedding: list[float]) -> str:
 
 _schema_index: Optional[VectorIndex] = None
 
+SCHEMA_INDEX_SNAPSHOT_NAME = "schema_index.hnsw"
+SCHEMA_INDEX_FINGERPRINT_NAME = "schema_index.fingerprint"
+
 
 async def _get_schema_index() -> VectorIndex:
     """
     Get or create the schema vector index.
 
     Implements lazy loading to avoid blocking server startup.
-    The index is populated from the database using SchemaLoader.
+    When RAG_SCHEMA_INDEX_SNAPSHOT_DIR is set, the index is restored from an
+    on-disk snapshot if the SchemaStore fingerprint still matches; otherwise it
+    is populated from the database using SchemaLoader and re-snapshotted.
     """
     global _schema_index
     if _schema_index is None:
+        from common.config.env import get_env_str
+
+        snapshot_dir = get_env_str("RAG_SCHEMA_INDEX_SNAPSHOT_DIR")
+        fingerprint = await _fetch_schema_fingerprint() if snapshot_dir else None
+
+        if fingerprint:
+            restored = _load_schema_index_snapshot(snapshot_dir, fingerprint)
+            if restored is not None:
+                _schema_index = restored
+                print("✓ Restored Schema Vector Index from snapshot")
+                return _schema_index
+
         # Create persistent HNSW index (in-memory, backed by DB via loader)
         # Using 384 dimensions for BGE-small
         _schema_index = create_vector_index(dim=384)
@@ -190,9 +249,65 @@ async def _get_schema_index() -> VectorIndex:
             print(f"Error loading schemas: {e}")
             raise e
 
+        if fingerprint:
+            _save_schema_index_snapshot(_schema_index, snapshot_dir, fingerprint)
+
     return _schema_index
 
 
+async def _fetch_schema_fingerprint() -> Optional[str]:
+    """Read the SchemaStore fingerprint, or None if unsupported or unavailable."""
+    from dal.database import Database
+
+    store = Database.get_schema_store()
+    fetch = getattr(store, "fetch_schema_fingerprint", None)
+    if fetch is None:
+        return None
+    try:
+        return await fetch()
+    except Exception as e:
+        print(f"Warning: could not read schema fingerprint: {e}")
+        return None
+
+
+def _load_schema_index_snapshot(snapshot_dir: str, fingerprint: str) -> Optional[VectorIndex]:
+    """Load the schema index snapshot if it was written for ``fingerprint``."""
+    fingerprint_path = os.path.join(snapshot_dir, SCHEMA_INDEX_FINGERPRINT_NAME)
+    try:
+        with open(fingerprint_path, encoding="utf-8") as f:
+            if f.read().strip() != fingerprint:
+                return None
+        index = create_vector_index()
+        index.load(os.path.join(snapshot_dir, SCHEMA_INDEX_SNAPSHOT_NAME))
+        return index
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Warning: ignoring unreadable schema index snapshot: {e}")
+        return None
+
+
+def _save_schema_index_snapshot(index: VectorIndex, snapshot_dir: str, fingerprint: str) -> None:
+    """Persist the schema index and tag it with the fingerprint it was built from."""
+    try:
+        os.makedirs(snapshot_dir, exist_ok=True)
+        index.save(os.path.join(snapshot_dir, SCHEMA_INDEX_SNAPSHOT_NAME))
+        fingerprint_path = os.path.join(snapshot_dir, SCHEMA_INDEX_FINGERPRINT_NAME)
+        descriptor, tmp_path = tempfile.mkstemp(
+            dir=snapshot_dir, prefix=f"{SCHEMA_INDEX_FINGERPRINT_NAME}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(descriptor, "w", encoding="utf-8") as f:
+                f.write(fingerprint)
+            os.replace(tmp_path, fingerprint_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+    except Exception as e:
+        print(f"Warning: could not write schema index snapshot: {e}")
+
+
 async def reload_schema_index() -> None:
     """Force reload the schema index from the database."""
     global _schema_index
@@ -200,6 +315,32 @@ async def reload_schema_index() -> None:
     await _get_schema_index()
 
 
+async def upsert_schema_embeddings(schema_embeddings: list) -> None:
+    """Apply new or changed table embeddings to the loaded schema index in place.
+
+    Cost is proportional to the number of tables passed in. If the index has
+    not been loaded yet this is a no-op: the lazy load reads the updated rows
+    from the SchemaStore.
+
+    Args:
+        schema_embeddings: SchemaEmbedding rows that were just saved.
+    """
+    index = _schema_index
+    if index is None or not schema_embeddings:
+        return
+
+    vectors = np.array([schema.embedding for schema in schema_embeddings], dtype=np.float32)
+    ids = [schema.table_name for schema in schema_embeddings]
+    metadata = {
+        schema.table_name: {
+            "table_name": schema.table_name,
+            "schema_text": schema.schema_text,
+        }
+        for schema in schema_embeddings
+    }
+    index.replace_items(vectors, ids, metadata=metadata)
+
+
 async def search_similar_tables(
     query_embedding: list[float],
     limit: int = 5,
@@ -236,3 +377,40 @@ async def search_similar_tables(
         )
 
     return structured_results
+
+
+async def search_similar_tables_batch(
+    query_embeddings: list[list[float]],
+    limit: int = 5,
+) -> list[list[dict]]:
+    """
+    Search for similar tables for many query embeddings in one index call.
+
+    Args:
+        query_embeddings: Embedding vectors, one per query.
+        limit: Maximum number of results per query.
+
+    Returns:
+        One list per query of dicts with 'table_name', 'schema_text', 'distance'.
+    """
+    if not query_embeddings:
+        return []
+
+    index = await _get_schema_index()
+
+    query_matrix = np.array(query_embeddings, dtype=np.float32)
+    batch = index.search_batch(query_matrix, k=limit)
+    metadata = batch.metadata or {}
+
+    return [
+        [
+            {
+                "table_name": str(table_id),
+                "schema_text": (metadata.get(table_id) or {}).get("schema_text", ""),
+                "distance": 1.0 - float(score),
+            }
+            for table_id, score in zip(ids_row, scores_row)
+            if table_id is not None
+        ]
+        for ids_row, scores_row in zip(batch.ids, batch.scores)
+    ]
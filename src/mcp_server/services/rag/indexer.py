@@ -2,7 +2,10 @@
 
 import mcp_server.services.rag
 from dal.database import Database
+from dal.postgres.registry_events import EVENT_SCHEMA, publish_registry_event
 from mcp_server.models import SchemaEmbedding
+from mcp_server.services.cache.result_cache import clear_result_cache
+from mcp_server.services.rag.catalog_snapshot import record_catalog
 
 from .engine import RagEngine, generate_schema_document
 
@@ -16,6 +19,9 @@ async def index_all_tables():
     2. Generates enriched schema documents
     3. Creates embeddings
     4. Saves to SchemaStore
+    5. Upserts the new embeddings into the live schema index
+    6. Records the catalog fingerprint served by get_schema_snapshot_id
+    7. Announces the schema change to registry caches
     """
     introspector = Database.get_schema_introspector()
     store = Database.get_schema_store()
@@ -23,9 +29,13 @@ async def index_all_tables():
     table_names = await introspector.list_table_names()
     print(f"Indexing {len(table_names)} tables...")
 
+    indexed = []
+    table_defs = []
+
     for table_name in table_names:
         # Get full definition
         table_def = await introspector.get_table_def(table_name)
+        table_defs.append(table_def)
 
         # Convert canonical types to dicts for RagEngine
         # (RagEngine code stays as is, accepting generic dicts for flexibility)
@@ -55,10 +65,18 @@ async def index_all_tables():
         )
 
         await store.save_schema_embedding(schema_embedding)
+        indexed.append(schema_embedding)
         print(f"  ✓ Indexed: {table_name}")
 
     print(f"✓ Schema indexing complete: {len(table_names)} tables indexed")
 
-    # Reload the in-memory vector index to reflect changes
-    await mcp_server.services.rag.reload_schema_index()
-    print("✓ Schema index reloaded")
+    # Apply the re-embedded tables to the in-memory vector index in place
+    await mcp_server.services.rag.upsert_schema_embeddings(indexed)
+    print("✓ Schema index updated")
+
+    snapshot = record_catalog(table_defs)
+    print(f"✓ Schema catalog snapshot: {snapshot.snapshot_id}")
+
+    # Cached SQL and results were produced against the previous schema snapshot
+    await publish_registry_event(EVENT_SCHEMA)
+    clear_result_cache()
@@ -4,6 +4,7 @@ from datetime import datetime, timezone
 from typing import Any, List, Optional
 
 from common.sanitization import sanitize_text
+from common.utils.run_embeddings import embedding_scope
 from mcp_server.models import QueryPair
 from mcp_server.services.recommendation.config import RECO_CONFIG
 from mcp_server.services.recommendation.explanation import (
@@ -51,6 +52,19 @@ class RecommendationService:
         4. Rank, Dedupe, and Apply Diversity to remaining candidates.
         5. Fallback if insufficient.
         """
+        # The approved, seeded and fallback lookups all embed the same question
+        with embedding_scope():
+            return await RecommendationService._recommend_examples(
+                question, tenant_id, limit, enable_fallback
+            )
+
+    @staticmethod
+    async def _recommend_examples(
+        question: str,
+        tenant_id: int,
+        limit: int,
+        enable_fallback: bool,
+    ) -> RecommendationResult:
         # 0. Initialize Explanation
         explanation = RecommendationExplanation()
 
@@ -1,5 +1,5 @@
 """Unified Registry Service package."""
 
-from .service import RegistryService
+from .service import BulkRegistrationOutcome, RegistryService
 
-__all__ = ["RegistryService"]
+__all__ = ["BulkRegistrationOutcome", "RegistryService"]
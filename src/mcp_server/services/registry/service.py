@@ -1,5 +1,7 @@
+import hashlib
 import logging
-from typing import List, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
 
 from dal.factory import get_registry_store
 from mcp_server.models import QueryPair
@@ -8,6 +10,28 @@ from mcp_server.services.rag import RagEngine
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BULK_BATCH_SIZE = 500
+
+
+@dataclass
+class BulkRegistrationOutcome:
+    """Result of registering one pair via ``register_pairs_bulk``.
+
+    ``status`` is "inserted", "updated", "duplicate" (superseded by a later
+    pair with the same signature in the same call), or "error".
+    """
+
+    index: int
+    status: str
+    signature_key: Optional[str] = None
+    pair: Optional[QueryPair] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Return True if the pair is stored in the registry."""
+        return self.status in ("inserted", "updated")
+
 
 class RegistryService:
     """Unified Registry Service for NLQ-SQL pairs.
@@ -37,8 +61,6 @@ class RegistryService:
         # Fallback to raw question hash if canonicalization is disabled or fails
         # This prevents collisions in the registry when SpaCy is unavailable
         if not fingerprint:
-            import hashlib
-
             signature_key = hashlib.sha256(question.lower().strip().encode()).hexdigest()
             fingerprint = f"RAW:{question.lower().strip()}"
 
@@ -67,15 +89,102 @@ class RegistryService:
         return pair
 
     @staticmethod
-    async def lookup_canonical(question: str, tenant_id: int) -> Optional[QueryPair]:
-        """Fetch a specific pair by its canonical signature."""
+    async def register_pairs_bulk(
+        pairs: List[Dict[str, Any]], batch_size: int = DEFAULT_BULK_BATCH_SIZE
+    ) -> List[BulkRegistrationOutcome]:
+        """Register many NLQ-SQL pairs with batched canonicalization, embedding and writes.
+
+        Each item takes the keyword arguments of ``register_pair``. A failing
+        batch marks only its own rows as errors.
+
+        Returns:
+            One outcome per input item, in input order.
+        """
+        canonicalizer = CanonicalizationService.get_instance()
+        store = get_registry_store()
+        outcomes: List[BulkRegistrationOutcome] = []
+
+        for start in range(0, len(pairs), batch_size):
+            chunk = pairs[start : start + batch_size]
+            try:
+                questions = [item["question"] for item in chunk]
+                canonical = await canonicalizer.process_queries(questions)
+                embeddings = await RagEngine.embed_batch(questions)
+            except Exception as e:
+                logger.warning(f"Bulk registration batch at {start} failed: {e}")
+                outcomes.extend(
+                    BulkRegistrationOutcome(index=start + i, status="error", error=str(e))
+                    for i in range(len(chunk))
+                )
+                continue
+
+            models = []
+            for item, (_, fingerprint, signature_key), embedding in zip(
+                chunk, canonical, embeddings
+            ):
+                question = item["question"]
+                if not fingerprint:
+                    signature_key = hashlib.sha256(question.lower().strip().encode()).hexdigest()
+                    fingerprint = f"RAW:{question.lower().strip()}"
+                models.append(
+                    QueryPair(
+                        signature_key=signature_key,
+                        tenant_id=item["tenant_id"],
+                        fingerprint=fingerprint,
+                        question=question,
+                        sql_query=item["sql_query"],
+                        embedding=embedding,
+                        roles=item["roles"],
+                        status=item.get("status", "unverified"),
+                        metadata=item.get("metadata") or {},
+                        performance=item.get("performance") or {},
+                    )
+                )
+
+            try:
+                statuses = await store.store_pairs(models)
+            except Exception as e:
+                logger.warning(f"Bulk registration batch at {start} failed: {e}")
+                statuses = ["error"] * len(models)
+                error = str(e)
+            else:
+                error = None
+
+            outcomes.extend(
+                BulkRegistrationOutcome(
+                    index=start + i,
+                    status=status,
+                    signature_key=pair.signature_key,
+                    pair=pair,
+                    error=error,
+                )
+                for i, (pair, status) in enumerate(zip(models, statuses))
+            )
+
+        stored = sum(1 for outcome in outcomes if outcome.ok)
+        logger.info(f"✓ Bulk registered {stored}/{len(pairs)} QueryPairs")
+        return outcomes
+
+    @staticmethod
+    async def compute_signature_key(question: str) -> str:
+        """Return the canonical signature key ``question`` is registered under."""
         canonicalizer = CanonicalizationService.get_instance()
         _, fingerprint, signature_key = await canonicalizer.process_query(question)
 
         if not fingerprint:
-            import hashlib
-
             signature_key = hashlib.sha256(question.lower().strip().encode()).hexdigest()
+        return signature_key
+
+    @staticmethod
+    async def lookup_canonical(
+        question: str, tenant_id: int, signature_key: Optional[str] = None
+    ) -> Optional[QueryPair]:
+        """Fetch a specific pair by its canonical signature.
+
+        Pass ``signature_key`` when the caller already canonicalized ``question``.
+        """
+        if signature_key is None:
+            signature_key = await RegistryService.compute_signature_key(question)
 
         store = get_registry_store()
         return await store.lookup_by_signature(signature_key, tenant_id)
@@ -88,9 +197,14 @@ class RegistryService:
         limit: int = 5,
         role: Optional[str] = None,
         status: Optional[str] = None,
+        embedding: Optional[List[float]] = None,
     ) -> List[QueryPair]:
-        """Search for semantically similar pairs."""
-        embedding = await RagEngine.embed_text(question)
+        """Search for semantically similar pairs.
+
+        Pass ``embedding`` when the caller already embedded ``question``.
+        """
+        if embedding is None:
+            embedding = await RagEngine.embed_text(question)
         store = get_registry_store()
         return await store.lookup_semantic_candidates(
             embedding, tenant_id, threshold=threshold, limit=limit, role=role, status=status
@@ -98,14 +212,17 @@ class RegistryService:
 
     @staticmethod
     async def get_few_shot_examples(
-        question: str, tenant_id: int, limit: int = 3
+        question: str,
+        tenant_id: int,
+        limit: int = 3,
+        embedding: Optional[List[float]] = None,
     ) -> List[QueryPair]:
         """Retrieve verified few-shot examples for a question."""
         # We look for 'example' role with 'verified' status
         # Note: Semantic lookup doesn't currently filter by status in the DAL call,
         # but we could add it or filter locally.
         candidates = await RegistryService.lookup_semantic(
-            question, tenant_id, threshold=0.70, limit=limit, role="example"
+            question, tenant_id, threshold=0.70, limit=limit, role="example", embedding=embedding
         )
 
         # Ensure they are verified if we want high trust
@@ -64,31 +64,34 @@ async def _process_seed_data(base_path: Path):
     skipped_error = 0
 
     print(f"Processing {len(items)} items from {base_path}...")
-    for item in items:
-        try:
-            # Register in Unified Registry with both 'example' and 'golden' roles
-            await RegistryService.register_pair(
-                question=item["question"],
-                sql_query=item["query"],
-                tenant_id=item.get("tenant_id", 1),
-                roles=["example", "golden"],
-                status="verified",
-                metadata={
+    # Register in Unified Registry with both 'example' and 'golden' roles
+    outcomes = await RegistryService.register_pairs_bulk(
+        [
+            {
+                "question": item["question"],
+                "sql_query": item["query"],
+                "tenant_id": item.get("tenant_id", 1),
+                "roles": ["example", "golden"],
+                "status": "verified",
+                "metadata": {
                     "category": item.get("category"),
                     "difficulty": item.get("difficulty", "medium"),
                     "expected_row_count": item.get("expected_row_count"),
                 },
-            )
+            }
+            for item in items
+        ]
+    )
+    for item, outcome in zip(items, outcomes):
+        if outcome.ok:
             registered += 1
-        except Exception as e:
-            error_str = str(e).lower()
-            # Detect duplicate/unique constraint violations (idempotency)
-            if "duplicate" in error_str or "unique" in error_str or "conflict" in error_str:
-                skipped_duplicate += 1
-            else:
-                skipped_error += 1
-                question_preview = item.get("question", "unknown")[:50]
-                print(f"  ⚠ Error registering '{question_preview}...': {e}")
+        elif outcome.status == "duplicate":
+            # Same signature seeded again later in the set (idempotency)
+            skipped_duplicate += 1
+        else:
+            skipped_error += 1
+            question_preview = item.get("question", "unknown")[:50]
+            print(f"  ⚠ Error registering '{question_preview}...': {outcome.error}")
 
     print(
         f"✓ Seeding complete: {registered} registered, "
@@ -143,6 +146,14 @@ async def main():
                 # 1. Seed Few-Shot Examples & Golden Dataset (Write to Registry via RegistryService)
                 await _process_seed_data(Path("/app/queries"))
 
+                # Per-role ANN indexes for registry/semantic-cache lookups (idempotent)
+                from ingestion.vector_index_ddl import ensure_query_pair_embedding_indexes
+
+                try:
+                    await ensure_query_pair_embedding_indexes(conn_control)
+                except Exception as e:
+                    print(f"⚠ Failed to ensure query_pairs vector indexes: {e}")
+
                 # 2. Seed Table Summaries (Read Main, Write Control)
                 await _seed_table_summaries(conn_main, conn_control, Path("/app/queries"))
 
@@ -30,6 +30,7 @@ from mcp_server.tools.execute_sql_query import handler as execute_sql_query_hand
 from mcp_server.tools.feedback import submit_feedback as submit_feedback_handler
 from mcp_server.tools.get_few_shot_examples import handler as get_few_shot_examples_handler
 from mcp_server.tools.get_sample_data import handler as get_sample_data_handler
+from mcp_server.tools.get_schema_snapshot_id import handler as get_schema_snapshot_id_handler
 from mcp_server.tools.get_semantic_definitions import handler as get_semantic_definitions_handler
 from mcp_server.tools.get_semantic_subgraph import handler as get_semantic_subgraph_handler
 from mcp_server.tools.get_table_schema import handler as get_table_schema_handler
@@ -56,6 +57,7 @@ __all__ = [
     "search_relevant_tables_handler",
     "get_semantic_subgraph_handler",
     "get_semantic_definitions_handler",
+    "get_schema_snapshot_id_handler",
     # Execution tools
     "execute_sql_query_handler",
     # Validation tools
@@ -50,21 +50,29 @@ async def handler(limit: int = 10) -> str:
     results = {"total": len(approved), "published": 0, "errors": []}
     execution_time_ms = (time.monotonic() - start_time) * 1000
 
-    for item in approved:
-        try:
-            # Register in Unified Registry as 'example' + 'verified'
-            await RegistryService.register_pair(
-                question=item["user_nlq_text"],
-                sql_query=item["corrected_sql"],
-                tenant_id=item["tenant_id"],
-                roles=["example"],
-                status="verified",
-                metadata={
+    # Register in Unified Registry as 'example' + 'verified'
+    outcomes = await RegistryService.register_pairs_bulk(
+        [
+            {
+                "question": item["user_nlq_text"],
+                "sql_query": item["corrected_sql"],
+                "tenant_id": item["tenant_id"],
+                "roles": ["example"],
+                "status": "verified",
+                "metadata": {
                     "interaction_id": item["interaction_id"],
                     "resolution_type": item["resolution_type"],
                     "source": "user_feedback",
                 },
-            )
+            }
+            for item in approved
+        ]
+    )
+
+    for item, outcome in zip(approved, outcomes):
+        try:
+            if outcome.status == "error":
+                raise RuntimeError(outcome.error)
 
             # Mark as PUBLISHED in review queue
             await f_store.set_published_status(item["interaction_id"])
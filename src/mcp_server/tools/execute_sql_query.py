@@ -8,7 +8,7 @@ import logging
 import time
 from dataclasses import dataclass
 from types import SimpleNamespace
-from typing import Any, Dict, List, Literal, Optional, Sequence
+from typing import Any, Dict, Iterator, List, Literal, Mapping, Optional, Sequence
 
 import asyncpg
 from opentelemetry import trace
@@ -21,6 +21,7 @@ from common.models.error_metadata import ErrorCategory
 from common.models.tool_envelopes import ExecuteSQLQueryMetadata, ExecuteSQLQueryResponseEnvelope
 from common.observability.metrics import mcp_metrics
 from common.security.tenant_enforcement_policy import PolicyDecision
+from common.sql.ast_cache import parse_sql, parse_sql_one
 from common.sql.complexity import (
     ComplexityMetrics,
     analyze_sql_complexity,
@@ -28,6 +29,7 @@ from common.sql.complexity import (
     get_mcp_complexity_limits,
 )
 from common.sql.dialect import normalize_sqlglot_dialect
+from common.sql.facts import get_sql_facts
 from dal.capability_negotiation import (
     CapabilityNegotiationResult,
     negotiate_capability_request,
@@ -47,6 +49,7 @@ from dal.execution_budget import (
     rows_remaining_bucket,
 )
 from dal.execution_resource_limits import ExecutionResourceLimits
+from dal.feature_flags import columnar_results_enabled
 from dal.offset_pagination import (
     OffsetPaginationTokenError,
     build_cursor_query_fingerprint,
@@ -93,12 +96,14 @@ from dal.postgres_sandbox import (
     SANDBOX_FAILURE_REASON_ALLOWLIST,
     build_postgres_sandbox_metadata,
 )
+from dal.query_result import ColumnarRows
 from dal.resource_containment import (
     ResourceContainmentPolicyError,
     enforce_byte_limit,
     enforce_row_limit,
     validate_resource_capabilities,
 )
+from dal.result_spool import ResultSpoolStore, get_result_spool_store, result_spool_enabled
 from dal.session_guardrails import (
     RESTRICTED_SESSION_MODE_OFF,
     SESSION_GUARDRAIL_SKIPPED,
@@ -108,6 +113,7 @@ from dal.session_guardrails import (
 from dal.util.column_metadata import build_column_meta
 from dal.util.row_limits import get_sync_max_rows
 from dal.util.timeouts import run_with_timeout
+from mcp_server.services.cache.result_cache import build_result_cache_key, get_result_cache
 from mcp_server.utils.provider import resolve_provider
 
 TOOL_NAME = "execute_sql_query"
@@ -471,7 +477,9 @@ def _tenant_enforcement_observability_fields(
     return mode, outcome, applied, reason_code
 
 
-def _record_tenant_enforcement_observability(metadata: dict[str, Any] | None) -> None:
+def _record_tenant_enforcement_observability(
+    metadata: dict[str, Any] | None, *, cache_hit: bool = False
+) -> None:
     mode, outcome, applied, reason_code = _tenant_enforcement_observability_fields(metadata)
 
     span = trace.get_current_span()
@@ -490,6 +498,8 @@ def _record_tenant_enforcement_observability(metadata: dict[str, Any] | None) ->
     }
     if reason_code is not None:
         metric_attributes["reason_code"] = reason_code
+    if cache_hit:
+        metric_attributes["result_cache_hit"] = True
     mcp_metrics.add_counter(
         "mcp.tenant_enforcement.outcome_total",
         description="Count of execute_sql_query tenant enforcement outcomes",
@@ -537,7 +547,9 @@ def _session_guardrail_observability_fields(
     )
 
 
-def _record_session_guardrail_observability(metadata: dict[str, Any] | None) -> None:
+def _record_session_guardrail_observability(
+    metadata: dict[str, Any] | None, *, cache_hit: bool = False
+) -> None:
     (
         applied,
         outcome,
@@ -569,6 +581,8 @@ def _record_session_guardrail_observability(metadata: dict[str, Any] | None) ->
         metric_attributes["execution_role_name"] = execution_role_name
     if capability_mismatch is not None:
         metric_attributes["capability_mismatch"] = capability_mismatch
+    if cache_hit:
+        metric_attributes["result_cache_hit"] = True
     mcp_metrics.add_counter(
         "mcp.session_guardrail.outcome_total",
         description="Count of execute_sql_query Postgres session guardrail outcomes",
@@ -651,7 +665,9 @@ def _sandbox_observability_fields(
     )
 
 
-def _record_sandbox_observability(metadata: dict[str, Any] | None) -> None:
+def _record_sandbox_observability(
+    metadata: dict[str, Any] | None, *, cache_hit: bool = False
+) -> None:
     (
         applied,
         outcome,
@@ -673,19 +689,22 @@ def _record_sandbox_observability(metadata: dict[str, Any] | None) -> None:
         span.set_attribute("db.session.reset_attempted", reset_attempted)
         span.set_attribute("db.session.reset_outcome", reset_outcome)
 
+    metric_attributes: dict[str, Any] = {
+        "tool_name": TOOL_NAME,
+        "applied": applied,
+        "sandbox_outcome": outcome,
+        "rollback": rollback,
+        "failure_reason": failure_reason,
+        "db_failure_reason": db_failure_reason or "none",
+        "session_reset_attempted": reset_attempted,
+        "session_reset_outcome": reset_outcome,
+    }
+    if cache_hit:
+        metric_attributes["result_cache_hit"] = True
     mcp_metrics.add_counter(
         "mcp.postgres.sandbox.outcome_total",
         description="Count of execute_sql_query Postgres sandbox execution outcomes",
-        attributes={
-            "tool_name": TOOL_NAME,
-            "applied": applied,
-            "sandbox_outcome": outcome,
-            "rollback": rollback,
-            "failure_reason": failure_reason,
-            "db_failure_reason": db_failure_reason or "none",
-            "session_reset_attempted": reset_attempted,
-            "session_reset_outcome": reset_outcome,
-        },
+        attributes=metric_attributes,
     )
 
 
@@ -1841,7 +1860,6 @@ def _record_keyset_schema_observability(metadata: dict[str, Any] | None) -> None
 
 def _query_contains_limit_or_offset(sql: str, provider: str) -> bool:
     """Return True when SQL explicitly includes LIMIT/OFFSET clauses."""
-    import sqlglot
     import sqlglot.expressions as exp
 
     from common.sql.comments import strip_sql_comments
@@ -1849,7 +1867,7 @@ def _query_contains_limit_or_offset(sql: str, provider: str) -> bool:
     normalized_sql = strip_sql_comments(sql)
     dialect = normalize_sqlglot_dialect(provider)
     try:
-        expressions = sqlglot.parse(normalized_sql, read=dialect)
+        expressions = parse_sql(normalized_sql, dialect, copy=False)
     except Exception:
         # Fail closed for pagination wrapper eligibility checks.
         return True
@@ -1859,6 +1877,26 @@ def _query_contains_limit_or_offset(sql: str, provider: str) -> bool:
     return expression.find(exp.Limit) is not None or expression.find(exp.Offset) is not None
 
 
+async def _read_offset_page_from_spool(
+    spool_store: ResultSpoolStore,
+    *,
+    session_id: str | None,
+    tenant_id: Any,
+    query_fingerprint: str,
+    offset: int,
+    limit: int,
+) -> list[dict[str, Any]] | None:
+    """Return an offset page from the session's result spool, or None to execute the query."""
+    spool = spool_store.get(session_id, tenant_id=tenant_id, query_fingerprint=query_fingerprint)
+    if spool is None or not spool.covers(offset, limit):
+        return None
+    try:
+        return await asyncio.to_thread(spool.read, offset, limit)
+    except OSError:
+        # The spool expired or was revoked while being read.
+        return None
+
+
 def _normalize_partial_reason(reason: str | None) -> str | None:
     if not isinstance(reason, str):
         return None
@@ -1868,17 +1906,24 @@ def _normalize_partial_reason(reason: str | None) -> str | None:
     return None
 
 
-def _rolling_average_row_size_bytes(rows: Sequence[dict[str, Any]]) -> int | None:
+def _json_row_sizes(rows: Sequence[Mapping[str, Any]]) -> Iterator[int]:
+    if isinstance(rows, ColumnarRows):
+        yield from rows.json_row_sizes()
+        return
+    for row in rows:
+        try:
+            yield len(json.dumps(row, default=str, separators=(",", ":")).encode("utf-8"))
+        except Exception:
+            yield 0
+
+
+def _rolling_average_row_size_bytes(rows: Sequence[Mapping[str, Any]]) -> int | None:
     """Estimate average serialized row size using a stable rolling average."""
     if not rows:
         return None
     running_average = 0.0
     observed = 0
-    for row in rows:
-        try:
-            row_size = len(json.dumps(row, default=str, separators=(",", ":")).encode("utf-8"))
-        except Exception:
-            row_size = 0
+    for row_size in _json_row_sizes(rows):
         observed += 1
         running_average += (float(row_size) - running_average) / float(observed)
     return max(1, int(round(running_average)))
@@ -2600,7 +2645,7 @@ def _validate_sql_ast_failure(sql: str, provider: str) -> Optional[SQLASTValidat
     stripped_sql = strip_sql_comments(sql)
 
     try:
-        expressions = sqlglot.parse(stripped_sql, read=dialect)
+        expressions = parse_sql(stripped_sql, dialect, copy=False)
         if not expressions:
             return SQLASTValidationFailure(
                 message="Empty or invalid SQL query.",
@@ -2627,7 +2672,8 @@ def _validate_sql_ast_failure(sql: str, provider: str) -> Optional[SQLASTValidat
             classify_sql_policy_violation,
         )
 
-        policy_violation = classify_sql_policy_violation(expression)
+        facts = get_sql_facts(expression)
+        policy_violation = classify_sql_policy_violation(expression, facts)
         if policy_violation is not None:
             if policy_violation.reason_code == "blocked_function":
                 function_name = (policy_violation.function or "UNKNOWN").upper()
@@ -2670,9 +2716,7 @@ def _validate_sql_ast_failure(sql: str, provider: str) -> Optional[SQLASTValidat
                 )
 
         # Block restricted/system tables and schemas for direct MCP invocations.
-        import sqlglot.expressions as exp
-
-        for table in expression.find_all(exp.Table):
+        for table in facts.tables:
             table_name = table.name.lower() if table.name else ""
             schema_name = table.db.lower() if table.db else ""
             blocked_reason = classify_blocked_table_reference(
@@ -2774,6 +2818,8 @@ async def handler(
     keyset_cursor: Optional[str] = None,
     keyset_order_by: Optional[List[str]] = None,
     streaming: bool = False,
+    schema_snapshot_id: Optional[str] = None,
+    bypass_result_cache: bool = False,
 ) -> str:
     """Execute a validated SQL query against the target database.
 
@@ -2789,6 +2835,11 @@ async def handler(
         - Unauthorized: If the required role is missing.
         - Timeout: If execution exceeds the allotted time.
         - Capacity detection: If query triggers row/resource caps.
+
+    Result Caching:
+        When EXECUTION_RESULT_CACHE_ENABLED is set, complete non-paginated results are
+        cached per (rewritten SQL, params, tenant, schema_snapshot_id, policy). Pass
+        bypass_result_cache=True to force execution and refresh the cached entry.
     """
     provider = _active_provider()
     import time
@@ -3702,6 +3753,52 @@ async def handler(
                 envelope_metadata=tenant_enforcement_metadata,
             )
 
+    result_cache = None
+    result_cache_key = None
+    if not pagination_requested and not streaming:
+        result_cache = get_result_cache()
+    if result_cache is not None:
+        tenant_enforcement_metadata["result_cache.hit"] = False
+        tenant_enforcement_metadata["result_cache.bypassed"] = bool(bypass_result_cache)
+        result_cache_key = build_result_cache_key(
+            sql=effective_sql_query,
+            params=effective_params,
+            tenant_id=tenant_id,
+            provider=provider,
+            schema_snapshot_id=schema_snapshot_id,
+            policy_fingerprint=_pagination_session_policy_snapshot_fingerprint(
+                tenant_enforcement_metadata
+            ),
+            shape={
+                "include_columns": bool(include_columns),
+                "max_rows": resource_limits.max_rows if resource_limits.enforce_row_limit else None,
+                "max_bytes": (
+                    resource_limits.max_bytes if resource_limits.enforce_byte_limit else None
+                ),
+                "force_result_limit": force_result_limit,
+            },
+        )
+        cached = None
+        if not bypass_result_cache:
+            cached = result_cache.get(result_cache_key, tenant_id, schema_snapshot_id)
+        if cached is not None:
+            cached_metadata = cached.envelope.setdefault("metadata", {})
+            cached_metadata["execution_duration_ms"] = max(
+                0, int((time.monotonic() - execution_started_at) * 1000)
+            )
+            cached_metadata["result_cache.hit"] = True
+            cached_metadata["result_cache.age_ms"] = cached.age_ms
+            cached_metadata["result_cache.bypassed"] = False
+            # Nothing ran, but the tenant policy, guardrails and sandbox outcome that
+            # produced the cached rows still apply to this response.
+            span = trace.get_current_span()
+            if span is not None and span.is_recording():
+                span.set_attribute("result_cache.hit", True)
+            _record_tenant_enforcement_observability(cached_metadata, cache_hit=True)
+            _record_session_guardrail_observability(cached_metadata, cache_hit=True)
+            _record_sandbox_observability(cached_metadata, cache_hit=True)
+            return json.dumps(cached.envelope, separators=(",", ":"))
+
     try:
         columns = None
         last_truncated = False
@@ -4218,7 +4315,7 @@ async def handler(
 
                 try:
                     dialect = normalize_sqlglot_dialect(provider)
-                    parsed_effective = sqlglot.parse_one(effective_sql_query, read=dialect)
+                    parsed_effective = parse_sql_one(effective_sql_query, dialect)
                     if not isinstance(parsed_effective, sqlglot.exp.Select):
                         raise ValueError("Effective query is not a SELECT statement.")
                     execution_select = parsed_effective
@@ -4410,15 +4507,53 @@ async def handler(
                             message="Pagination offset exceeds configured bounds.",
                         )
                     wrapped_limit = pagination_limit + 1
-                    wrapped_sql = (
-                        f"SELECT * FROM ({effective_sql_query}) AS text2sql_page "
-                        f"LIMIT {wrapped_limit} OFFSET {pagination_offset}"
-                    )
-                    if effective_params:
-                        rows = await conn.fetch(wrapped_sql, *effective_params)
-                    else:
-                        rows = await conn.fetch(wrapped_sql)
-                    rows = [dict(row) for row in rows]
+                    rows = None
+                    spool_store = get_result_spool_store() if result_spool_enabled() else None
+                    if spool_store is not None and page_token:
+                        rows = await _read_offset_page_from_spool(
+                            spool_store,
+                            session_id=pagination_session_id,
+                            tenant_id=tenant_id,
+                            query_fingerprint=query_fingerprint or "",
+                            offset=pagination_offset,
+                            limit=wrapped_limit,
+                        )
+                        tenant_enforcement_metadata["pagination.spool.hit"] = rows is not None
+                    elif spool_store is not None and pagination_session_id is not None:
+                        # Fetch every row a continuation token could reach, once.
+                        spool_row_cap = min(
+                            (max_offset_pages + 1) * pagination_limit + 1, spool_store.max_rows
+                        )
+                        if row_limit:
+                            spool_row_cap = min(spool_row_cap, row_limit)
+                        spool_row_cap = max(wrapped_limit, spool_row_cap)
+                        spool_sql = (
+                            f"SELECT * FROM ({effective_sql_query}) AS text2sql_page "
+                            f"LIMIT {spool_row_cap}"
+                        )
+                        spool_rows = [
+                            dict(row) for row in await conn.fetch(spool_sql, *effective_params)
+                        ]
+                        spool = await asyncio.to_thread(
+                            spool_store.write,
+                            pagination_session_id,
+                            tenant_id=tenant_id,
+                            query_fingerprint=query_fingerprint or "",
+                            rows=spool_rows,
+                            complete=len(spool_rows) < spool_row_cap,
+                        )
+                        tenant_enforcement_metadata["pagination.spool.written"] = spool is not None
+                        rows = spool_rows[:wrapped_limit]
+                    if rows is None:
+                        wrapped_sql = (
+                            f"SELECT * FROM ({effective_sql_query}) AS text2sql_page "
+                            f"LIMIT {wrapped_limit} OFFSET {pagination_offset}"
+                        )
+                        if effective_params:
+                            rows = await conn.fetch(wrapped_sql, *effective_params)
+                        else:
+                            rows = await conn.fetch(wrapped_sql)
+                        rows = [dict(row) for row in rows]
                     if len(rows) > pagination_limit:
                         rows = rows[:pagination_limit]
                         if not _pagination_signing_available:
@@ -4446,6 +4581,16 @@ async def handler(
                     supports_fetch_with_columns = (
                         callable(fetch_with_columns) and "fetch_with_columns" in type(conn).__dict__
                     )
+                    fetch_columnar = getattr(conn, "fetch_columnar", None)
+                    if (
+                        supports_fetch_with_columns
+                        and callable(fetch_columnar)
+                        and "fetch_columnar" in type(conn).__dict__
+                        and columnar_results_enabled()
+                    ):
+                        # Rows stay column-backed through the row and byte caps;
+                        # enforce_byte_limit materializes only the rows returned.
+                        fetch_with_columns = fetch_columnar
                     supports_prepare = callable(prepare) and "prepare" in type(conn).__dict__
                     if effective_params:
                         if supports_fetch_with_columns:
@@ -4839,6 +4984,12 @@ async def handler(
             pagination_session_id=tenant_enforcement_metadata.get("pagination_session_id"),
             next_keyset_cursor=tenant_enforcement_metadata.get("next_keyset_cursor"),
             **{
+                "result_cache.hit": tenant_enforcement_metadata.get("result_cache.hit"),
+                "result_cache.bypassed": tenant_enforcement_metadata.get("result_cache.bypassed"),
+                "pagination.spool.hit": tenant_enforcement_metadata.get("pagination.spool.hit"),
+                "pagination.spool.written": tenant_enforcement_metadata.get(
+                    "pagination.spool.written"
+                ),
                 "pagination.keyset.partial_page": tenant_enforcement_metadata.get(
                     "pagination.keyset.partial_page"
                 ),
@@ -5060,6 +5211,15 @@ async def handler(
         envelope = ExecuteSQLQueryResponseEnvelope(
             rows=result_rows, columns=columns, metadata=envelope_metadata
         )
+        envelope_json = envelope.model_dump_json(exclude_none=True, by_alias=True)
+        if result_cache is not None and result_cache_key is not None:
+            result_cache.put(
+                result_cache_key,
+                envelope_json,
+                tenant_id=tenant_id,
+                provider=provider,
+                schema_snapshot_id=schema_snapshot_id,
+            )
         _record_tenant_enforcement_observability(tenant_enforcement_metadata)
         _record_session_guardrail_observability(tenant_enforcement_metadata)
         _record_sandbox_observability(tenant_enforcement_metadata)
@@ -5106,7 +5266,7 @@ async def handler(
             ),
         )
 
-        return envelope.model_dump_json(exclude_none=True, by_alias=True)
+        return envelope_json
 
     except _SandboxExecutionTimeout as e:
         provider = _active_provider()
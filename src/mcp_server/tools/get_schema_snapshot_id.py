@@ -0,0 +1,75 @@
+"""MCP tool: get_schema_snapshot_id - Return the current schema catalog snapshot id."""
+
+from mcp_server.services.rag.catalog_snapshot import get_catalog_snapshot
+
+TOOL_NAME = "get_schema_snapshot_id"
+TOOL_DESCRIPTION = "Return the fingerprint of the current schema catalog."
+
+
+async def handler(tenant_id: int) -> str:
+    """Return the fingerprint of the current schema catalog.
+
+    The fingerprint is maintained when the schema is indexed or hydrated, so
+    this is cheap enough to call on every cache hit. Cache entries stamped
+    with a different ``catalog_snapshot_id`` were generated against an older
+    schema.
+
+    Authorization:
+        Requires 'SQL_USER_ROLE' (or higher) and valid 'tenant_id'.
+
+    Data Access:
+        Reads the in-process catalog fingerprint; re-introspects the schema
+        only when the fingerprint is missing or stale.
+
+    Failure Modes:
+        - Unauthorized: If tenant_id is missing or role is insufficient.
+        - Snapshot Unavailable: If the schema cannot be introspected.
+
+    Args:
+        tenant_id: Tenant identifier.
+
+    Returns:
+        JSON envelope with schema_snapshot_id, table_count and age_seconds.
+    """
+    import time
+
+    from common.models.error_metadata import ErrorCategory
+    from common.models.tool_envelopes import GenericToolMetadata, ToolResponseEnvelope
+    from dal.database import Database
+    from mcp_server.utils.auth import validate_role
+    from mcp_server.utils.errors import build_error_metadata
+    from mcp_server.utils.validation import require_tenant_id
+
+    if err := validate_role("SQL_USER_ROLE", TOOL_NAME, tenant_id=tenant_id):
+        return err
+    if err := require_tenant_id(tenant_id, TOOL_NAME):
+        return err
+
+    start_time = time.monotonic()
+
+    try:
+        snapshot = await get_catalog_snapshot()
+    except Exception:
+        error_code = "SCHEMA_SNAPSHOT_UNAVAILABLE"
+        return ToolResponseEnvelope(
+            result={"success": False, "error": {"code": error_code}},
+            error=build_error_metadata(
+                message="Failed to resolve schema snapshot.",
+                category=ErrorCategory.INTERNAL,
+                provider="schema_catalog",
+                retryable=True,
+                code=error_code,
+            ),
+        ).model_dump_json(exclude_none=True)
+
+    execution_time_ms = (time.monotonic() - start_time) * 1000
+    return ToolResponseEnvelope(
+        result={
+            "schema_snapshot_id": snapshot.snapshot_id,
+            "table_count": snapshot.table_count,
+            "age_seconds": round(snapshot.age_seconds, 3),
+        },
+        metadata=GenericToolMetadata(
+            provider=Database.get_query_target_provider(), execution_time_ms=execution_time_ms
+        ),
+    ).model_dump_json(exclude_none=True)
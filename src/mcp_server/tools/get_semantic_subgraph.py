@@ -12,6 +12,7 @@ import time
 from typing import Optional
 
 from common.telemetry import Telemetry
+from common.utils.run_embeddings import embedding_scope
 from dal.database import Database
 from dal.memgraph import MemgraphStore
 from ingestion.vector_indexer import VectorIndexer
@@ -432,7 +433,9 @@ async def handler(query: str, tenant_id: int = None, snapshot_id: Optional[str]
                 ),
             ).model_dump_json(exclude_none=True)
 
-        result = await _get_mini_graph(query, store)
+        # Table seeds and the column fallback embed the same query
+        with embedding_scope():
+            result = await _get_mini_graph(query, store)
 
         if isinstance(result, dict) and "error" in result:
             from common.models.tool_envelopes import ToolResponseEnvelope
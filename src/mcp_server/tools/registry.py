@@ -22,6 +22,7 @@ CANONICAL_TOOLS: Set[str] = {
     "search_relevant_tables",
     "get_semantic_subgraph",
     "get_semantic_definitions",
+    "get_schema_snapshot_id",
     # Execution tools
     "execute_sql_query",
     # Validation tools
@@ -108,6 +109,7 @@ def register_all(mcp: "FastMCP") -> None:
     from mcp_server.tools.feedback.submit_feedback import handler as submit_feedback
     from mcp_server.tools.get_few_shot_examples import handler as get_few_shot_examples
     from mcp_server.tools.get_sample_data import handler as get_sample_data
+    from mcp_server.tools.get_schema_snapshot_id import handler as get_schema_snapshot_id
     from mcp_server.tools.get_semantic_definitions import handler as get_semantic_definitions
     from mcp_server.tools.get_semantic_subgraph import handler as get_semantic_subgraph
     from mcp_server.tools.get_table_schema import handler as get_table_schema
@@ -139,6 +141,7 @@ def register_all(mcp: "FastMCP") -> None:
     register("search_relevant_tables", search_relevant_tables)
     register("get_semantic_subgraph", get_semantic_subgraph)
     register("get_semantic_definitions", get_semantic_definitions)
+    register("get_schema_snapshot_id", get_schema_snapshot_id)
 
     # Register execution tools
     register("execute_sql_query", execute_sql_query)
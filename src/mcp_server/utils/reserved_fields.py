@@ -6,11 +6,13 @@ from typing import Any, Mapping
 
 TRACE_CONTEXT_RESERVED_FIELD = "_trace_context"
 REQUEST_ID_RESERVED_FIELD = "_request_id"
+RUN_ID_RESERVED_FIELD = "_run_id"
 
 RESERVED_TOOL_METADATA_KEYS = frozenset(
     {
         TRACE_CONTEXT_RESERVED_FIELD,
         REQUEST_ID_RESERVED_FIELD,
+        RUN_ID_RESERVED_FIELD,
     }
 )
 
@@ -26,6 +26,7 @@ from common.tenancy.limits import TenantConcurrencyLimitExceeded, get_mcp_tool_t
 from mcp_server.utils.errors import tool_error_response
 from mcp_server.utils.reserved_fields import (
     REQUEST_ID_RESERVED_FIELD,
+    RUN_ID_RESERVED_FIELD,
     TRACE_CONTEXT_RESERVED_FIELD,
     split_reserved_tool_metadata,
 )
@@ -357,6 +358,20 @@ def trace_tool(tool_name: str) -> Callable[[Callable[P, Awaitable[R]]], Callable
     def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
         @functools.wraps(func)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            # Pooled agent sessions forward the run id per call, not per connection.
+            run_id = _normalize_request_id(kwargs.get(RUN_ID_RESERVED_FIELD))
+            if run_id is None:
+                return await _traced(*args, **kwargs)
+
+            from common.observability.context import run_id_var
+
+            run_token = run_id_var.set(run_id)
+            try:
+                return await _traced(*args, **kwargs)
+            finally:
+                run_id_var.reset(run_token)
+
+        async def _traced(*args: P.args, **kwargs: P.kwargs) -> R:
             # Check enforcement mode
             mode = get_env_str("TELEMETRY_ENFORCEMENT_MODE", "warn").lower()
             tool_kwargs, reserved_kwargs = split_reserved_tool_metadata(kwargs)
@@ -399,6 +414,9 @@ def trace_tool(tool_name: str) -> Callable[[Callable[P, Awaitable[R]]], Callable
                 span.set_attribute("mcp.tool.supported_version", supported_tool_version)
                 if requested_tool_version is not None:
                     span.set_attribute("mcp.tool.requested_version", str(requested_tool_version))
+                run_id = _normalize_request_id(reserved_kwargs.get(RUN_ID_RESERVED_FIELD))
+                if run_id is not None:
+                    span.set_attribute("run_id", run_id)
                 if request_id is not None:
                     span.set_attribute("mcp.request_id", request_id)
                     span.set_attribute("request_id", request_id)
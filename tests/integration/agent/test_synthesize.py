@@ -1,7 +1,9 @@
 """Unit tests for insight synthesis node."""
 
 import os
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
 
 from agent.nodes.synthesize import synthesize_insight_node
 from agent.state import AgentState
@@ -12,9 +14,10 @@ os.environ["OPENAI_API_KEY"] = "sk-test-key-for-synthesis-verification"
 class TestSynthesizeInsightNode:
     """Unit tests for synthesize_insight_node function."""
 
+    @pytest.mark.asyncio
     @patch("agent.llm_client.get_llm")
     @patch("agent.nodes.synthesize.ChatPromptTemplate")
-    def test_synthesize_insight_node_success(self, mock_prompt_class, mock_llm):
+    async def test_synthesize_insight_node_success(self, mock_prompt_class, mock_llm):
         """Test successful insight synthesis with query results."""
         # Create mock prompt template and chain
         mock_prompt = MagicMock()
@@ -26,7 +29,7 @@ class TestSynthesizeInsightNode:
         # Create mock response
         mock_response = MagicMock()
         mock_response.content = "There are 1000 films in the database."
-        mock_chain.invoke.return_value = mock_response
+        mock_chain.ainvoke = AsyncMock(return_value=mock_response)
 
         # Create test state
         from langchain_core.messages import HumanMessage
@@ -40,14 +43,14 @@ class TestSynthesizeInsightNode:
             retry_count=0,
         )
 
-        result = synthesize_insight_node(state)
+        result = await synthesize_insight_node(state)
 
         # Verify prompt was created
         mock_prompt_class.from_messages.assert_called_once()
 
         # Verify chain was invoked with correct parameters
-        mock_chain.invoke.assert_called_once()
-        call_kwargs = mock_chain.invoke.call_args[0][0]
+        mock_chain.ainvoke.assert_called_once()
+        call_kwargs = mock_chain.ainvoke.call_args[0][0]
         assert "question" in call_kwargs
         assert "results" in call_kwargs
         assert call_kwargs["question"] == "How many films are there?"
@@ -58,7 +61,8 @@ class TestSynthesizeInsightNode:
         assert len(result["messages"]) == 1
         assert result["messages"][0].content == "There are 1000 films in the database."
 
-    def test_synthesize_insight_node_empty_results(self):
+    @pytest.mark.asyncio
+    async def test_synthesize_insight_node_empty_results(self):
         """Test handling of empty query results."""
         from langchain_core.messages import HumanMessage
 
@@ -71,14 +75,15 @@ class TestSynthesizeInsightNode:
             retry_count=0,
         )
 
-        result = synthesize_insight_node(state)
+        result = await synthesize_insight_node(state)
 
         # Verify empty result message
         assert "messages" in result
         assert len(result["messages"]) == 1
         assert "couldn't retrieve any results" in result["messages"][0].content.lower()
 
-    def test_synthesize_insight_node_empty_list_results(self):
+    @pytest.mark.asyncio
+    async def test_synthesize_insight_node_empty_list_results(self):
         """Test handling of empty list results."""
         from langchain_core.messages import HumanMessage
 
@@ -91,16 +96,17 @@ class TestSynthesizeInsightNode:
             retry_count=0,
         )
 
-        result = synthesize_insight_node(state)
+        result = await synthesize_insight_node(state)
 
         # Empty list should still trigger empty result handling
         # (empty list is falsy in Python)
         assert "messages" in result
         assert len(result["messages"]) == 1
 
+    @pytest.mark.asyncio
     @patch("agent.llm_client.get_llm")
     @patch("agent.nodes.synthesize.ChatPromptTemplate")
-    def test_synthesize_insight_node_large_result_set(self, mock_prompt_class, mock_llm):
+    async def test_synthesize_insight_node_large_result_set(self, mock_prompt_class, mock_llm):
         """Test synthesis with large result set."""
         mock_prompt = MagicMock()
         mock_chain = MagicMock()
@@ -110,7 +116,7 @@ class TestSynthesizeInsightNode:
 
         mock_response = MagicMock()
         mock_response.content = "Found 500 films matching your criteria."
-        mock_chain.invoke.return_value = mock_response
+        mock_chain.ainvoke = AsyncMock(return_value=mock_response)
 
         from langchain_core.messages import HumanMessage
 
@@ -126,19 +132,20 @@ class TestSynthesizeInsightNode:
             retry_count=0,
         )
 
-        result = synthesize_insight_node(state)
+        result = await synthesize_insight_node(state)
 
         # Verify LLM was called with large result set
-        call_kwargs = mock_chain.invoke.call_args[0][0]
+        call_kwargs = mock_chain.ainvoke.call_args[0][0]
         assert len(call_kwargs["results"]) > 0  # JSON string should be non-empty
 
         # Verify result contains AIMessage
         assert "messages" in result
         assert result["messages"][0].content == "Found 500 films matching your criteria."
 
+    @pytest.mark.asyncio
     @patch("agent.llm_client.get_llm")
     @patch("agent.nodes.synthesize.ChatPromptTemplate")
-    def test_synthesize_insight_node_json_serialization(self, mock_prompt_class, mock_llm):
+    async def test_synthesize_insight_node_json_serialization(self, mock_prompt_class, mock_llm):
         """Test JSON serialization handles complex types (dates, decimals)."""
         from datetime import date
         from decimal import Decimal
@@ -151,7 +158,7 @@ class TestSynthesizeInsightNode:
 
         mock_response = MagicMock()
         mock_response.content = "Payment processed on 2024-01-15 for $99.99"
-        mock_chain.invoke.return_value = mock_response
+        mock_chain.ainvoke = AsyncMock(return_value=mock_response)
 
         from langchain_core.messages import HumanMessage
 
@@ -171,10 +178,10 @@ class TestSynthesizeInsightNode:
             retry_count=0,
         )
 
-        result = synthesize_insight_node(state)
+        result = await synthesize_insight_node(state)
 
         # Verify JSON serialization worked (default=str handles dates/decimals)
-        call_kwargs = mock_chain.invoke.call_args[0][0]
+        call_kwargs = mock_chain.ainvoke.call_args[0][0]
         assert "99.99" in call_kwargs["results"]
         assert "2024-01-15" in call_kwargs["results"]
 
@@ -182,9 +189,10 @@ class TestSynthesizeInsightNode:
         assert "messages" in result
         assert len(result["messages"]) == 1
 
+    @pytest.mark.asyncio
     @patch("agent.llm_client.get_llm")
     @patch("agent.nodes.synthesize.ChatPromptTemplate")
-    def test_synthesize_insight_node_multiple_messages(self, mock_prompt_class, mock_llm):
+    async def test_synthesize_insight_node_multiple_messages(self, mock_prompt_class, mock_llm):
         """Test that original question is extracted from first message."""
         mock_prompt = MagicMock()
         mock_chain = MagicMock()
@@ -194,7 +202,7 @@ class TestSynthesizeInsightNode:
 
         mock_response = MagicMock()
         mock_response.content = "Result summary"
-        mock_chain.invoke.return_value = mock_response
+        mock_chain.ainvoke = AsyncMock(return_value=mock_response)
 
         from langchain_core.messages import AIMessage, HumanMessage
 
@@ -211,17 +219,18 @@ class TestSynthesizeInsightNode:
             retry_count=0,
         )
 
-        result = synthesize_insight_node(state)
+        result = await synthesize_insight_node(state)
 
         # Verify first message content was used
-        call_kwargs = mock_chain.invoke.call_args[0][0]
+        call_kwargs = mock_chain.ainvoke.call_args[0][0]
         assert call_kwargs["question"] == "How many customers?"
 
         assert "messages" in result
 
+    @pytest.mark.asyncio
     @patch("agent.llm_client.get_llm")
     @patch("agent.nodes.synthesize.ChatPromptTemplate")
-    def test_synthesize_includes_truncation_warning_when_truncated(
+    async def test_synthesize_includes_truncation_warning_when_truncated(
         self, mock_prompt_class, mock_llm
     ):
         """Warn users when results are truncated."""
@@ -233,7 +242,7 @@ class TestSynthesizeInsightNode:
 
         mock_response = MagicMock()
         mock_response.content = "Found results."
-        mock_chain.invoke.return_value = mock_response
+        mock_chain.ainvoke = AsyncMock(return_value=mock_response)
 
         from langchain_core.messages import HumanMessage
 
@@ -249,15 +258,16 @@ class TestSynthesizeInsightNode:
             result_rows_returned=1,
         )
 
-        result = synthesize_insight_node(state)
+        result = await synthesize_insight_node(state)
 
         assert result["messages"][0].content.startswith("Note: Results are truncated")
         assert "100" in result["messages"][0].content
         assert "showing 1" in result["messages"][0].content
 
+    @pytest.mark.asyncio
     @patch("agent.llm_client.get_llm")
     @patch("agent.nodes.synthesize.ChatPromptTemplate")
-    def test_synthesize_no_warning_when_not_truncated(self, mock_prompt_class, mock_llm):
+    async def test_synthesize_no_warning_when_not_truncated(self, mock_prompt_class, mock_llm):
         """Do not warn users when results are not truncated."""
         mock_prompt = MagicMock()
         mock_chain = MagicMock()
@@ -267,7 +277,7 @@ class TestSynthesizeInsightNode:
 
         mock_response = MagicMock()
         mock_response.content = "Found results."
-        mock_chain.invoke.return_value = mock_response
+        mock_chain.ainvoke = AsyncMock(return_value=mock_response)
 
         from langchain_core.messages import HumanMessage
 
@@ -283,13 +293,14 @@ class TestSynthesizeInsightNode:
             result_rows_returned=1,
         )
 
-        result = synthesize_insight_node(state)
+        result = await synthesize_insight_node(state)
 
         assert result["messages"][0].content == "Found results."
 
+    @pytest.mark.asyncio
     @patch("agent.llm_client.get_llm")
     @patch("agent.nodes.synthesize.ChatPromptTemplate")
-    def test_synthesize_prompt_includes_column_hints_when_present(
+    async def test_synthesize_prompt_includes_column_hints_when_present(
         self, mock_prompt_class, mock_llm
     ):
         """Include column type hints when available."""
@@ -301,7 +312,7 @@ class TestSynthesizeInsightNode:
 
         mock_response = MagicMock()
         mock_response.content = "Summary"
-        mock_chain.invoke.return_value = mock_response
+        mock_chain.ainvoke = AsyncMock(return_value=mock_response)
 
         from langchain_core.messages import HumanMessage
 
@@ -315,15 +326,18 @@ class TestSynthesizeInsightNode:
             result_columns=[{"name": "id", "type": "int"}],
         )
 
-        synthesize_insight_node(state)
+        await synthesize_insight_node(state)
 
-        call_kwargs = mock_chain.invoke.call_args[0][0]
+        call_kwargs = mock_chain.ainvoke.call_args[0][0]
         assert "Column types:" in call_kwargs["column_hints"]
         assert "id: int" in call_kwargs["column_hints"]
 
+    @pytest.mark.asyncio
     @patch("agent.llm_client.get_llm")
     @patch("agent.nodes.synthesize.ChatPromptTemplate")
-    def test_synthesize_prompt_omits_column_hints_when_missing(self, mock_prompt_class, mock_llm):
+    async def test_synthesize_prompt_omits_column_hints_when_missing(
+        self, mock_prompt_class, mock_llm
+    ):
         """Skip column type hints when not available."""
         mock_prompt = MagicMock()
         mock_chain = MagicMock()
@@ -333,7 +347,7 @@ class TestSynthesizeInsightNode:
 
         mock_response = MagicMock()
         mock_response.content = "Summary"
-        mock_chain.invoke.return_value = mock_response
+        mock_chain.ainvoke = AsyncMock(return_value=mock_response)
 
         from langchain_core.messages import HumanMessage
 
@@ -346,14 +360,15 @@ class TestSynthesizeInsightNode:
             retry_count=0,
         )
 
-        synthesize_insight_node(state)
+        await synthesize_insight_node(state)
 
-        call_kwargs = mock_chain.invoke.call_args[0][0]
+        call_kwargs = mock_chain.ainvoke.call_args[0][0]
         assert call_kwargs["column_hints"] == ""
 
+    @pytest.mark.asyncio
     @patch("agent.llm_client.get_llm")
     @patch("agent.nodes.synthesize.ChatPromptTemplate")
-    def test_synthesize_insight_node_returns_aimessage(self, mock_prompt_class, mock_llm):
+    async def test_synthesize_insight_node_returns_aimessage(self, mock_prompt_class, mock_llm):
         """Test that result contains AIMessage objects, not dicts."""
         mock_prompt = MagicMock()
         mock_chain = MagicMock()
@@ -363,7 +378,7 @@ class TestSynthesizeInsightNode:
 
         mock_response = MagicMock()
         mock_response.content = "Test response"
-        mock_chain.invoke.return_value = mock_response
+        mock_chain.ainvoke = AsyncMock(return_value=mock_response)
 
         from langchain_core.messages import AIMessage, HumanMessage
 
@@ -376,7 +391,7 @@ class TestSynthesizeInsightNode:
             retry_count=0,
         )
 
-        result = synthesize_insight_node(state)
+        result = await synthesize_insight_node(state)
 
         # Verify result contains AIMessage object
         assert "messages" in result
@@ -384,7 +399,8 @@ class TestSynthesizeInsightNode:
         assert isinstance(result["messages"][0], AIMessage)
         assert result["messages"][0].content == "Test response"
 
-    def test_synthesize_insight_node_error(self):
+    @pytest.mark.asyncio
+    async def test_synthesize_insight_node_error(self):
         """Test that errors are correctly handled and recorded."""
         from langchain_core.messages import HumanMessage
 
@@ -400,7 +416,7 @@ class TestSynthesizeInsightNode:
             retry_count=3,
         )
 
-        result = synthesize_insight_node(state)
+        result = await synthesize_insight_node(state)
 
         # Verify error response logic
         assert "messages" in result
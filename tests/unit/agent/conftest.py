@@ -58,12 +58,18 @@ def autoreset_globals():
 
     reset_schema_cache()
 
+    # 5. MCP session pools
+    from agent.mcp_client.session_pool import reset_mcp_session_pools
+
+    reset_mcp_session_pools()
+
     yield
 
     # Optional: cleanup after as well
     reset_prefetch_state()
     reset_cache_state()
     reset_schema_cache()
+    reset_mcp_session_pools()
 
 
 @pytest.fixture(scope="session")
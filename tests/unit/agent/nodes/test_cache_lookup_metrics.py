@@ -65,3 +65,36 @@ async def test_cache_lookup_miss_emits_miss_metric(monkeypatch):
         attributes={"outcome": "miss"},
         description="Cache lookup outcomes (hit/miss/error)",
     )
+
+
+@pytest.mark.asyncio
+async def test_cache_lookup_validates_snapshot_via_catalog_tool(monkeypatch):
+    """Entries stamped with a catalog id are validated without subgraph retrieval."""
+    monkeypatch.setenv("AGENT_CACHE_SCHEMA_VALIDATION", "true")
+    cache_tool = AsyncMock()
+    cache_tool.name = "lookup_cache"
+    cache_tool.ainvoke = AsyncMock(
+        return_value={
+            "value": "SELECT 1",
+            "cache_id": "cache-1",
+            "metadata": {"schema_snapshot_id": "fp-sub", "catalog_snapshot_id": "fp-old"},
+        }
+    )
+    snapshot_tool = AsyncMock()
+    snapshot_tool.name = "get_schema_snapshot_id"
+    snapshot_tool.ainvoke = AsyncMock(return_value={"schema_snapshot_id": "fp-old"})
+    subgraph_tool = AsyncMock()
+    subgraph_tool.name = "get_semantic_subgraph"
+    tools = [cache_tool, snapshot_tool, subgraph_tool]
+
+    with patch("agent.nodes.cache_lookup.get_mcp_tools", AsyncMock(return_value=tools)):
+        state = {"messages": [HumanMessage(content="show users")], "tenant_id": 1}
+        hit = await cache_lookup_node(state)
+
+        snapshot_tool.ainvoke.return_value = {"schema_snapshot_id": "fp-new"}
+        rejected = await cache_lookup_node(state)
+
+    assert hit["from_cache"] is True
+    assert rejected["from_cache"] is False
+    assert rejected["rejected_cache_context"]["reason"] == "schema_snapshot_mismatch"
+    subgraph_tool.ainvoke.assert_not_called()
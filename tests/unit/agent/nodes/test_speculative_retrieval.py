@@ -0,0 +1,109 @@
+"""Tests for speculative retrieval alongside cache lookup."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from langchain_core.messages import HumanMessage
+
+from agent.graph import route_after_cache_lookup
+from agent.nodes.speculative_retrieval import (
+    speculative_cache_lookup_node,
+    speculative_retrieval_enabled,
+)
+
+MODULE = "agent.nodes.speculative_retrieval"
+
+
+def _state(tenant_id=1):
+    return {"messages": [HumanMessage(content="show users")], "tenant_id": tenant_id}
+
+
+def test_enabled_respects_tenant_toggles(monkeypatch):
+    """The global switch can be narrowed to, or exclude, specific tenants."""
+    assert not speculative_retrieval_enabled(1)
+
+    monkeypatch.setenv("AGENT_SPECULATIVE_RETRIEVAL", "on")
+    assert speculative_retrieval_enabled(1)
+
+    monkeypatch.setenv("AGENT_SPECULATIVE_RETRIEVAL_TENANTS", "2,3")
+    assert not speculative_retrieval_enabled(1)
+    assert speculative_retrieval_enabled(2)
+
+    monkeypatch.setenv("AGENT_SPECULATIVE_RETRIEVAL_DISABLED_TENANTS", "2")
+    assert not speculative_retrieval_enabled(2)
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_cancels_speculative_work(monkeypatch):
+    """A hit cancels in-flight retrieval and recommendation and records the waste."""
+    monkeypatch.setenv("AGENT_SPECULATIVE_RETRIEVAL", "on")
+    cancelled = []
+
+    async def _slow(name):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(name)
+            raise
+
+    async def _lookup(state):
+        await asyncio.sleep(0)  # let the speculative tasks start
+        return {"from_cache": True, "current_sql": "SELECT 1", "cached_sql": "SELECT 1"}
+
+    with (
+        patch(f"{MODULE}.cache_lookup_node", _lookup),
+        patch(f"{MODULE}.retrieve_context_node", lambda state: _slow("retrieval")),
+        patch(f"{MODULE}.get_few_shot_examples", lambda *a, **k: _slow("few_shot")),
+        patch(f"{MODULE}.agent_metrics.add_counter") as mock_counter,
+    ):
+        result = await speculative_cache_lookup_node(_state())
+
+    assert result["from_cache"] is True
+    assert result["speculative_retrieval_applied"] is False
+    assert sorted(cancelled) == ["few_shot", "retrieval"]
+    assert mock_counter.call_args.kwargs["attributes"] == {"outcome": "wasted"}
+    assert route_after_cache_lookup(result) == "validate"
+
+
+@pytest.mark.asyncio
+async def test_cache_miss_uses_speculative_results(monkeypatch):
+    """A miss merges the retrieval output and routes straight to the router."""
+    monkeypatch.setenv("AGENT_SPECULATIVE_RETRIEVAL", "on")
+    miss = {"cached_sql": None, "from_cache": False, "cache_lookup_failed": False}
+    retrieved = {"schema_context": "users(id)", "table_names": ["users"]}
+
+    with (
+        patch(f"{MODULE}.cache_lookup_node", AsyncMock(return_value=miss)),
+        patch(f"{MODULE}.retrieve_context_node", AsyncMock(return_value=retrieved)),
+        patch(f"{MODULE}.get_few_shot_examples", AsyncMock(return_value="- Question: q")),
+    ):
+        result = await speculative_cache_lookup_node(_state())
+
+    assert result["speculative_retrieval_applied"] is True
+    assert result["table_names"] == ["users"]
+    assert result["prefetched_few_shot"] == {
+        "query": "show users",
+        "tenant_id": 1,
+        "examples": "- Question: q",
+    }
+    assert route_after_cache_lookup(result) == "router"
+
+
+@pytest.mark.asyncio
+async def test_disabled_tenant_falls_back_to_serial_retrieval(monkeypatch):
+    """Without speculation a miss still routes through the retrieve node."""
+    monkeypatch.setenv("AGENT_SPECULATIVE_RETRIEVAL", "on")
+    monkeypatch.setenv("AGENT_SPECULATIVE_RETRIEVAL_DISABLED_TENANTS", "1")
+    retrieve = AsyncMock()
+
+    with (
+        patch(f"{MODULE}.cache_lookup_node", AsyncMock(return_value={"from_cache": False})),
+        patch(f"{MODULE}.retrieve_context_node", retrieve),
+    ):
+        result = await speculative_cache_lookup_node(
+            {**_state(), "speculative_retrieval_applied": True}
+        )
+
+    retrieve.assert_not_called()
+    assert route_after_cache_lookup(result) == "retrieve"
@@ -28,7 +28,8 @@ def base_state():
     }
 
 
-def test_synthesize_redacts_credentials(mock_telemetry, base_state):
+@pytest.mark.asyncio
+async def test_synthesize_redacts_credentials(mock_telemetry, base_state):
     """Verify that credentials in errors are redacted."""
     state = base_state.copy()
     state.update(
@@ -38,7 +39,7 @@ def test_synthesize_redacts_credentials(mock_telemetry, base_state):
         }
     )
 
-    result = synthesize_insight_node(state)
+    result = await synthesize_insight_node(state)
     content = result["messages"][0].content
 
     assert "admin" not in content
@@ -46,19 +47,21 @@ def test_synthesize_redacts_credentials(mock_telemetry, base_state):
     assert "<user>:<password>" in content
 
 
-def test_synthesize_generic_message_for_unknown_error(mock_telemetry, base_state):
+@pytest.mark.asyncio
+async def test_synthesize_generic_message_for_unknown_error(mock_telemetry, base_state):
     """Verify that unknown error categories get a generic message."""
     state = base_state.copy()
     state.update({"error": "Table 'secret_schema_info' not found", "error_category": "unknown"})
 
-    result = synthesize_insight_node(state)
+    result = await synthesize_insight_node(state)
     content = result["messages"][0].content
 
     assert "secret_schema_info" not in content
     assert "An internal error occurred while processing your request." in content
 
 
-def test_synthesize_generic_message_for_syntax_error(mock_telemetry, base_state):
+@pytest.mark.asyncio
+async def test_synthesize_generic_message_for_syntax_error(mock_telemetry, base_state):
     """Verify that syntax errors (unsafe) get a generic message."""
     state = base_state.copy()
     state.update(
@@ -68,26 +71,28 @@ def test_synthesize_generic_message_for_syntax_error(mock_telemetry, base_state)
         }
     )
 
-    result = synthesize_insight_node(state)
+    result = await synthesize_insight_node(state)
     content = result["messages"][0].content
 
     assert "users_private" not in content
     assert "An internal error occurred while processing your request." in content
 
 
-def test_synthesize_safe_category_passthrough(mock_telemetry, base_state):
+@pytest.mark.asyncio
+async def test_synthesize_safe_category_passthrough(mock_telemetry, base_state):
     """Verify that safe categories pass through the redacted error."""
     state = base_state.copy()
     state.update({"error": "Operation timed out after 30s", "error_category": "timeout"})
 
-    result = synthesize_insight_node(state)
+    result = await synthesize_insight_node(state)
     content = result["messages"][0].content
 
     # Check if the error is contained within the message
     assert "Operation timed out after 30s" in content
 
 
-def test_synthesize_unsupported_capability_specific(mock_telemetry, base_state):
+@pytest.mark.asyncio
+async def test_synthesize_unsupported_capability_specific(mock_telemetry, base_state):
     """Verify that unsupported_capability still gives specific feedback."""
     state = base_state.copy()
     state.update(
@@ -98,14 +103,15 @@ def test_synthesize_unsupported_capability_specific(mock_telemetry, base_state):
         }
     )
 
-    result = synthesize_insight_node(state)
+    result = await synthesize_insight_node(state)
     content = result["messages"][0].content
 
     assert "recursive_queries" in content
     assert "The database backend does not support" in content
 
 
-def test_synthesize_invalid_request_passthrough(mock_telemetry, base_state):
+@pytest.mark.asyncio
+async def test_synthesize_invalid_request_passthrough(mock_telemetry, base_state):
     """Verify that invalid_request (safe) passes through the redacted error."""
     state = base_state.copy()
     state.update(
@@ -115,7 +121,7 @@ def test_synthesize_invalid_request_passthrough(mock_telemetry, base_state):
         }
     )
 
-    result = synthesize_insight_node(state)
+    result = await synthesize_insight_node(state)
     content = result["messages"][0].content
 
     assert "I encountered a validation error" in content
@@ -26,7 +26,8 @@ def mock_llm_chain(monkeypatch):
     return mock_llm
 
 
-def test_synthesize_empty_with_filters_suggests_check(mock_telemetry, mock_llm_chain):
+@pytest.mark.asyncio
+async def test_synthesize_empty_with_filters_suggests_check(mock_telemetry, mock_llm_chain):
     """Test that empty results with WHERE clause triggers suggestion."""
     state = AgentState(
         messages=[],
@@ -40,14 +41,15 @@ def test_synthesize_empty_with_filters_suggests_check(mock_telemetry, mock_llm_c
     # But for test robustness I should patch it.
 
     with patch("agent.nodes.synthesize._sanity_check_enabled", return_value=True):
-        result = synthesize_insight_node(state)
+        result = await synthesize_insight_node(state)
         content = result["messages"][0].content
 
         assert "couldn't find any rows" in content
         assert "widening your filters" in content or "adjusting the time range" in content
 
 
-def test_synthesize_empty_no_filters_no_suggestion(mock_telemetry, mock_llm_chain):
+@pytest.mark.asyncio
+async def test_synthesize_empty_no_filters_no_suggestion(mock_telemetry, mock_llm_chain):
     """Test that empty results without filters does NOT trigger specific suggestion."""
     state = AgentState(
         messages=[],
@@ -57,7 +59,7 @@ def test_synthesize_empty_no_filters_no_suggestion(mock_telemetry, mock_llm_chai
     )
 
     with patch("agent.nodes.synthesize._sanity_check_enabled", return_value=True):
-        result = synthesize_insight_node(state)
+        result = await synthesize_insight_node(state)
         content = result["messages"][0].content
 
         assert "couldn't find any rows" in content
@@ -65,7 +67,8 @@ def test_synthesize_empty_no_filters_no_suggestion(mock_telemetry, mock_llm_chai
         assert "double-check filters" not in content
 
 
-def test_synthesize_empty_implies_existence(mock_telemetry, mock_llm_chain):
+@pytest.mark.asyncio
+async def test_synthesize_empty_implies_existence(mock_telemetry, mock_llm_chain):
     """Test that 'top/best' questions trigger suggestion."""
     # We need a HumanMessage in messages
     from langchain_core.messages import HumanMessage
@@ -78,7 +81,7 @@ def test_synthesize_empty_implies_existence(mock_telemetry, mock_llm_chain):
     )
 
     with patch("agent.nodes.synthesize._sanity_check_enabled", return_value=True):
-        result = synthesize_insight_node(state)
+        result = await synthesize_insight_node(state)
         content = result["messages"][0].content
 
         # _question_implies_existence should capture 'top'
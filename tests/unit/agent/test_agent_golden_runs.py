@@ -59,7 +59,7 @@ def _mock_llm(prompt_class):
 
     mock_response = MagicMock()
     mock_response.content = "Mock response."
-    mock_chain.invoke.return_value = mock_response
+    mock_chain.ainvoke = AsyncMock(return_value=mock_response)
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,184 @@
+"""Tests for the bounded agent checkpointer."""
+
+import operator
+from typing import Annotated, List, TypedDict
+
+import pytest
+from langgraph.graph import END, StateGraph
+
+from agent.state.checkpointer import BoundedMemorySaver, finish_thread
+
+
+class _State(TypedDict):
+    items: Annotated[List[str], operator.add]
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _FakeOffloadStore:
+    def __init__(self):
+        self.rows = {}
+
+    async def save(self, thread_id, payload):
+        self.rows[thread_id] = payload
+
+    async def load(self, thread_id):
+        return self.rows.pop(thread_id, None)
+
+    async def purge_expired(self):
+        pass
+
+
+def _app(checkpointer):
+    graph = StateGraph(_State)
+    graph.add_node("first", lambda state: {"items": ["a" * 100]})
+    graph.add_node("second", lambda state: {"items": ["b" * 100]})
+    graph.set_entry_point("first")
+    graph.add_edge("first", "second")
+    graph.add_edge("second", END)
+    return graph.compile(checkpointer=checkpointer)
+
+
+def _config(thread_id):
+    return {"configurable": {"thread_id": thread_id}}
+
+
+@pytest.mark.asyncio
+async def test_lru_thread_limit_evicts_least_recent():
+    """Only the most recently used threads are kept."""
+    saver = BoundedMemorySaver(max_threads=2, ttl_seconds=0)
+    app = _app(saver)
+
+    for thread_id in ("t1", "t2", "t3"):
+        await app.ainvoke({"items": []}, _config(thread_id))
+
+    assert saver.stats()["threads"] == 2
+    assert (await app.aget_state(_config("t1"))).values == {}
+    assert len((await app.aget_state(_config("t3"))).values["items"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_ttl_and_byte_budget():
+    """Idle threads expire, and the byte budget evicts down to the writing thread."""
+    clock = _Clock()
+    saver = BoundedMemorySaver(max_threads=0, ttl_seconds=60, clock=clock)
+    app = _app(saver)
+    await app.ainvoke({"items": []}, _config("idle"))
+
+    clock.now = 120
+    await app.ainvoke({"items": []}, _config("active"))
+    assert saver.stats()["threads"] == 1
+
+    saver.max_bytes = 1
+    await app.ainvoke({"items": []}, _config("next"))
+    assert saver.stats()["threads"] == 1
+    assert (await app.aget_state(_config("next"))).values["items"]
+
+
+@pytest.mark.asyncio
+async def test_compaction_keeps_only_latest_checkpoint():
+    """A finished run is compacted to one checkpoint without losing its state."""
+    saver = BoundedMemorySaver()
+    app = _app(saver)
+    await app.ainvoke({"items": []}, _config("t1"))
+    before = saver.stats()
+
+    finish_thread(saver, "t1")
+
+    after = saver.stats()
+    assert before["checkpoints"] > 1
+    assert after["checkpoints"] == 1
+    assert after["bytes"] < before["bytes"]
+    assert len((await app.aget_state(_config("t1"))).values["items"]) == 2
+
+    await app.ainvoke({"items": []}, _config("t1"))
+    assert len((await app.aget_state(_config("t1"))).values["items"]) == 4
+
+
+@pytest.mark.asyncio
+async def test_evicted_thread_is_offloaded_and_restored():
+    """Evicted threads round-trip through the offload store and resume their state."""
+    store = _FakeOffloadStore()
+    saver = BoundedMemorySaver(max_threads=1, ttl_seconds=0, offload_store=store)
+    app = _app(saver)
+
+    await app.ainvoke({"items": []}, _config("t1"))
+    await app.ainvoke({"items": []}, _config("t2"))
+    assert set(store.rows) == {"t1"}
+
+    await app.ainvoke({"items": []}, _config("t1"))
+
+    assert len((await app.aget_state(_config("t1"))).values["items"]) == 4
+    assert set(store.rows) == {"t2"}
+
+
+class _FakeControlPlaneConnection:
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+
+    async def fetchval(self, sql, *args):
+        self.statements.append(" ".join(sql.split()))
+        if sql.strip().startswith("SELECT"):
+            return args[0] in self.rows
+        return self.rows.pop(args[0], None)
+
+    async def execute(self, sql, *args):
+        self.statements.append(" ".join(sql.split()))
+
+
+@pytest.fixture
+def control_plane(monkeypatch):
+    """Patch the control-plane pool with an in-memory connection."""
+    from contextlib import asynccontextmanager
+
+    from mcp_server.config.control_plane import ControlPlaneDatabase
+
+    conn = _FakeControlPlaneConnection({"evicted": b"payload"})
+
+    @asynccontextmanager
+    async def _direct_connection(tenant_id=None):
+        yield conn
+
+    monkeypatch.setattr(ControlPlaneDatabase, "is_configured", classmethod(lambda cls: True))
+    monkeypatch.setattr(ControlPlaneDatabase, "get_direct_connection", _direct_connection)
+    return conn
+
+
+@pytest.mark.asyncio
+async def test_offload_store_load_only_reads_for_unknown_threads(control_plane):
+    """A brand-new thread costs one read; only a stored thread is claimed with DELETE."""
+    from agent.state.checkpointer import ControlPlaneCheckpointStore
+
+    store = ControlPlaneCheckpointStore()
+
+    assert await store.load("new-run") is None
+    assert len(control_plane.statements) == 1
+    assert control_plane.statements[0].startswith("SELECT EXISTS")
+
+    assert await store.load("evicted") == b"payload"
+    assert control_plane.statements[-1].startswith("DELETE FROM agent_checkpoints WHERE thread_id")
+    assert not any("expires_at <= NOW()" in sql for sql in control_plane.statements)
+
+
+@pytest.mark.asyncio
+async def test_offload_store_purges_expired_rows_at_most_once_per_interval(control_plane):
+    """Expired-row purges are rate limited instead of running on every restore."""
+    from agent.state.checkpointer import ControlPlaneCheckpointStore
+
+    clock = _Clock()
+    store = ControlPlaneCheckpointStore(purge_interval_seconds=60, clock=clock)
+
+    await store.purge_expired()
+    await store.purge_expired()
+    clock.now = 61.0
+    await store.purge_expired()
+
+    purges = [sql for sql in control_plane.statements if "expires_at <= NOW()" in sql]
+    assert len(purges) == 2
@@ -1,6 +1,6 @@
 """Unit tests for SQL correction node."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -18,9 +18,10 @@ class TestCorrectSqlNode:
         with patch.dict("os.environ", {"AGENT_CORRECTION_SIMILARITY_ENFORCE": "False"}):
             yield
 
+    @pytest.mark.asyncio
     @patch("agent.llm_client.get_llm")
     @patch("agent.nodes.correct.ChatPromptTemplate")
-    def test_correct_sql_node_success(self, mock_prompt_class, mock_llm):
+    async def test_correct_sql_node_success(self, mock_prompt_class, mock_llm):
         """Test successful SQL correction."""
         # Create mock prompt template and chain
         mock_prompt = MagicMock()
@@ -32,7 +33,7 @@ class TestCorrectSqlNode:
         # Create mock response
         mock_response = MagicMock()
         mock_response.content = "SELECT * FROM film"
-        mock_chain.invoke.return_value = mock_response
+        mock_chain.ainvoke = AsyncMock(return_value=mock_response)
 
         state = AgentState(
             messages=[],
@@ -43,14 +44,14 @@ class TestCorrectSqlNode:
             retry_count=0,
         )
 
-        result = correct_sql_node(state)
+        result = await correct_sql_node(state)
 
         # Verify prompt was created
         mock_prompt_class.from_messages.assert_called_once()
 
         # Verify chain was invoked with correct parameters
-        mock_chain.invoke.assert_called_once()
-        call_kwargs = mock_chain.invoke.call_args[0][0]
+        mock_chain.ainvoke.assert_called_once()
+        call_kwargs = mock_chain.ainvoke.call_args[0][0]
         assert "schema_context" in call_kwargs
         assert "bad_query" in call_kwargs
         assert "error_msg" in call_kwargs
@@ -64,9 +65,10 @@ class TestCorrectSqlNode:
         # Verify error reset
         assert result["error"] is None
 
+    @pytest.mark.asyncio
     @patch("agent.llm_client.get_llm")
     @patch("agent.nodes.correct.ChatPromptTemplate")
-    def test_correct_sql_node_prompt_budget_exceeded(
+    async def test_correct_sql_node_prompt_budget_exceeded(
         self, mock_prompt_class, mock_llm, monkeypatch
     ):
         """Prompt-byte budget should stop correction before invoking the LLM."""
@@ -88,16 +90,17 @@ class TestCorrectSqlNode:
             llm_budget_exceeded=False,
         )
 
-        result = correct_sql_node(state)
+        result = await correct_sql_node(state)
 
-        mock_chain.invoke.assert_not_called()
+        mock_chain.ainvoke.assert_not_called()
         mock_llm.assert_not_called()
         assert result["error_category"] == "budget_exceeded"
         assert result["llm_budget_exceeded"] is True
 
+    @pytest.mark.asyncio
     @patch("agent.llm_client.get_llm")
     @patch("agent.nodes.correct.ChatPromptTemplate")
-    def test_correct_sql_node_retry_count_increment(self, mock_prompt_class, mock_llm):
+    async def test_correct_sql_node_retry_count_increment(self, mock_prompt_class, mock_llm):
         """Test that retry_count is incremented."""
         mock_prompt = MagicMock()
         mock_chain = MagicMock()
@@ -107,7 +110,7 @@ class TestCorrectSqlNode:
 
         mock_response = MagicMock()
         mock_response.content = "SELECT film_id FROM film"
-        mock_chain.invoke.return_value = mock_response
+        mock_chain.ainvoke = AsyncMock(return_value=mock_response)
 
         state = AgentState(
             messages=[],
@@ -118,13 +121,14 @@ class TestCorrectSqlNode:
             retry_count=2,
         )
 
-        result = correct_sql_node(state)
+        result = await correct_sql_node(state)
 
         assert result["retry_count"] == 3
 
+    @pytest.mark.asyncio
     @patch("agent.llm_client.get_llm")
     @patch("agent.nodes.correct.ChatPromptTemplate")
-    def test_correct_sql_node_error_reset(self, mock_prompt_class, mock_llm):
+    async def test_correct_sql_node_error_reset(self, mock_prompt_class, mock_llm):
         """Test that error is reset to None."""
         mock_prompt = MagicMock()
         mock_chain = MagicMock()
@@ -134,7 +138,7 @@ class TestCorrectSqlNode:
 
         mock_response = MagicMock()
         mock_response.content = "SELECT * FROM film"
-        mock_chain.invoke.return_value = mock_response
+        mock_chain.ainvoke = AsyncMock(return_value=mock_response)
 
         state = AgentState(
             messages=[],
@@ -145,13 +149,14 @@ class TestCorrectSqlNode:
             retry_count=0,
         )
 
-        result = correct_sql_node(state)
+        result = await correct_sql_node(state)
 
         assert result["error"] is None
 
+    @pytest.mark.asyncio
     @patch("agent.llm_client.get_llm")
     @patch("agent.nodes.correct.ChatPromptTemplate")
-    def test_correct_sql_node_markdown_removal(self, mock_prompt_class, mock_llm):
+    async def test_correct_sql_node_markdown_removal(self, mock_prompt_class, mock_llm):
         """Test markdown code block removal from corrected SQL."""
         mock_prompt = MagicMock()
         mock_chain = MagicMock()
@@ -161,7 +166,7 @@ class TestCorrectSqlNode:
 
         mock_response = MagicMock()
         mock_response.content = "```sql\nSELECT * FROM film\n```"
-        mock_chain.invoke.return_value = mock_response
+        mock_chain.ainvoke = AsyncMock(return_value=mock_response)
 
         state = AgentState(
             messages=[],
@@ -172,13 +177,14 @@ class TestCorrectSqlNode:
             retry_count=0,
         )
 
-        result = correct_sql_node(state)
+        result = await correct_sql_node(state)
 
         assert result["current_sql"] == "SELECT * FROM film"
 
+    @pytest.mark.asyncio
     @patch("agent.llm_client.get_llm")
     @patch("agent.nodes.correct.ChatPromptTemplate")
-    def test_correct_sql_node_empty_schema_context(self, mock_prompt_class, mock_llm):
+    async def test_correct_sql_node_empty_schema_context(self, mock_prompt_class, mock_llm):
         """Test correction with empty schema_context."""
         mock_prompt = MagicMock()
         mock_chain = MagicMock()
@@ -188,7 +194,7 @@ class TestCorrectSqlNode:
 
         mock_response = MagicMock()
         mock_response.content = "SELECT 1"
-        mock_chain.invoke.return_value = mock_response
+        mock_chain.ainvoke = AsyncMock(return_value=mock_response)
 
         state = AgentState(
             messages=[],
@@ -199,17 +205,18 @@ class TestCorrectSqlNode:
             retry_count=0,
         )
 
-        result = correct_sql_node(state)
+        result = await correct_sql_node(state)
 
         # Verify empty schema_context was passed
-        call_kwargs = mock_chain.invoke.call_args[0][0]
+        call_kwargs = mock_chain.ainvoke.call_args[0][0]
         assert call_kwargs["schema_context"] == ""
 
         assert result["current_sql"] == "SELECT 1"
 
+    @pytest.mark.asyncio
     @patch("agent.llm_client.get_llm")
     @patch("agent.nodes.correct.ChatPromptTemplate")
-    def test_correct_sql_node_missing_retry_count(self, mock_prompt_class, mock_llm):
+    async def test_correct_sql_node_missing_retry_count(self, mock_prompt_class, mock_llm):
         """Test that retry_count defaults to 0 if missing."""
         mock_prompt = MagicMock()
         mock_chain = MagicMock()
@@ -219,7 +226,7 @@ class TestCorrectSqlNode:
 
         mock_response = MagicMock()
         mock_response.content = "SELECT * FROM film"
-        mock_chain.invoke.return_value = mock_response
+        mock_chain.ainvoke = AsyncMock(return_value=mock_response)
 
         # Create state without retry_count (should default to 0)
         # Use dict.get() to test the default value path
@@ -232,14 +239,15 @@ class TestCorrectSqlNode:
             # retry_count is missing - will use .get() default
         }
 
-        result = correct_sql_node(state)
+        result = await correct_sql_node(state)
 
         # Should increment from 0 to 1
         assert result["retry_count"] == 1
 
+    @pytest.mark.asyncio
     @patch("agent.llm_client.get_llm")
     @patch("agent.nodes.correct.ChatPromptTemplate")
-    def test_correct_sql_node_column_name_error(self, mock_prompt_class, mock_llm):
+    async def test_correct_sql_node_column_name_error(self, mock_prompt_class, mock_llm):
         """Test correction of column name errors."""
         mock_prompt = MagicMock()
         mock_chain = MagicMock()
@@ -249,7 +257,7 @@ class TestCorrectSqlNode:
 
         mock_response = MagicMock()
         mock_response.content = "SELECT film_id, title FROM film"
-        mock_chain.invoke.return_value = mock_response
+        mock_chain.ainvoke = AsyncMock(return_value=mock_response)
 
         state = AgentState(
             messages=[],
@@ -260,15 +268,16 @@ class TestCorrectSqlNode:
             retry_count=0,
         )
 
-        result = correct_sql_node(state)
+        result = await correct_sql_node(state)
 
         assert result["current_sql"] == "SELECT film_id, title FROM film"
         assert result["retry_count"] == 1
         assert result["error"] is None
 
+    @pytest.mark.asyncio
     @patch("agent.llm_client.get_llm")
     @patch("agent.nodes.correct.ChatPromptTemplate")
-    def test_correct_sql_node_syntax_error(self, mock_prompt_class, mock_llm):
+    async def test_correct_sql_node_syntax_error(self, mock_prompt_class, mock_llm):
         """Test correction of syntax errors."""
         mock_prompt = MagicMock()
         mock_chain = MagicMock()
@@ -278,7 +287,7 @@ class TestCorrectSqlNode:
 
         mock_response = MagicMock()
         mock_response.content = "SELECT * FROM film WHERE rating = 'PG'"
-        mock_chain.invoke.return_value = mock_response
+        mock_chain.ainvoke = AsyncMock(return_value=mock_response)
 
         state = AgentState(
             messages=[],
@@ -289,14 +298,15 @@ class TestCorrectSqlNode:
             retry_count=0,
         )
 
-        result = correct_sql_node(state)
+        result = await correct_sql_node(state)
 
         assert result["current_sql"] == "SELECT * FROM film WHERE rating = 'PG'"
         assert result["retry_count"] == 1
 
+    @pytest.mark.asyncio
     @patch("agent.llm_client.get_llm")
     @patch("agent.nodes.correct.ChatPromptTemplate")
-    def test_correct_sql_node_complex_markdown(self, mock_prompt_class, mock_llm):
+    async def test_correct_sql_node_complex_markdown(self, mock_prompt_class, mock_llm):
         """Test SQL extraction from complex markdown format."""
         mock_prompt = MagicMock()
         mock_chain = MagicMock()
@@ -306,7 +316,7 @@ class TestCorrectSqlNode:
 
         mock_response = MagicMock()
         mock_response.content = "```sql\n  SELECT COUNT(*)\n  FROM film\n  WHERE rating = 'PG'\n```"
-        mock_chain.invoke.return_value = mock_response
+        mock_chain.ainvoke = AsyncMock(return_value=mock_response)
 
         state = AgentState(
             messages=[],
@@ -317,12 +327,13 @@ class TestCorrectSqlNode:
             retry_count=0,
         )
 
-        result = correct_sql_node(state)
+        result = await correct_sql_node(state)
 
         expected_sql = "SELECT COUNT(*)\n  FROM film\n  WHERE rating = 'PG'"
         assert result["current_sql"] == expected_sql
 
-    def test_correct_sql_node_tracks_budget_exhaustion_in_correction_attempts(self):
+    @pytest.mark.asyncio
+    async def test_correct_sql_node_tracks_budget_exhaustion_in_correction_attempts(self):
         """Budget-exhausted exits should still produce correction attempt telemetry state."""
         state = AgentState(
             messages=[],
@@ -334,14 +345,15 @@ class TestCorrectSqlNode:
             token_budget={"max_tokens": 10, "consumed_tokens": 10},
         )
 
-        result = correct_sql_node(state)
+        result = await correct_sql_node(state)
 
         assert result["error_category"] == "budget_exceeded"
         assert result["correction_attempts"][-1]["outcome"] == "budget_exhausted"
 
+    @pytest.mark.asyncio
     @patch("agent.llm_client.get_llm")
     @patch("agent.nodes.correct.ChatPromptTemplate")
-    def test_correct_sql_node_tracks_repeated_error_stop(self, mock_prompt_class, mock_llm):
+    async def test_correct_sql_node_tracks_repeated_error_stop(self, mock_prompt_class, mock_llm):
         """Repeated-signature exits should preserve correction attempts and outcome."""
         error_msg = "syntax error near from"
         # The node will normalize "SYNTAX_ERROR" to likely "syntax" or "unknown"
@@ -362,12 +374,13 @@ class TestCorrectSqlNode:
             error_signatures=[signature],
         )
 
-        result = correct_sql_node(state)
+        result = await correct_sql_node(state)
 
         assert result["error_category"] == "repeated_error"
         assert result["correction_attempts"][-1]["outcome"] == "repeated_error"
 
-    def test_correction_attempts_memory_cap_sets_truncation_metadata(self, monkeypatch):
+    @pytest.mark.asyncio
+    async def test_correction_attempts_memory_cap_sets_truncation_metadata(self, monkeypatch):
         """Correction history should stay bounded and expose truncation metadata."""
         monkeypatch.setenv("AGENT_RETRY_SUMMARY_MAX_EVENTS", "1")
         state = AgentState(
@@ -381,7 +394,7 @@ class TestCorrectSqlNode:
             correction_attempts=[{"attempt": 0, "outcome": "seed"}],
         )
 
-        result = correct_sql_node(state)
+        result = await correct_sql_node(state)
 
         assert len(result["correction_attempts"]) == 1
         assert result["correction_attempts_truncated"] is True
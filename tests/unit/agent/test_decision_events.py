@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -63,9 +63,10 @@ def test_replay_mode_fast_fail_emits_decision_event(monkeypatch):
     assert event["reason"] == "MAX_RETRIES_REACHED"
 
 
+@pytest.mark.asyncio
 @patch("agent.llm_client.get_llm")
 @patch("agent.nodes.correct.ChatPromptTemplate")
-def test_correct_node_emits_throttle_sleep_event(mock_prompt_class, mock_llm, monkeypatch):
+async def test_correct_node_emits_throttle_sleep_event(mock_prompt_class, mock_llm, monkeypatch):
     """Correction path should emit throttle_sleep events when retry_after is applied."""
     monkeypatch.setattr("agent.nodes.correct.time.sleep", lambda _: None)
 
@@ -77,7 +78,7 @@ def test_correct_node_emits_throttle_sleep_event(mock_prompt_class, mock_llm, mo
 
     mock_response = MagicMock()
     mock_response.content = "SELECT 1"
-    mock_chain.invoke.return_value = mock_response
+    mock_chain.ainvoke = AsyncMock(return_value=mock_response)
 
     state = {
         "run_id": "run-sleep",
@@ -90,7 +91,7 @@ def test_correct_node_emits_throttle_sleep_event(mock_prompt_class, mock_llm, mo
         "retry_after_seconds": 1.2,
     }
 
-    _ = correct_sql_node(state)
+    _ = await correct_sql_node(state)
     sleep_event = state["decision_events"][-1]
     assert sleep_event["decision"] == "throttle_sleep"
     assert sleep_event["reason"] == "retry_after_sleep"
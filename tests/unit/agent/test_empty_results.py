@@ -6,8 +6,9 @@ from agent.nodes.synthesize import synthesize_insight_node
 from agent.state import AgentState
 
 
+@pytest.mark.asyncio
 @pytest.mark.parametrize("schema_drift", [False, True])
-def test_empty_results_message_includes_guidance(schema_drift):
+async def test_empty_results_message_includes_guidance(schema_drift):
     """Empty results should provide guidance and optional drift hint."""
     from langchain_core.messages import HumanMessage
 
@@ -21,7 +22,7 @@ def test_empty_results_message_includes_guidance(schema_drift):
         schema_drift_suspected=schema_drift,
     )
 
-    result = synthesize_insight_node(state)
+    result = await synthesize_insight_node(state)
     content = result["messages"][0].content
     assert "couldn't find any rows" in content.lower()
     assert "widening your filters" in content.lower()
@@ -29,7 +30,8 @@ def test_empty_results_message_includes_guidance(schema_drift):
         assert "schema may have changed" in content.lower()
 
 
-def test_empty_results_sanity_check_flag(monkeypatch):
+@pytest.mark.asyncio
+async def test_empty_results_sanity_check_flag(monkeypatch):
     """Sanity check adds extra caution when enabled."""
     from langchain_core.messages import HumanMessage
 
@@ -43,6 +45,6 @@ def test_empty_results_sanity_check_flag(monkeypatch):
         retry_count=0,
     )
 
-    result = synthesize_insight_node(state)
+    result = await synthesize_insight_node(state)
     content = result["messages"][0].content.lower()
     assert "double-check filters" in content
@@ -1,6 +1,6 @@
 """Unit tests for SQL generation node."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -36,7 +36,7 @@ class TestGenerateSqlNode:
         # Create mock response
         mock_response = MagicMock()
         mock_response.content = "SELECT COUNT(*) FROM film"
-        mock_chain.invoke.return_value = mock_response
+        mock_chain.ainvoke = AsyncMock(return_value=mock_response)
 
         # Create test state
         from langchain_core.messages import HumanMessage
@@ -56,8 +56,8 @@ class TestGenerateSqlNode:
         mock_prompt_class.from_messages.assert_called_once()
 
         # Verify chain was invoked with correct parameters
-        mock_chain.invoke.assert_called_once()
-        call_kwargs = mock_chain.invoke.call_args[0][0]
+        mock_chain.ainvoke.assert_called_once()
+        call_kwargs = mock_chain.ainvoke.call_args[0][0]
         assert "schema_context" in call_kwargs
         assert "question" in call_kwargs
         assert call_kwargs["question"] == "How many films are there?"
@@ -83,7 +83,7 @@ class TestGenerateSqlNode:
 
         mock_response = MagicMock()
         mock_response.content = "```sql\nSELECT * FROM film\n```"
-        mock_chain.invoke.return_value = mock_response
+        mock_chain.ainvoke = AsyncMock(return_value=mock_response)
 
         from langchain_core.messages import HumanMessage
 
@@ -117,7 +117,7 @@ class TestGenerateSqlNode:
 
         mock_response = MagicMock()
         mock_response.content = "```\nSELECT * FROM film\n```"
-        mock_chain.invoke.return_value = mock_response
+        mock_chain.ainvoke = AsyncMock(return_value=mock_response)
 
         from langchain_core.messages import HumanMessage
 
@@ -151,7 +151,7 @@ class TestGenerateSqlNode:
 
         mock_response = MagicMock()
         mock_response.content = "SELECT * FROM film"
-        mock_chain.invoke.return_value = mock_response
+        mock_chain.ainvoke = AsyncMock(return_value=mock_response)
 
         from langchain_core.messages import HumanMessage
 
@@ -185,7 +185,7 @@ class TestGenerateSqlNode:
 
         mock_response = MagicMock()
         mock_response.content = "SELECT 1"
-        mock_chain.invoke.return_value = mock_response
+        mock_chain.ainvoke = AsyncMock(return_value=mock_response)
 
         from langchain_core.messages import HumanMessage
 
@@ -201,7 +201,7 @@ class TestGenerateSqlNode:
         result = await generate_sql_node(state)
 
         # Verify empty schema_context was passed
-        call_kwargs = mock_chain.invoke.call_args[0][0]
+        call_kwargs = mock_chain.ainvoke.call_args[0][0]
         assert call_kwargs["schema_context"] == ""
 
         assert result["current_sql"] == "SELECT 1"
@@ -223,7 +223,7 @@ class TestGenerateSqlNode:
 
         mock_response = MagicMock()
         mock_response.content = "SELECT * FROM customer"
-        mock_chain.invoke.return_value = mock_response
+        mock_chain.ainvoke = AsyncMock(return_value=mock_response)
 
         from langchain_core.messages import AIMessage, HumanMessage
 
@@ -243,7 +243,7 @@ class TestGenerateSqlNode:
         result = await generate_sql_node(state)
 
         # Verify last message content was used
-        call_kwargs = mock_chain.invoke.call_args[0][0]
+        call_kwargs = mock_chain.ainvoke.call_args[0][0]
         assert call_kwargs["question"] == "Second question"
 
         assert result["current_sql"] == "SELECT * FROM customer"
@@ -265,7 +265,7 @@ class TestGenerateSqlNode:
 
         mock_response = MagicMock()
         mock_response.content = "  SELECT * FROM film  "
-        mock_chain.invoke.return_value = mock_response
+        mock_chain.ainvoke = AsyncMock(return_value=mock_response)
 
         from langchain_core.messages import HumanMessage
 
@@ -301,7 +301,7 @@ class TestGenerateSqlNode:
         mock_response.content = (
             "```sql\n  SELECT COUNT(*) as count\n  FROM film\n  WHERE rating = 'PG'\n```"
         )
-        mock_chain.invoke.return_value = mock_response
+        mock_chain.ainvoke = AsyncMock(return_value=mock_response)
 
         from langchain_core.messages import HumanMessage
 
@@ -350,7 +350,7 @@ class TestGenerateSqlNode:
 
         result = await generate_sql_node(state)
 
-        mock_chain.invoke.assert_not_called()
+        mock_chain.ainvoke.assert_not_called()
         mock_llm.assert_not_called()
         assert result["error_category"] == "budget_exhausted"
         assert result["llm_budget_exceeded"] is True
@@ -45,7 +45,7 @@ async def test_generate_few_shot_integration(
     # but since we mock the chain result via prompt | llm, we assume valid chain construction.
     # The unused assignment caused lint error.
     mock_prompt_instance.__or__.return_value = mock_chain
-    mock_chain.invoke.return_value.content = "SELECT 1"
+    mock_chain.ainvoke = AsyncMock(return_value=MagicMock(content="SELECT 1"))
 
     # State
     from langchain_core.messages import HumanMessage
@@ -62,7 +62,7 @@ class TestGenerateSchema(unittest.IsolatedAsyncioTestCase):
         mock_chain = MagicMock()
         mock_prompt_class.from_messages.return_value = mock_prompt_instance
         mock_prompt_instance.__or__.return_value = mock_chain
-        mock_chain.invoke.return_value.content = "SELECT * FROM film"
+        mock_chain.ainvoke = AsyncMock(return_value=MagicMock(content="SELECT * FROM film"))
 
         # Simulate schema_context from retrieve node (compact markdown format)
         schema_context = """# Schema Context
@@ -86,7 +86,7 @@ class TestGenerateSchema(unittest.IsolatedAsyncioTestCase):
         await generate_sql_node(state)
 
         # Verify Prompt content
-        args, _ = mock_chain.invoke.call_args
+        args, _ = mock_chain.ainvoke.call_args
         chain_input = args[0]
 
         # Check that schema_context was passed to the LLM
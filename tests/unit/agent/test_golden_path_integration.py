@@ -54,7 +54,7 @@ def _mock_prompt_response(mock_prompt_class, content: str) -> None:
     response = MagicMock()
     response.content = content
     response.response_metadata = {}
-    chain.invoke.return_value = response
+    chain.ainvoke = AsyncMock(return_value=response)
 
 
 @pytest.mark.asyncio
@@ -1,6 +1,6 @@
 """Tests for limit disclosure and parsing."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from langchain_core.messages import HumanMessage
@@ -45,9 +45,10 @@ async def test_validate_sets_result_limit_from_limit_clause():
     assert result.get("result_limit") == 10
 
 
+@pytest.mark.asyncio
 @patch("agent.llm_client.get_llm")
 @patch("agent.nodes.synthesize.ChatPromptTemplate")
-def test_synthesize_includes_limit_disclosure(mock_prompt_class, mock_llm):
+async def test_synthesize_includes_limit_disclosure(mock_prompt_class, mock_llm):
     """Ensure limit disclosure is prepended to responses."""
     mock_prompt = MagicMock()
     mock_chain = MagicMock()
@@ -57,7 +58,7 @@ def test_synthesize_includes_limit_disclosure(mock_prompt_class, mock_llm):
 
     mock_response = MagicMock()
     mock_response.content = "Here are the top customers."
-    mock_chain.invoke.return_value = mock_response
+    mock_chain.ainvoke = AsyncMock(return_value=mock_response)
 
     state = AgentState(
         messages=[HumanMessage(content="Top customers")],
@@ -70,15 +71,16 @@ def test_synthesize_includes_limit_disclosure(mock_prompt_class, mock_llm):
         retry_count=0,
     )
 
-    result = synthesize_insight_node(state)
+    result = await synthesize_insight_node(state)
     content = result["messages"][0].content
     assert "limited to the top 5 rows" in content
     assert "Here are the top customers." in content
 
 
+@pytest.mark.asyncio
 @patch("agent.llm_client.get_llm")
 @patch("agent.nodes.synthesize.ChatPromptTemplate")
-def test_synthesize_handles_limit_and_truncation_together(mock_prompt_class, mock_llm):
+async def test_synthesize_handles_limit_and_truncation_together(mock_prompt_class, mock_llm):
     """Ensure both limit and truncation disclosures appear."""
     mock_prompt = MagicMock()
     mock_chain = MagicMock()
@@ -88,7 +90,7 @@ def test_synthesize_handles_limit_and_truncation_together(mock_prompt_class, moc
 
     mock_response = MagicMock()
     mock_response.content = "Results summary."
-    mock_chain.invoke.return_value = mock_response
+    mock_chain.ainvoke = AsyncMock(return_value=mock_response)
 
     state = AgentState(
         messages=[HumanMessage(content="Top customers")],
@@ -104,7 +106,7 @@ def test_synthesize_handles_limit_and_truncation_together(mock_prompt_class, moc
         retry_count=0,
     )
 
-    result = synthesize_insight_node(state)
+    result = await synthesize_insight_node(state)
     content = result["messages"][0].content
     assert "Results are truncated" in content
     assert "limited to the top 5 rows" in content
@@ -0,0 +1,240 @@
+"""Tests for the process-wide MCP session pool."""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from agent.mcp_client.manager import RetryConfig, create_resilient_invoke_fn
+from agent.mcp_client.sdk_client import ToolInfo
+from agent.mcp_client.session_pool import (
+    McpSessionPool,
+    SessionPoolConfig,
+    connection_headers,
+    get_mcp_session_pool,
+)
+
+
+class _FakeClient:
+    """Minimal MCPClient stand-in that records connection lifecycle."""
+
+    instances: list = []
+
+    def __init__(self, server_version="1.0.0", call_delay=0.0):
+        self.server_version = server_version
+        self.call_delay = call_delay
+        self.connects = 0
+        self.disconnects = 0
+        self.list_calls = 0
+        self.call_results: list = []
+        self.ping_ok = True
+        _FakeClient.instances.append(self)
+
+    @asynccontextmanager
+    async def connect(self):
+        self.connects += 1
+        try:
+            yield self
+        finally:
+            self.disconnects += 1
+
+    async def list_tools(self):
+        self.list_calls += 1
+        return [ToolInfo(name="list_tables", description="", input_schema={})]
+
+    async def call_tool(self, name, arguments):
+        if self.call_delay:
+            await asyncio.sleep(self.call_delay)
+        if self.call_results:
+            outcome = self.call_results.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+        return {"tool": name, "arguments": arguments}
+
+    async def ping(self):
+        if not self.ping_ok:
+            raise ConnectionError("connection reset")
+
+
+@pytest.fixture(autouse=True)
+def _reset_fake_clients():
+    _FakeClient.instances = []
+    yield
+    _FakeClient.instances = []
+
+
+def _pool(factory=_FakeClient, **config_overrides) -> McpSessionPool:
+    return McpSessionPool(
+        server_url="http://localhost:8000/messages",
+        config=SessionPoolConfig(**config_overrides),
+        client_factory=factory,
+    )
+
+
+@pytest.mark.asyncio
+async def test_tool_catalog_is_cached_across_calls():
+    """Repeated catalog reads should reuse one session and one list_tools call."""
+    pool = _pool()
+    try:
+        first = await pool.get_tool_catalog()
+        second = await pool.get_tool_catalog()
+    finally:
+        await pool.close()
+
+    assert [t.name for t in first] == ["list_tables"]
+    assert [t.name for t in second] == ["list_tables"]
+    assert len(_FakeClient.instances) == 1
+    assert _FakeClient.instances[0].list_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_tool_catalog_refreshes_after_ttl_expiry():
+    """A zero TTL forces a refetch on every read without reconnecting."""
+    pool = _pool(catalog_ttl_seconds=0.0)
+    try:
+        await pool.get_tool_catalog()
+        await pool.get_tool_catalog()
+    finally:
+        await pool.close()
+
+    assert len(_FakeClient.instances) == 1
+    assert _FakeClient.instances[0].list_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_server_version_change_invalidates_catalog():
+    """A new session reporting a different server version drops the cached catalog."""
+    versions = iter(["1.0.0", "2.0.0"])
+    pool = _pool(factory=lambda: _FakeClient(server_version=next(versions)))
+    try:
+        await pool.get_tool_catalog()
+        pool._sessions[0].broken = True
+        await pool.call_tool("list_tables", {})
+        assert pool.get_stats()["catalog_cached"] is False
+        await pool.get_tool_catalog()
+        assert pool.get_stats()["catalog_server_version"] == "2.0.0"
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_are_multiplexed_over_one_session():
+    """In-flight calls should share a session instead of opening new connections."""
+    pool = _pool(
+        factory=lambda: _FakeClient(call_delay=0.01),
+        max_sessions=4,
+        max_concurrent_calls_per_session=8,
+    )
+    try:
+        results = await asyncio.gather(*(pool.call_tool("t", {"i": i}) for i in range(8)))
+    finally:
+        await pool.close()
+
+    assert [r["arguments"]["i"] for r in results] == list(range(8))
+    assert len(_FakeClient.instances) == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_grows_when_sessions_are_saturated():
+    """The pool opens extra sessions up to max_sessions when per-session limits are hit."""
+    pool = _pool(
+        factory=lambda: _FakeClient(call_delay=0.02),
+        max_sessions=2,
+        max_concurrent_calls_per_session=1,
+    )
+    try:
+        await asyncio.gather(*(pool.call_tool("t", {}) for _ in range(4)))
+        assert pool.size == 2
+    finally:
+        await pool.close()
+
+    assert len(_FakeClient.instances) == 2
+    assert all(client.disconnects == 1 for client in _FakeClient.instances)
+
+
+@pytest.mark.asyncio
+async def test_transient_failure_replaces_session():
+    """Connection-level failures should discard the session and count a reconnect."""
+    pool = _pool()
+    try:
+        await pool.call_tool("t", {})
+        _FakeClient.instances[0].call_results.append(ConnectionError("connection reset"))
+        with pytest.raises(ConnectionError):
+            await pool.call_tool("t", {})
+        await pool.call_tool("t", {})
+        assert pool.get_stats()["reconnects"] == 1
+    finally:
+        await pool.close()
+
+    assert len(_FakeClient.instances) == 2
+    assert _FakeClient.instances[0].disconnects == 1
+
+
+@pytest.mark.asyncio
+async def test_tool_level_error_keeps_session():
+    """Errors reported by the tool itself travel over a healthy session."""
+    pool = _pool()
+    try:
+        await pool.call_tool("t", {})
+        _FakeClient.instances[0].call_results.append(Exception("MCP tool 't' error: boom"))
+        with pytest.raises(Exception, match="boom"):
+            await pool.call_tool("t", {})
+        await pool.call_tool("t", {})
+        assert pool.get_stats()["reconnects"] == 0
+    finally:
+        await pool.close()
+
+    assert len(_FakeClient.instances) == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_health_check_reconnects_idle_session():
+    """Idle sessions are pinged before reuse and replaced when the ping fails."""
+    pool = _pool(health_check_interval_seconds=0.0)
+    try:
+        await pool.call_tool("t", {})
+        _FakeClient.instances[0].ping_ok = False
+        await pool.call_tool("t", {})
+        assert pool.get_stats()["reconnects"] == 1
+    finally:
+        await pool.close()
+
+    assert len(_FakeClient.instances) == 2
+
+
+@pytest.mark.asyncio
+async def test_resilient_invoke_fn_retries_over_pool():
+    """Pooled invoke functions keep retry semantics for transient failures."""
+    pool = _pool()
+    invoke = create_resilient_invoke_fn(
+        "http://localhost:8000/messages",
+        "sse",
+        "t",
+        pool=pool,
+        retry_config=RetryConfig(max_retries=1, base_delay_seconds=0.0),
+    )
+    try:
+        await pool.call_tool("warmup", {})
+        _FakeClient.instances[0].call_results.append(TimeoutError("timed out"))
+        result = await invoke({"x": 1})
+    finally:
+        await pool.close()
+
+    assert result == {"tool": "t", "arguments": {"x": 1}}
+    assert len(_FakeClient.instances) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_mcp_session_pool_shares_pool_across_run_headers():
+    """Per-run headers must not fragment the process-wide pool."""
+    first = get_mcp_session_pool("http://mcp/messages", "sse", {"X-Run-ID": "run-1"})
+    second = get_mcp_session_pool("http://mcp/messages", "sse", {"X-Run-ID": "run-2"})
+    assert first is second
+    assert "X-Run-ID" not in first.headers
+
+
+def test_connection_headers_strip_per_run_values():
+    """Only connection-scoped headers are kept for pooled sessions."""
+    headers = {"X-Internal-Token": "secret", "X-Run-ID": "r", "X-Request-ID": "q"}
+    assert connection_headers(headers) == {"X-Internal-Token": "secret"}
@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from langchain_core.messages import AIMessage
@@ -91,7 +91,7 @@ async def test_generate_node_telemetry():
             "token_usage": {"prompt_tokens": 11, "completion_tokens": 22, "total_tokens": 33}
         },
     )
-    mock_chain.invoke.return_value = mock_response
+    mock_chain.ainvoke = AsyncMock(return_value=mock_response)
 
     # Mock get_few_shot_examples to avoid async issues or tools import
     # We need to patch where it's used
@@ -1,6 +1,6 @@
 """P0 retry budget estimation tests."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -85,7 +85,7 @@ async def test_integration_slow_correction_influences_budget(monkeypatch):
     mock_prompt.__or__ = MagicMock(return_value=mock_chain)
     mock_response = MagicMock()
     mock_response.content = "SELECT 1"
-    mock_chain.invoke.return_value = mock_response
+    mock_chain.ainvoke = AsyncMock(return_value=mock_response)
 
     with (
         patch("agent.nodes.correct.ChatPromptTemplate") as mock_prompt_class,
@@ -95,7 +95,7 @@ async def test_integration_slow_correction_influences_budget(monkeypatch):
         mock_prompt_class.from_messages.return_value = mock_prompt
         mock_span.return_value.__enter__ = MagicMock(return_value=MagicMock())
         mock_span.return_value.__exit__ = MagicMock(return_value=False)
-        result = correct_sql_node(state)
+        result = await correct_sql_node(state)
 
     result["deadline_ts"] = 14.0
     result["error"] = "Execution error"
@@ -1,7 +1,7 @@
 """Unit tests for SQL-of-Thought planner node."""
 
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from langchain_core.messages import HumanMessage
@@ -76,7 +76,7 @@ class TestPlanSqlNode:
         mock_response.content = plan_json
 
         mock_chain = MagicMock()
-        mock_chain.invoke = MagicMock(return_value=mock_response)
+        mock_chain.ainvoke = AsyncMock(return_value=mock_response)
 
         with (
             patch("agent.nodes.plan.telemetry.start_span", return_value=create_mock_span()),
@@ -120,7 +120,7 @@ class TestPlanSqlNode:
         mock_response.content = plan_json
 
         mock_chain = MagicMock()
-        mock_chain.invoke = MagicMock(return_value=mock_response)
+        mock_chain.ainvoke = AsyncMock(return_value=mock_response)
 
         with (
             patch("agent.nodes.plan.telemetry.start_span", return_value=create_mock_span()),
@@ -141,7 +141,7 @@ class TestPlanSqlNode:
         mock_response.content = "This is not valid JSON - just raw text plan"
 
         mock_chain = MagicMock()
-        mock_chain.invoke = MagicMock(return_value=mock_response)
+        mock_chain.ainvoke = AsyncMock(return_value=mock_response)
 
         with (
             patch("agent.nodes.plan.telemetry.start_span", return_value=create_mock_span()),
@@ -1,6 +1,8 @@
 """Tests for retry observability attributes."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
 
 from agent.nodes.correct import correct_sql_node
 from agent.state import AgentState
@@ -14,9 +16,12 @@ def _mock_span_ctx(mock_start_span):
     return mock_span
 
 
+@pytest.mark.asyncio
 @patch("agent.llm_client.get_llm")
 @patch("agent.nodes.correct.ChatPromptTemplate")
-def test_retry_observability_emits_bounded_attributes(mock_prompt_class, mock_llm, monkeypatch):
+async def test_retry_observability_emits_bounded_attributes(
+    mock_prompt_class, mock_llm, monkeypatch
+):
     """Retry observability uses bounded reason categories."""
     mock_prompt = MagicMock()
     mock_chain = MagicMock()
@@ -26,7 +31,7 @@ def test_retry_observability_emits_bounded_attributes(mock_prompt_class, mock_ll
 
     mock_response = MagicMock()
     mock_response.content = "SELECT 1"
-    mock_chain.invoke.return_value = mock_response
+    mock_chain.ainvoke = AsyncMock(return_value=mock_response)
 
     monkeypatch.setenv("QUERY_TARGET_BACKEND", "postgres")
 
@@ -46,7 +51,7 @@ def test_retry_observability_emits_bounded_attributes(mock_prompt_class, mock_ll
             retry_count=1,
         )
 
-        correct_sql_node(state)
+        await correct_sql_node(state)
 
         expected_categories = set(ERROR_TAXONOMY.keys()) | {"UNKNOWN"}
         call_args = [
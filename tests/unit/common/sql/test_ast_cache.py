@@ -0,0 +1,94 @@
+"""Tests for the shared SQL AST cache."""
+
+import pytest
+import sqlglot
+from sqlglot import exp
+from sqlglot.errors import ParseError
+
+from common.sql.ast_cache import SqlAstCache
+
+
+def test_hit_returns_independent_copy():
+    """Mutating a returned tree does not leak into later callers."""
+    cache = SqlAstCache(max_entries=4)
+
+    first = cache.parse_one("SELECT id FROM users")
+    first.set("where", exp.Where(this=exp.false()))
+    second = cache.parse_one("SELECT id FROM users")
+
+    assert second.args.get("where") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_shared_tree_without_copy():
+    """Read-only callers can opt out of the copy and share one tree."""
+    cache = SqlAstCache(max_entries=4)
+
+    assert cache.parse("SELECT 1", copy=False)[0] is cache.parse("SELECT 1", copy=False)[0]
+
+
+def test_dialect_is_part_of_the_key():
+    """The same text parsed under another dialect is a separate entry."""
+    cache = SqlAstCache(max_entries=4)
+
+    cache.parse("SELECT 1", "postgres")
+    cache.parse("SELECT 1", "duckdb")
+    cache.parse("SELECT 1", sqlglot.Dialect.get("duckdb"))
+    cache.parse("SELECT 1", sqlglot.Dialect.get("duckdb"))
+
+    assert cache.stats()["entries"] == 3
+    assert cache.stats()["hits"] == 1
+
+
+def test_parse_errors_are_cached_and_reraised():
+    """A failed parse is not retried but raises the same error every time."""
+    cache = SqlAstCache(max_entries=4)
+
+    for _ in range(2):
+        with pytest.raises(ParseError):
+            cache.parse("SELECT FROM (")
+    with pytest.raises(ParseError):
+        cache.parse_one("")
+
+    assert cache.stats()["misses"] == 2
+
+
+def test_cached_parse_error_is_raised_as_a_fresh_object():
+    """Each hit raises a new exception whose traceback does not grow."""
+    cache = SqlAstCache(max_entries=4)
+    raised = []
+    for _ in range(4):
+        try:
+            cache.parse("SELECT FROM (")
+        except ParseError as e:
+            raised.append(e)
+
+    assert len({id(e) for e in raised}) == 4
+    depths = []
+    for error in raised:
+        depth, tb = 0, error.__traceback__
+        while tb is not None:
+            depth, tb = depth + 1, tb.tb_next
+        depths.append(depth)
+    assert depths[1:] == [depths[1]] * 3
+    assert depths[-1] <= 2
+    assert raised[-1].errors == raised[0].errors
+    assert raised[-1].errors is not raised[0].errors
+
+
+def test_lru_bound_and_disabled_cache():
+    """The cache keeps the most recent entries and can be switched off."""
+    cache = SqlAstCache(max_entries=2)
+    for sql in ("SELECT 1", "SELECT 2", "SELECT 1", "SELECT 3"):
+        cache.parse(sql)
+
+    assert cache.stats()["entries"] == 2
+    cache.parse("SELECT 1")
+    assert cache.stats()["hits"] == 2
+
+    disabled = SqlAstCache(max_entries=0)
+    disabled.parse("SELECT 1")
+    disabled.parse("SELECT 1")
+    assert disabled.stats()["entries"] == 0
+    assert disabled.stats()["misses"] == 2
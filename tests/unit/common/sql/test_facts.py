@@ -0,0 +1,65 @@
+"""Tests for single-pass SQL facts collection."""
+
+import sqlglot
+from sqlglot import exp
+
+from common.sql.facts import collect_sql_facts, get_sql_facts
+
+SQL = """
+WITH recent AS (SELECT customer_id FROM orders WHERE total > 10)
+SELECT c.id, COUNT(*) AS n, ROW_NUMBER() OVER (ORDER BY c.id)
+FROM customers c, regions r
+JOIN recent ON recent.customer_id = c.id
+CROSS JOIN segments s
+WHERE c.id IN (SELECT id FROM (SELECT id FROM vip) AS v)
+GROUP BY c.id
+UNION ALL
+SELECT 1, 2, 3 FROM dual
+"""
+
+
+def test_inventories_match_find_all_order():
+    """Each inventory lists the same nodes, in the same order, as find_all."""
+    expression = sqlglot.parse_one(SQL, read="postgres")
+    facts = collect_sql_facts(expression)
+
+    for field, node_type in (
+        ("selects", exp.Select),
+        ("joins", exp.Join),
+        ("ctes", exp.CTE),
+        ("subqueries", exp.Subquery),
+        ("tables", exp.Table),
+        ("columns", exp.Column),
+        ("functions", exp.Func),
+        ("windows", exp.Window),
+        ("set_operations", exp.SetOperation),
+    ):
+        expected = list(expression.find_all(node_type))
+        assert [id(n) for n in getattr(facts, field)] == [id(n) for n in expected], field
+
+    assert facts.node_count == sum(1 for _ in expression.walk())
+    assert facts.join_count == 3
+    assert facts.subquery_depth == 2
+    assert facts.scope_depth == 3
+    assert facts.cte_names == {"recent"}
+    assert facts.blocked_statement is None
+    assert not facts.has_modifying_cte
+
+
+def test_write_statements_and_modifying_ctes():
+    """DML inside a CTE body is flagged and listed."""
+    expression = sqlglot.parse_one(
+        "WITH d AS (DELETE FROM users RETURNING id) SELECT * FROM d", read="postgres"
+    )
+    facts = collect_sql_facts(expression)
+
+    assert facts.has_modifying_cte
+    assert [type(n) for n in facts.write_statements] == [exp.Delete]
+
+
+def test_memoized_facts_follow_object_identity():
+    """Shared trees reuse their facts; structurally equal copies do not."""
+    expression = sqlglot.parse_one("SELECT id FROM users")
+
+    assert get_sql_facts(expression) is get_sql_facts(expression)
+    assert get_sql_facts(expression.copy()) is not get_sql_facts(expression)
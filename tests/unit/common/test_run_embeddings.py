@@ -0,0 +1,85 @@
+"""Tests for the run-scoped embedding memo."""
+
+import asyncio
+
+import pytest
+
+from common.observability.context import run_id_var
+from common.utils.run_embeddings import RunEmbeddingMemo, embedding_scope
+
+
+def _counting_compute(calls, value=None, delay=0.0):
+    async def _compute():
+        calls.append(1)
+        if delay:
+            await asyncio.sleep(delay)
+        return value if value is not None else [float(len(calls))]
+
+    return _compute
+
+
+@pytest.mark.asyncio
+async def test_same_run_reuses_embedding_per_model():
+    """A question is embedded once per run and per model."""
+    memo = RunEmbeddingMemo()
+    calls = []
+    token = run_id_var.set("run-1")
+    try:
+        first = await memo.get_or_compute("m", "top customers", _counting_compute(calls))
+        again = await memo.get_or_compute("m", "top  customers ", _counting_compute(calls))
+        other_model = await memo.get_or_compute("m2", "top customers", _counting_compute(calls))
+    finally:
+        run_id_var.reset(token)
+
+    assert first == again == [1.0]
+    assert other_model == [2.0]
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_no_scope_is_not_memoized():
+    """Without a run or local scope every call computes."""
+    memo = RunEmbeddingMemo()
+    calls = []
+    await memo.get_or_compute("m", "q", _counting_compute(calls))
+    await memo.get_or_compute("m", "q", _counting_compute(calls))
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_local_scope_and_concurrent_callers_share_computation():
+    """Concurrent lookups inside embedding_scope() share one in-flight call."""
+    memo = RunEmbeddingMemo()
+    calls = []
+    with embedding_scope():
+        results = await asyncio.gather(
+            *[
+                memo.get_or_compute("m", "q", _counting_compute(calls, [0.5], 0.01))
+                for _ in range(3)
+            ]
+        )
+    assert results == [[0.5]] * 3
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_failures_are_not_memoized():
+    """A failed computation is retried by the next caller."""
+    memo = RunEmbeddingMemo()
+
+    async def _fail():
+        raise RuntimeError("provider down")
+
+    calls = []
+    with embedding_scope():
+        with pytest.raises(RuntimeError):
+            await memo.get_or_compute("m", "q", _fail)
+        assert await memo.get_or_compute("m", "q", _counting_compute(calls)) == [1.0]
+
+
+def test_oldest_run_is_evicted():
+    """Only max_runs runs are retained."""
+    memo = RunEmbeddingMemo(max_runs=2)
+    for scope in ("a", "b", "c"):
+        memo._entries(scope)[("m", "q")] = [1.0]
+    assert list(memo._runs) == ["b", "c"]
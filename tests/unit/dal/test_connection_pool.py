@@ -0,0 +1,162 @@
+"""Tests for the embedded query-target connection pool."""
+
+import asyncio
+
+import pytest
+
+from dal.util.connection_pool import EmbeddedConnectionPool
+
+
+class _Connections:
+    def __init__(self):
+        self.opened = []
+        self.closed = []
+        self.checked = []
+        self.unhealthy = set()
+
+    async def open(self):
+        conn = f"conn-{len(self.opened)}"
+        self.opened.append(conn)
+        return conn
+
+    async def close(self, conn):
+        self.closed.append(conn)
+
+    async def check(self, conn):
+        self.checked.append(conn)
+        if conn in self.unhealthy:
+            raise RuntimeError("connection lost")
+
+
+def _pool(connections, *, max_size=2, clock=None, health_check_interval_seconds=30.0):
+    return EmbeddedConnectionPool(
+        provider="sqlite",
+        max_size=max_size,
+        open_connection=connections.open,
+        close_connection=connections.close,
+        check_connection=connections.check,
+        health_check_interval_seconds=health_check_interval_seconds,
+        clock=clock or (lambda: 0.0),
+    )
+
+
+@pytest.mark.asyncio
+async def test_released_connections_are_reused():
+    """Sequential acquires reuse one connection without reopening it."""
+    connections = _Connections()
+    pool = _pool(connections)
+
+    for _ in range(3):
+        async with pool.acquire() as conn:
+            assert conn == "conn-0"
+
+    assert connections.opened == ["conn-0"]
+    assert pool.stats()["idle"] == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_bounds_concurrent_connections():
+    """A third concurrent acquire waits until one of two connections is released."""
+    connections = _Connections()
+    pool = _pool(connections, max_size=2)
+    release = asyncio.Event()
+    seen = []
+
+    async def _worker():
+        async with pool.acquire() as conn:
+            seen.append(conn)
+            await release.wait()
+
+    tasks = [asyncio.create_task(_worker()) for _ in range(3)]
+    await asyncio.sleep(0)
+    assert len(seen) == 2
+    assert pool.stats()["in_use"] == 2
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert len(connections.opened) == 2
+    assert len(seen) == 3
+
+
+@pytest.mark.asyncio
+async def test_connection_is_discarded_when_its_use_raises():
+    """A connection that saw an error (e.g. a timed-out query) is never reused."""
+    connections = _Connections()
+    pool = _pool(connections)
+
+    with pytest.raises(TimeoutError):
+        async with pool.acquire():
+            raise TimeoutError("query timed out")
+    async with pool.acquire() as conn:
+        assert conn == "conn-1"
+
+    assert connections.closed == ["conn-0"]
+    assert pool.stats()["discarded"] == 1
+
+
+@pytest.mark.asyncio
+async def test_idle_connections_are_health_checked_before_reuse():
+    """Connections idle past the interval are checked and replaced when unhealthy."""
+    now = [0.0]
+    connections = _Connections()
+    pool = _pool(connections, clock=lambda: now[0], health_check_interval_seconds=10)
+
+    async with pool.acquire():
+        pass
+    async with pool.acquire():
+        pass
+    assert connections.checked == []
+
+    now[0] = 60.0
+    connections.unhealthy.add("conn-0")
+    async with pool.acquire() as conn:
+        assert conn == "conn-1"
+
+    assert connections.checked == ["conn-0"]
+    assert connections.closed == ["conn-0"]
+
+
+@pytest.mark.asyncio
+async def test_close_releases_idle_and_in_use_connections():
+    """Closing the pool closes idle connections now and busy ones on release."""
+    connections = _Connections()
+    pool = _pool(connections)
+
+    async with pool.acquire():
+        pass
+    async with pool.acquire():
+        async with pool.acquire():
+            await pool.close()
+            assert connections.closed == []
+    assert sorted(connections.closed) == ["conn-0", "conn-1"]
+
+    with pytest.raises(RuntimeError, match="closed"):
+        async with pool.acquire():
+            pass
+
+
+@pytest.mark.asyncio
+async def test_connections_opened_against_an_old_source_version_are_recycled():
+    """A change in source version (e.g. the file was replaced) retires idle connections."""
+    version = ["v1"]
+    connections = _Connections()
+    pool = EmbeddedConnectionPool(
+        provider="sqlite",
+        max_size=2,
+        open_connection=connections.open,
+        close_connection=connections.close,
+        check_connection=connections.check,
+        source_version=lambda: version[0],
+    )
+
+    async with pool.acquire():
+        pass
+    async with pool.acquire() as conn:
+        assert conn == "conn-0"
+
+    version[0] = "v2"
+    async with pool.acquire() as conn:
+        assert conn == "conn-1"
+
+    assert connections.closed == ["conn-0"]
+    assert connections.checked == []
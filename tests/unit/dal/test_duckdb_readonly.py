@@ -42,3 +42,71 @@ async def test_duckdb_readonly_flag_passed():
         async with DuckDBQueryTargetDatabase.get_connection() as conn:
             assert conn is not None
             mock_connect.assert_called_once_with(":memory:", read_only=True)
+
+
+@pytest.mark.asyncio
+async def test_duckdb_read_only_target_pools_cursors_on_shared_instance():
+    """Read-only file targets open one shared instance and reuse pooled cursors."""
+    pytest.importorskip("duckdb")
+
+    config = DuckDBConfig(
+        path="analytics.duckdb", query_timeout_seconds=5, max_rows=100, pool_size=4
+    )
+    await DuckDBQueryTargetDatabase.init(config)
+
+    shared = MagicMock()
+    try:
+        with patch("duckdb.connect", return_value=shared) as mock_connect:
+            for _ in range(2):
+                async with DuckDBQueryTargetDatabase.get_connection(read_only=False) as conn:
+                    assert conn._read_only is True
+                    assert conn._conn is shared.cursor.return_value
+    finally:
+        await DuckDBQueryTargetDatabase.close()
+
+    mock_connect.assert_called_once_with("analytics.duckdb", read_only=True)
+    shared.cursor.assert_called_once_with()
+    shared.cursor.return_value.close.assert_called_once_with()
+    shared.close.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_duckdb_pool_is_opt_in():
+    """Read-only file targets connect per request unless a pool size is configured."""
+    config = DuckDBConfig(path="analytics.duckdb", query_timeout_seconds=5, max_rows=100)
+    await DuckDBQueryTargetDatabase.init(config)
+    try:
+        assert DuckDBQueryTargetDatabase._pool is None
+    finally:
+        await DuckDBQueryTargetDatabase.close()
+
+
+@pytest.mark.asyncio
+async def test_duckdb_pool_reopens_shared_instance_when_file_is_replaced(tmp_path):
+    """Swapping the database file retires pooled cursors and the shared instance."""
+    pytest.importorskip("duckdb")
+
+    db_path = tmp_path / "analytics.duckdb"
+    db_path.write_bytes(b"old")
+    config = DuckDBConfig(path=str(db_path), query_timeout_seconds=5, max_rows=100, pool_size=4)
+    await DuckDBQueryTargetDatabase.init(config)
+
+    old_instance, new_instance = MagicMock(), MagicMock()
+    try:
+        with patch("duckdb.connect", side_effect=[old_instance, new_instance]):
+            async with DuckDBQueryTargetDatabase.get_connection(read_only=True) as conn:
+                assert conn._conn is old_instance.cursor.return_value
+
+            refreshed = tmp_path / "refresh.duckdb"
+            refreshed.write_bytes(b"new")
+            os.replace(refreshed, db_path)
+
+            async with DuckDBQueryTargetDatabase.get_connection(read_only=True) as conn:
+                assert conn._conn is new_instance.cursor.return_value
+
+        old_instance.cursor.return_value.close.assert_called_once_with()
+        old_instance.close.assert_called_once_with()
+        new_instance.close.assert_not_called()
+    finally:
+        await DuckDBQueryTargetDatabase.close()
+    new_instance.close.assert_called_once_with()
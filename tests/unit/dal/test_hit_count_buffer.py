@@ -0,0 +1,100 @@
+"""Tests for write-behind cache hit counting."""
+
+import asyncio
+
+import pytest
+
+from dal.postgres.hit_counts import HitCountBuffer
+
+
+class _Sink:
+    def __init__(self, fail: bool = False, failing_tenants=()):
+        self.batches = []
+        self.fail = fail
+        self.failing_tenants = set(failing_tenants)
+
+    async def __call__(self, counts):
+        if self.fail or any(tenant in self.failing_tenants for _, tenant in counts):
+            raise RuntimeError("pool closed")
+        self.batches.append(dict(counts))
+
+
+@pytest.mark.asyncio
+async def test_hits_are_aggregated_per_entry_and_flushed_on_close():
+    """Repeated hits collapse into one counter per (cache_id, tenant), flushed per tenant."""
+    sink = _Sink()
+    buffer = HitCountBuffer(sink, interval_seconds=60)
+
+    for _ in range(3):
+        buffer.add("a", 1)
+    buffer.add("a", 2)
+    buffer.add("b", 1)
+    assert sink.batches == []
+
+    await buffer.close()
+
+    assert sink.batches == [{("a", 1): 3, ("b", 1): 1}, {("a", 2): 1}]
+    assert buffer.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_periodic_flush():
+    """The background task flushes after the interval."""
+    sink = _Sink()
+    buffer = HitCountBuffer(sink, interval_seconds=0.01)
+
+    buffer.add("a", 1)
+    await asyncio.sleep(0.05)
+
+    assert sink.batches == [{("a", 1): 1}]
+    await buffer.close()
+
+
+@pytest.mark.asyncio
+async def test_max_pending_keys_triggers_early_flush():
+    """Reaching the key cap flushes without waiting for the interval."""
+    sink = _Sink()
+    buffer = HitCountBuffer(sink, interval_seconds=60, max_pending_keys=2)
+
+    buffer.add("a", 1)
+    buffer.add("b", 1)
+    await asyncio.sleep(0.01)
+
+    assert sink.batches == [{("a", 1): 1, ("b", 1): 1}]
+    await buffer.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_counts():
+    """Counts from a failed flush are retried with the next batch."""
+    sink = _Sink(fail=True)
+    buffer = HitCountBuffer(sink, interval_seconds=60)
+
+    buffer.add("a", 1)
+    await buffer.flush()
+    assert buffer.pending == 1
+
+    sink.fail = False
+    buffer.add("a", 1)
+    await buffer.close()
+
+    assert sink.batches == [{("a", 1): 2}]
+
+
+@pytest.mark.asyncio
+async def test_failed_tenant_does_not_rewrite_other_tenants():
+    """A tenant whose write fails is retried alone; written tenants are not re-counted."""
+    sink = _Sink(failing_tenants={2})
+    buffer = HitCountBuffer(sink, interval_seconds=60)
+
+    buffer.add("a", 1)
+    buffer.add("a", 1)
+    buffer.add("b", 2)
+    await buffer.flush()
+    assert sink.batches == [{("a", 1): 2}]
+    assert buffer.pending == 1
+
+    sink.failing_tenants.clear()
+    await buffer.close()
+
+    assert sink.batches == [{("a", 1): 2}, {("b", 2): 1}]
@@ -1,10 +1,12 @@
 from contextlib import asynccontextmanager
 from unittest.mock import MagicMock, patch
 
+import asyncpg
 import pytest
 
 from dal.capabilities import capabilities_for_provider
 from dal.database import Database
+from dal.postgres_sandbox import PostgresSandboxExecutionError
 from dal.session_guardrails import PostgresSessionGuardrailSettings, SessionGuardrailPolicyError
 
 
@@ -99,16 +101,64 @@ async def test_postgres_restricted_session_applies_expected_settings(monkeypatch
         pass
 
     assert conn.execute_calls == [
-        ("SELECT set_config('default_transaction_read_only', 'on', true)", ()),
-        ("SELECT set_config('statement_timeout', $1, true)", ("11000ms",)),
-        ("SELECT set_config('lock_timeout', $1, true)", ("7000ms",)),
-        ("SELECT set_config('idle_in_transaction_session_timeout', $1, true)", ("9000ms",)),
-        ("SELECT set_config('search_path', $1, true)", ("public",)),
+        (
+            "SELECT set_config('default_transaction_read_only', $1, true), "
+            "set_config('statement_timeout', $2, true), "
+            "set_config('lock_timeout', $3, true), "
+            "set_config('idle_in_transaction_session_timeout', $4, true), "
+            "set_config('search_path', $5, true)",
+            ("on", "11000ms", "7000ms", "9000ms", "public"),
+        ),
         ("RESET ROLE", ()),
         ("RESET ALL", ()),
     ]
 
 
+@pytest.mark.asyncio
+async def test_postgres_guardrails_role_and_tenant_share_one_round_trip(monkeypatch):
+    """Guardrail settings, execution role and tenant context are one batched statement."""
+    conn = _FakeConn()
+    Database._pool = _FakePool(conn)
+    monkeypatch.setenv("POSTGRES_RESTRICTED_SESSION_ENABLED", "true")
+    monkeypatch.setenv("POSTGRES_RESTRICTED_LOCK_TIMEOUT_MS", "0")
+    monkeypatch.setenv("POSTGRES_EXECUTION_ROLE_ENABLED", "true")
+    monkeypatch.setenv("POSTGRES_EXECUTION_ROLE", "text2sql_readonly")
+
+    with patch("dal.database.mcp_metrics.record_histogram") as mock_histogram:
+        async with Database.get_connection(tenant_id=7, read_only=True):
+            pass
+
+    assert conn.execute_calls[0] == (
+        "SELECT set_config('default_transaction_read_only', $1, true), "
+        "set_config('statement_timeout', $2, true), "
+        "set_config('idle_in_transaction_session_timeout', $3, true), "
+        "set_config('role', $4, true), "
+        "set_config('app.current_tenant', $5, true)",
+        ("on", "15000ms", "15000ms", "text2sql_readonly", "7"),
+    )
+    assert conn.execute_calls[1:] == [("RESET ROLE", ()), ("RESET ALL", ())]
+    mock_histogram.assert_called_once()
+    assert mock_histogram.call_args[0][0] == "mcp.db.connection_setup.duration_ms"
+
+
+@pytest.mark.asyncio
+async def test_postgres_pool_init_hook_warms_extension_probe(monkeypatch):
+    """The pool init hook probes the execution role so acquires skip the probe."""
+    conn = _FakeConn()
+    Database._pool = _FakePool(conn)
+    monkeypatch.setenv("POSTGRES_EXECUTION_ROLE_ENABLED", "true")
+    monkeypatch.setenv("POSTGRES_EXECUTION_ROLE", "text2sql_readonly")
+
+    await Database._init_postgres_pool_connection(conn)
+    assert conn.fetchrow_calls[0][1] == ("text2sql_readonly",)
+
+    async with Database.get_connection(read_only=True):
+        pass
+
+    assert len(conn.fetchrow_calls) == 1
+    assert conn.events[0] == ("fetchrow", conn.fetchrow_calls[0][0])
+
+
 @pytest.mark.asyncio
 async def test_postgres_restricted_session_skips_when_not_read_only(monkeypatch):
     """Restricted session settings should not run for non-read-only usage."""
@@ -137,8 +187,8 @@ async def test_postgres_execution_role_set_local_role_before_query(monkeypatch):
     async with Database.get_connection(read_only=True) as wrapped_conn:
         await wrapped_conn.fetch("SELECT 1 AS ok")
 
-    set_role_sql = 'SET LOCAL ROLE "text2sql_readonly"'
-    assert (set_role_sql, ()) in conn.execute_calls
+    set_role_sql = "SELECT set_config('role', $1, true)"
+    assert (set_role_sql, ("text2sql_readonly",)) in conn.execute_calls
 
     tx_begin_index = conn.events.index(("transaction", "begin"))
     set_role_index = conn.events.index(("execute", set_role_sql))
@@ -147,6 +197,79 @@ async def test_postgres_execution_role_set_local_role_before_query(monkeypatch):
     assert set_role_index < fetch_index
 
 
+@pytest.mark.asyncio
+async def test_postgres_execution_role_batch_failure_reports_role_switch(monkeypatch):
+    """A failed batched setup that switches roles maps to ROLE_SWITCH_FAILURE."""
+    conn = _FakeConn()
+    Database._pool = _FakePool(conn)
+    monkeypatch.setenv("POSTGRES_EXECUTION_ROLE_ENABLED", "true")
+    monkeypatch.setenv("POSTGRES_EXECUTION_ROLE", "missing_role")
+
+    async def _failing_execute(sql, *args):
+        conn.execute_calls.append((sql, args))
+        if "set_config('role'" in sql:
+            raise asyncpg.exceptions.InvalidParameterValueError(
+                'role "missing_role" does not exist'
+            )
+
+    conn.execute = _failing_execute
+
+    with pytest.raises(PostgresSandboxExecutionError) as exc_info:
+        async with Database.get_connection(read_only=True):
+            pass
+    assert exc_info.value.failure_reason == "ROLE_SWITCH_FAILURE"
+    assert conn.fetchrow_calls == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "error",
+    [
+        asyncpg.exceptions.InvalidParameterValueError(
+            'invalid value for parameter "statement_timeout": "15x"'
+        ),
+        asyncpg.exceptions.InvalidTextRepresentationError("invalid input syntax"),
+        RuntimeError("connection reset"),
+    ],
+)
+async def test_postgres_batch_failure_unrelated_to_role_keeps_its_error(monkeypatch, error):
+    """Only the role's set_config is reported as ROLE_SWITCH_FAILURE."""
+    conn = _FakeConn()
+    Database._pool = _FakePool(conn)
+    monkeypatch.setenv("POSTGRES_EXECUTION_ROLE_ENABLED", "true")
+    monkeypatch.setenv("POSTGRES_EXECUTION_ROLE", "text2sql_readonly")
+
+    async def _failing_execute(sql, *args):
+        raise error
+
+    conn.execute = _failing_execute
+
+    with pytest.raises(type(error)):
+        async with Database.get_connection(read_only=True):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_postgres_role_privilege_error_reports_role_switch(monkeypatch):
+    """Insufficient privilege to assume the role maps to ROLE_SWITCH_FAILURE."""
+    conn = _FakeConn()
+    Database._pool = _FakePool(conn)
+    monkeypatch.setenv("POSTGRES_EXECUTION_ROLE_ENABLED", "true")
+    monkeypatch.setenv("POSTGRES_EXECUTION_ROLE", "text2sql_readonly")
+
+    async def _failing_execute(sql, *args):
+        raise asyncpg.exceptions.InsufficientPrivilegeError(
+            'permission denied to set role "text2sql_readonly"'
+        )
+
+    conn.execute = _failing_execute
+
+    with pytest.raises(PostgresSandboxExecutionError) as exc_info:
+        async with Database.get_connection(read_only=True):
+            pass
+    assert exc_info.value.failure_reason == "ROLE_SWITCH_FAILURE"
+
+
 @pytest.mark.asyncio
 async def test_postgres_execution_role_enabled_without_role_fails_closed(monkeypatch):
     """Execution role mode without role name should fail closed."""
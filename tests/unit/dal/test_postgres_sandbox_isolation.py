@@ -50,8 +50,8 @@ class _IsolationConn:
     async def execute(self, sql, *args):
         self.execute_calls.append((sql, args))
         self._append_tx_event("execute", sql)
-        if sql.startswith("SET LOCAL ROLE "):
-            self.settings["role"] = "text2sql_readonly"
+        if sql == "SELECT set_config('role', $1, true)":
+            self.settings["role"] = args[0]
         elif sql == "RESET ROLE":
             self.settings["role"] = "none"
         elif sql == "RESET ALL":
@@ -172,7 +172,7 @@ async def test_failure_in_first_execution_does_not_contaminate_second(monkeypatc
 
 @pytest.mark.asyncio
 async def test_execution_role_not_sticky_across_transactions(monkeypatch):
-    """SET LOCAL ROLE should execute once per transaction and never be sticky."""
+    """The execution role should be set once per transaction and never be sticky."""
     conn = _IsolationConn()
     Database._pool = _IsolationPool(conn)
     monkeypatch.setenv("POSTGRES_EXECUTION_ROLE_ENABLED", "true")
@@ -182,7 +182,7 @@ async def test_execution_role_not_sticky_across_transactions(monkeypatch):
         async with Database.get_connection(read_only=True) as wrapped_conn:
             await wrapped_conn.fetch("SELECT 1 AS ok")
 
-    role_sql = 'SET LOCAL ROLE "text2sql_readonly"'
+    role_sql = "SELECT set_config('role', $1, true)"
     assert sum(1 for sql, _ in conn.execute_calls if sql == role_sql) == 2
     start_roles = []
     for tx_events in conn.transaction_events:
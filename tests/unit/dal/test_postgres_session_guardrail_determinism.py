@@ -102,7 +102,7 @@ async def test_guardrail_metadata_deterministic_across_repeated_execution(monkey
 
 @pytest.mark.asyncio
 async def test_execution_role_set_local_role_once_per_transaction(monkeypatch):
-    """SET LOCAL ROLE should execute exactly once per transaction before SQL fetches."""
+    """The execution role should be set exactly once per transaction before SQL fetches."""
     conn = _DeterministicConn()
     Database._pool = _DeterministicPool(conn)
     monkeypatch.setenv("POSTGRES_EXECUTION_ROLE_ENABLED", "true")
@@ -112,7 +112,7 @@ async def test_execution_role_set_local_role_once_per_transaction(monkeypatch):
         async with Database.get_connection(read_only=True) as wrapped_conn:
             await wrapped_conn.fetch("SELECT 1 AS ok")
 
-    role_sql = 'SET LOCAL ROLE "text2sql_readonly"'
+    role_sql = "SELECT set_config('role', $1, true)"
     assert sum(1 for sql, _ in conn.execute_calls if sql == role_sql) == 2
 
     for tx_id in sorted(conn.transaction_events):
@@ -21,3 +21,90 @@ async def test_traced_asyncpg_connection_sets_provider_cap_reason():
     assert rows == [{"id": 1}]
     assert conn.last_truncated is True
     assert conn.last_truncated_reason == "PROVIDER_CAP"
+
+
+class _FakeCursor:
+    def __init__(self, rows):
+        self._rows = list(rows)
+        self.requested = []
+
+    async def fetch(self, n: int):
+        self.requested.append(n)
+        batch, self._rows = self._rows[:n], self._rows[n:]
+        return batch
+
+
+class _FakeTransactionConn:
+    def __init__(self, rows):
+        self.cursor_obj = _FakeCursor(rows)
+
+    def is_in_transaction(self) -> bool:
+        return True
+
+    async def cursor(self, sql: str, *params):
+        _ = sql, params
+        return self.cursor_obj
+
+    async def fetch(self, sql: str, *params):
+        raise AssertionError("capped fetch inside a transaction should stream")
+
+
+@pytest.mark.asyncio
+async def test_traced_asyncpg_connection_streams_until_cap_plus_one():
+    """Capped fetches stop pulling rows once the cap is proven exceeded."""
+    fake = _FakeTransactionConn([{"id": i} for i in range(10_000)])
+    conn = TracedAsyncpgConnection(fake, provider="postgres", execution_model="sync", max_rows=3)
+
+    rows = await conn.fetch("SELECT id FROM t")
+
+    assert rows == [{"id": 0}, {"id": 1}, {"id": 2}]
+    assert fake.cursor_obj.requested == [4]
+    assert conn.last_truncated is True
+
+
+@pytest.mark.asyncio
+async def test_traced_asyncpg_connection_stream_not_truncated_at_exact_cap():
+    """Results exactly at the cap are not reported as truncated."""
+    fake = _FakeTransactionConn([{"id": 1}, {"id": 2}])
+    conn = TracedAsyncpgConnection(fake, provider="postgres", execution_model="sync", max_rows=2)
+
+    rows = await conn.fetch("SELECT id FROM t")
+
+    assert rows == [{"id": 1}, {"id": 2}]
+    assert conn.last_truncated is False
+    assert conn.last_truncated_reason is None
+
+
+@pytest.mark.asyncio
+async def test_sqlite_connection_streams_capped_fetch():
+    """Capped SQLite fetches stop at the cap and still report truncation."""
+    pytest.importorskip("aiosqlite")
+    from dal.sqlite.query_target import SqliteQueryTargetDatabase
+
+    await SqliteQueryTargetDatabase.init(":memory:", max_rows=5)
+    async with SqliteQueryTargetDatabase.get_connection() as conn:
+        rows = await conn.fetch(
+            "WITH RECURSIVE n(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM n WHERE x < 5000) "
+            "SELECT x FROM n"
+        )
+        assert rows == [{"x": i} for i in range(1, 6)]
+        assert conn.last_truncated is True
+
+
+@pytest.mark.asyncio
+async def test_sqlite_fetch_columnar_matches_fetch_with_columns():
+    """Columnar fetches return the same rows, columns and caps as dict fetches."""
+    pytest.importorskip("aiosqlite")
+    from dal.query_result import ColumnarRows
+    from dal.sqlite.query_target import SqliteQueryTargetDatabase
+
+    sql = "SELECT 1 AS a, 'x' AS b UNION ALL SELECT 2, 'y' UNION ALL SELECT 3, 'z'"
+    await SqliteQueryTargetDatabase.init(":memory:", max_rows=2)
+    async with SqliteQueryTargetDatabase.get_connection() as conn:
+        dict_rows, dict_columns = await conn.fetch_with_columns(sql)
+        columnar_rows, columnar_columns = await conn.fetch_columnar(sql)
+        assert conn.last_truncated is True
+
+    assert isinstance(columnar_rows, ColumnarRows)
+    assert columnar_rows.to_dicts() == dict_rows == [{"a": 1, "b": "x"}, {"a": 2, "b": "y"}]
+    assert columnar_columns == dict_columns
@@ -0,0 +1,58 @@
+"""Tests for the columnar query result backing."""
+
+import datetime
+import json
+from decimal import Decimal
+
+import pytest
+
+from dal.query_result import ColumnarRows, QueryResult
+
+NAMES = ["id", "name", "score", "active", "meta", "id"]
+RECORDS = [
+    (1, 'Zoë "q"', 1.5, True, {"k": [1, None]}, 10),
+    (2, None, float("nan"), False, Decimal("3.10"), 20),
+    (3, "plain", -7, None, datetime.date(2024, 1, 2), 30),
+]
+
+
+def _expected_dicts():
+    return [dict(zip(NAMES, record)) for record in RECORDS]
+
+
+def test_row_views_match_dict_zip_semantics():
+    """Row views, slices and materialization match dict(zip(names, record))."""
+    rows = ColumnarRows.from_records(NAMES, RECORDS)
+    expected = _expected_dicts()
+
+    assert len(rows) == 3
+    assert rows.column_names == ["id", "name", "score", "active", "meta"]
+    assert rows[0]["id"] == 10
+    assert dict(rows[-1]) == expected[-1]
+    assert rows[1:].to_dicts() == expected[1:]
+    assert rows[::2].to_dicts() == expected[::2]
+    assert rows[5:].to_dicts() == []
+    assert QueryResult(rows=rows).row_dicts() == rows.to_dicts()
+    with pytest.raises(IndexError):
+        rows[3]
+
+
+def test_json_row_sizes_match_row_wise_serialization():
+    """Column-wise sizes equal the compact JSON size of each materialized row."""
+    rows = ColumnarRows.from_records(NAMES, RECORDS)
+
+    expected = [
+        len(json.dumps(row, default=str, separators=(",", ":")).encode("utf-8"))
+        for row in _expected_dicts()
+    ]
+    assert rows.json_row_sizes() == expected
+    assert rows[1:2].json_row_sizes() == expected[1:2]
+
+
+def test_rows_without_columns_keep_their_count():
+    """Zero-column results still report one empty row per record."""
+    rows = ColumnarRows.from_records([], [(), ()])
+
+    assert len(rows) == 2
+    assert rows.to_dicts() == [{}, {}]
+    assert rows.json_row_sizes() == [2, 2]
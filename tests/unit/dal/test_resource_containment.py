@@ -141,3 +141,35 @@ def test_validate_resource_capabilities_fails_closed(kwargs, expected_reason):
     with pytest.raises(ResourceContainmentPolicyError) as exc_info:
         validate_resource_capabilities(provider="unknown-provider", **kwargs)
     assert exc_info.value.reason_code == expected_reason
+
+
+def test_columnar_rows_are_capped_and_materialized_once():
+    """Columnar rows stay columnar through the row cap and match row-wise byte limits."""
+    from dal.query_result import ColumnarRows
+
+    records = [(idx, "x" * idx) for idx in range(8)]
+    columnar = ColumnarRows.from_records(["id", "payload"], records)
+    dict_rows = [{"id": idx, "payload": payload} for idx, payload in records]
+
+    row_limited = enforce_row_limit(columnar, max_rows=6, enforce=True)
+    assert isinstance(row_limited.rows, ColumnarRows)
+    assert row_limited.partial is True
+    assert row_limited.items_returned == 6
+
+    budget = _json_size({"metadata": {}, "rows": []}) + sum(
+        _json_size(row) for row in dict_rows[:4]
+    )
+    columnar_bytes = enforce_byte_limit(
+        row_limited.rows,
+        max_bytes=budget,
+        enforce=True,
+        envelope_overhead={"metadata": {}, "rows": []},
+    )
+    row_bytes = enforce_byte_limit(
+        dict_rows[:6],
+        max_bytes=budget,
+        enforce=True,
+        envelope_overhead={"metadata": {}, "rows": []},
+    )
+    assert columnar_bytes == row_bytes
+    assert columnar_bytes.rows == dict_rows[:4]
@@ -0,0 +1,177 @@
+"""Tests for offset-pagination result spools."""
+
+import datetime
+from decimal import Decimal
+
+import pytest
+
+import dal.result_spool as result_spool_module
+from dal.pagination_session import (
+    InMemoryPaginationSessionRegistry,
+    create_pagination_session,
+    revoke_session,
+)
+from dal.result_spool import ResultSpoolStore
+
+pytestmark = pytest.mark.pagination
+
+SESSION_ID = "spool-session-0001"
+
+
+def _rows(count: int) -> list[dict]:
+    return [{"id": idx, "name": f"row-{idx}\n"} for idx in range(count)]
+
+
+def test_spool_serves_page_ranges_from_disk(tmp_path) -> None:
+    """Pages are read back in order, including short final pages."""
+    store = ResultSpoolStore(directory=str(tmp_path))
+    spool = store.write(
+        SESSION_ID, tenant_id=1, query_fingerprint="fp", rows=_rows(7), complete=True
+    )
+
+    assert spool is not None and spool.row_count == 7
+    assert spool.read(0, 3) == _rows(7)[:3]
+    assert spool.read(6, 3) == _rows(7)[6:]
+    assert spool.read(9, 3) == []
+    assert store.get(SESSION_ID, tenant_id=1, query_fingerprint="fp") is spool
+    assert store.get(SESSION_ID, tenant_id=2, query_fingerprint="fp") is None
+    assert store.get(SESSION_ID, tenant_id=1, query_fingerprint="other") is None
+
+
+def test_spool_encodes_values_like_the_response_envelope(tmp_path) -> None:
+    """Non-JSON values are stored in their envelope JSON form."""
+    store = ResultSpoolStore(directory=str(tmp_path))
+    spool = store.write(
+        SESSION_ID,
+        tenant_id=1,
+        query_fingerprint="fp",
+        rows=[{"amount": Decimal("3.10"), "day": datetime.date(2024, 1, 2)}],
+        complete=True,
+    )
+
+    assert spool.read(0, 1) == [{"amount": "3.10", "day": "2024-01-02"}]
+
+
+def test_byte_quotas_keep_a_prefix_and_mark_it_incomplete(tmp_path) -> None:
+    """Rows past the byte quota are dropped and only covered ranges are served."""
+    row_bytes = len(b'{"id":0,"name":"row-0\\n"}\n')
+    store = ResultSpoolStore(
+        directory=str(tmp_path), max_spool_bytes=row_bytes * 4, max_tenant_bytes=row_bytes * 6
+    )
+
+    first = store.write(
+        SESSION_ID, tenant_id=1, query_fingerprint="fp", rows=_rows(9), complete=True
+    )
+    assert first.row_count == 4 and not first.complete
+    assert first.covers(1, 3) and not first.covers(2, 3)
+
+    second = store.write(
+        "spool-session-0002", tenant_id=1, query_fingerprint="fp", rows=_rows(9), complete=True
+    )
+    assert second.row_count == 2
+    assert store.tenant_bytes(1) == row_bytes * 6
+    assert (
+        store.write(
+            "spool-session-0003", tenant_id=1, query_fingerprint="fp", rows=_rows(1), complete=True
+        )
+        is None
+    )
+
+
+def test_spools_expire_and_release_tenant_bytes(tmp_path) -> None:
+    """TTL eviction deletes the spill file and frees the tenant quota."""
+    now = {"ms": 1_000}
+    store = ResultSpoolStore(directory=str(tmp_path), ttl_ms=500, now_ms=lambda: now["ms"])
+    spool = store.write(
+        SESSION_ID, tenant_id=1, query_fingerprint="fp", rows=_rows(3), complete=True
+    )
+
+    now["ms"] = 1_600
+    assert store.get(SESSION_ID, tenant_id=1, query_fingerprint="fp") is None
+    assert store.tenant_bytes(1) == 0
+    assert not (tmp_path / spool.path).exists()
+
+
+def test_revoke_session_discards_its_spool(tmp_path, monkeypatch) -> None:
+    """Revoking a pagination session deletes the spool bound to it."""
+    store = ResultSpoolStore(directory=str(tmp_path))
+    monkeypatch.setattr(result_spool_module, "_STORE", store)
+    registry = InMemoryPaginationSessionRegistry()
+    session = create_pagination_session(
+        tenant_id="1",
+        provider_name="postgres",
+        pagination_mode="offset",
+        query_scope_fp="scope",
+        policy_snapshot_fp="policy",
+        revocation_epoch=0,
+    )
+    registry.put(session)
+    store.write(
+        session.session_id, tenant_id=1, query_fingerprint="fp", rows=_rows(2), complete=True
+    )
+
+    revoke_session(session.session_id, registry=registry)
+
+    assert store.get(session.session_id, tenant_id=1, query_fingerprint="fp") is None
+    assert store.tenant_bytes(1) == 0
+
+
+def test_discard_and_sweep_delete_expired_spools(tmp_path) -> None:
+    """Expired spools are removed by discard and by an explicit sweep, not only on reads."""
+    now = {"ms": 1_000}
+    store = ResultSpoolStore(directory=str(tmp_path), ttl_ms=500, now_ms=lambda: now["ms"])
+    first = store.write(
+        SESSION_ID, tenant_id=1, query_fingerprint="fp", rows=_rows(2), complete=True
+    )
+    second = store.write(
+        "spool-session-0002", tenant_id=1, query_fingerprint="fp", rows=_rows(2), complete=True
+    )
+
+    now["ms"] = 1_600
+    assert store.discard("unknown-session") is False
+    assert not (tmp_path / first.path).exists()
+    assert not (tmp_path / second.path).exists()
+    assert store.tenant_bytes(1) == 0
+
+    store.write(SESSION_ID, tenant_id=1, query_fingerprint="fp", rows=_rows(2), complete=True)
+    now["ms"] = 2_200
+    assert store.sweep_expired() == 1
+
+
+def test_background_sweeper_removes_expired_spools(tmp_path) -> None:
+    """The sweeper thread deletes expired spools without any store access."""
+    import time
+
+    now = {"ms": 1_000}
+    store = ResultSpoolStore(
+        directory=str(tmp_path),
+        ttl_ms=500,
+        now_ms=lambda: now["ms"],
+        sweep_interval_seconds=0.01,
+    )
+    try:
+        spool = store.write(
+            SESSION_ID, tenant_id=1, query_fingerprint="fp", rows=_rows(1), complete=True
+        )
+        now["ms"] = 1_600
+        deadline = time.monotonic() + 2.0
+        while (tmp_path / spool.path).exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert not (tmp_path / spool.path).exists()
+    finally:
+        store.close()
+
+
+def test_close_result_spool_store_removes_spill_directory(tmp_path, monkeypatch) -> None:
+    """Shutdown closes the process-wide store and deletes its directory."""
+    import os
+
+    monkeypatch.setattr(result_spool_module, "_STORE", None)
+    monkeypatch.setenv("EXECUTION_PAGINATION_SPOOL_DIR", str(tmp_path))
+    store = result_spool_module.get_result_spool_store()
+    store.write(SESSION_ID, tenant_id=1, query_fingerprint="fp", rows=_rows(1), complete=True)
+
+    result_spool_module.close_result_spool_store()
+
+    assert not os.path.exists(store.directory)
+    assert result_spool_module._STORE is None
@@ -83,3 +83,75 @@ async def test_sqlite_fetchval_returns_single_value():
         await conn.execute("CREATE TABLE empty (id INTEGER)")
         missing_val = await conn.fetchval("SELECT id FROM empty")
         assert missing_val is None
+
+
+@pytest.mark.asyncio
+async def test_sqlite_read_only_connections_are_pooled(tmp_path, monkeypatch):
+    """Read-only requests reuse one tuned, query-only connection; writers do not."""
+    monkeypatch.setenv("SQLITE_POOL_SIZE", "2")
+    db_path = tmp_path / "pooled.db"
+    await SqliteQueryTargetDatabase.init(str(db_path))
+    try:
+        async with SqliteQueryTargetDatabase.get_connection() as conn:
+            await conn.execute("CREATE TABLE t (id INTEGER)")
+            await conn.execute("INSERT INTO t (id) VALUES ($1)", 1)
+
+        raw_connections = []
+        for _ in range(2):
+            async with SqliteQueryTargetDatabase.get_connection(read_only=True) as conn:
+                raw_connections.append(conn._conn)
+                assert await conn.fetchval("SELECT id FROM t") == 1
+
+        pooled = raw_connections[0]
+        assert (await (await pooled.execute("PRAGMA query_only")).fetchone())[0] == 1
+        assert (await (await pooled.execute("PRAGMA mmap_size")).fetchone())[0] > 0
+        assert raw_connections[0] is raw_connections[1]
+        assert SqliteQueryTargetDatabase._pool.stats()["opened"] == 1
+
+        async with SqliteQueryTargetDatabase.get_connection() as conn:
+            await conn.execute("INSERT INTO t (id) VALUES ($1)", 2)
+        async with SqliteQueryTargetDatabase.get_connection(read_only=True) as conn:
+            assert await conn.fetchval("SELECT COUNT(*) FROM t") == 2
+    finally:
+        await SqliteQueryTargetDatabase.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_pool_is_opt_in(tmp_path, monkeypatch):
+    """Without SQLITE_POOL_SIZE, read-only connections are opened per request."""
+    monkeypatch.delenv("SQLITE_POOL_SIZE", raising=False)
+    await SqliteQueryTargetDatabase.init(str(tmp_path / "unpooled.db"))
+    try:
+        assert SqliteQueryTargetDatabase._pool is None
+    finally:
+        await SqliteQueryTargetDatabase.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_pool_recycles_connections_when_file_is_replaced(tmp_path, monkeypatch):
+    """A database file swapped in by rename is read by the next pooled checkout."""
+    import os
+    import sqlite3
+
+    monkeypatch.setenv("SQLITE_POOL_SIZE", "2")
+    db_path = tmp_path / "target.db"
+    for path, value in ((db_path, 1), (tmp_path / "refresh.db", 2)):
+        with sqlite3.connect(path) as seed:
+            seed.execute("CREATE TABLE t (id INTEGER)")
+            seed.execute("INSERT INTO t (id) VALUES (?)", (value,))
+        seed.close()
+
+    await SqliteQueryTargetDatabase.init(str(db_path))
+    try:
+        async with SqliteQueryTargetDatabase.get_connection(read_only=True) as conn:
+            assert await conn.fetchval("SELECT id FROM t") == 1
+
+        os.replace(tmp_path / "refresh.db", db_path)
+
+        async with SqliteQueryTargetDatabase.get_connection(read_only=True) as conn:
+            assert await conn.fetchval("SELECT id FROM t") == 2
+        stats = SqliteQueryTargetDatabase._pool.stats()
+        assert stats["opened"] == 2
+        assert stats["discarded"] == 1
+    finally:
+        await SqliteQueryTargetDatabase.close()
@@ -24,9 +24,10 @@ def _reset_limiter():
 
 @pytest.mark.asyncio
 async def test_global_limiter_rejects_when_concurrency_exceeded(monkeypatch):
-    """Second in-flight call should fail fast with typed limit-exceeded error."""
+    """With queueing disabled, a second in-flight call should fail fast."""
     monkeypatch.setenv("LLM_MAX_CONCURRENT_CALLS", "1")
     monkeypatch.setenv("LLM_LIMIT_RETRY_AFTER_SECONDS", "2.5")
+    monkeypatch.setenv("LLM_QUEUE_TIMEOUT_SECONDS", "0")
     limiter = get_global_llm_limiter()
     release = asyncio.Event()
 
@@ -48,6 +49,132 @@ async def test_global_limiter_rejects_when_concurrency_exceeded(monkeypatch):
         await task
 
 
+@pytest.mark.asyncio
+async def test_global_limiter_queues_async_callers_until_slot_frees(monkeypatch):
+    """Async callers should wait for a slot instead of failing while queue budget remains."""
+    monkeypatch.setenv("LLM_MAX_CONCURRENT_CALLS", "1")
+    monkeypatch.setenv("LLM_WARM_START_COOLDOWN_SECONDS", "0")
+    monkeypatch.setenv("LLM_QUEUE_TIMEOUT_SECONDS", "2")
+    monkeypatch.setenv("LLM_MAX_QUEUED_CALLS", "4")
+    limiter = get_global_llm_limiter()
+    order: list[int] = []
+
+    async def _call(index: int) -> float:
+        async with limiter.acquire_async() as lease:
+            order.append(index)
+            await asyncio.sleep(0.01)
+            return lease.queue_wait_ms
+
+    waits = await asyncio.gather(*(_call(i) for i in range(3)))
+
+    assert sorted(order) == [0, 1, 2]
+    assert waits[0] == pytest.approx(0.0, abs=5.0)
+    assert max(waits) > 5.0
+    assert limiter.queued_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_global_limiter_rejects_when_queue_is_full(monkeypatch):
+    """Callers beyond the queue depth should fail fast with a typed error."""
+    monkeypatch.setenv("LLM_MAX_CONCURRENT_CALLS", "1")
+    monkeypatch.setenv("LLM_WARM_START_COOLDOWN_SECONDS", "0")
+    monkeypatch.setenv("LLM_QUEUE_TIMEOUT_SECONDS", "2")
+    monkeypatch.setenv("LLM_MAX_QUEUED_CALLS", "1")
+    limiter = get_global_llm_limiter()
+    release = asyncio.Event()
+
+    async def _hold_slot() -> None:
+        async with limiter.acquire_async():
+            await release.wait()
+
+    holder = asyncio.create_task(_hold_slot())
+    await asyncio.sleep(0)
+    queued = asyncio.create_task(_hold_slot())
+    await asyncio.sleep(0)
+
+    try:
+        assert limiter.queued_calls == 1
+        with pytest.raises(LLMRateLimitExceededError):
+            async with limiter.acquire_async():
+                pass
+    finally:
+        release.set()
+        await asyncio.gather(holder, queued)
+
+
+@pytest.mark.asyncio
+async def test_global_limiter_queue_times_out(monkeypatch):
+    """Queued callers should give up with a typed error after the queue timeout."""
+    monkeypatch.setenv("LLM_MAX_CONCURRENT_CALLS", "1")
+    monkeypatch.setenv("LLM_WARM_START_COOLDOWN_SECONDS", "0")
+    monkeypatch.setenv("LLM_QUEUE_TIMEOUT_SECONDS", "0.05")
+    limiter = get_global_llm_limiter()
+
+    async with limiter.acquire_async():
+        with pytest.raises(LLMRateLimitExceededError):
+            async with limiter.acquire_async():
+                pass
+    assert limiter.queued_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_global_limiter_hands_released_slots_to_oldest_waiter(monkeypatch):
+    """A caller arriving after a release must not take the slot ahead of queued waiters."""
+    monkeypatch.setenv("LLM_MAX_CONCURRENT_CALLS", "1")
+    monkeypatch.setenv("LLM_WARM_START_COOLDOWN_SECONDS", "0")
+    monkeypatch.setenv("LLM_QUEUE_TIMEOUT_SECONDS", "2")
+    monkeypatch.setenv("LLM_MAX_QUEUED_CALLS", "4")
+    limiter = get_global_llm_limiter()
+    order: list[str] = []
+
+    async def _call(name: str) -> None:
+        async with limiter.acquire_async():
+            order.append(name)
+            await asyncio.sleep(0)
+
+    holder = limiter.acquire_async()
+    await holder.__aenter__()
+    waiters = [asyncio.create_task(_call(f"queued-{i}")) for i in range(2)]
+    await asyncio.sleep(0)
+    assert limiter.queued_calls == 2
+
+    await holder.__aexit__(None, None, None)
+    late = asyncio.create_task(_call("late"))
+    await asyncio.gather(*waiters, late)
+
+    assert order == ["queued-0", "queued-1", "late"]
+    assert limiter.queued_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_passes_granted_slot_on(monkeypatch):
+    """A waiter cancelled after being granted a slot must not leak it."""
+    monkeypatch.setenv("LLM_MAX_CONCURRENT_CALLS", "1")
+    monkeypatch.setenv("LLM_WARM_START_COOLDOWN_SECONDS", "0")
+    monkeypatch.setenv("LLM_QUEUE_TIMEOUT_SECONDS", "2")
+    monkeypatch.setenv("LLM_MAX_QUEUED_CALLS", "4")
+    limiter = get_global_llm_limiter()
+    acquired: list[str] = []
+
+    async def _call(name: str) -> None:
+        async with limiter.acquire_async():
+            acquired.append(name)
+
+    holder = limiter.acquire_async()
+    await holder.__aenter__()
+    first = asyncio.create_task(_call("first"))
+    second = asyncio.create_task(_call("second"))
+    await asyncio.sleep(0)
+
+    await holder.__aexit__(None, None, None)
+    first.cancel()
+    await asyncio.gather(first, second, return_exceptions=True)
+
+    assert acquired == ["second"]
+    async with limiter.acquire_async() as lease:
+        assert lease.active_calls == 1
+
+
 def test_circuit_opens_after_threshold_failures(monkeypatch):
     """Consecutive upstream failures should open the circuit."""
     monkeypatch.setenv("LLM_CIRCUIT_BREAKER_FAILURE_THRESHOLD", "2")
@@ -0,0 +1,164 @@
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from dal.memgraph.embedding_index import NodeEmbeddingIndex
+from dal.memgraph.graph_store import MemgraphStore
+
+
+class _MockNode(dict):
+    """Mock Neo4j node that behaves like a dict with labels."""
+
+    def __init__(self, data, labels):
+        """Initialize mock node."""
+        super().__init__(data)
+        self.labels = labels
+
+
+def _nodes():
+    return [
+        ("c1", {"id": "c1", "name": "amount", "embedding": [1.0, 0.0]}),
+        ("c2", {"id": "c2", "name": "customer", "embedding": [0.0, 1.0]}),
+        ("c3", {"id": "c3", "name": "total", "embedding": [1.0, 1.0]}),
+    ]
+
+
+class TestNodeEmbeddingIndex:
+    """Tests for the in-process node embedding matrix."""
+
+    def test_search_orders_by_cosine_and_strips_embedding(self):
+        """Top-k hits are sorted by score and omit the embedding property."""
+        index = NodeEmbeddingIndex("Column")
+        index.load(_nodes(), version=1)
+
+        hits = index.search([2.0, 0.0], k=2)
+
+        assert [hit["node"]["name"] for hit in hits] == ["amount", "total"]
+        assert abs(hits[0]["score"] - 1.0) < 1e-6
+        assert abs(hits[1]["score"] - 0.70710677) < 1e-5
+        assert "embedding" not in hits[0]["node"]
+        assert index.version == 1
+
+    def test_apply_node_upserts_and_drops_unembedded(self):
+        """Upserts replace rows in place; losing the embedding removes the row."""
+        index = NodeEmbeddingIndex("Column")
+        index.load(_nodes())
+
+        index.apply_node("c2", {"id": "c2", "name": "customer", "embedding": [1.0, 0.0]})
+        index.apply_node("c4", {"id": "c4", "name": "new", "embedding": [0.0, 1.0]})
+        index.apply_node("c1", {"id": "c1", "name": "amount"})
+
+        assert len(index) == 3
+        hits = index.search([0.0, 1.0], k=1)
+        assert hits[0]["node"]["id"] == "c4"
+
+    def test_remove_keeps_rows_contiguous(self):
+        """Removing a middle row still returns every remaining node."""
+        index = NodeEmbeddingIndex("Column")
+        index.load(_nodes())
+
+        assert index.remove(["c1", "missing"]) == 1
+
+        ids = {hit["node"]["id"] for hit in index.search([1.0, 1.0], k=10)}
+        assert ids == {"c2", "c3"}
+
+    def test_dimension_mismatch_returns_no_hits(self):
+        """A query with the wrong dimension does not raise."""
+        index = NodeEmbeddingIndex("Column")
+        index.load(_nodes())
+
+        assert index.search([1.0, 0.0, 0.0], k=3) == []
+
+
+class TestMemgraphStoreEmbeddingIndex:
+    """Tests for how MemgraphStore loads and refreshes embedding indexes."""
+
+    @pytest.fixture
+    def store(self):
+        """Create a MemgraphStore with a mocked driver and no vector_search."""
+        with patch("dal.memgraph.graph_store.GraphDatabase.driver"):
+            store = MemgraphStore("bolt://localhost:7687", "user", "pass")
+        store.supports_vector_search = MagicMock(return_value=False)
+        store.has_index = MagicMock(return_value=False)
+        store.get_hydration_version = MagicMock(return_value=1)
+        store._fetch_embedded_nodes = MagicMock(side_effect=lambda *_: iter(_nodes()))
+        return store
+
+    def test_index_is_loaded_once_per_version(self, store):
+        """Repeated searches reuse the matrix until the hydration version moves."""
+        store.search_ann_seeds("Column", [1.0, 0.0], k=2)
+        store.search_ann_seeds("Column", [0.0, 1.0], k=2)
+        assert store._fetch_embedded_nodes.call_count == 1
+
+        store.get_hydration_version.return_value = 2
+        store._version_checked_at = None
+        store.search_ann_seeds("Column", [1.0, 0.0], k=2)
+        assert store._fetch_embedded_nodes.call_count == 2
+
+    def test_upsert_node_refreshes_loaded_index(self, store):
+        """Writes through the store are applied to the loaded index."""
+        store.search_ann_seeds("Column", [1.0, 0.0], k=1)
+
+        neo_node = _MockNode({"id": "c5", "name": "fresh", "embedding": [0.0, -1.0]}, ["Column"])
+        session = MagicMock()
+        session.run.return_value.single.return_value = {"n": neo_node}
+        store.driver.session.return_value.__enter__.return_value = session
+
+        store.upsert_node("Column", "c5", {"embedding": [0.0, -1.0]})
+
+        hits = store.search_ann_seeds("Column", [0.0, -1.0], k=1)
+        assert hits[0]["node"]["id"] == "c5"
+        assert store._fetch_embedded_nodes.call_count == 1
+
+    def test_disabled_index_scans_every_call(self, store):
+        """With the flag off each search re-reads embeddings from the graph."""
+        store._embedding_index_enabled = False
+
+        store.search_ann_seeds("Column", [1.0, 0.0], k=2)
+        store.search_ann_seeds("Column", [1.0, 0.0], k=2)
+
+        assert store._fetch_embedded_nodes.call_count == 2
+
+    def test_bump_restamps_only_when_no_other_bump_intervened(self, store):
+        """Local indexes survive our own bump but reload after a concurrent one."""
+        session = MagicMock()
+        store.driver.session.return_value.__enter__.return_value = session
+        store.search_ann_seeds("Column", [1.0, 0.0], k=1)
+
+        session.run.return_value = [{"version": 2}]
+        assert store.bump_hydration_version() == 2
+        store.search_ann_seeds("Column", [1.0, 0.0], k=1)
+        assert store._fetch_embedded_nodes.call_count == 1
+
+        # Another process bumped to 3, so our bump lands on 4.
+        session.run.return_value = [{"version": 4}]
+        assert store.bump_hydration_version() == 4
+        assert store._embedding_indexes == {}
+        store.search_ann_seeds("Column", [1.0, 0.0], k=1)
+        assert store._fetch_embedded_nodes.call_count == 2
+
+    def test_loading_one_label_does_not_block_others(self, store):
+        """A slow Bolt load holds only its own label's lock."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def _fetch(label, _prop):
+            if label == "Column":
+                started.set()
+                release.wait(5)
+            return iter(_nodes())
+
+        store._fetch_embedded_nodes = MagicMock(side_effect=_fetch)
+        loader = threading.Thread(
+            target=store.search_ann_seeds, args=("Column", [1.0, 0.0]), kwargs={"k": 1}
+        )
+        loader.start()
+        assert started.wait(5)
+        try:
+            hits = store.search_ann_seeds("Metric", [1.0, 0.0], k=1)
+            assert hits[0]["node"]["id"] == "c1"
+        finally:
+            release.set()
+            loader.join(5)
+        assert not loader.is_alive()
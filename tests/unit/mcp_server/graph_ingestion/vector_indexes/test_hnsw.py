@@ -420,3 +420,232 @@ class TestHNSWProtocolCompliance:
         index.add_items(vectors, [1])
         results = index.search(np.array([1.0, 0.0, 0.0]), k=1)
         assert len(results) == 1
+
+
+class TestHNSWIncrementalUpdates:
+    """Tests for growable storage, deletes and replacement on the real HNSWIndex."""
+
+    @pytest.fixture(autouse=True)
+    def _require_hnswlib(self):
+        pytest.importorskip("hnswlib")
+
+    @staticmethod
+    def _index(**kwargs):
+        from ingestion.vector_indexes.hnsw import HNSWIndex
+
+        return HNSWIndex(dim=2, **kwargs)
+
+    def test_vector_buffer_grows_geometrically(self):
+        """Single-item adds reuse preallocated buffer capacity."""
+        index = self._index(max_elements=4)
+
+        capacities = set()
+        for i in range(100):
+            index.add_items(np.array([[float(i + 1), 1.0]]), [i])
+            capacities.add(index._vectors_normalized.shape[0])
+
+        assert len(index) == 100
+        assert capacities == {64, 128}
+
+    def test_mark_deleted_hides_items_and_reuses_slots(self):
+        """Deleted ids drop out of search and their slots are reused."""
+        index = self._index()
+        index.add_items(np.array([[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]]), [1, 2, 3])
+
+        assert index.mark_deleted([1, 99]) == 1
+        assert len(index) == 2
+        assert 1 not in [r.id for r in index.search(np.array([1.0, 0.0]), k=3)]
+
+        index.add_items(np.array([[1.0, -1.0]]), [4])
+        assert len(index._ids) == 3
+        assert index.search(np.array([1.0, -1.0]), k=1)[0].id == 4
+
+    def test_replace_items_updates_in_place(self):
+        """Replacing an id moves its vector and replaces its metadata."""
+        index = self._index()
+        index.add_items(np.array([[1.0, 0.0], [0.0, 1.0]]), [1, 2], metadata={1: {"v": "old"}})
+
+        index.replace_items(np.array([[0.0, -1.0]]), [1], metadata={1: {"v": "new"}})
+
+        assert len(index) == 2
+        result = index.search(np.array([0.0, -1.0]), k=1)[0]
+        assert result.id == 1
+        assert result.metadata == {"v": "new"}
+
+    def test_compaction_after_majority_deleted(self):
+        """Deleting most items rebuilds the graph with dense labels."""
+        index = self._index()
+        vectors = np.array([[float(i + 1), 1.0] for i in range(10)])
+        index.add_items(vectors, list(range(10)))
+
+        index.mark_deleted(list(range(6)))
+
+        assert index._free_slots == []
+        assert sorted(index._ids) == [6, 7, 8, 9]
+        vectors_out, ids_out = index.get_all_vectors()
+        assert ids_out == [6, 7, 8, 9]
+        assert vectors_out.shape == (4, 2)
+
+    def test_save_and_load_preserves_deletes(self):
+        """Tombstones and free slots survive a save/load round trip."""
+        from ingestion.vector_indexes.hnsw import HNSWIndex
+
+        index = self._index()
+        index.add_items(np.array([[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]]), [1, 2, 3])
+        index.mark_deleted([2])
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "index.hnsw")
+            index.save(path)
+            loaded = HNSWIndex()
+            loaded.load(path)
+
+        assert len(loaded) == 2
+        assert 2 not in [r.id for r in loaded.search(np.array([0.0, 1.0]), k=2)]
+        loaded.add_items(np.array([[0.0, 1.0]]), [5])
+        assert len(loaded._ids) == 3
+
+
+class TestHNSWSnapshotFormat:
+    """Tests for the pickle-free, memory-mapped snapshot layout."""
+
+    @pytest.fixture(autouse=True)
+    def _require_hnswlib(self):
+        pytest.importorskip("hnswlib")
+
+    def test_snapshot_files_are_pickle_free(self, tmp_path):
+        """Vectors and ids are plain .npy arrays readable without pickle."""
+        from ingestion.vector_indexes.hnsw import HNSWIndex
+
+        index = HNSWIndex(dim=2)
+        index.add_items(np.array([[3.0, 4.0], [0.0, 1.0]]), ["orders", "users"])
+        path = str(tmp_path / "schema.hnsw")
+        index.save(path)
+
+        vectors = np.load(path + ".vectors.npy", allow_pickle=False)
+        ids = np.load(path + ".ids.npy", allow_pickle=False)
+        assert vectors.dtype == np.float32
+        np.testing.assert_allclose(vectors[0], [0.6, 0.8], rtol=1e-6)
+        assert ids.tolist() == ["orders", "users"]
+        assert not os.path.exists(str(tmp_path / "schema.meta"))
+
+    def test_load_memory_maps_vectors(self, tmp_path):
+        """Loaded vectors are a copy-on-write memmap and stay writable."""
+        from ingestion.vector_indexes.hnsw import HNSWIndex
+
+        index = HNSWIndex(dim=2)
+        index.add_items(
+            np.array([[1.0, 0.0], [0.0, 1.0]]),
+            ["orders", "users"],
+            metadata={"orders": {"table_name": "orders", "schema_text": "Table: orders"}},
+        )
+        path = str(tmp_path / "schema.hnsw")
+        index.save(path)
+
+        loaded = HNSWIndex()
+        loaded.load(path)
+
+        assert isinstance(loaded._vectors_normalized, np.memmap)
+        result = loaded.search(np.array([1.0, 0.0]), k=1)[0]
+        assert result.id == "orders"
+        assert result.metadata == {"table_name": "orders", "schema_text": "Table: orders"}
+        assert loaded.search(np.array([0.0, 1.0]), k=1)[0].metadata is None
+
+        loaded.replace_items(np.array([[1.0, 1.0]]), ["users"])
+        reread = np.load(path + ".vectors.npy", allow_pickle=False)
+        np.testing.assert_allclose(reread[1], [0.0, 1.0])
+
+    def test_unsupported_format_version_rejected(self, tmp_path):
+        """Loading a snapshot with an unknown format version fails loudly."""
+        import json
+
+        from ingestion.vector_indexes.hnsw import HNSWIndex
+
+        index = HNSWIndex(dim=2)
+        index.add_items(np.array([[1.0, 0.0]]), [1])
+        path = str(tmp_path / "index.hnsw")
+        index.save(path)
+
+        manifest_path = path + ".manifest.json"
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        manifest["format_version"] = 999
+        with open(manifest_path, "w") as f:
+            json.dump(manifest, f)
+
+        with pytest.raises(ValueError, match="Unsupported HNSW snapshot format"):
+            HNSWIndex().load(path)
+
+    def test_mixed_snapshot_files_rejected(self, tmp_path):
+        """A sidecar left over from another save is caught by the manifest check."""
+        import os
+        import shutil
+
+        from ingestion.vector_indexes.hnsw import HNSWIndex
+
+        first = HNSWIndex(dim=2)
+        first.add_items(np.array([[1.0, 0.0]]), [1])
+        second = HNSWIndex(dim=2)
+        second.add_items(np.array([[0.0, 1.0], [1.0, 1.0]]), [2, 3])
+
+        first_path = str(tmp_path / "first.hnsw")
+        path = str(tmp_path / "index.hnsw")
+        first.save(first_path)
+        second.save(path)
+        assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+        shutil.copyfile(first_path + ".ids.npy", path + ".ids.npy")
+
+        with pytest.raises(ValueError, match="does not match its manifest"):
+            HNSWIndex().load(path)
+
+
+class TestHNSWSearchBatch:
+    """Tests for the batched search API on the real HNSWIndex."""
+
+    @pytest.fixture(autouse=True)
+    def _require_hnswlib(self):
+        pytest.importorskip("hnswlib")
+
+    def test_search_batch_matches_search(self):
+        """Every batch row agrees with a single-vector search."""
+        from ingestion.vector_indexes.hnsw import HNSWIndex
+
+        rng = np.random.default_rng(7)
+        vectors = rng.normal(size=(50, 8)).astype(np.float32)
+        index = HNSWIndex(dim=8)
+        index.add_items(vectors, [f"t{i}" for i in range(50)])
+
+        queries = rng.normal(size=(20, 8)).astype(np.float32)
+        batch = index.search_batch(queries, k=5)
+
+        assert len(batch) == 20
+        assert batch.ids.shape == (20, 5)
+        assert batch.scores.dtype == np.float32
+        for i, query in enumerate(queries):
+            single = index.search(query, k=5)
+            assert batch.ids[i].tolist() == [r.id for r in single]
+
+    def test_search_batch_skips_deleted_and_zero_queries(self):
+        """Deleted ids never appear and zero queries produce empty rows."""
+        from ingestion.vector_indexes.hnsw import HNSWIndex
+
+        index = HNSWIndex(dim=2)
+        index.add_items(np.array([[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]]), [1, 2, 3])
+        index.mark_deleted([1])
+
+        batch = index.search_batch(np.array([[1.0, 0.0], [0.0, 0.0]]), k=5)
+
+        assert batch.ids.shape == (2, 2)
+        assert 1 not in batch.ids[0].tolist()
+        assert batch.row(1) == []
+        assert np.isneginf(batch.scores[1]).all()
+
+    def test_search_batch_on_empty_index(self):
+        """An empty index returns zero-width rows."""
+        from ingestion.vector_indexes.hnsw import HNSWIndex
+
+        batch = HNSWIndex(dim=2).search_batch(np.ones((3, 2)), k=4)
+
+        assert batch.ids.shape == (3, 0)
+        assert [batch.row(i) for i in range(3)] == [[], [], []]
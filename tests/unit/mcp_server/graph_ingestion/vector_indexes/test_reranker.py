@@ -233,3 +233,52 @@ class TestRecallLossLogging:
             assert len(results) == 2
         finally:
             os.environ.pop("RECORD_GOLDEN_SET", None)
+
+
+class TestSearchBatchWithRerank:
+    """Tests for batched retrieve-and-rerank on the real HNSWIndex."""
+
+    @pytest.fixture
+    def hnsw_index(self):
+        """Create a real HNSWIndex with sample data."""
+        pytest.importorskip("hnswlib")
+        from ingestion.vector_indexes import HNSWIndex
+
+        index = HNSWIndex(dim=3)
+        vectors = np.array(
+            [
+                [1.0, 0.0, 0.0],
+                [0.9, 0.1, 0.0],
+                [0.8, 0.2, 0.0],
+                [0.0, 1.0, 0.0],
+                [0.1, 0.9, 0.0],
+                [0.5, 0.5, 0.0],
+            ]
+        )
+        index.add_items(vectors, list(range(6)), metadata={0: {"name": "x_axis"}})
+        return index
+
+    def test_batch_matches_single_query_rerank(self, hnsw_index):
+        """Each row equals the single-query rerank for the same vector."""
+        from ingestion.vector_indexes import search_batch_with_rerank
+
+        queries = np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.6, 0.4, 0.0]])
+        batch = search_batch_with_rerank(hnsw_index, queries, k=3, expansion_factor=2)
+
+        assert batch.ids.shape == (3, 3)
+        for i, query in enumerate(queries):
+            single = search_with_rerank(hnsw_index, query, k=3, expansion_factor=2)
+            assert [r.id for r in batch.row(i)] == [r.id for r in single]
+            np.testing.assert_allclose(batch.scores[i], [r.score for r in single], rtol=1e-5)
+
+        assert batch.row(0)[0].metadata == {"name": "x_axis"}
+
+    def test_zero_query_row_is_empty(self, hnsw_index):
+        """A zero vector yields an empty row without affecting the others."""
+        from ingestion.vector_indexes import search_batch_with_rerank
+
+        queries = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0]])
+        batch = search_batch_with_rerank(hnsw_index, queries, k=2)
+
+        assert batch.row(0) == []
+        assert batch.row(1)[0].id == 0
@@ -4,7 +4,7 @@ import tempfile
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import numpy as np
 
@@ -143,6 +143,31 @@ class TestThreadSafeIndex:
 
         assert len(safe) == 1
 
+    def test_incremental_writes_delegate_to_active_index(self):
+        """Verify replace_items and mark_deleted pass through to active index."""
+        inner = MagicMock()
+        inner.mark_deleted.return_value = 1
+        safe = ThreadSafeIndex(inner)
+        vectors = np.array([[1.0, 0.0]])
+
+        safe.replace_items(vectors, [1], metadata={1: {"name": "a"}})
+        deleted = safe.mark_deleted([1])
+
+        inner.replace_items.assert_called_once_with(vectors, [1], {1: {"name": "a"}})
+        inner.mark_deleted.assert_called_once_with([1])
+        assert deleted == 1
+
+    def test_search_batch_delegates_to_active_index(self):
+        """Verify search_batch reads from the active index."""
+        inner = MagicMock()
+        safe = ThreadSafeIndex(inner)
+        queries = np.ones((4, 2))
+
+        result = safe.search_batch(queries, k=3)
+
+        inner.search_batch.assert_called_once_with(queries, 3)
+        assert result is inner.search_batch.return_value
+
     def test_create_factory(self):
         """Verify factory creates HNSW index."""
         with patch("ingestion.vector_indexes.factory.create_vector_index") as mock_create:
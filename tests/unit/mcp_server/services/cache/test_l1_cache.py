@@ -0,0 +1,196 @@
+"""Tests for the in-process registry L1 cache."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from dal.postgres.registry_events import RegistryEventListener, encode_registry_event
+from mcp_server.services.cache.l1_cache import RegistryL1Cache
+from mcp_server.services.cache.service import lookup_cache
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _cache(**kwargs) -> RegistryL1Cache:
+    cache = RegistryL1Cache(**kwargs)
+    cache.set_coherent(True)
+    return cache
+
+
+def test_signature_hit_and_ttl_expiry():
+    """Entries are served by signature until their TTL elapses."""
+    clock = _Clock()
+    cache = _cache(ttl_seconds=10, clock=clock)
+    cache.put(1, "sig", "SELECT 1", {"match_type": "signature"})
+
+    assert cache.lookup_signature(1, "sig").sql_query == "SELECT 1"
+    assert cache.lookup_signature(2, "sig") is None
+
+    clock.now = 11
+    assert cache.lookup_signature(1, "sig") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_put_is_ignored_until_coherent():
+    """Nothing is cached while invalidation events are not being received."""
+    cache = RegistryL1Cache()
+    cache.put(1, "sig", "SELECT 1")
+    assert cache.stats()["entries"] == 0
+
+
+def test_stale_generation_is_not_cached():
+    """A registry read that raced an invalidation is not cached."""
+    cache = _cache()
+    generation = cache.generation
+    cache.invalidate(1, "sig")
+
+    cache.put(1, "sig", "SELECT old", generation=generation)
+
+    assert cache.lookup_signature(1, "sig") is None
+
+
+def test_byte_cap_evicts_least_recently_used():
+    """The memory bound evicts the coldest entry first."""
+    cache = _cache(max_bytes=1000)
+    cache.put(1, "a", "SELECT 'a'")
+    cache.put(1, "b", "SELECT 'b'")
+    cache.lookup_signature(1, "a")
+    cache.put(1, "c", "SELECT 'c'")
+
+    assert cache.lookup_signature(1, "b") is None
+    assert cache.lookup_signature(1, "a") is not None
+    assert cache.lookup_signature(1, "c") is not None
+    assert cache.stats()["bytes"] <= 1000
+
+
+def test_semantic_lookup_is_tenant_scoped():
+    """Nearest neighbours come only from the caller's tenant, above the threshold."""
+    cache = _cache()
+    cache.put(1, "revenue", "SELECT SUM(amount)", embedding=[1.0, 0.0, 0.0])
+    cache.put(1, "count", "SELECT COUNT(*)", embedding=[0.0, 1.0, 0.0])
+    cache.put(2, "other", "SELECT 2", embedding=[1.0, 0.0, 0.0])
+
+    hits = cache.lookup_semantic(1, [0.99, 0.05, 0.0], threshold=0.9)
+
+    assert [entry.signature_key for entry in hits] == ["revenue"]
+    assert cache.lookup_semantic(3, [1.0, 0.0, 0.0], threshold=0.9) == []
+
+
+def test_store_event_invalidates_pair_and_alias():
+    """A change to either the pair or an aliased signature drops the cached answer."""
+    cache = _cache()
+    cache.put(1, "pair", "SELECT 1", embedding=[1.0, 0.0])
+    cache.add_alias(1, "pair", "question")
+    assert cache.lookup_signature(1, "question").signature_key == "pair"
+
+    cache.handle_event({"event": "store", "tenant_id": 1, "signature_key": "question"})
+    assert cache.lookup_signature(1, "question") is None
+    assert cache.lookup_signature(1, "pair") is not None
+
+    cache.handle_event({"event": "tombstone", "tenant_id": 1, "signature_key": "pair"})
+    assert cache.lookup_signature(1, "pair") is None
+    assert cache.lookup_semantic(1, [1.0, 0.0], threshold=0.5) == []
+
+
+def test_reset_and_schema_events():
+    """Tenant resets are scoped; schema changes and malformed events clear everything."""
+    cache = _cache()
+    cache.put(1, "a", "SELECT 1")
+    cache.put(2, "b", "SELECT 2")
+
+    cache.handle_event({"event": "reset", "tenant_id": 1, "signature_key": None})
+    assert cache.lookup_signature(1, "a") is None
+    assert cache.lookup_signature(2, "b") is not None
+
+    cache.handle_event({"event": "schema", "tenant_id": None, "signature_key": None})
+    assert cache.stats()["entries"] == 0
+
+    cache.put(2, "b", "SELECT 2")
+    cache.handle_event(None)
+    assert cache.stats()["entries"] == 0
+
+
+def test_listener_decodes_payloads():
+    """Notifications are decoded; undecodable payloads are reported as None."""
+    events = []
+    listener = RegistryEventListener(events.append, lambda _state: None)
+
+    listener._dispatch(None, 1, "query_registry_events", encode_registry_event("store", 1, "s"))
+    listener._dispatch(None, 1, "query_registry_events", "not json")
+
+    assert events == [{"event": "store", "tenant_id": 1, "signature_key": "s"}, None]
+
+
+@pytest.mark.asyncio
+async def test_lookup_cache_serves_repeat_queries_from_l1():
+    """A validated registry hit is served from L1 on the next lookup."""
+    cache = _cache()
+    pair = MagicMock()
+    pair.signature_key = "abc123"
+    pair.sql_query = "SELECT SUM(amount) FROM payment;"
+    pair.roles = ["cache"]
+    pair.status = "autogenerated"
+    pair.metadata = {"schema_snapshot_id": "snap-1"}
+    pair.embedding = [0.1, 0.2, 0.3]
+
+    with (
+        patch("mcp_server.services.cache.service.get_l1_cache", return_value=cache),
+        patch(
+            "mcp_server.services.cache.service.RegistryService.compute_signature_key",
+            new_callable=AsyncMock,
+            return_value="abc123",
+        ),
+        patch(
+            "mcp_server.services.cache.service.RegistryService.lookup_canonical",
+            new_callable=AsyncMock,
+            return_value=pair,
+        ) as lookup_canonical,
+    ):
+        first = await lookup_cache("What is the total revenue?", tenant_id=1)
+        second = await lookup_cache("What is the total revenue?", tenant_id=1)
+
+    assert lookup_canonical.await_count == 1
+    assert second.value == first.value
+    assert second.metadata == {"match_type": "signature", "schema_snapshot_id": "snap-1"}
+
+
+@pytest.mark.asyncio
+async def test_lookup_cache_resolves_paraphrase_from_l1_semantic_tier():
+    """A paraphrase near a cached pair skips the registry's vector search."""
+    cache = _cache()
+    cache.put(1, "abc123", "SELECT SUM(amount) FROM payment;", embedding=[1.0, 0.0, 0.0])
+
+    with (
+        patch("mcp_server.services.cache.service.get_l1_cache", return_value=cache),
+        patch(
+            "mcp_server.services.cache.service.RegistryService.compute_signature_key",
+            new_callable=AsyncMock,
+            return_value="paraphrase",
+        ),
+        patch(
+            "mcp_server.services.cache.service.RegistryService.lookup_canonical",
+            new_callable=AsyncMock,
+            return_value=None,
+        ),
+        patch(
+            "mcp_server.services.cache.service.RagEngine.embed_text",
+            new_callable=AsyncMock,
+            return_value=[0.98, 0.1, 0.0],
+        ),
+        patch(
+            "mcp_server.services.cache.service.RegistryService.lookup_semantic",
+            new_callable=AsyncMock,
+        ) as lookup_semantic,
+    ):
+        result = await lookup_cache("Show me total revenue", tenant_id=1)
+
+    lookup_semantic.assert_not_awaited()
+    assert result.cache_id == "abc123"
+    assert result.metadata["match_type"] == "semantic"
+    assert cache.lookup_signature(1, "paraphrase").signature_key == "abc123"
@@ -0,0 +1,209 @@
+"""Tests for the executed-result cache."""
+
+import hashlib
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from mcp_server.services.cache.result_cache import ResultCache, build_result_cache_key
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _key(**overrides):
+    kwargs = {
+        "sql": "SELECT 1",
+        "params": [],
+        "tenant_id": 1,
+        "provider": "postgres",
+        "schema_snapshot_id": "snap-1",
+        "policy_fingerprint": "policy",
+    }
+    kwargs.update(overrides)
+    return build_result_cache_key(**kwargs)
+
+
+def _envelope(value):
+    return json.dumps({"rows": [{"value": value}], "metadata": {"rows_returned": 1}})
+
+
+def test_key_covers_sql_params_tenant_snapshot_and_policy():
+    """Any component that can change the result yields a different key."""
+    base = _key()
+    assert _key() == base
+    for override in (
+        {"sql": "SELECT 2"},
+        {"params": [1]},
+        {"tenant_id": 2},
+        {"schema_snapshot_id": "snap-2"},
+        {"policy_fingerprint": "other"},
+        {"provider": "duckdb"},
+        {"shape": {"include_columns": False}},
+    ):
+        assert _key(**override) != base
+
+
+def test_hit_reports_age_and_expires_per_provider_ttl():
+    """Entries are compressed, served with their age, and expire on the provider TTL."""
+    clock = _Clock()
+    cache = ResultCache(default_ttl_seconds=60, provider_ttl_seconds={"DuckDB": 5}, clock=clock)
+    cache.put("pg", _envelope(1), tenant_id=1, provider="postgres", schema_snapshot_id=None)
+    cache.put("duck", _envelope(2), tenant_id=1, provider="duckdb", schema_snapshot_id=None)
+
+    clock.now = 10
+    hit = cache.get("pg", 1, None)
+    assert hit.envelope["rows"] == [{"value": 1}]
+    assert hit.age_ms == 10_000
+    assert cache.get("duck", 1, None) is None
+
+
+def test_zero_ttl_disables_provider():
+    """A TTL of zero turns caching off for that provider."""
+    cache = ResultCache(provider_ttl_seconds={"bigquery": 0})
+    assert not cache.put(
+        "k", _envelope(1), tenant_id=1, provider="bigquery", schema_snapshot_id=None
+    )
+
+
+def test_byte_bounds():
+    """Oversized results are skipped and the total size evicts least recently used."""
+    cache = ResultCache(max_bytes=600, max_entry_bytes=400)
+    incompressible = json.dumps([hashlib.sha256(str(i).encode()).hexdigest() for i in range(20)])
+    assert not cache.put(
+        "big", incompressible, tenant_id=1, provider="postgres", schema_snapshot_id=None
+    )
+
+    for key in ("a", "b", "c"):
+        cache.put(key, _envelope(key), tenant_id=1, provider="postgres", schema_snapshot_id=None)
+
+    assert cache.stats()["bytes"] <= 600
+    assert cache.get("a", 1, None) is None
+    assert cache.get("c", 1, None) is not None
+
+
+def test_schema_snapshot_change_invalidates_tenant_entries():
+    """Seeing a new snapshot for a tenant drops its results from older snapshots."""
+    cache = ResultCache()
+    cache.put("t1", _envelope(1), tenant_id=1, provider="postgres", schema_snapshot_id="s1")
+    cache.put("t2", _envelope(2), tenant_id=2, provider="postgres", schema_snapshot_id="s1")
+
+    assert cache.get("other", 1, "s2") is None
+
+    assert cache.get("t1", 1, "s1") is None
+    assert cache.get("t2", 2, "s1") is not None
+
+
+@pytest.mark.asyncio
+async def test_execute_sql_query_serves_repeat_query_from_cache(monkeypatch):
+    """A repeated query is answered without touching the database unless bypassed."""
+    from dal.capabilities import BackendCapabilities
+    from dal.database import Database
+    from mcp_server.tools.execute_sql_query import handler
+
+    monkeypatch.setattr(
+        Database,
+        "_query_target_capabilities",
+        BackendCapabilities(
+            supports_tenant_enforcement=True,
+            tenant_enforcement_mode="rls_session",
+            supports_column_metadata=True,
+            supports_cancel=True,
+            supports_pagination=True,
+            execution_model="sync",
+            supports_schema_cache=False,
+        ),
+    )
+    monkeypatch.setattr(Database, "_query_target_provider", "postgres")
+
+    mock_conn = AsyncMock()
+    mock_conn.fetch = AsyncMock(return_value=[{"count": 1000}])
+    mock_conn.__aenter__ = AsyncMock(return_value=mock_conn)
+    mock_conn.__aexit__ = AsyncMock(return_value=False)
+    mock_get = MagicMock(return_value=mock_conn)
+    cache = ResultCache()
+
+    with (
+        patch("agent.validation.policy_enforcer.PolicyEnforcer.validate_sql"),
+        patch("mcp_server.tools.execute_sql_query.Database.get_connection", mock_get),
+        patch("mcp_server.utils.auth.validate_role", return_value=None),
+        patch("mcp_server.tools.execute_sql_query.get_result_cache", return_value=cache),
+    ):
+        sql = "SELECT COUNT(*) as count FROM film"
+        first = json.loads(await handler(sql, tenant_id=1, schema_snapshot_id="snap-1"))
+        second = json.loads(await handler(sql, tenant_id=1, schema_snapshot_id="snap-1"))
+        other_tenant = json.loads(await handler(sql, tenant_id=2, schema_snapshot_id="snap-1"))
+        bypassed = json.loads(
+            await handler(sql, tenant_id=1, schema_snapshot_id="snap-1", bypass_result_cache=True)
+        )
+
+    assert mock_get.call_count == 3
+    assert first["metadata"]["result_cache.hit"] is False
+    assert second["rows"] == first["rows"]
+    assert second["metadata"]["result_cache.hit"] is True
+    assert second["metadata"]["result_cache.age_ms"] >= 0
+    assert other_tenant["metadata"]["result_cache.hit"] is False
+    assert bypassed["metadata"]["result_cache.hit"] is False
+    assert bypassed["metadata"]["result_cache.bypassed"] is True
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_records_enforcement_observability(monkeypatch):
+    """A cache hit still emits tenant, guardrail and sandbox outcomes, flagged as a hit."""
+    from dal.capabilities import BackendCapabilities
+    from dal.database import Database
+    from mcp_server.tools.execute_sql_query import handler
+
+    monkeypatch.setattr(
+        Database,
+        "_query_target_capabilities",
+        BackendCapabilities(
+            supports_tenant_enforcement=True,
+            tenant_enforcement_mode="rls_session",
+            supports_column_metadata=True,
+            supports_cancel=True,
+            supports_pagination=True,
+            execution_model="sync",
+            supports_schema_cache=False,
+        ),
+    )
+    monkeypatch.setattr(Database, "_query_target_provider", "postgres")
+
+    mock_conn = AsyncMock()
+    mock_conn.fetch = AsyncMock(return_value=[{"count": 1000}])
+    mock_conn.__aenter__ = AsyncMock(return_value=mock_conn)
+    mock_conn.__aexit__ = AsyncMock(return_value=False)
+    cache = ResultCache()
+
+    with (
+        patch("agent.validation.policy_enforcer.PolicyEnforcer.validate_sql"),
+        patch(
+            "mcp_server.tools.execute_sql_query.Database.get_connection",
+            MagicMock(return_value=mock_conn),
+        ),
+        patch("mcp_server.utils.auth.validate_role", return_value=None),
+        patch("mcp_server.tools.execute_sql_query.get_result_cache", return_value=cache),
+        patch("mcp_server.tools.execute_sql_query.mcp_metrics.add_counter") as mock_add_counter,
+    ):
+        sql = "SELECT COUNT(*) as count FROM film"
+        await handler(sql, tenant_id=1, schema_snapshot_id="snap-1")
+        mock_add_counter.reset_mock()
+        second = json.loads(await handler(sql, tenant_id=1, schema_snapshot_id="snap-1"))
+
+    assert second["metadata"]["result_cache.hit"] is True
+    hit_counters = {
+        call.args[0]: call.kwargs.get("attributes", {}) for call in mock_add_counter.call_args_list
+    }
+    for name in (
+        "mcp.tenant_enforcement.outcome_total",
+        "mcp.session_guardrail.outcome_total",
+        "mcp.postgres.sandbox.outcome_total",
+    ):
+        assert hit_counters[name]["result_cache_hit"] is True
+    assert hit_counters["mcp.tenant_enforcement.outcome_total"]["outcome"] == "APPLIED"
@@ -0,0 +1,108 @@
+"""Tests for memoized, off-loop canonicalization."""
+
+import threading
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import spacy
+
+from mcp_server.services.canonicalization.spacy_pipeline import CanonicalizationService
+
+
+class _CountingNlp:
+    """Blank English pipeline with a RATING ruler that records how it is called."""
+
+    def __init__(self):
+        self._nlp = spacy.blank("en")
+        ruler = self._nlp.add_pipe("entity_ruler")
+        ruler.add_patterns([{"label": "RATING", "pattern": "PG"}])
+        self.vocab = self._nlp.vocab
+        self.calls = []
+        self.threads = set()
+
+    def __call__(self, text):
+        self.calls.append(text)
+        self.threads.add(threading.current_thread().name)
+        return self._nlp(text)
+
+    def pipe(self, texts, batch_size=64):
+        texts = list(texts)
+        self.calls.append(tuple(texts))
+        self.threads.add(threading.current_thread().name)
+        return self._nlp.pipe(texts, batch_size=batch_size)
+
+
+@pytest.fixture
+def service_factory():
+    """Build services whose pipelines are _CountingNlp instances."""
+    nlps = []
+
+    def build_nlp(_model):
+        nlps.append(_CountingNlp())
+        return nlps[-1]
+
+    with (
+        patch("mcp_server.services.canonicalization.spacy_pipeline.SPACY_ENABLED", True),
+        patch("spacy.load", side_effect=build_nlp),
+        patch.object(CanonicalizationService, "_setup_entity_ruler", return_value=1),
+        patch.object(CanonicalizationService, "_setup_dependency_matcher", return_value=None),
+    ):
+        CanonicalizationService.reset_instance()
+        yield lambda: (CanonicalizationService("en_core_web_sm"), nlps)
+    CanonicalizationService.reset_instance()
+
+
+@pytest.mark.asyncio
+async def test_repeated_queries_are_parsed_once_off_the_loop(service_factory):
+    """Whitespace variants share one parse, which runs on the spaCy worker pool."""
+    service, nlps = service_factory()
+
+    first = await service.process_query("Top 10 PG movies")
+    second = await service.process_query("  Top 10   PG movies ")
+
+    assert first == second
+    assert first[0]["rating"] == "PG"
+    assert nlps[0].calls == ["Top 10 PG movies"]
+    assert all(name.startswith("spacy-canon") for name in nlps[0].threads)
+
+
+@pytest.mark.asyncio
+async def test_memo_returns_independent_copies(service_factory):
+    """Mutating a returned constraints dict does not poison the memo."""
+    service, _ = service_factory()
+
+    constraints, _, _ = await service.process_query("PG films")
+    constraints["rating"] = "R"
+
+    assert service.extract_constraints("PG films")["rating"] == "PG"
+
+
+@pytest.mark.asyncio
+async def test_reload_patterns_invalidates_memo(service_factory):
+    """Queries are re-parsed by the new pipeline after a pattern reload."""
+    service, nlps = service_factory()
+    await service.process_query("PG films")
+
+    with patch("dal.database.Database") as mock_db:
+        mock_conn = AsyncMock()
+        mock_conn.fetch.return_value = []
+        mock_db.get_connection.return_value.__aenter__.return_value = mock_conn
+        await service.reload_patterns()
+
+    await service.process_query("PG films")
+
+    assert nlps[0].calls == ["PG films"]
+    assert nlps[1].calls == ["PG films"]
+
+
+@pytest.mark.asyncio
+async def test_process_queries_pipes_unique_misses(service_factory):
+    """The batch API parses each distinct uncached query once, in one nlp.pipe call."""
+    service, nlps = service_factory()
+    await service.process_query("PG films")
+
+    results = await service.process_queries(["PG films", "G films", "count films", "G films"])
+
+    assert [constraints["rating"] for constraints, _, _ in results] == ["PG", None, None, None]
+    assert results[1] == results[3]
+    assert nlps[0].calls == ["PG films", ("G films", "count films")]
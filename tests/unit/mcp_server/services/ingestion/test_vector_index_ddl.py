@@ -1,11 +1,16 @@
 """Unit tests for Memgraph vector index DDL utility."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from common.interfaces import GraphStore
-from ingestion.vector_index_ddl import ensure_table_embedding_hnsw_index
+from ingestion.vector_index_ddl import (
+    QUERY_PAIR_ANN_ROLES,
+    ensure_query_pair_embedding_indexes,
+    ensure_table_embedding_hnsw_index,
+    query_pair_embedding_index_ddl,
+)
 
 
 class TestVectorIndexDDL:
@@ -82,3 +87,33 @@ class TestVectorIndexDDL:
 
         query = mock_store.run_query.call_args[0][0]
         assert "'dimension': 768" in query
+
+
+class TestQueryPairIndexDDL:
+    """Tests for the per-role pgvector indexes on query_pairs."""
+
+    def test_ddl_is_partial_hnsw_per_role(self):
+        """The predicate matches the inlined role filter used by lookups."""
+        ddl = query_pair_embedding_index_ddl("cache")
+
+        assert "CREATE INDEX IF NOT EXISTS idx_query_pairs_embedding_cache" in ddl
+        assert "USING hnsw (embedding vector_cosine_ops)" in ddl
+        assert ddl.endswith("WHERE 'cache' = ANY(roles)")
+
+    def test_ddl_rejects_unknown_role(self):
+        """Only known roles are interpolated into DDL."""
+        with pytest.raises(ValueError):
+            query_pair_embedding_index_ddl("cache'; DROP TABLE x; --")
+
+    @pytest.mark.asyncio
+    async def test_ensure_creates_only_missing_indexes(self):
+        """Existing indexes are skipped and a failure does not stop other roles."""
+        conn = MagicMock()
+        conn.fetch = AsyncMock(return_value=[{"indexname": "idx_query_pairs_embedding_cache"}])
+        conn.execute = AsyncMock(side_effect=[Exception("boom")] + [None] * 10)
+
+        created = await ensure_query_pair_embedding_indexes(conn)
+
+        assert conn.execute.call_count == len(QUERY_PAIR_ANN_ROLES) - 1
+        assert "idx_query_pairs_embedding_cache" not in created
+        assert len(created) == len(QUERY_PAIR_ANN_ROLES) - 2
@@ -68,6 +68,16 @@ class TestVectorIndexerCharacterization:
         assert results[0]["node"]["name"] == "good"
         assert results[0]["score"] > results[1]["score"]
 
+    @pytest.mark.asyncio
+    async def test_precomputed_query_vector_skips_embedding(self, indexer):
+        """A caller-supplied query vector is used as-is."""
+        await indexer.search_nodes_with_metadata(
+            "query", k=1, apply_threshold=False, query_vector=[0.0, 1.0]
+        )
+
+        indexer.embedding_service.embed_text.assert_not_called()
+        assert indexer.store.search_ann_seeds.call_args[0][1] == [0.0, 1.0]
+
 
 class TestAdaptiveThresholdCharacterization:
     """Characterization tests for apply_adaptive_threshold logic."""
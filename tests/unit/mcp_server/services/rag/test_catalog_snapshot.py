@@ -0,0 +1,112 @@
+"""Tests for the maintained schema catalog fingerprint and its MCP tool."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from mcp_server.services.rag import catalog_snapshot
+from mcp_server.services.rag.catalog_snapshot import (
+    fingerprint_table_defs,
+    get_catalog_snapshot,
+    invalidate_catalog_snapshot,
+    record_catalog,
+)
+from schema import ColumnDef, TableDef
+
+
+@pytest.fixture(autouse=True)
+def _reset_snapshot():
+    invalidate_catalog_snapshot()
+    yield
+    invalidate_catalog_snapshot()
+
+
+def _table(name, *columns):
+    return TableDef(
+        name=name,
+        columns=[ColumnDef(name=col, data_type="integer", is_nullable=False) for col in columns],
+        foreign_keys=[],
+    )
+
+
+def _introspector(tables):
+    introspector = MagicMock()
+    introspector.list_table_names = AsyncMock(side_effect=lambda: [t.name for t in tables])
+    introspector.get_table_def = AsyncMock(
+        side_effect=lambda name: next(t for t in tables if t.name == name)
+    )
+    return introspector
+
+
+def test_fingerprint_is_order_independent_and_column_sensitive():
+    """The id ignores table order but changes when a column is added."""
+    users, orders = _table("users", "id"), _table("orders", "id", "user_id")
+
+    assert fingerprint_table_defs([users, orders]) == fingerprint_table_defs([orders, users])
+    assert fingerprint_table_defs([users]).startswith("fp-")
+    assert fingerprint_table_defs([users]) != fingerprint_table_defs([_table("users", "id", "x")])
+
+
+@pytest.mark.asyncio
+async def test_recorded_snapshot_is_served_without_introspection(monkeypatch):
+    """A fingerprint recorded by indexing is read without touching the database."""
+    monkeypatch.setenv("SCHEMA_CATALOG_SNAPSHOT_MAX_AGE_SECONDS", "0")
+    recorded = record_catalog([_table("users", "id")])
+
+    with patch("dal.database.Database.get_schema_introspector") as mock_get:
+        snapshot = await get_catalog_snapshot()
+
+    mock_get.assert_not_called()
+    assert snapshot == recorded
+    assert snapshot.table_count == 1
+
+
+@pytest.mark.asyncio
+async def test_missing_or_stale_snapshot_is_introspected(monkeypatch):
+    """Without a recorded fingerprint, or once it is too old, the catalog is re-read."""
+    monkeypatch.setenv("SCHEMA_CATALOG_SNAPSHOT_MAX_AGE_SECONDS", "60")
+    tables = [_table("users", "id")]
+    introspector = _introspector(tables)
+
+    with patch("dal.database.Database.get_schema_introspector", return_value=introspector):
+        first = await get_catalog_snapshot()
+        await get_catalog_snapshot()
+        assert introspector.list_table_names.await_count == 1
+
+        tables.append(_table("orders", "id"))
+        monkeypatch.setattr(catalog_snapshot.time, "time", lambda: first.computed_at + 61)
+        refreshed = await get_catalog_snapshot()
+
+    assert introspector.list_table_names.await_count == 2
+    assert refreshed.snapshot_id != first.snapshot_id
+    assert refreshed.table_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_schema_snapshot_id_tool(monkeypatch):
+    """The tool returns the catalog fingerprint in a standard envelope."""
+    from mcp_server.tools.get_schema_snapshot_id import handler
+
+    monkeypatch.setenv("MCP_USER_ROLE", "SQL_USER_ROLE")
+    snapshot = record_catalog([_table("users", "id")])
+
+    payload = json.loads(await handler(tenant_id=1))
+
+    assert payload["result"]["schema_snapshot_id"] == snapshot.snapshot_id
+    assert payload["result"]["table_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_get_schema_snapshot_id_tool_reports_introspection_failure(monkeypatch):
+    """Introspection errors surface as a structured, retryable error."""
+    from mcp_server.tools.get_schema_snapshot_id import handler
+
+    monkeypatch.setenv("MCP_USER_ROLE", "SQL_USER_ROLE")
+    with patch(
+        "dal.database.Database.get_schema_introspector", side_effect=RuntimeError("db down")
+    ):
+        payload = json.loads(await handler(tenant_id=1))
+
+    assert payload["error"]["retryable"] is True
+    assert "db down" not in json.dumps(payload)
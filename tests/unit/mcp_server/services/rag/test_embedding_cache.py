@@ -0,0 +1,135 @@
+"""Tests for the two-tier RagEngine embedding cache."""
+
+import os
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from mcp_server.services.rag.embedding_cache import (
+    DiskEmbeddingStore,
+    EmbeddingCache,
+    embedding_cache_key,
+)
+from mcp_server.services.rag.engine import RagEngine
+
+
+def test_key_ignores_whitespace_but_not_model():
+    """Whitespace variants share a key; different models never do."""
+    assert embedding_cache_key("m", "top  customers\n") == embedding_cache_key("m", "top customers")
+    assert embedding_cache_key("m", "top customers") != embedding_cache_key(
+        "other", "top customers"
+    )
+
+
+def test_memory_tier_counts_hits_and_misses():
+    """Lookups report memory hits and misses."""
+    cache = EmbeddingCache("m")
+    cache.put("a", [1.0, 2.0])
+
+    assert cache.get_many(["a", "b"]) == [[1.0, 2.0], None]
+    stats = cache.stats()
+    assert stats["memory_hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_memory_tier_evicts_least_recently_used_by_bytes():
+    """The byte bound evicts the least recently used entry first."""
+    entry_bytes = 4 * 4 + 200
+    cache = EmbeddingCache("m", max_bytes=2 * entry_bytes)
+    cache.put("a", [0.0] * 4)
+    cache.put("b", [1.0] * 4)
+    cache.get("a")
+    cache.put("c", [2.0] * 4)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.stats()["bytes"] <= 2 * entry_bytes
+
+
+def test_disk_tier_survives_new_cache_instance(tmp_path):
+    """Embeddings written to disk are served to a fresh process-level cache."""
+    first = EmbeddingCache("m", disk=DiskEmbeddingStore(str(tmp_path)))
+    first.put_many(["a", "b"], [[1.0, 0.0], [0.0, 1.0]])
+
+    second = EmbeddingCache("m", disk=DiskEmbeddingStore(str(tmp_path)))
+    assert second.get_many(["b", "a", "c"]) == [[0.0, 1.0], [1.0, 0.0], None]
+    assert second.stats()["disk_hits"] == 2
+
+    # Promoted into memory on the way out
+    second.get("a")
+    assert second.stats()["memory_hits"] == 1
+
+
+def test_disk_tier_recovers_from_torn_append(tmp_path):
+    """A partial trailing row is discarded before the next append."""
+    store = DiskEmbeddingStore(str(tmp_path))
+    store.put_many({"k1": np.array([1.0, 2.0], dtype=np.float32)})
+    with open(os.path.join(tmp_path, "vectors_2.f32"), "ab") as f:
+        f.write(b"\x00\x01")
+
+    store.put_many({"k2": np.array([3.0, 4.0], dtype=np.float32)})
+
+    found = store.get_many(["k1", "k2"])
+    np.testing.assert_array_equal(found["k2"], [3.0, 4.0])
+    np.testing.assert_array_equal(found["k1"], [1.0, 2.0])
+
+
+class TestRagEngineCaching:
+    """RagEngine only runs the model for cache misses."""
+
+    @pytest.fixture(autouse=True)
+    def reset_model(self, monkeypatch):
+        """Reset the singleton model and cache before each test."""
+        monkeypatch.delenv("RAG_EMBEDDING_CACHE_DIR", raising=False)
+        RagEngine._model = None
+        RagEngine._embedding_cache = None
+        yield
+        RagEngine._model = None
+        RagEngine._embedding_cache = None
+
+    @pytest.mark.asyncio
+    async def test_embed_batch_computes_only_misses(self):
+        """A second batch only embeds the new text."""
+        with patch("mcp_server.services.rag.engine.TextEmbedding") as mock_embedding:
+            mock_model = MagicMock()
+            mock_model.embed.side_effect = lambda texts: iter(
+                [np.full(4, float(len(t)), dtype=np.float32) for t in texts]
+            )
+            mock_embedding.return_value = mock_model
+
+            first = await RagEngine.embed_batch(["a", "bb"])
+            second = await RagEngine.embed_batch(["bb", "ccc", "a", "ccc"])
+
+        assert mock_model.embed.call_args_list[1].args[0] == ["ccc"]
+        assert second == [first[1], [3.0] * 4, first[0], [3.0] * 4]
+        assert RagEngine.get_embedding_cache_stats()["memory_hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_embed_text_hit_skips_model(self):
+        """Repeated questions are served from the cache."""
+        with patch("mcp_server.services.rag.engine.TextEmbedding") as mock_embedding:
+            mock_model = MagicMock()
+            mock_model.embed.side_effect = lambda texts: iter([np.ones(4, dtype=np.float32)])
+            mock_embedding.return_value = mock_model
+
+            v1 = await RagEngine.embed_text("top customers")
+            v2 = await RagEngine.embed_text("top  customers")
+
+        assert v1 == v2
+        assert mock_model.embed.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_can_be_disabled(self, monkeypatch):
+        """RAG_EMBEDDING_CACHE_ENABLED=false always runs the model."""
+        monkeypatch.setenv("RAG_EMBEDDING_CACHE_ENABLED", "false")
+        with patch("mcp_server.services.rag.engine.TextEmbedding") as mock_embedding:
+            mock_model = MagicMock()
+            mock_model.embed.side_effect = lambda texts: iter([np.ones(4, dtype=np.float32)])
+            mock_embedding.return_value = mock_model
+
+            await RagEngine.embed_text("q")
+            await RagEngine.embed_text("q")
+
+        assert mock_model.embed.call_count == 2
+        assert RagEngine.get_embedding_cache_stats() is None
@@ -0,0 +1,70 @@
+"""Tests for the micro-batching embedding scheduler."""
+
+import asyncio
+
+import pytest
+
+from mcp_server.services.rag.embedding_scheduler import EmbeddingBatcher
+
+
+class _RecordingModel:
+    def __init__(self, fail: bool = False):
+        self.batches = []
+        self.fail = fail
+
+    def __call__(self, texts):
+        self.batches.append(list(texts))
+        if self.fail:
+            raise RuntimeError("onnx exploded")
+        return [[float(len(text))] for text in texts]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_model_call():
+    """Requests arriving within the window are embedded together, in order."""
+    model = _RecordingModel()
+    batcher = EmbeddingBatcher(model, window_ms=20)
+
+    results = await asyncio.gather(*[batcher.embed("x" * n) for n in range(1, 6)])
+
+    assert results == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+    assert model.batches == [["x", "xx", "xxx", "xxxx", "xxxxx"]]
+
+
+@pytest.mark.asyncio
+async def test_batches_are_capped_at_max_batch_size():
+    """A burst larger than max_batch_size is split across model calls."""
+    model = _RecordingModel()
+    batcher = EmbeddingBatcher(model, window_ms=20, max_batch_size=2)
+
+    await asyncio.gather(*[batcher.embed(str(i)) for i in range(5)])
+
+    assert [len(batch) for batch in model.batches] == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_model_failure_propagates_and_worker_survives():
+    """Every caller in a failed batch sees the error; later batches still run."""
+    model = _RecordingModel(fail=True)
+    batcher = EmbeddingBatcher(model, window_ms=5)
+
+    results = await asyncio.gather(batcher.embed("a"), batcher.embed("b"), return_exceptions=True)
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+    model.fail = False
+    assert await batcher.embed("abc") == [3.0]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_is_skipped():
+    """A request cancelled while queued is not sent to the model."""
+    model = _RecordingModel()
+    batcher = EmbeddingBatcher(model, window_ms=20)
+
+    cancelled = asyncio.ensure_future(batcher.embed("gone"))
+    kept = asyncio.ensure_future(batcher.embed("kept"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    assert await kept == [4.0]
+    assert model.batches == [["kept"]]
@@ -54,3 +54,17 @@ async def test_mock_determinism(mock_provider_env):
 
     assert v1 == v2
     assert v1 != v3
+
+
+@pytest.mark.asyncio
+async def test_disabled_batcher_is_resolved_once(mock_provider_env, monkeypatch):
+    """A disabled embedding batcher is decided once, not on every call."""
+    monkeypatch.setattr(RagEngine, "_batcher", None)
+    monkeypatch.setattr(RagEngine, "_batcher_resolved", False)
+    with patch(
+        "mcp_server.services.rag.engine.build_embedding_batcher", return_value=None
+    ) as mock_build:
+        await RagEngine._embed_text("first")
+        await RagEngine._embed_text("second")
+
+    mock_build.assert_called_once()
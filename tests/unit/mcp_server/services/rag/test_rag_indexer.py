@@ -53,8 +53,8 @@ class TestIndexer:
                 return_value=[0.1, 0.2],
             ),
             patch(
-                "mcp_server.services.rag.reload_schema_index", new_callable=AsyncMock
-            ) as mock_reload,
+                "mcp_server.services.rag.upsert_schema_embeddings", new_callable=AsyncMock
+            ) as mock_upsert,
         ):
 
             await index_all_tables()
@@ -69,4 +69,4 @@ class TestIndexer:
             assert "email (string, nullable)" in embedding_arg.schema_text
             assert embedding_arg.embedding == [0.1, 0.2]
 
-            mock_reload.assert_called_once()
+            mock_upsert.assert_called_once_with([embedding_arg])
@@ -1813,3 +1813,64 @@ async def test_execute_sql_query_pagination_span_parity():
         "db.result.next_page_token_present", bool(metadata.get("next_page_token"))
     )
     mock_span.set_attribute.assert_any_call("db.result.partial", metadata["partial"])
+
+
+@pytest.mark.asyncio
+async def test_execute_sql_query_offset_pages_are_served_from_result_spool(monkeypatch, tmp_path):
+    """With spooling on, only the first page reaches the warehouse."""
+    import dal.result_spool as result_spool_module
+    from dal.result_spool import ResultSpoolStore
+
+    monkeypatch.setenv("EXECUTION_PAGINATION_SPOOL_ENABLED", "true")
+    monkeypatch.setattr(result_spool_module, "_STORE", ResultSpoolStore(directory=str(tmp_path)))
+    caps = SimpleNamespace(
+        supports_column_metadata=True,
+        supports_cancel=True,
+        supports_pagination=False,
+        execution_model="sync",
+        supports_offset_pagination_wrapper=True,
+        supports_query_wrapping_subselect=True,
+    )
+    executed = []
+
+    class _Conn:
+        async def fetch(self, sql, *params):
+            _ = params
+            executed.append(sql)
+            return [{"id": idx} for idx in range(1, 6)]
+
+    @asynccontextmanager
+    async def _conn_ctx(*_args, **_kwargs):
+        yield _Conn()
+
+    pages = []
+    page_token = None
+    with (
+        patch(
+            "mcp_server.tools.execute_sql_query.Database.get_query_target_capabilities",
+            return_value=caps,
+        ),
+        patch(
+            "mcp_server.tools.execute_sql_query.Database.get_connection",
+            side_effect=lambda *_a, **_k: _conn_ctx(),
+        ),
+        patch("mcp_server.utils.auth.validate_role", return_value=None),
+    ):
+        for _ in range(3):
+            payload = await handler(
+                "SELECT 1 AS id", tenant_id=1, page_size=2, page_token=page_token
+            )
+            result = json.loads(payload)
+            pages.append(result)
+            page_token = result["metadata"].get("next_page_token")
+
+    assert [page["rows"] for page in pages] == [
+        [{"id": 1}, {"id": 2}],
+        [{"id": 3}, {"id": 4}],
+        [{"id": 5}],
+    ]
+    assert len(executed) == 1
+    assert "OFFSET" not in executed[0]
+    assert pages[0]["metadata"]["pagination.spool.written"] is True
+    assert pages[1]["metadata"]["pagination.spool.hit"] is True
+    assert pages[2]["metadata"].get("next_page_token") is None
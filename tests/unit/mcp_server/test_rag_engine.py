@@ -11,6 +11,8 @@ from mcp_server.services.rag.engine import (
     format_vector_for_postgres,
     generate_schema_document,
     search_similar_tables,
+    search_similar_tables_batch,
+    upsert_schema_embeddings,
 )
 
 
@@ -364,3 +366,157 @@ class TestSearchSimilarTables:
 
             # Results should be limited (via index search logic)
             assert len(results) == 3
+
+
+class TestSearchSimilarTablesBatch:
+    """Unit tests for search_similar_tables_batch function."""
+
+    @pytest.mark.asyncio
+    async def test_batch_maps_rows_to_table_dicts(self):
+        """Each query gets its own list of table hits from one index call."""
+        from common.interfaces.vector_index import BatchSearchResult
+
+        mock_index = MagicMock()
+        mock_index.search_batch.return_value = BatchSearchResult(
+            ids=np.array([["customer", "order"], [None, None]], dtype=object),
+            scores=np.array([[0.9, 0.8], [-np.inf, -np.inf]], dtype=np.float32),
+            metadata={"customer": {"schema_text": "Table: customer"}},
+        )
+
+        async def _fake_get_schema_index():
+            return mock_index
+
+        with patch("mcp_server.services.rag.engine._get_schema_index", new=_fake_get_schema_index):
+            results = await search_similar_tables_batch([[0.1] * 384, [0.0] * 384], limit=2)
+
+        mock_index.search_batch.assert_called_once()
+        assert mock_index.search_batch.call_args[0][0].shape == (2, 384)
+        assert [r["table_name"] for r in results[0]] == ["customer", "order"]
+        assert results[0][0]["schema_text"] == "Table: customer"
+        assert results[0][1]["schema_text"] == ""
+        assert pytest.approx(results[0][0]["distance"], abs=1e-5) == 0.1
+        assert results[1] == []
+
+
+class TestUpsertSchemaEmbeddings:
+    """Unit tests for upsert_schema_embeddings function."""
+
+    @pytest.fixture(autouse=True)
+    async def reset_schema_index(self):
+        """Reset the singleton schema index before each test."""
+        from mcp_server.services.rag import engine as rag_engine
+
+        rag_engine._schema_index = None
+        yield
+        rag_engine._schema_index = None
+
+    @pytest.mark.asyncio
+    async def test_upsert_replaces_items_in_loaded_index(self):
+        """Loaded index receives only the changed tables."""
+        from mcp_server.services.rag import engine as rag_engine
+
+        mock_index = MagicMock()
+        rag_engine._schema_index = mock_index
+        schema = SimpleNamespace(table_name="film", schema_text="Table: film", embedding=[0.1, 0.2])
+
+        await upsert_schema_embeddings([schema])
+
+        vectors, ids = mock_index.replace_items.call_args[0]
+        assert ids == ["film"]
+        assert vectors.shape == (1, 2)
+        assert mock_index.replace_items.call_args[1]["metadata"] == {
+            "film": {"table_name": "film", "schema_text": "Table: film"}
+        }
+
+    @pytest.mark.asyncio
+    async def test_upsert_is_noop_before_lazy_load(self):
+        """Nothing is built eagerly when the index has not been loaded."""
+        from mcp_server.services.rag import engine as rag_engine
+
+        schema = SimpleNamespace(table_name="film", schema_text="Table: film", embedding=[0.1])
+
+        await upsert_schema_embeddings([schema])
+
+        assert rag_engine._schema_index is None
+
+
+class TestSchemaIndexSnapshot:
+    """Unit tests for schema index warm start from an on-disk snapshot."""
+
+    @pytest.fixture(autouse=True)
+    async def reset_schema_index(self):
+        """Reset the singleton schema index before each test."""
+        from mcp_server.services.rag import engine as rag_engine
+
+        rag_engine._schema_index = None
+        yield
+        rag_engine._schema_index = None
+
+    @staticmethod
+    def _store(fingerprint):
+        store = MagicMock()
+
+        async def _fetch_fingerprint():
+            return fingerprint
+
+        async def _fetch_embeddings():
+            return [
+                SimpleNamespace(table_name="film", schema_text="Table: film", embedding=[1.0, 0.0]),
+                SimpleNamespace(
+                    table_name="actor", schema_text="Table: actor", embedding=[0.0, 1.0]
+                ),
+            ]
+
+        store.fetch_schema_fingerprint = _fetch_fingerprint
+        store.fetch_schema_embeddings = MagicMock(side_effect=_fetch_embeddings)
+        return store
+
+    @pytest.mark.asyncio
+    async def test_restores_snapshot_when_fingerprint_matches(self, tmp_path, monkeypatch):
+        """Second cold start skips the SchemaStore scan."""
+        pytest.importorskip("hnswlib")
+        from mcp_server.services.rag import engine as rag_engine
+
+        monkeypatch.setenv("RAG_SCHEMA_INDEX_SNAPSHOT_DIR", str(tmp_path))
+        store = self._store("fp-1")
+
+        with (
+            patch("dal.database.Database.get_schema_store", return_value=store),
+            patch(
+                "mcp_server.services.rag.engine.create_vector_index",
+                side_effect=lambda **kwargs: _small_index(),
+            ),
+        ):
+            await rag_engine._get_schema_index()
+            rag_engine._schema_index = None
+            index = await rag_engine._get_schema_index()
+
+        assert store.fetch_schema_embeddings.call_count == 1
+        assert index.search(np.array([1.0, 0.0], dtype=np.float32), k=1)[0].id == "film"
+
+    @pytest.mark.asyncio
+    async def test_rebuilds_when_fingerprint_changes(self, tmp_path, monkeypatch):
+        """A changed fingerprint falls back to the SchemaStore."""
+        pytest.importorskip("hnswlib")
+        from mcp_server.services.rag import engine as rag_engine
+
+        monkeypatch.setenv("RAG_SCHEMA_INDEX_SNAPSHOT_DIR", str(tmp_path))
+        first, second = self._store("fp-1"), self._store("fp-2")
+
+        with patch(
+            "mcp_server.services.rag.engine.create_vector_index",
+            side_effect=lambda **kwargs: _small_index(),
+        ):
+            with patch("dal.database.Database.get_schema_store", return_value=first):
+                await rag_engine._get_schema_index()
+            rag_engine._schema_index = None
+            with patch("dal.database.Database.get_schema_store", return_value=second):
+                await rag_engine._get_schema_index()
+
+        assert second.fetch_schema_embeddings.call_count == 1
+
+
+def _small_index():
+    from ingestion.vector_indexes.hnsw import HNSWIndex
+
+    return HNSWIndex(max_elements=16)
@@ -66,12 +66,15 @@ async def test_index_all_tables_success():
         async def embed_text_async(_schema_text):
             return [0.1] * 384
 
-        async def reload_schema_index_async():
+        async def upsert_schema_embeddings_async(_schema_embeddings):
             return None
 
         with (
             patch("mcp_server.services.rag.indexer.RagEngine.embed_text", new=embed_text_async),
-            patch("mcp_server.services.rag.reload_schema_index", new=reload_schema_index_async),
+            patch(
+                "mcp_server.services.rag.upsert_schema_embeddings",
+                new=upsert_schema_embeddings_async,
+            ),
         ):
             await index_all_tables()
 
@@ -104,10 +107,13 @@ async def test_index_all_tables_empty_database():
         MockDatabase.get_schema_introspector.return_value = mock_introspector
         MockDatabase.get_schema_store.return_value = mock_store
 
-        async def reload_schema_index_async():
+        async def upsert_schema_embeddings_async(_schema_embeddings):
             return None
 
-        with patch("mcp_server.services.rag.reload_schema_index", new=reload_schema_index_async):
+        with patch(
+            "mcp_server.services.rag.upsert_schema_embeddings",
+            new=upsert_schema_embeddings_async,
+        ):
             await index_all_tables()
 
             assert save_calls["count"] == 0
@@ -158,12 +164,15 @@ async def test_index_all_tables_with_relationships():
         async def embed_text_async(_schema_text):
             return [0.1] * 384
 
-        async def reload_schema_index_async():
+        async def upsert_schema_embeddings_async(_schema_embeddings):
             return None
 
         with (
             patch("mcp_server.services.rag.indexer.RagEngine.embed_text", new=embed_text_async),
-            patch("mcp_server.services.rag.reload_schema_index", new=reload_schema_index_async),
+            patch(
+                "mcp_server.services.rag.upsert_schema_embeddings",
+                new=upsert_schema_embeddings_async,
+            ),
         ):
             await index_all_tables()
 
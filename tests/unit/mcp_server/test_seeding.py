@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from mcp_server.services.registry import BulkRegistrationOutcome
 from mcp_server.services.seeding import cli
 from mcp_server.services.seeding.loader import load_from_directory
 
@@ -42,7 +43,10 @@ class TestSeederCli:
 
     @pytest.mark.asyncio
     @patch("mcp_server.services.seeding.cli.load_from_directory")
-    @patch("mcp_server.services.seeding.cli.RegistryService.register_pair", new_callable=AsyncMock)
+    @patch(
+        "mcp_server.services.seeding.cli.RegistryService.register_pairs_bulk",
+        new_callable=AsyncMock,
+    )
     async def test_main_processing(self, mock_register, mock_load):
         """Test unified processing of seed items."""
         mock_load.return_value = [
@@ -54,10 +58,14 @@ class TestSeederCli:
             }
         ]
 
+        mock_register.return_value = [BulkRegistrationOutcome(index=0, status="inserted")]
+
         await cli._process_seed_data(Path("/app/queries"))
 
         mock_register.assert_awaited_once()
-        call_kwargs = mock_register.call_args.kwargs
+        (items,) = mock_register.call_args.args
+        assert len(items) == 1
+        call_kwargs = items[0]
         assert call_kwargs["question"] == "Q1"
         assert call_kwargs["sql_query"] == "SELECT 1"
         assert call_kwargs["roles"] == ["example", "golden"]
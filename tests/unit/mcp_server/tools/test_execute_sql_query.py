@@ -213,15 +213,20 @@ class TestExecuteSqlQuery:
         assert data["metadata"]["sandbox_failure_reason"] == "NONE"
         assert data["metadata"]["session_reset_attempted"] is True
         assert data["metadata"]["session_reset_outcome"] == "ok"
-        assert (
-            "SELECT set_config('default_transaction_read_only', 'on', true)",
-            (),
-        ) in fake_conn.execute_calls
-        assert ('SET LOCAL ROLE "text2sql_readonly"', ()) in fake_conn.execute_calls
+        setup_sql, setup_args = fake_conn.execute_calls[0]
+        assert setup_sql.startswith(
+            "SELECT set_config('default_transaction_read_only', $1, true), "
+        )
+        assert setup_sql.endswith(
+            f"set_config('role', ${len(setup_args) - 1}, true), "
+            f"set_config('app.current_tenant', ${len(setup_args)}, true)"
+        )
+        assert setup_args[0] == "on"
+        assert setup_args[-2:] == ("text2sql_readonly", "1")
         assert ("RESET ROLE", ()) in fake_conn.execute_calls
         assert ("RESET ALL", ()) in fake_conn.execute_calls
 
-        role_event_index = fake_conn.events.index(("execute", 'SET LOCAL ROLE "text2sql_readonly"'))
+        role_event_index = fake_conn.events.index(("execute", setup_sql))
         fetch_event_index = fake_conn.events.index(("fetch", "SELECT 1 AS ok"))
         assert role_event_index < fetch_event_index
 
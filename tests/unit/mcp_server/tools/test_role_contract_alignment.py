@@ -12,6 +12,7 @@ from mcp_server.tools.conversation.save_conversation_state import (
 )
 from mcp_server.tools.feedback.submit_feedback import handler as submit_feedback_handler
 from mcp_server.tools.get_few_shot_examples import handler as get_few_shot_examples_handler
+from mcp_server.tools.get_schema_snapshot_id import handler as get_schema_snapshot_id_handler
 from mcp_server.tools.get_semantic_definitions import handler as get_semantic_definitions_handler
 from mcp_server.tools.get_semantic_subgraph import handler as get_semantic_subgraph_handler
 from mcp_server.tools.interaction.create_interaction import handler as create_interaction_handler
@@ -44,6 +45,7 @@ ENFORCED_SQL_USER_ROLE_HANDLERS = [
         get_semantic_subgraph_handler,
         {"query": "test", "tenant_id": 1},
     ),
+    ("get_schema_snapshot_id", get_schema_snapshot_id_handler, {"tenant_id": 1}),
     (
         "submit_feedback",
         submit_feedback_handler,
@@ -8,7 +8,7 @@ from typing import Any, Dict, List, Optional
 import numpy as np
 
 from common.interfaces import CacheStore, ExtendedVectorIndex, GraphStore
-from common.interfaces.vector_index import SearchResult
+from common.interfaces.vector_index import BatchSearchResult, SearchResult
 from mcp_server.models import CacheLookupResult, Edge, GraphData, Node
 
 
@@ -141,6 +141,15 @@ class MockVectorIndex:
         """Mock search."""
         return []
 
+    def search_batch(
+        self,
+        query_matrix: np.ndarray,
+        k: int,
+        filter: Optional[Dict] = None,
+    ) -> BatchSearchResult:
+        """Mock search_batch."""
+        return BatchSearchResult.empty(len(query_matrix))
+
     def add_items(
         self,
         vectors: np.ndarray,
@@ -51,6 +51,10 @@ class TestPgSemanticCache:
 
         # Verify SQL param formatting (format_vector_for_postgres mock or check str)
         mock_conn.fetchrow.assert_called_once()
+        query, *args = mock_conn.fetchrow.call_args[0]
+        assert "ORDER BY embedding <=> $1" in query
+        assert "'sql' = ANY(roles)" in query
+        assert args[2] == 1  # top-1 before thresholding
 
     @pytest.mark.asyncio
     async def test_lookup_miss(self, cache, mock_db):
@@ -64,28 +68,46 @@ class TestPgSemanticCache:
 
     @pytest.mark.asyncio
     async def test_record_hit(self, cache, mock_db):
-        """Test record_hit executes update."""
+        """Test record_hit buffers hits and flushes them as one batched update."""
         mock_conn = AsyncMock()
         mock_db.get_connection.return_value.__aenter__.return_value = mock_conn
 
         await cache.record_hit("123", tenant_id=1)
+        await cache.record_hit("123", tenant_id=1)
+        await cache.record_hit("456", tenant_id=1)
+        mock_conn.execute.assert_not_called()
+
+        await cache.flush_hits()
 
         mock_conn.execute.assert_called_once()
         args = mock_conn.execute.call_args[0]
         assert "UPDATE public.query_pairs" in args[0]
-        assert args[1] == "123"  # String signature_key
+        assert args[1:] == (["123", "456"], [2, 1], 1)
+
+    @pytest.mark.asyncio
+    async def test_record_hit_write_through(self, cache, mock_db, monkeypatch):
+        """A zero flush interval writes each hit immediately."""
+        monkeypatch.setenv("SEMANTIC_CACHE_HIT_FLUSH_INTERVAL_SECONDS", "0")
+        mock_conn = AsyncMock()
+        mock_db.get_connection.return_value.__aenter__.return_value = mock_conn
+
+        await cache.record_hit("123", tenant_id=1)
+
+        mock_conn.execute.assert_called_once()
+        assert mock_conn.execute.call_args[0][1:] == (["123"], [1], 1)
 
     @pytest.mark.asyncio
     async def test_store(self, cache, mock_db):
-        """Test store executes insert."""
+        """Test store executes insert and announces the change."""
         mock_conn = AsyncMock()
         mock_db.get_connection.return_value.__aenter__.return_value = mock_conn
 
         await cache.store("query", "sql", MOCK_EMBEDDING, tenant_id=1)
 
-        mock_conn.execute.assert_called_once()
-        args = mock_conn.execute.call_args[0]
-        assert "INSERT INTO public.query_pairs" in args[0]
+        insert_call, notify_call = mock_conn.execute.call_args_list
+        assert "INSERT INTO public.query_pairs" in insert_call[0][0]
+        assert notify_call[0][0] == "SELECT pg_notify($1, $2)"
+        assert '"event": "store"' in notify_call[0][2]
 
 
 class TestPostgresExampleStore:
@@ -37,5 +37,119 @@ class TestPostgresRegistryStore:
         query = args[0]
         query_args = args[1:]
 
-        assert "status = $5" in query  # $1 vector, $2 threshold, $3 limit, $4 role, $5 status
+        # $1 vector, $2 threshold, $3 limit, $4 status; the role is inlined for the partial index
+        assert "status = $4" in query
+        assert "'example' = ANY(roles)" in query
         assert "verified" in query_args
+
+    @pytest.mark.asyncio
+    async def test_lookup_semantic_candidates_orders_by_distance(self, store, mock_db):
+        """The ANN top-k is taken before the similarity threshold is applied."""
+        mock_conn = AsyncMock()
+        mock_db.get_connection.return_value.__aenter__.return_value = mock_conn
+        mock_conn.fetch.return_value = []
+
+        await store.lookup_semantic_candidates(MOCK_EMBEDDING, tenant_id=1, threshold=0.8)
+
+        query = mock_conn.fetch.call_args[0][0]
+        inner, outer = query.split(") AS nearest")
+        assert "ORDER BY embedding <=> $1" in inner
+        assert "LIMIT $3" in inner
+        assert ">= $2" not in inner
+        assert "(1 - distance) >= $2" in outer
+
+    @pytest.mark.asyncio
+    async def test_tombstone_pair_notifies_on_update(self, store, mock_db):
+        """A successful tombstone is announced on the registry channel."""
+        mock_conn = AsyncMock()
+        mock_db.get_connection.return_value.__aenter__.return_value = mock_conn
+        mock_conn.execute.side_effect = ["UPDATE 1", "SELECT 1"]
+
+        assert await store.tombstone_pair("sig", 7, "stale") is True
+
+        notify_args = mock_conn.execute.call_args_list[1][0]
+        assert notify_args[:2] == ("SELECT pg_notify($1, $2)", "query_registry_events")
+        assert '"tenant_id": 7' in notify_args[2]
+        assert '"signature_key": "sig"' in notify_args[2]
+
+    @pytest.mark.asyncio
+    async def test_tombstone_pair_without_match_does_not_notify(self, store, mock_db):
+        """Nothing is announced when no row was tombstoned."""
+        mock_conn = AsyncMock()
+        mock_db.get_connection.return_value.__aenter__.return_value = mock_conn
+        mock_conn.execute.return_value = "UPDATE 0"
+
+        assert await store.tombstone_pair("sig", 7, "stale") is False
+        mock_conn.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_store_pairs_copies_then_upserts_per_tenant(self, store, mock_db):
+        """Bulk writes stage rows via COPY and upsert once per tenant, last row winning."""
+        from schema.registry import QueryPair
+
+        def pair(sig, tenant_id, sql):
+            return QueryPair(
+                signature_key=sig,
+                tenant_id=tenant_id,
+                fingerprint=sig,
+                question=sig,
+                sql_query=sql,
+                embedding=MOCK_EMBEDDING,
+                roles=["example"],
+            )
+
+        mock_conn = AsyncMock()
+        mock_db.get_connection.return_value.__aenter__.return_value = mock_conn
+        mock_conn.fetch.side_effect = [
+            [{"signature_key": "a", "inserted": False}, {"signature_key": "b", "inserted": True}],
+            [{"signature_key": "a", "inserted": True}],
+        ]
+
+        outcomes = await store.store_pairs(
+            [pair("a", 1, "SELECT 1"), pair("b", 1, "SELECT 2"), pair("a", 1, "SELECT 3")]
+            + [pair("a", 2, "SELECT 4")]
+        )
+
+        assert outcomes == ["duplicate", "inserted", "updated", "inserted"]
+        assert [c.args[0] for c in mock_db.get_connection.call_args_list] == [1, 2]
+
+        copied = mock_conn.copy_records_to_table.call_args_list[0].kwargs["records"]
+        assert [(r[0], r[1], r[5]) for r in copied] == [(2, "a", "SELECT 3"), (1, "b", "SELECT 2")]
+        assert copied[0][6] == "[0.1,0.2,0.3]"
+
+        upsert = mock_conn.fetch.call_args_list[0].args[0]
+        assert "FROM query_pairs_staging" in upsert
+        assert "ON CONFLICT (signature_key, tenant_id)" in upsert
+        assert "RETURNING signature_key, (xmax = 0) AS inserted" in upsert
+
+    @pytest.mark.asyncio
+    async def test_store_pairs_bypasses_traced_connection_row_cap(self, store, mock_db):
+        """Outcomes past DAL_SYNC_MAX_ROWS are reported, and COPY runs on the raw connection."""
+        from dal.tracing import TracedAsyncpgConnection
+        from schema.registry import QueryPair
+
+        raw_conn = AsyncMock()
+        raw_conn.fetch.return_value = [
+            {"signature_key": f"s{i}", "inserted": i % 2 == 0} for i in range(5)
+        ]
+        mock_db.get_connection.return_value.__aenter__.return_value = TracedAsyncpgConnection(
+            raw_conn, provider="postgres", execution_model="sync", max_rows=2
+        )
+
+        outcomes = await store.store_pairs(
+            [
+                QueryPair(
+                    signature_key=f"s{i}",
+                    tenant_id=1,
+                    fingerprint=f"s{i}",
+                    question="q",
+                    sql_query="SELECT 1",
+                    roles=["example"],
+                )
+                for i in range(5)
+            ]
+        )
+
+        assert outcomes == ["inserted", "updated", "inserted", "updated", "inserted"]
+        raw_conn.copy_records_to_table.assert_awaited_once()
+        raw_conn.executemany.assert_not_called()
@@ -116,3 +116,34 @@ async def test_get_few_shot_examples(mock_store, mock_rag_engine):
     # Check role filter was passed to DAL
     kwargs = mock_store.lookup_semantic_candidates.call_args[1]
     assert kwargs["role"] == "example"
+
+
+@pytest.mark.asyncio
+async def test_register_pairs_bulk(mock_canonicalizer, mock_store):
+    """Bulk registration batches canonicalization, embedding and writes per chunk."""
+    mock_canonicalizer.process_queries = AsyncMock(
+        side_effect=[
+            [({}, "F1", "SIG1"), ({}, "", "")],
+            [({}, "F3", "SIG3")],
+        ]
+    )
+    mock_store.store_pairs.side_effect = [["inserted", "updated"], RuntimeError("db down")]
+    items = [
+        {"question": q, "sql_query": "SELECT 1", "tenant_id": 1, "roles": ["example"]}
+        for q in ("Q1", " Raw Q ", "Q3")
+    ]
+
+    with patch(
+        "mcp_server.services.rag.RagEngine.embed_batch",
+        new_callable=AsyncMock,
+        side_effect=lambda texts: [[0.1] * 3 for _ in texts],
+    ) as embed_batch:
+        outcomes = await RegistryService.register_pairs_bulk(items, batch_size=2)
+
+    assert [o.status for o in outcomes] == ["inserted", "updated", "error"]
+    assert [o.index for o in outcomes] == [0, 1, 2]
+    assert outcomes[1].pair.fingerprint == "RAW:raw q"
+    assert outcomes[2].error == "db down"
+    assert embed_batch.await_count == 2
+    first_batch = mock_store.store_pairs.call_args_list[0].args[0]
+    assert [p.signature_key for p in first_batch][0] == "SIG1"